@@ -40,7 +40,8 @@ Usage:
     provider.authenticate()
 """
 
-from core import auth, cli, config, exceptions, parallel, region, shared, tools
+import importlib
+from typing import Any
 
 __all__: list[str] = [
     # 서브패키지
@@ -54,3 +55,14 @@ __all__: list[str] = [
     "config",
     "exceptions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """서브패키지 지연 로드 (``core.auth`` 등 첫 접근 시 import)
+
+    ``aa --help`` 처럼 일부 모듈만 쓰는 실행에서 boto3/openpyxl 등
+    전체 의존성을 import하지 않기 위함입니다.
+    """
+    if name in __all__:
+        return importlib.import_module(f"core.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,7 +13,7 @@ core/auth - AWS 통합 인증 모듈
 서브패키지:
     - types: Provider 인터페이스, ProviderType enum, AccountInfo, 에러 클래스
     - config: ~/.aws/config, ~/.aws/credentials 파싱 및 Provider 타입 감지
-    - cache: SSO 토큰 파일 캐시, 메모리 기반 계정/자격증명 캐시
+    - cache: SSO 토큰/계정 목록 파일 캐시, 메모리 기반 계정/자격증명 캐시
     - provider: BaseProvider, SSOSession/SSOProfile/Static Provider 구현
 
 Example:
@@ -37,6 +37,7 @@ from .account import (
 from .auth import Manager, create_manager
 from .cache import (
     AccountCache,
+    AccountFileCache,
     CacheEntry,
     CredentialsCache,
     TokenCache,
@@ -104,6 +105,7 @@ __all__: list[str] = [
     "TokenCache",
     "TokenCacheManager",
     "AccountCache",
+    "AccountFileCache",
     "CredentialsCache",
     "CacheEntry",
     # Config
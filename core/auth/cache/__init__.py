@@ -6,6 +6,7 @@ SSO 토큰과 계정 정보를 캐시하여 불필요한 API 호출을 줄입니
 
 캐시 전략:
     - TokenCache / TokenCacheManager: 파일 기반 (~/.aws/sso/cache/) - AWS CLI 호환 필수
+    - AccountFileCache: 파일 기반 - SSO 계정/역할 목록 프로세스 간 재사용 (토큰이 바뀌면 무효)
     - AccountCache: 메모리 기반 - 세션 중 계정 정보 재사용 (기본 TTL 1시간)
     - CredentialsCache: 메모리 기반 - STS 임시 자격증명 캐시 (기본 TTL 30분)
     - CacheEntry: 제네릭 캐시 항목 (만료 시간 관리 포함)
@@ -13,6 +14,7 @@ SSO 토큰과 계정 정보를 캐시하여 불필요한 API 호출을 줄입니
 
 from .cache import (
     AccountCache,
+    AccountFileCache,
     CacheEntry,
     CredentialsCache,
     TokenCache,
@@ -23,6 +25,7 @@ __all__: list[str] = [
     "TokenCache",
     "TokenCacheManager",
     "AccountCache",
+    "AccountFileCache",
     "CredentialsCache",
     "CacheEntry",
 ]
@@ -8,11 +8,13 @@ SSO 토큰, 계정 정보, 임시 자격증명의 캐시를 관리합니다.
     - CacheEntry: 제네릭 캐시 항목 (TTL 만료 관리)
     - TokenCache: SSO 토큰 데이터 구조 (AWS CLI 호환 JSON 직렬화)
     - TokenCacheManager: 토큰 캐시 파일 관리 (~/.aws/sso/cache/)
+    - AccountFileCache: SSO 계정/역할 목록 파일 캐시 (암호화, 토큰이 바뀌면 무효)
     - AccountCache: 메모리 기반 계정 캐시 (Thread-safe, 기본 TTL 1시간)
     - CredentialsCache: 메모리 기반 자격증명 캐시 (Thread-safe, 기본 TTL 30분)
 
 설계 원칙:
-    - 파일 캐시는 SSO 토큰만 (AWS CLI 호환 필수)
+    - SSO 토큰 파일 캐시는 AWS CLI 호환 필수
+    - 계정/역할 목록은 프로세스 간 재사용을 위해 파일 캐시 (토큰과 동일하게 암호화)
     - 나머지는 메모리 캐시로 단순화
     - 토큰 만료 시간은 IAM Identity Center 설정을 따름
 """
@@ -24,8 +26,9 @@ import hashlib
 import json
 import logging
 import os
+import tempfile
 import threading
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Generic, TypeVar
@@ -493,6 +496,176 @@ class TokenCacheManager:
         return self.cache_path.exists()
 
 
+class AccountFileCache:
+    """SSO 계정/역할 목록 파일 캐시
+
+    계정이 수백 개인 조직에서는 ListAccounts + 계정별 ListAccountRoles 조회에 시간이
+    오래 걸리므로, 조회 결과를 파일에 저장하여 새 프로세스에서도 재사용합니다.
+    캐시 파일 위치: ~/.aws/sso/cache/aa-accounts-{session_name_hash}.json
+
+    계정 목록은 토큰과 같은 방식(TokenEncryption)으로 암호화되며, 저장 시점의
+    SSO 액세스 토큰 지문(SHA-256)이 현재 토큰과 같을 때만 유효합니다.
+    재로그인/토큰 갱신으로 토큰이 바뀌면 캐시는 자동으로 무시됩니다.
+
+    저장은 임시 파일에 쓴 뒤 ``os.replace`` 로 교체하므로 읽는 쪽은 항상 완전한 파일을 봅니다.
+    ``saved_at`` 은 마지막 ``load()`` 가 읽은 저장 시각이며 ``is_stale()`` 의 기준입니다.
+    """
+
+    # 캐시 형식 버전 (구조 변경 시 증가 → 기존 파일 무시)
+    VERSION = 1
+
+    # 캐시 파일명 접두어 (AWS CLI 토큰 파일과 구분)
+    FILE_PREFIX = "aa-accounts-"
+
+    def __init__(
+        self,
+        session_name: str,
+        start_url: str,
+        cache_dir: str | None = None,
+    ):
+        """AccountFileCache 초기화
+
+        Args:
+            session_name: SSO 세션 이름
+            start_url: SSO 시작 URL
+            cache_dir: 캐시 디렉토리 (기본: ~/.aws/sso/cache)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".aws" / "sso" / "cache"
+        input_str = session_name if session_name else start_url
+        self._cache_key = hashlib.sha1(input_str.encode("utf-8"), usedforsecurity=False).hexdigest()
+        self.saved_at: datetime | None = None
+
+    @property
+    def cache_path(self) -> Path:
+        """캐시 파일 전체 경로"""
+        return self.cache_dir / f"{self.FILE_PREFIX}{self._cache_key}.json"
+
+    def _get_lock(self):
+        """파일 잠금 객체 반환"""
+        import filelock
+
+        return filelock.FileLock(str(self.cache_path) + ".lock", timeout=5)
+
+    @staticmethod
+    def _token_fingerprint(access_token: str) -> str:
+        """액세스 토큰 지문 (원문 토큰은 저장하지 않음)"""
+        return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+    def load(self, access_token: str) -> dict[str, AccountInfo] | None:
+        """현재 토큰으로 저장된 계정 목록 로드
+
+        Args:
+            access_token: 현재 SSO 액세스 토큰
+
+        Returns:
+            {account_id: AccountInfo} 또는 None (파일 없음, 토큰 변경, 파싱 실패, 잠금 타임아웃)
+        """
+        import filelock
+
+        self.saved_at = None
+        try:
+            if not self.cache_path.exists():
+                return None
+
+            with self._get_lock(), open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+
+            if data.get("version") != self.VERSION:
+                return None
+            if data.get("token") != self._token_fingerprint(access_token):
+                logger.debug("SSO 토큰 변경 - 계정 파일 캐시 무시")
+                return None
+
+            payload = data["accounts"]
+            if data.get("_encrypted", False):
+                encryption = get_token_encryption()
+                if not encryption.is_available:
+                    return None
+                payload = encryption.decrypt(payload)
+
+            accounts = {item["id"]: AccountInfo(**item) for item in json.loads(payload)}
+            saved_at = data.get("savedAt")
+            if saved_at:
+                self.saved_at = datetime.strptime(saved_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+            return accounts
+        except filelock.Timeout as e:
+            logger.debug(f"계정 캐시 파일 잠금 타임아웃: {e}")
+            return None
+        except (FileNotFoundError, PermissionError) as e:
+            logger.debug(f"계정 캐시 파일 접근 실패: {e}")
+            return None
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"계정 캐시 데이터 형식 오류: {e}")
+            return None
+
+    def save(self, access_token: str, accounts: dict[str, AccountInfo]) -> None:
+        """계정 목록을 현재 토큰 지문과 함께 저장
+
+        Args:
+            access_token: 현재 SSO 액세스 토큰
+            accounts: {account_id: AccountInfo} 딕셔너리
+
+        Raises:
+            IOError: 파일 저장 실패 시
+        """
+        encryption = get_token_encryption()
+        payload = json.dumps([asdict(account) for account in accounts.values()], ensure_ascii=False)
+        if encryption.is_available:
+            payload = encryption.encrypt(payload)
+
+        data = {
+            "version": self.VERSION,
+            "token": self._token_fingerprint(access_token),
+            "savedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "_encrypted": encryption.is_available,
+            "accounts": payload,
+        }
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self._get_lock():
+            # 임시 파일에 쓴 뒤 교체 (중단되어도 기존 캐시가 깨지지 않음)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{self.FILE_PREFIX}", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+
+                # 계정 목록도 토큰과 동일하게 소유자만 읽기/쓰기 가능
+                if os.name != "nt":
+                    os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, self.cache_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+    def is_stale(self, max_age: float) -> bool:
+        """마지막 ``load()`` 로 읽은 캐시가 ``max_age`` 초보다 오래되었는지 확인
+
+        Args:
+            max_age: 갱신 주기 (초)
+
+        Returns:
+            저장 시각을 모르거나 ``max_age`` 이상 지났으면 True
+        """
+        if self.saved_at is None:
+            return True
+        return datetime.now(timezone.utc) - self.saved_at >= timedelta(seconds=max_age)
+
+    def delete(self) -> bool:
+        """캐시 파일 삭제
+
+        Returns:
+            True if 삭제 성공
+        """
+        try:
+            if self.cache_path.exists():
+                self.cache_path.unlink()
+            return True
+        except OSError as e:
+            logger.debug(f"계정 캐시 파일 삭제 실패: {e}")
+            return False
+
+
 # =============================================================================
 # Memory-based Caches
 # =============================================================================
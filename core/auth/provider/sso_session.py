@@ -9,11 +9,19 @@ AWS IAM Identity Center(SSO) 세션 기반 인증 Provider입니다.
     1. 캐시된 토큰 확인 (유효하면 재사용)
     2. refresh_token으로 토큰 갱신 시도
     3. 디바이스 인증 흐름 시작 (브라우저 인증)
+
+계정 목록:
+    - 계정별 ListAccountRoles는 제한된 스레드 풀에서 병렬 조회 ("sso" Rate limit 적용)
+    - 조회 결과는 암호화된 파일 캐시에 저장되어 토큰이 바뀔 때까지 프로세스 간 재사용
+    - 파일 캐시가 갱신 주기보다 오래된 경우에만 백그라운드에서 목록을 다시 조회하여 캐시 갱신
+      (자격증명 선행 획득과 "sso" Rate limit을 나눠 쓰므로 캐시 히트마다 갱신하지 않음)
 """
 
 import contextlib
 import logging
+import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from time import sleep
@@ -22,7 +30,9 @@ from typing import Any
 import boto3
 from botocore.exceptions import ClientError
 
-from ..cache import TokenCache, TokenCacheManager
+from core.parallel.request_limiter import THROTTLING_ERROR_CODES, get_scoped_rate_limiter
+
+from ..cache import AccountFileCache, TokenCache, TokenCacheManager
 from ..types import (
     AccountInfo,
     ProviderError,
@@ -33,6 +43,15 @@ from .base import BaseProvider
 
 logger = logging.getLogger(__name__)
 
+# 계정별 역할 조회 동시 실행 수 (SSO 포털 API 쓰로틀링을 고려한 상한)
+DEFAULT_ROLE_DISCOVERY_WORKERS = 8
+
+# 파일 캐시 백그라운드 갱신 주기 (초) - 이보다 오래된 캐시를 사용하면 목록을 다시 조회
+DEFAULT_ACCOUNT_REFRESH_AGE = 3600
+
+# SSO 포털 API 쓰로틀링 시 최대 시도 횟수
+SSO_MAX_ATTEMPTS = 3
+
 
 @dataclass
 class SSOSessionConfig:
@@ -44,6 +63,9 @@ class SSOSessionConfig:
         region: SSO 리전
         client_name: OIDC 클라이언트 이름 (기본: "python-auth")
         client_type: OIDC 클라이언트 타입 (기본: "public")
+        role_discovery_workers: 계정별 역할 조회 동시 실행 수 (기본: 8)
+        background_account_refresh: 파일 캐시 사용 시 백그라운드 갱신 여부 (기본: True)
+        account_refresh_age: 파일 캐시가 이보다 오래되었을 때만 백그라운드 갱신 (초, 기본: 3600)
     """
 
     session_name: str
@@ -51,6 +73,9 @@ class SSOSessionConfig:
     region: str
     client_name: str = "python-auth"
     client_type: str = "public"
+    role_discovery_workers: int = DEFAULT_ROLE_DISCOVERY_WORKERS
+    background_account_refresh: bool = True
+    account_refresh_age: float = DEFAULT_ACCOUNT_REFRESH_AGE
 
 
 class SSOSessionProvider(BaseProvider):
@@ -58,8 +83,9 @@ class SSOSessionProvider(BaseProvider):
 
     특징:
     - AWS SSO (IAM Identity Center) 세션 기반 인증
-    - 멀티 계정 지원 (ListAccounts API)
+    - 멀티 계정 지원 (ListAccounts API, 역할 병렬 조회)
     - AWS CLI 호환 토큰 캐시 (~/.aws/sso/cache/)
+    - 계정/역할 목록 파일 캐시 (토큰이 바뀔 때까지 재사용, 백그라운드 갱신)
     - 자동 토큰 갱신
 
     Example:
@@ -94,6 +120,14 @@ class SSOSessionProvider(BaseProvider):
         self._token_cache: TokenCache | None = None
         self._access_token: str | None = None
 
+        # 계정/역할 목록 파일 캐시 + 백그라운드 갱신 스레드
+        self._account_file_cache = AccountFileCache(
+            session_name=config.session_name,
+            start_url=config.start_url,
+        )
+        self._account_refresh_thread: threading.Thread | None = None
+        self._account_refresh_lock = threading.Lock()
+
         # boto3 클라이언트
         self._base_session = boto3.Session(region_name=config.region)
         self._sso_client = self._base_session.client("sso", region_name=config.region)
@@ -332,6 +366,46 @@ class SSOSessionProvider(BaseProvider):
         Returns:
             boto3.Session 객체
         """
+        credentials = self._get_role_credentials(account_id, role_name, retry_on_expired)
+        return self._create_session(
+            credentials["access_key_id"],
+            credentials["secret_access_key"],
+            credentials.get("session_token"),
+            region or self._default_region,
+        )
+
+    def prefetch_credentials(self, account_id: str, role_name: str) -> None:
+        """특정 계정/역할의 자격증명을 미리 획득하여 캐시에 저장
+
+        Session을 만들지 않고 자격증명만 캐시에 채웁니다. 병렬 실행기가
+        작업 실행 전에 다음 계정들의 자격증명을 선행 획득할 때 사용하며,
+        이후 get_session() 호출은 캐시에서 바로 Session을 생성합니다.
+
+        Args:
+            account_id: AWS 계정 ID
+            role_name: 역할 이름
+        """
+        self._get_role_credentials(account_id, role_name)
+
+    def _get_role_credentials(
+        self,
+        account_id: str | None,
+        role_name: str | None,
+        retry_on_expired: bool = True,
+    ) -> dict[str, str]:
+        """캐시된 자격증명을 반환하거나 get_role_credentials로 새로 획득
+
+        get_role_credentials는 ``_call_sso`` 를 거치므로 "sso" Rate limit과
+        쓰로틀링 재시도가 적용됩니다.
+
+        Args:
+            account_id: AWS 계정 ID
+            role_name: 역할 이름
+            retry_on_expired: 토큰 만료 시 재인증 후 재시도 여부
+
+        Returns:
+            {"access_key_id", "secret_access_key", "session_token"} 딕셔너리
+        """
         self._ensure_authenticated()
 
         if not account_id or not role_name:
@@ -340,17 +414,13 @@ class SSOSessionProvider(BaseProvider):
         # 캐시 확인
         cached = self._get_cached_credentials(account_id, role_name)
         if cached:
-            return self._create_session(
-                cached["access_key_id"],
-                cached["secret_access_key"],
-                cached.get("session_token"),
-                region or self._default_region,
-            )
+            return cached
 
         # 새 자격증명 획득
         assert self._access_token is not None, "인증이 필요합니다"
         try:
-            response = self._sso_client.get_role_credentials(
+            response = self._call_sso(
+                "get_role_credentials",
                 roleName=role_name,
                 accountId=account_id,
                 accessToken=self._access_token,
@@ -365,13 +435,7 @@ class SSOSessionProvider(BaseProvider):
                 "session_token": str(credentials["sessionToken"]),
             }
             self._cache_credentials(account_id, role_name, creds_dict)
-
-            return self._create_session(
-                str(credentials["accessKeyId"]),
-                str(credentials["secretAccessKey"]),
-                str(credentials["sessionToken"]),
-                region or self._default_region,
-            )
+            return creds_dict
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
@@ -382,7 +446,7 @@ class SSOSessionProvider(BaseProvider):
                 if retry_on_expired:
                     logger.info("SSO 토큰 만료됨, 재인증 시도...")
                     self.authenticate(force=True)  # 강제 재인증
-                    return self.get_session(account_id, role_name, region, retry_on_expired=False)
+                    return self._get_role_credentials(account_id, role_name, retry_on_expired=False)
 
                 raise TokenExpiredError(
                     f"SSO 토큰이 만료되었습니다: {error_code}",
@@ -430,34 +494,21 @@ class SSOSessionProvider(BaseProvider):
         if cached_accounts:
             return cached_accounts
 
-        accounts = {}
         assert self._access_token is not None, "인증이 필요합니다"
 
-        try:
-            paginator = self._sso_client.get_paginator("list_accounts")
-
-            for page in paginator.paginate(accessToken=self._access_token):
-                for account in page.get("accountList", []):
-                    # TypedDict fields accessed with explicit str conversion
-                    acct = dict(account)  # Convert TypedDict to regular dict
-                    account_id = str(acct.get("accountId", ""))
-
-                    # 역할 목록 조회
-                    roles = self._list_account_roles(account_id)
-
-                    email_value = acct.get("emailAddress")
-                    account_info = AccountInfo(
-                        id=account_id,
-                        name=str(acct.get("accountName", f"account-{account_id}")),
-                        email=str(email_value) if email_value else None,
-                        roles=roles,
-                    )
-                    accounts[account_id] = account_info
-
-            # 캐시 저장
-            self._account_cache.set_all(accounts)
+        # 파일 캐시 확인 (같은 토큰으로 저장된 경우만 유효) - 즉시 반환, 오래된 캐시면 백그라운드 갱신
+        file_cached = self._account_file_cache.load(self._access_token)
+        if file_cached:
+            logger.debug(f"계정 파일 캐시 사용: {len(file_cached)}개")
+            self._account_cache.set_all(file_cached)
+            if self._config.background_account_refresh and self._account_file_cache.is_stale(
+                self._config.account_refresh_age
+            ):
+                self._start_account_refresh()
+            return file_cached
 
-            return accounts
+        try:
+            return self._discover_accounts()
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
@@ -481,26 +532,142 @@ class SSOSessionProvider(BaseProvider):
                 cause=e,
             ) from e
 
-    def _list_account_roles(self, account_id: str) -> list[str]:
-        """특정 계정에서 사용 가능한 역할 목록을 조회합니다.
+    def _discover_accounts(self) -> dict[str, AccountInfo]:
+        """계정 목록과 계정별 역할을 조회하여 메모리/파일 캐시에 저장합니다.
+
+        역할 조회가 하나라도 실패하면 불완전한 목록이 다음 프로세스까지 남지 않도록
+        파일 캐시에는 저장하지 않습니다.
+
+        Returns:
+            {account_id: AccountInfo} 딕셔너리 (ListAccounts 순서)
+
+        Raises:
+            ClientError: ListAccounts 호출 실패 시
+        """
+        access_token = self._access_token
+        assert access_token is not None, "인증이 필요합니다"
+
+        account_list: list[dict[str, Any]] = []
+        paginator = self._sso_client.get_paginator("list_accounts")
+        for page in paginator.paginate(accessToken=access_token):
+            # Convert TypedDict to regular dict
+            account_list.extend(dict(account) for account in page.get("accountList", []))
+
+        account_ids = [str(acct.get("accountId", "")) for acct in account_list]
+        roles_by_account = self._fetch_roles_parallel(account_ids)
+
+        accounts = {}
+        for acct, account_id in zip(account_list, account_ids, strict=True):
+            email_value = acct.get("emailAddress")
+            accounts[account_id] = AccountInfo(
+                id=account_id,
+                name=str(acct.get("accountName", f"account-{account_id}")),
+                email=str(email_value) if email_value else None,
+                roles=roles_by_account.get(account_id) or [],
+            )
+
+        # 캐시 저장
+        self._account_cache.set_all(accounts)
+        if all(roles is not None for roles in roles_by_account.values()):
+            try:
+                self._account_file_cache.save(access_token, accounts)
+            except Exception as e:
+                logger.debug(f"계정 파일 캐시 저장 실패: {e}")
+
+        return accounts
+
+    def _fetch_roles_parallel(self, account_ids: list[str]) -> dict[str, list[str] | None]:
+        """계정별 역할 목록을 제한된 스레드 풀에서 병렬 조회합니다.
+
+        Args:
+            account_ids: AWS 계정 ID 목록
+
+        Returns:
+            {account_id: 역할 이름 리스트 또는 None (조회 실패)}
+        """
+        workers = min(max(self._config.role_discovery_workers, 1), len(account_ids))
+        if workers <= 1:
+            return {account_id: self._fetch_account_roles(account_id) for account_id in account_ids}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sso-roles") as pool:
+            return dict(zip(account_ids, pool.map(self._fetch_account_roles, account_ids), strict=True))
+
+    def _start_account_refresh(self) -> None:
+        """백그라운드 계정 목록 갱신 시작 (이미 실행 중이면 무시)"""
+        with self._account_refresh_lock:
+            if self._account_refresh_thread is not None and self._account_refresh_thread.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._refresh_accounts_in_background,
+                name=f"sso-account-refresh-{self._name}",
+                daemon=True,
+            )
+            self._account_refresh_thread = thread
+        thread.start()
+
+    def _refresh_accounts_in_background(self) -> None:
+        """계정 목록을 다시 조회하여 메모리/파일 캐시 갱신 (실패는 무시)"""
+        try:
+            accounts = self._discover_accounts()
+            logger.debug(f"계정 목록 백그라운드 갱신 완료: {len(accounts)}개")
+        except Exception as e:
+            logger.debug(f"계정 목록 백그라운드 갱신 실패: {e}")
+
+    def _call_sso(self, operation: str, **kwargs: Any) -> Any:
+        """SSO 포털 API 호출 ("sso" Rate limit 적용, 쓰로틀링 시 재시도)
+
+        SSO 포털 API는 대상 서비스와 별개로 쓰로틀링되므로
+        (세션, SSO 리전, "sso") 단위 limiter를 공유합니다.
+
+        Args:
+            operation: sso client 메서드명 (예: "list_account_roles")
+            **kwargs: API 파라미터
+
+        Returns:
+            API 응답
+        """
+        limiter = get_scoped_rate_limiter(self._name, self._config.region, "sso")
+        attempt = 1
+        while True:
+            limiter.acquire()
+            try:
+                response = getattr(self._sso_client, operation)(**kwargs)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code", "") not in THROTTLING_ERROR_CODES:
+                    raise
+                limiter.on_throttle()
+                if attempt >= SSO_MAX_ATTEMPTS:
+                    raise
+                attempt += 1
+                continue
+            limiter.on_success()
+            return response
+
+    def _fetch_account_roles(self, account_id: str) -> list[str] | None:
+        """특정 계정의 역할 목록을 페이지 단위로 조회합니다.
 
         Args:
             account_id: AWS 계정 ID
 
         Returns:
-            역할 이름 리스트 (API 실패 시 빈 리스트)
+            역할 이름 리스트 또는 None (API 실패)
         """
         if self._access_token is None:
-            return []
+            return None
+        roles: list[str] = []
+        params: dict[str, Any] = {"accessToken": self._access_token, "accountId": account_id}
         try:
-            response = self._sso_client.list_account_roles(
-                accessToken=self._access_token,
-                accountId=account_id,
-            )
-            # Convert TypedDict role entries to strings
-            return [str(dict(role).get("roleName", "")) for role in response.get("roleList", [])]
-        except Exception:
-            return []  # Return empty list on API failure
+            while True:
+                response = self._call_sso("list_account_roles", **params)
+                # Convert TypedDict role entries to strings
+                roles.extend(str(dict(role).get("roleName", "")) for role in response.get("roleList", []))
+                next_token = response.get("nextToken")
+                if not next_token:
+                    return roles
+                params["nextToken"] = next_token
+        except Exception as e:
+            logger.debug(f"역할 목록 조회 실패 ({account_id}): {e}")
+            return None
 
     def supports_multi_account(self) -> bool:
         """멀티 계정 지원 여부를 반환합니다.
@@ -76,7 +76,7 @@ def get_version() -> str:
 VERSION = get_version()
 
 # 유틸리티 명령어 목록 (서비스 명령어와 분리 표시용)
-UTILITY_COMMANDS = {"tools", "group", "fav", "all", "service", "purpose", "category"}
+UTILITY_COMMANDS = {"tools", "group", "fav", "pricing", "all", "service", "purpose", "category"}
 
 
 class GroupedCommandsGroup(click.Group):
@@ -1171,6 +1171,131 @@ def fav_clear(yes: bool) -> None:
     console.print(f"[green]{t('cli.fav_cleared')}[/green]")
 
 
+# =============================================================================
+# 가격 DB 명령어
+# =============================================================================
+
+
+@cli.group("pricing")
+def pricing_cmd():
+    """로컬 가격 DB 관리
+
+    \b
+    AWS Bulk Price List offer 파일을 로컬 DB에 적재하면
+    비용 계산 시 Pricing API 호출 없이 DB에서 단가를 조회합니다.
+
+    \b
+    Examples:
+        aa pricing sync -r ap-northeast-2              # offer 파일 다운로드 후 적재
+        aa pricing sync -r us-east-1 -s ec2 -s ebs     # 일부 서비스만 적재
+        aa pricing sync --source ./offers              # 내려받은 offer 파일 적재
+        aa pricing status                              # 적재 현황
+    """
+    pass
+
+
+@pricing_cmd.command("sync")
+@click.option(
+    "--source",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="offer 파일(*.json) 디렉토리 (미지정 시 다운로드)",
+)
+@click.option("-r", "--region", "regions", multiple=True, help="대상 리전 (여러 번 지정 가능)")
+@click.option("-s", "--service", "services", multiple=True, help="대상 서비스 (예: ec2, ebs / 기본: 전체)")
+def pricing_sync(source: Path | None, regions: tuple[str, ...], services: tuple[str, ...]) -> None:
+    """offer 파일을 로컬 가격 DB에 적재
+
+    \b
+    Examples:
+        aa pricing sync -r ap-northeast-2 -r us-east-1
+        aa pricing sync --source ./offers -s ec2
+    """
+    from rich.console import Console
+    from rich.table import Table
+
+    from core.shared.aws.pricing.price_db import sync_price_db
+
+    console = Console()
+
+    if source is None and not regions:
+        console.print(f"[red]{t('cli.pricing_no_source')}[/red]")
+        raise SystemExit(1)
+
+    try:
+        results = sync_price_db(
+            source=source,
+            regions=list(regions) or None,
+            services=list(services) or None,
+            progress=lambda message: console.print(f"[dim]{message}[/dim]"),
+        )
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1) from None
+
+    if not results:
+        console.print(f"[yellow]{t('cli.pricing_sync_empty')}[/yellow]")
+        return
+
+    table = Table(title=t("cli.pricing_db_title"), show_header=True)
+    table.add_column(t("cli.col_offer"), style="#FF9900")
+    table.add_column(t("cli.col_region"), style="white")
+    table.add_column(t("cli.col_sku_count"), style="yellow", justify="right")
+
+    for result in results:
+        table.add_row(result.offer_code, result.region or "global", f"{result.sku_count:,}")
+
+    console.print(table)
+    console.print(f"[green]{t('cli.pricing_sync_done', count=len(results))}[/green]")
+
+
+@pricing_cmd.command("status")
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="JSON 형식으로 출력",
+)
+def pricing_status(as_json: bool) -> None:
+    """로컬 가격 DB 적재 현황"""
+    import json as json_module
+
+    from rich.console import Console
+    from rich.table import Table
+
+    from core.shared.aws.pricing.price_db import PriceDatabase
+
+    console = Console()
+    offers = PriceDatabase().offers()
+
+    if as_json:
+        click.echo(json_module.dumps(offers, ensure_ascii=False, indent=2))
+        return
+
+    if not offers:
+        console.print(f"[dim]{t('cli.pricing_db_empty')}[/dim]")
+        console.print(f"[dim]{t('cli.pricing_sync_hint')}[/dim]")
+        return
+
+    table = Table(title=t("cli.pricing_db_title"), show_header=True)
+    table.add_column(t("cli.col_offer"), style="#FF9900")
+    table.add_column(t("cli.col_region"), style="white")
+    table.add_column(t("cli.col_sku_count"), style="yellow", justify="right")
+    table.add_column(t("cli.col_publication_date"), style="dim")
+    table.add_column(t("cli.col_synced_at"), style="dim")
+
+    for offer in offers:
+        table.add_row(
+            offer["offer_code"],
+            offer["region"] or "global",
+            f"{offer['sku_count']:,}",
+            offer.get("publication_date") or "-",
+            offer.get("synced_at") or "-",
+        )
+
+    console.print(table)
+
+
 def _register_category_commands():
     """discovery 기반 카테고리 명령어 자동 등록 (별칭, 하위 서비스 포함)
 
@@ -311,12 +311,16 @@ class FlowRunner:
             # 타임라인 phases 결정 (빈 리스트면 timeline 없이 실행)
             phases = _build_phases(tool)
 
-            if not phases:
-                # 대화형/메뉴 도구: timeline 없이 바로 실행
-                ctx.result = run_fn(ctx)
-            else:
-                # 타임라인 래핑 실행
-                self._execute_with_timeline(ctx, run_fn, phases)
+            from core.parallel.describe_store import describe_store_scope
+
+            # 실행 동안 describe 응답 공유 (같은 목록 중복 조회 방지)
+            with describe_store_scope():
+                if not phases:
+                    # 대화형/메뉴 도구: timeline 없이 바로 실행
+                    ctx.result = run_fn(ctx)
+                else:
+                    # 타임라인 래핑 실행
+                    self._execute_with_timeline(ctx, run_fn, phases)
 
         except Exception as e:
             ctx._timeline = None
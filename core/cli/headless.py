@@ -439,7 +439,11 @@ class HeadlessRunner:
             console.print(f"[red]{t('flow.tool_no_run_function')}[/red]")
             return 1
 
-        self._ctx.result = run_fn(self._ctx)
+        from core.parallel.describe_store import describe_store_scope
+
+        # 실행 동안 describe 응답 공유 (같은 목록 중복 조회 방지)
+        with describe_store_scope():
+            self._ctx.result = run_fn(self._ctx)
 
         return 0
 
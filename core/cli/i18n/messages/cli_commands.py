@@ -412,4 +412,48 @@ CLI_MESSAGES = {
         "ko": "관리: aa fav list | aa fav add <path> | aa fav rm <number>",
         "en": "Manage: aa fav list | aa fav add <path> | aa fav rm <number>",
     },
+    "pricing_no_source": {
+        "ko": "오류: --source 또는 -r/--region 중 하나는 지정해야 합니다.",
+        "en": "Error: Specify either --source or -r/--region.",
+    },
+    "pricing_sync_empty": {
+        "ko": "적재할 offer 데이터가 없습니다.",
+        "en": "No offer data to sync.",
+    },
+    "pricing_sync_done": {
+        "ko": "{count}개 offer를 로컬 가격 DB에 적재했습니다.",
+        "en": "Synced {count} offers into the local price database.",
+    },
+    "pricing_db_empty": {
+        "ko": "로컬 가격 DB가 비어 있습니다. (Pricing API 사용)",
+        "en": "Local price database is empty. (Using Pricing API)",
+    },
+    "pricing_sync_hint": {
+        "ko": "적재: aa pricing sync -r <region> 또는 aa pricing sync --source <dir>",
+        "en": "Sync: aa pricing sync -r <region> or aa pricing sync --source <dir>",
+    },
+    "pricing_db_title": {
+        "ko": "로컬 가격 DB",
+        "en": "Local Price Database",
+    },
+    "col_offer": {
+        "ko": "Offer",
+        "en": "Offer",
+    },
+    "col_region": {
+        "ko": "리전",
+        "en": "Region",
+    },
+    "col_sku_count": {
+        "ko": "SKU 수",
+        "en": "SKUs",
+    },
+    "col_publication_date": {
+        "ko": "게시일",
+        "en": "Published",
+    },
+    "col_synced_at": {
+        "ko": "적재 시각",
+        "en": "Synced At",
+    },
 }
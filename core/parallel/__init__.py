@@ -6,7 +6,14 @@ core/parallel - 병렬 처리 모듈
 주요 구성 요소:
 - ParallelSessionExecutor: Map-Reduce 패턴 병렬 실행기
 - parallel_collect: 간편한 병렬 수집 함수
+- parallel_collect_many: 여러 수집 작업을 하나의 작업 큐로 병렬 수집
+- parallel_stream: 결과를 완료 순서대로 내보내는 스트리밍 수집 (메모리 고정)
+- scope="account" / "org": 글로벌 서비스용 계정당 1개 / 전체 1개 태스크
 - TokenBucketRateLimiter: API 쓰로틀링 방지
+- AdaptiveRateLimiter / install_rate_limit_hooks: API 호출 단위 (계정, 리전, 서비스)별 AIMD Rate limit
+- ClientPool: 자격증명/서비스/리전별 boto3 client 재사용
+- describe_pages / describe_store_scope: 실행 단위 describe 응답 공유 (single-flight, 읽기 전용)
+- CredentialPrefetcher: SSO 계정 자격증명 선행 획득 (executor가 SSO 실행 시 자동 사용)
 
 Example (권장 - parallel_collect):
     from core.parallel import parallel_collect
@@ -47,7 +54,16 @@ Example (상세 제어 - Executor):
 """
 
 from .client import get_client
+from .client_pool import ClientPool, ClientPoolStats, get_client_pool, reset_client_pool
+from .credential_prefetch import CredentialPrefetcher, CredentialPrefetchStats
 from .decorators import RetryConfig
+from .describe_store import (
+    DescribeStore,
+    DescribeStoreStats,
+    describe_pages,
+    describe_store_scope,
+    get_describe_store,
+)
 from .errors import (
     CollectedError,
     ErrorCollector,
@@ -55,14 +71,32 @@ from .errors import (
     safe_collect,
     try_or_default,
 )
-from .executor import ParallelConfig, ParallelSessionExecutor, parallel_collect
+from .executor import (
+    GLOBAL_SERVICE_REGIONS,
+    TASK_SCOPES,
+    CollectJob,
+    ParallelConfig,
+    ParallelSessionExecutor,
+    global_service_region,
+    parallel_collect,
+    parallel_collect_many,
+    parallel_stream,
+)
 from .quiet import is_quiet, quiet_mode, set_quiet
 from .rate_limiter import (
+    AdaptiveRateLimiter,
     RateLimiterConfig,
     TokenBucketRateLimiter,
     get_rate_limiter,
     reset_rate_limiters,
 )
+from .request_limiter import (
+    THROTTLING_ERROR_CODES,
+    get_scoped_rate_limiter,
+    install_rate_limit_hooks,
+    rate_limit_scope,
+    reset_scoped_rate_limiters,
+)
 from .types import ErrorCategory, ParallelExecutionResult, TaskError, TaskResult
 
 __all__: list[str] = [
@@ -70,8 +104,27 @@ __all__: list[str] = [
     "ParallelSessionExecutor",
     "ParallelConfig",
     "parallel_collect",
+    "parallel_collect_many",
+    "parallel_stream",
+    "CollectJob",
+    "TASK_SCOPES",
+    "GLOBAL_SERVICE_REGIONS",
+    "global_service_region",
     # Client (retry 적용)
     "get_client",
+    "ClientPool",
+    "ClientPoolStats",
+    "get_client_pool",
+    "reset_client_pool",
+    # Describe 응답 저장소
+    "DescribeStore",
+    "DescribeStoreStats",
+    "describe_pages",
+    "describe_store_scope",
+    "get_describe_store",
+    # 자격증명 선행 획득
+    "CredentialPrefetcher",
+    "CredentialPrefetchStats",
     # Decorators
     "RetryConfig",
     # Error handling
@@ -89,6 +142,13 @@ __all__: list[str] = [
     "RateLimiterConfig",
     "get_rate_limiter",
     "reset_rate_limiters",
+    "AdaptiveRateLimiter",
+    # Request 단위 Rate Limiter
+    "get_scoped_rate_limiter",
+    "install_rate_limit_hooks",
+    "rate_limit_scope",
+    "reset_scoped_rate_limiters",
+    "THROTTLING_ERROR_CODES",
     # Types
     "ErrorCategory",
     "TaskError",
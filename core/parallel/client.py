@@ -3,9 +3,11 @@ core/parallel/client.py - boto3 client 생성 헬퍼
 
 타임아웃 + 연결 풀이 설정된 boto3 client를 생성합니다.
 botocore 자체 재시도는 비활성화하고, 앱 레벨 재시도(executor)만 사용합니다.
+생성된 client는 전역 client 풀(client_pool)에 보관되어 같은 자격증명/서비스/리전/설정
+조합에서 재사용되며, 요청 단위 Rate limit 훅(request_limiter)이 등록됩니다.
 
 주요 구성 요소:
-- get_client: retry 설정이 적용된 boto3 client 생성
+- get_client: retry 설정이 적용된 boto3 client 생성 (풀 재사용)
 
 Example:
     from core.parallel.client import get_client
@@ -40,6 +42,8 @@ def get_client(
     connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
     read_timeout: int = DEFAULT_READ_TIMEOUT,
     max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+    pooled: bool = True,
+    rate_limited: bool = True,
     **kwargs: Any,
 ) -> Any:
     """Retry가 적용된 boto3 client 생성
@@ -53,6 +57,9 @@ def get_client(
         connect_timeout: 연결 타임아웃 (초)
         read_timeout: 읽기 타임아웃 (초)
         max_pool_connections: HTTP 연결 풀 크기 (기본: 25, max_workers 이상 권장)
+        pooled: True면 전역 client 풀에서 재사용 (기본: True)
+        rate_limited: True면 API 호출마다 (계정, 리전, 서비스) limiter 적용 (기본: True).
+            계정은 현재 스레드의 rate_limit_scope (executor 작업 계정)를 사용합니다.
         **kwargs: session.client()에 전달할 추가 인자
 
     Returns:
@@ -78,11 +85,23 @@ def get_client(
         existing = kwargs.pop("config")
         config = config.merge(existing)
 
-    # session.client은 문자열 서비스명을 받지만 boto3-stubs는 Literal 타입 요구
-    # cast to Any to bypass boto3-stubs Literal type requirements
-    return session.client(  # pyright: ignore[reportCallIssue]
-        cast(Any, service_name),
-        region_name=region_name,
-        config=config,
-        **kwargs,
-    )
+    if pooled:
+        from .client_pool import get_client_pool
+
+        client = get_client_pool().get(session, service_name, region_name, config=config, **kwargs)
+    else:
+        # session.client은 문자열 서비스명을 받지만 boto3-stubs는 Literal 타입 요구
+        # cast to Any to bypass boto3-stubs Literal type requirements
+        client = session.client(  # pyright: ignore[reportCallIssue]
+            cast(Any, service_name),
+            region_name=region_name,
+            config=config,
+            **kwargs,
+        )
+
+    if rate_limited:
+        from .request_limiter import get_current_account, install_rate_limit_hooks
+
+        install_rate_limit_hooks(getattr(getattr(client, "meta", None), "events", None), get_current_account())
+
+    return client
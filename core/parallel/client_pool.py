@@ -0,0 +1,362 @@
+"""
+core/parallel/client_pool.py - boto3 client 풀
+
+동일한 자격증명/서비스/리전/설정 조합의 boto3 client를 재사용합니다.
+
+병렬 수집에서는 작업마다 새 boto3 Session이 만들어지므로, 같은 계정+리전의
+``ec2``/``cloudwatch`` client가 수십 번 생성됩니다. client 생성은 서비스 모델 로딩과
+urllib3 연결 풀 생성을 포함하므로 비용이 큽니다. 풀은 Session 객체가 아닌
+자격증명 식별값(access key + secret/token 해시)을 키로 사용하므로, 서로 다른 Session
+이라도 같은 자격증명이면 client를 공유합니다. (boto3 client는 thread-safe)
+
+주요 구성 요소:
+- ClientPool: Thread-safe client 풀 (LRU + 자격증명 만료 기반 제거)
+- ClientPoolStats: hit/miss/eviction 통계
+- get_client_pool: 프로세스 전역 풀 (싱글톤)
+- reset_client_pool: 전역 풀 초기화
+
+Example:
+    from core.parallel.client_pool import get_client_pool
+
+    pool = get_client_pool()
+    ec2 = pool.get(session, "ec2", "ap-northeast-2", config=config)
+
+    print(pool.stats)  # ClientPoolStats(hits=..., misses=..., ...)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+# 기본 설정
+DEFAULT_MAX_SIZE = 512  # 최대 보관 client 수 (초과 시 LRU 제거)
+DEFAULT_MAX_AGE_SECONDS = 1800  # 만료 시간을 알 수 없는 자격증명의 최대 보관 시간 (CredentialsCache TTL과 동일)
+DEFAULT_EXPIRY_BUFFER_SECONDS = 300  # 자격증명 만료 전 미리 제거하는 여유 시간
+
+# (자격증명 식별값, 서비스, 리전, 설정 키)
+PoolKey = tuple[str, str, str, str]
+
+
+@dataclass(frozen=True)
+class ClientPoolStats:
+    """Client 풀 통계
+
+    Attributes:
+        hits: 기존 client 재사용 횟수
+        misses: 새 client 생성 횟수
+        evictions: 만료/LRU로 제거된 client 수
+        bypassed: 자격증명 식별 불가로 풀을 거치지 않은 생성 횟수
+        size: 현재 보관 중인 client 수
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bypassed: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """재사용 비율 (0.0~1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _PoolEntry:
+    """풀 항목
+
+    Attributes:
+        client: boto3 client
+        created_at: 생성 시각 (monotonic)
+        expires_at: 자격증명 만료 시각 (UTC, 알 수 없으면 None)
+    """
+
+    client: Any
+    created_at: float
+    expires_at: datetime | None = None
+
+
+class ClientPool:
+    """Thread-safe boto3 client 풀
+
+    - 키: (자격증명 식별값, 서비스, 리전, client 설정)
+    - 제거 조건: 자격증명 만료 임박, 최대 보관 시간 초과, 최대 개수 초과(LRU)
+    - 동일 키에 대한 동시 생성은 한 번만 수행 (single-flight)
+
+    Example:
+        pool = ClientPool(max_size=256)
+        ec2 = pool.get(session, "ec2", "ap-northeast-2")
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        expiry_buffer_seconds: float = DEFAULT_EXPIRY_BUFFER_SECONDS,
+    ):
+        """초기화
+
+        Args:
+            max_size: 최대 보관 client 수
+            max_age_seconds: client 최대 보관 시간 (초)
+            expiry_buffer_seconds: 자격증명 만료 전 제거 여유 시간 (초)
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+
+        self.max_size = max_size
+        self.max_age_seconds = max_age_seconds
+        self.expiry_buffer_seconds = expiry_buffer_seconds
+
+        self._entries: OrderedDict[PoolKey, _PoolEntry] = OrderedDict()
+        self._creating: dict[PoolKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bypassed = 0
+
+    def get(
+        self,
+        session: boto3.Session,
+        service_name: str,
+        region_name: str | None = None,
+        config: Config | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """풀에서 client를 조회하거나 생성
+
+        자격증명을 식별할 수 없는 Session(자격증명 없음, mock 등)은 풀을 거치지 않고
+        매번 새 client를 생성합니다.
+
+        Args:
+            session: boto3 Session
+            service_name: AWS 서비스 이름
+            region_name: 리전 (None이면 세션 기본값)
+            config: botocore Config
+            **kwargs: session.client()에 전달할 추가 인자
+
+        Returns:
+            boto3 client
+        """
+        region = region_name or session.region_name or ""
+
+        def factory() -> Any:
+            return session.client(service_name, region_name=region_name, config=config, **kwargs)
+
+        identity = _credential_identity(session)
+        if identity is None:
+            with self._lock:
+                self._bypassed += 1
+            return factory()
+
+        credential_key, expires_at = identity
+        key: PoolKey = (credential_key, service_name, region, _config_key(config, kwargs))
+        return self._get_or_create(key, factory, expires_at)
+
+    def _get_or_create(
+        self,
+        key: PoolKey,
+        factory: Callable[[], Any],
+        expires_at: datetime | None,
+    ) -> Any:
+        """키에 해당하는 client 반환 (없으면 single-flight로 생성)"""
+        with self._lock:
+            client = self._lookup(key)
+            if client is not None:
+                return client
+            key_lock = self._creating.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # 대기 중 다른 스레드가 생성했을 수 있음
+            with self._lock:
+                client = self._lookup(key)
+                if client is not None:
+                    return client
+
+            try:
+                client = factory()
+            except BaseException:
+                with self._lock:
+                    self._creating.pop(key, None)
+                raise
+
+            # 저장과 생성 중 표시 제거를 같은 임계 구역에서 수행
+            # (사이에 들어온 스레드가 항목도 생성 중 표시도 없다고 보고 중복 생성하지 않도록)
+            with self._lock:
+                self._misses += 1
+                self._entries[key] = _PoolEntry(client=client, created_at=time.monotonic(), expires_at=expires_at)
+                self._creating.pop(key, None)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+            return client
+
+    def _lookup(self, key: PoolKey) -> Any | None:
+        """유효한 client 조회 (락 내에서 호출)
+
+        만료된 항목은 제거하고 None을 반환합니다.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_expired(entry):
+            del self._entries[key]
+            self._evictions += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.client
+
+    def _is_expired(self, entry: _PoolEntry) -> bool:
+        """항목 만료 여부 (자격증명 만료 임박 또는 최대 보관 시간 초과)"""
+        if time.monotonic() - entry.created_at >= self.max_age_seconds:
+            return True
+        if entry.expires_at is not None:
+            remaining = (entry.expires_at - datetime.now(timezone.utc)).total_seconds()
+            return remaining <= self.expiry_buffer_seconds
+        return False
+
+    def evict_expired(self) -> int:
+        """만료된 client를 모두 제거
+
+        Returns:
+            제거된 client 수
+        """
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if self._is_expired(entry)]
+            for key in expired:
+                del self._entries[key]
+            self._evictions += len(expired)
+            return len(expired)
+
+    def clear(self) -> None:
+        """모든 client와 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._bypassed = 0
+
+    @property
+    def stats(self) -> ClientPoolStats:
+        """현재 풀 통계"""
+        with self._lock:
+            return ClientPoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                bypassed=self._bypassed,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _credential_identity(session: boto3.Session) -> tuple[str, datetime | None] | None:
+    """Session 자격증명의 식별값과 만료 시각 추출
+
+    access key와 secret/token 해시를 조합하여 식별값을 만들고, 원문 비밀값은 키에
+    보관하지 않습니다. RefreshableCredentials(AssumeRole 프로파일 등)는 만료 시각도 반환합니다.
+
+    Args:
+        session: boto3 Session
+
+    Returns:
+        (식별값, 만료 시각) 또는 None (자격증명이 없거나 식별 불가)
+    """
+    try:
+        credentials = session.get_credentials()
+    except Exception as e:
+        logger.debug(f"자격증명 조회 실패, client 풀 미사용: {e}")
+        return None
+    return _credentials_identity(credentials)
+
+
+def _credentials_identity(credentials: Any) -> tuple[str, datetime | None] | None:
+    """botocore Credentials 객체의 식별값과 만료 시각 추출
+
+    Args:
+        credentials: botocore Credentials (Session 또는 client 서명기에서 조회)
+
+    Returns:
+        (식별값, 만료 시각) 또는 None (자격증명이 없거나 식별 불가)
+    """
+    if credentials is None:
+        return None
+    try:
+        frozen = credentials.get_frozen_credentials()
+    except Exception as e:
+        logger.debug(f"자격증명 조회 실패: {e}")
+        return None
+
+    access_key = frozen.access_key
+    if not isinstance(access_key, str) or not access_key:
+        return None
+
+    secret_part = f"{frozen.secret_key or ''}:{frozen.token or ''}"
+    digest = hashlib.sha256(secret_part.encode("utf-8")).hexdigest()[:16]
+
+    expires_at = getattr(credentials, "_expiry_time", None)
+    if not isinstance(expires_at, datetime):
+        expires_at = None
+    elif expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+
+    return f"{access_key}:{digest}", expires_at
+
+
+def _config_key(config: Config | None, kwargs: dict[str, Any]) -> str:
+    """client 설정을 풀 키 문자열로 변환"""
+    options: dict[str, Any] = getattr(config, "_user_provided_options", {}) if config is not None else {}
+    return repr((sorted(options.items()), sorted(kwargs.items())))
+
+
+# =============================================================================
+# 전역 풀
+# =============================================================================
+
+_client_pool: ClientPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ClientPool:
+    """프로세스 전역 client 풀 반환 (싱글톤)
+
+    Returns:
+        ClientPool 인스턴스
+    """
+    global _client_pool
+    with _pool_lock:
+        if _client_pool is None:
+            _client_pool = ClientPool()
+        return _client_pool
+
+
+def reset_client_pool() -> None:
+    """전역 client 풀 초기화
+
+    테스트 또는 자격증명 전환 후 기존 client를 모두 버려야 할 때 사용합니다.
+    """
+    global _client_pool
+    with _pool_lock:
+        _client_pool = None
@@ -0,0 +1,186 @@
+"""
+core/parallel/credential_prefetch.py - 자격증명 선행 획득 파이프라인
+
+SSO Session 멀티 계정 실행에서 각 작업의 session_getter는 캐시 미스 시
+``get_role_credentials`` 를 워커 슬롯 안에서 호출합니다. 계정이 많으면 첫 웨이브의
+워커 전체가 자격증명 대기로 묶이고, 같은 계정의 리전 작업들이 동시에 같은 자격증명을
+중복 요청합니다.
+
+CredentialPrefetcher는 작은 전용 스레드 풀로 다가올 계정의 자격증명을 작업 순서대로
+미리 획득합니다. 키(계정+역할)마다 한 번만 요청하며(single-flight), 서비스 워커는
+``wait()`` 로 자기 계정의 자격증명이 준비되기를 기다린 뒤 캐시에서 Session을 만듭니다.
+SSO Rate limit은 선행 획득 함수(provider의 ``"sso"`` limiter)가 그대로 적용합니다.
+
+선행 획득 실패는 삼키고 기록만 하며, 워커가 직접 session_getter를 호출하여
+원래와 같은 에러를 TaskResult로 보고합니다.
+
+주요 구성 요소:
+- CredentialPrefetcher: 키별 single-flight 선행 획득 풀
+- CredentialPrefetchStats: 요청/성공/실패/대기 통계
+
+Example:
+    from core.parallel.credential_prefetch import CredentialPrefetcher
+
+    with CredentialPrefetcher(max_workers=4) as prefetcher:
+        for account_id in account_ids:
+            prefetcher.schedule(account_id, lambda a=account_id: provider.prefetch_credentials(a, role))
+
+        # 워커 스레드
+        prefetcher.wait(account_id)
+        session = provider.get_session(account_id, role, region)  # 캐시 히트
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# 기본 선행 획득 워커 수 (SSO 포털 API limiter보다 조금 적게)
+DEFAULT_PREFETCH_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class CredentialPrefetchStats:
+    """자격증명 선행 획득 통계
+
+    Attributes:
+        scheduled: 선행 획득을 요청한 키 수
+        ready: 선행 획득에 성공한 키 수
+        failed: 선행 획득에 실패한 키 수 (워커가 직접 재시도)
+        waits: 워커가 준비되지 않은 자격증명을 기다린 횟수
+        wait_ms: 워커 대기 시간 합계 (ms)
+    """
+
+    scheduled: int = 0
+    ready: int = 0
+    failed: int = 0
+    waits: int = 0
+    wait_ms: float = 0.0
+
+
+class CredentialPrefetcher:
+    """키별 single-flight 자격증명 선행 획득 풀
+
+    - schedule(): 키마다 한 번만 획득 함수를 전용 풀에 제출 (제출 순서대로 실행)
+    - is_ready(): 키의 자격증명이 준비되었는지 (예약되지 않은 키는 항상 준비됨)
+    - wait(): 키의 선행 획득이 끝날 때까지 대기 (실패/취소는 무시)
+    - close(): 시작하지 않은 선행 획득을 취소 (실행 중인 획득은 기다리지 않음)
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_PREFETCH_WORKERS) -> None:
+        """초기화
+
+        Args:
+            max_workers: 선행 획득 전용 스레드 수 (1 이상)
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cred-prefetch")
+        self._futures: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+        self._ready = 0
+        self._failed = 0
+        self._waits = 0
+        self._wait_ms = 0.0
+
+    def schedule(self, key: str, fetch: Callable[[], Any]) -> None:
+        """키의 자격증명 선행 획득 예약 (이미 예약된 키는 무시)
+
+        Args:
+            key: 자격증명 식별 키 (예: "계정ID:역할")
+            fetch: 자격증명을 획득하여 캐시에 채우는 함수
+        """
+        with self._lock:
+            if key in self._futures:
+                return
+            future = self._pool.submit(fetch)
+            self._futures[key] = future
+
+        def on_done(done: Future[Any]) -> None:
+            self._on_done(key, done)
+
+        future.add_done_callback(on_done)
+
+    def _on_done(self, key: str, future: Future[Any]) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        with self._lock:
+            if error is None:
+                self._ready += 1
+            else:
+                self._failed += 1
+        if error is not None:
+            logger.debug(f"자격증명 선행 획득 실패 [{key}]: {error}")
+
+    def is_ready(self, key: str | None) -> bool:
+        """키의 자격증명이 준비되었는지 확인
+
+        Args:
+            key: 자격증명 식별 키 (None이면 항상 준비됨)
+
+        Returns:
+            선행 획득이 끝났거나 예약되지 않았으면 True
+        """
+        if key is None:
+            return True
+        with self._lock:
+            future = self._futures.get(key)
+        return future is None or future.done()
+
+    def wait(self, key: str | None) -> None:
+        """키의 선행 획득이 끝날 때까지 대기
+
+        실패나 취소는 호출자에게 전달하지 않습니다. 호출자는 이후 session_getter로
+        자격증명을 직접 획득하며, 그때의 에러가 작업 결과로 보고됩니다.
+
+        Args:
+            key: 자격증명 식별 키 (None이거나 예약되지 않았으면 즉시 반환)
+        """
+        if key is None:
+            return
+        with self._lock:
+            future = self._futures.get(key)
+        if future is None:
+            return
+
+        start = time.monotonic() if not future.done() else None
+        with suppress(Exception, CancelledError):
+            future.result()
+        if start is not None:
+            elapsed_ms = (time.monotonic() - start) * 1000
+            with self._lock:
+                self._waits += 1
+                self._wait_ms += elapsed_ms
+
+    def close(self) -> None:
+        """시작하지 않은 선행 획득을 취소하고 풀을 종료 (실행 중인 획득은 기다리지 않음)"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        logger.debug(f"자격증명 선행 획득: {self.stats}")
+
+    @property
+    def stats(self) -> CredentialPrefetchStats:
+        """현재 선행 획득 통계"""
+        with self._lock:
+            return CredentialPrefetchStats(
+                scheduled=len(self._futures),
+                ready=self._ready,
+                failed=self._failed,
+                waits=self._waits,
+                wait_ms=self._wait_ms,
+            )
+
+    def __enter__(self) -> CredentialPrefetcher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,316 @@
+"""
+core/parallel/describe_store.py - 실행 단위 describe 응답 저장소
+
+한 번의 실행(도구 실행, cost dashboard, 정기 작업 일괄 실행) 동안 같은
+계정+리전의 ``describe_*`` 목록 조회 결과를 공유합니다.
+
+``ec2/ebs_audit``, ``ec2/ami_audit``, ``ec2/snapshot_audit``, ``ec2/unused``, inventory,
+backup 수집기는 각자 ``describe_instances``/``describe_images``/``describe_snapshots``/
+``describe_volumes`` 를 페이지네이션합니다. 이들이 함께 실행되면 같은 목록을 여러 번
+조회하게 되므로, 저장소는 (자격증명 식별값, 서비스, 리전, 작업, 정규화된 파라미터)를
+키로 응답 페이지를 보관하고 동시에 들어온 동일 조회는 한 번만 수행합니다 (single-flight).
+
+공유되는 응답이 호출자 간에 오염되지 않도록 페이지는 읽기 전용 뷰
+(dict → MappingProxyType, list → tuple)로 반환됩니다.
+
+저장소는 ``describe_store_scope()`` 안에서만 활성화되며, scope 밖에서는
+``describe_pages()`` 가 매번 API를 호출합니다. scope는 중첩 시 바깥 저장소를 공유하고,
+가장 바깥 scope 종료 시 절감한 페이지 수를 로그로 남긴 뒤 비웁니다.
+
+주요 구성 요소:
+- DescribeStore: Thread-safe 응답 저장소 (single-flight)
+- DescribeStoreStats: hit/miss/페이지 절감 통계
+- describe_store_scope: 실행 단위 저장소 활성화 컨텍스트 매니저
+- describe_pages: 저장소를 거치는 페이지네이션 조회 (읽기 전용 페이지 반환)
+
+Example:
+    from core.parallel.describe_store import describe_pages, describe_store_scope
+
+    with describe_store_scope():
+        ec2 = get_client(session, "ec2", region_name=region)
+        for page in describe_pages(ec2, "describe_snapshots", OwnerIds=["self"]):
+            for snapshot in page.get("Snapshots", []):
+                ...
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Generator, Mapping
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from .client_pool import _credentials_identity
+
+logger = logging.getLogger(__name__)
+
+# (자격증명 식별값, 서비스, 리전, 작업, 정규화된 파라미터)
+DescribeKey = tuple[str, str, str, str, str]
+
+# 읽기 전용 응답 페이지 목록
+Pages = tuple[Mapping[str, Any], ...]
+
+
+@dataclass(frozen=True)
+class DescribeStoreStats:
+    """describe 저장소 통계
+
+    Attributes:
+        hits: 보관된 응답 재사용 횟수 (진행 중 조회 대기 포함)
+        misses: 실제 API 조회 횟수
+        pages_fetched: API로 가져온 페이지 수
+        pages_saved: 재사용으로 생략된 API 페이지 수
+        bypassed: 자격증명 식별 불가로 저장소를 거치지 않은 조회 횟수
+        size: 현재 보관 중인 조회 결과 수
+    """
+
+    hits: int = 0
+    misses: int = 0
+    pages_fetched: int = 0
+    pages_saved: int = 0
+    bypassed: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """재사용 비율 (0.0~1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class DescribeStore:
+    """Thread-safe describe 응답 저장소
+
+    - 키: (자격증명 식별값, 서비스, 리전, 작업, 정규화된 파라미터)
+    - 동일 키에 대한 동시 조회는 한 번만 수행 (single-flight)
+    - 조회 실패는 보관하지 않음 (대기 중이던 호출자에게는 같은 예외 전달)
+
+    Example:
+        store = DescribeStore()
+        pages = store.paginate(ec2, "describe_volumes")
+        print(store.stats.pages_saved)
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[DescribeKey, Pages] = {}
+        self._inflight: dict[DescribeKey, Future[Pages]] = {}
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._pages_fetched = 0
+        self._pages_saved = 0
+        self._bypassed = 0
+
+    def paginate(self, client: Any, operation: str, **params: Any) -> Pages:
+        """보관된 응답을 반환하거나 페이지네이션으로 조회
+
+        자격증명을 식별할 수 없는 client(mock 등)는 저장소를 거치지 않고 매번 조회합니다.
+
+        Args:
+            client: boto3 client
+            operation: 페이지네이션 가능한 작업명 (예: "describe_instances")
+            **params: paginate()에 전달할 파라미터
+
+        Returns:
+            읽기 전용 응답 페이지 목록
+        """
+        key = _describe_key(client, operation, params)
+        if key is None:
+            with self._lock:
+                self._bypassed += 1
+            return _fetch_pages(client, operation, params)
+
+        with self._lock:
+            pages = self._entries.get(key)
+            if pages is not None:
+                self._record_hit(pages)
+                return pages
+            future = self._inflight.get(key)
+            owner = future is None
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            # 다른 스레드가 조회 중 - 결과를 기다려 공유
+            pages = future.result()
+            with self._lock:
+                self._record_hit(pages)
+            return pages
+
+        try:
+            pages = _fetch_pages(client, operation, params)
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            self._entries[key] = pages
+            self._misses += 1
+            self._pages_fetched += len(pages)
+        future.set_result(pages)
+        return pages
+
+    def _record_hit(self, pages: Pages) -> None:
+        """재사용 통계 갱신 (락 내에서 호출)"""
+        self._hits += 1
+        self._pages_saved += len(pages)
+
+    def clear(self) -> None:
+        """보관된 응답과 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._pages_fetched = 0
+            self._pages_saved = 0
+            self._bypassed = 0
+
+    @property
+    def stats(self) -> DescribeStoreStats:
+        """현재 저장소 통계"""
+        with self._lock:
+            return DescribeStoreStats(
+                hits=self._hits,
+                misses=self._misses,
+                pages_fetched=self._pages_fetched,
+                pages_saved=self._pages_saved,
+                bypassed=self._bypassed,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _describe_key(client: Any, operation: str, params: dict[str, Any]) -> DescribeKey | None:
+    """client 자격증명/서비스/리전과 파라미터로 저장소 키 생성
+
+    Returns:
+        저장소 키 또는 None (자격증명 식별 불가)
+    """
+    signer = getattr(client, "_request_signer", None)
+    identity = _credentials_identity(getattr(signer, "_credentials", None))
+    if identity is None:
+        return None
+
+    meta = getattr(client, "meta", None)
+    service = getattr(getattr(meta, "service_model", None), "service_name", "")
+    region = getattr(meta, "region_name", "") or ""
+    if not isinstance(service, str) or not isinstance(region, str):
+        return None
+
+    normalized = {name: value for name, value in params.items() if value is not None}
+    params_key = json.dumps(normalized, sort_keys=True, default=str, separators=(",", ":"))
+    return identity[0], service, region, operation, params_key
+
+
+def _fetch_pages(client: Any, operation: str, params: dict[str, Any]) -> Pages:
+    """페이지네이션으로 전체 페이지를 읽어 읽기 전용으로 변환"""
+    paginator = client.get_paginator(operation)
+    return tuple(freeze(page) for page in paginator.paginate(**params))
+
+
+def freeze(value: Any) -> Any:
+    """응답 구조를 읽기 전용 뷰로 변환 (dict → MappingProxyType, list → tuple)
+
+    Args:
+        value: boto3 응답 값
+
+    Returns:
+        읽기 전용으로 변환된 값 (스칼라는 그대로)
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+# =============================================================================
+# 실행 단위 저장소
+# =============================================================================
+
+_active_store: DescribeStore | None = None
+_scope_depth = 0
+_scope_lock = threading.Lock()
+
+
+def get_describe_store() -> DescribeStore | None:
+    """현재 활성화된 저장소 반환
+
+    Returns:
+        describe_store_scope() 안이면 DescribeStore, 아니면 None
+    """
+    with _scope_lock:
+        return _active_store
+
+
+@contextmanager
+def describe_store_scope() -> Generator[DescribeStore, None, None]:
+    """실행 단위 describe 저장소 활성화
+
+    scope 안에서는 모든 스레드의 describe_pages() 호출이 같은 저장소를 공유합니다.
+    중첩된 scope는 바깥 저장소를 그대로 사용하며, 가장 바깥 scope 종료 시
+    절감한 페이지 수를 기록하고 저장소를 비웁니다.
+
+    Yields:
+        활성화된 DescribeStore
+    """
+    global _active_store, _scope_depth
+    with _scope_lock:
+        if _active_store is None:
+            _active_store = DescribeStore()
+        store = _active_store
+        _scope_depth += 1
+
+    try:
+        yield store
+    finally:
+        with _scope_lock:
+            _scope_depth -= 1
+            outermost = _scope_depth == 0
+            if outermost:
+                _active_store = None
+
+        if outermost:
+            stats = store.stats
+            if stats.pages_saved:
+                logger.info(f"describe 응답 재사용: {stats.hits}회, API 페이지 {stats.pages_saved}개 절감")
+            logger.debug(f"describe 저장소: {stats}")
+            store.clear()
+
+
+def describe_pages(client: Any, operation: str, **params: Any) -> Pages:
+    """describe 작업의 전체 페이지를 조회 (활성 저장소가 있으면 공유)
+
+    반환된 페이지는 읽기 전용이므로 수정이 필요하면 복사해서 사용합니다.
+
+    Args:
+        client: boto3 client
+        operation: 페이지네이션 가능한 작업명 (예: "describe_instances")
+        **params: paginate()에 전달할 파라미터
+
+    Returns:
+        읽기 전용 응답 페이지 목록
+
+    Example:
+        ec2 = get_client(session, "ec2", region_name=region)
+        for page in describe_pages(ec2, "describe_volumes"):
+            for volume in page.get("Volumes", []):
+                ...
+    """
+    store = get_describe_store()
+    if store is None:
+        return _fetch_pages(client, operation, params)
+    return store.paginate(client, operation, **params)
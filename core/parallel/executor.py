@@ -8,6 +8,10 @@ ThreadPoolExecutor 기반이며, Rate limiting과 지수 백오프 재시도를
 - ParallelConfig: 병렬 실행 설정 (워커 수, 재시도, Rate limit)
 - ParallelSessionExecutor: 멀티 계정/리전 병렬 실행기
 - parallel_collect: 간편한 병렬 수집 래퍼 함수
+- CollectJob / parallel_collect_many: 여러 수집 작업을 하나의 작업 큐로 병렬 처리
+- parallel_stream: 완료 순서대로 결과를 내보내는 스트리밍 수집 (in-flight 상한으로 메모리 고정)
+- scope: 태스크 범위 ("region" 계정 x 리전, "account" 계정당 1개, "org" 전체 1개)
+- 자격증명 선행 획득: SSO 계정의 역할 자격증명을 전용 풀에서 미리 받아 워커는 준비된 세션부터 실행
 
 Example:
     from core.parallel import parallel_collect
@@ -18,20 +22,30 @@ Example:
 
     result = parallel_collect(ctx, collect_volumes, service="ec2")
     all_volumes = result.get_flat_data()
+
+    # 글로벌 서비스 (IAM, Route53 등): 계정당 1회, 파티션의 글로벌 엔드포인트 리전으로 호출
+    result = parallel_collect(ctx, collect_hosted_zones, service="route53", scope="account")
 """
 
 from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from core.region.availability import filter_service_regions, get_enabled_regions
+from core.region.data import DEFAULT_GLOBAL_REGION, PARTITIONS, get_global_region, requires_opt_in
 
+from .client_pool import get_client_pool
+from .credential_prefetch import DEFAULT_PREFETCH_WORKERS, CredentialPrefetcher
 from .decorators import RetryConfig, categorize_error, get_error_code, is_retryable
 from .quiet import is_quiet, set_quiet
 from .rate_limiter import RateLimiterConfig, TokenBucketRateLimiter
+from .request_limiter import install_rate_limit_hooks, rate_limit_scope
 from .types import ErrorCategory, ParallelExecutionResult, TaskError, TaskResult
 
 if TYPE_CHECKING:
@@ -44,6 +58,36 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# 스트리밍 실행 시 기본 in-flight 상한 (max_workers 배수)
+# 워커가 쉬지 않을 만큼만 미리 제출하고, 소비자가 늦으면 제출을 멈춤
+STREAM_WINDOW_FACTOR = 2
+
+# 태스크 범위
+# - region: 계정 x 리전 (리전 서비스, 기본값)
+# - account: 계정당 1개 (IAM, Route53, CloudFront, S3 버킷 목록 등 글로벌 서비스)
+# - org: 전체 1개 (관리 계정 기준 Organizations 조회 등)
+TASK_SCOPES = ("region", "account", "org")
+
+# 글로벌 서비스 엔드포인트 리전 집합 (region 범위 수집기의 중복 수집 가드용)
+GLOBAL_SERVICE_REGIONS = frozenset([DEFAULT_GLOBAL_REGION, *(region for _, _, region in PARTITIONS)])
+
+
+def global_service_region(regions: Sequence[str]) -> str:
+    """선택된 리전의 파티션에 맞는 글로벌 서비스 엔드포인트 리전 반환
+
+    Args:
+        regions: 컨텍스트 리전 목록 (첫 리전으로 파티션 판단, 비어 있으면 aws)
+
+    Returns:
+        us-east-1 (aws), us-gov-west-1 (aws-us-gov), cn-northwest-1 (aws-cn)
+    """
+    return get_global_region(regions[0]) if regions else DEFAULT_GLOBAL_REGION
+
+
+def _validate_scope(scope: str) -> None:
+    if scope not in TASK_SCOPES:
+        raise ValueError(f"scope must be one of {TASK_SCOPES}, got {scope!r}")
+
 
 def _clear_exception_chain(e: BaseException) -> None:
     """traceback + chained exception 메모리 누수 방지"""
@@ -62,19 +106,49 @@ class ParallelConfig:
         max_workers: 최대 동시 스레드 수 (1~100)
         retry_config: 재시도 설정
         rate_limiter_config: Rate limiter 설정
+        prune_regions: region 범위 작업에서 서비스 미제공 리전과
+            계정에서 비활성화된 옵트인 리전을 실행 전에 제외
+        credential_prefetch_workers: SSO 자격증명 선행 획득 전용 스레드 수 (0이면 비활성화)
     """
 
     max_workers: int = 20
     retry_config: RetryConfig | None = None
     rate_limiter_config: RateLimiterConfig | None = None
+    prune_regions: bool = True
+    credential_prefetch_workers: int = DEFAULT_PREFETCH_WORKERS
 
     def __post_init__(self) -> None:
         if self.max_workers < 1:
             raise ValueError(f"max_workers must be >= 1, got {self.max_workers}")
+        if self.credential_prefetch_workers < 0:
+            raise ValueError(f"credential_prefetch_workers must be >= 0, got {self.credential_prefetch_workers}")
         if self.max_workers > 100:
             self.max_workers = 100
 
 
+@dataclass
+class CollectJob:
+    """다중 작업 실행 시 개별 수집 작업 정의
+
+    ``execute_many`` / ``parallel_collect_many``에 전달하면 모든 작업의
+    (계정 x 리전) 태스크가 하나의 워커 풀에서 함께 실행됩니다.
+
+    Attributes:
+        name: 작업 식별자 (결과/콜백 키, 중복 불가)
+        func: (session, account_id, account_name, region) -> T 함수
+        service: AWS 서비스 이름 (rate limit용)
+        scope: 태스크 범위 ("region" | "account" | "org")
+    """
+
+    name: str
+    func: Callable[[boto3.Session, str, str, str], Any]
+    service: str = "default"
+    scope: str = "region"
+
+    def __post_init__(self) -> None:
+        _validate_scope(self.scope)
+
+
 @dataclass
 class _TaskSpec:
     """내부 작업 명세
@@ -86,12 +160,16 @@ class _TaskSpec:
         account_name: AWS 계정 이름 또는 프로파일명
         region: 대상 AWS 리전
         session_getter: boto3 Session을 반환하는 지연 팩토리 함수
+        credential_key: 자격증명 식별 키 (선행 획득 대상이 아니면 None)
+        credential_fetcher: 자격증명을 미리 획득하여 캐시에 채우는 함수 (선택)
     """
 
     account_id: str
     account_name: str
     region: str
     session_getter: Callable[[], boto3.Session]
+    credential_key: str | None = None
+    credential_fetcher: Callable[[], Any] | None = None
 
 
 class ParallelSessionExecutor:
@@ -136,11 +214,15 @@ class ParallelSessionExecutor:
         # 재시도 설정
         self._retry_config = self.config.retry_config or RetryConfig()
 
+        # 계정별 활성 리전 (None: 판단 불가) - 실행기 수명 동안 재사용
+        self._enabled_regions: dict[str, frozenset[str] | None] = {}
+
     def execute(
         self,
         func: Callable[[boto3.Session, str, str, str], T],
         service: str = "default",
         progress_tracker: ParallelTracker | None = None,
+        scope: str = "region",
     ) -> ParallelExecutionResult[T]:
         """작업 함수를 모든 세션에 병렬 실행
 
@@ -151,122 +233,542 @@ class ParallelSessionExecutor:
                 전달 시 자동으로:
                 1. set_total(task_count) 호출
                 2. 각 task 완료 시 on_complete(success) 호출
+            scope: 태스크 범위 ("region" | "account" | "org", ``_build_task_list`` 참고)
 
         Returns:
             ParallelExecutionResult[T]: 전체 실행 결과
         """
         # 작업 목록 생성
-        tasks = self._build_task_list()
+        tasks = self._build_task_list(scope, service)
 
         if not tasks:
             logger.warning("실행할 작업이 없습니다")
             return ParallelExecutionResult()
 
-        logger.info(f"병렬 실행 시작: {len(tasks)}개 작업, max_workers={self.config.max_workers}, service={service}")
+        logger.info(
+            f"병렬 실행 시작: {len(tasks)}개 작업, max_workers={self.config.max_workers}, "
+            f"service={service}, scope={scope}"
+        )
 
         # progress_tracker에 total 설정
         if progress_tracker:
             progress_tracker.set_total(len(tasks))
 
-        results: list[TaskResult[T]] = []
         start_time = time.monotonic()
 
+        # 모든 작업을 한 번에 제출 (in-flight 상한 = 작업 수, 자격증명 선행 획득 시에는 워커 수)
+        results = tuple(self._iter_task_results(func, tasks, service, progress_tracker, max_in_flight=len(tasks)))
+
+        total_time = (time.monotonic() - start_time) * 1000
+        exec_result = ParallelExecutionResult(results=results)
+
+        logger.info(
+            f"병렬 실행 완료: 성공 {exec_result.success_count}, 실패 {exec_result.error_count}, 총 {total_time:.0f}ms"
+        )
+        logger.debug(f"client 풀: {get_client_pool().stats}")
+
+        return exec_result
+
+    def execute_iter(
+        self,
+        func: Callable[[boto3.Session, str, str, str], T],
+        service: str = "default",
+        progress_tracker: ParallelTracker | None = None,
+        max_in_flight: int | None = None,
+        scope: str = "region",
+    ) -> Iterator[TaskResult[T]]:
+        """작업 함수를 모든 세션에 병렬 실행하고 결과를 완료 순서대로 내보냄
+
+        ``execute``는 모든 TaskResult를 모은 뒤 반환하므로 계정 x 리전 결과 전체가
+        메모리에 남습니다. 이 메서드는 제출된(실행 중 + 완료 후 미소비) 작업 수를
+        ``max_in_flight``로 제한하고, 결과를 하나 소비할 때마다 다음 작업을 제출합니다.
+        소비자가 결과를 기록하고 버리면 계정 수와 무관하게 최대 메모리가 일정합니다.
+
+        - progress_tracker 연동은 ``execute``와 동일합니다 (set_total / on_complete).
+        - 소비를 중단하면(break, 예외) 대기 중인 작업은 취소되고 실행 중인 작업만 마칩니다.
+
+        Args:
+            func: (session, account_id, account_name, region) -> T 함수
+            service: AWS 서비스 이름 (rate limit용, 로깅용)
+            progress_tracker: 진행 상황 추적기 (선택사항)
+            max_in_flight: 동시에 제출해 둘 최대 작업 수
+                (None이면 max_workers x STREAM_WINDOW_FACTOR)
+            scope: 태스크 범위 ("region" | "account" | "org")
+
+        Yields:
+            TaskResult[T]: 완료된 작업 결과 (완료 순서)
+
+        Example:
+            executor = ParallelSessionExecutor(ctx, ParallelConfig(max_workers=20))
+            for task_result in executor.execute_iter(collect_volumes, service="ec2"):
+                if task_result.success:
+                    writer.write_rows(task_result.data)  # 기록 후 결과 해제
+        """
+        window = max_in_flight if max_in_flight is not None else self.config.max_workers * STREAM_WINDOW_FACTOR
+        if window < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+
+        tasks = self._build_task_list(scope, service)
+
+        if not tasks:
+            logger.warning("실행할 작업이 없습니다")
+            return
+
+        logger.info(
+            f"스트리밍 병렬 실행 시작: {len(tasks)}개 작업, max_workers={self.config.max_workers}, "
+            f"max_in_flight={window}, service={service}, scope={scope}"
+        )
+
+        if progress_tracker:
+            progress_tracker.set_total(len(tasks))
+
+        start_time = time.monotonic()
+        success_count = error_count = 0
+
+        for result in self._iter_task_results(func, tasks, service, progress_tracker, max_in_flight=window):
+            if result.success:
+                success_count += 1
+            else:
+                error_count += 1
+            yield result
+
+        total_time = (time.monotonic() - start_time) * 1000
+        logger.info(f"스트리밍 병렬 실행 완료: 성공 {success_count}, 실패 {error_count}, 총 {total_time:.0f}ms")
+        logger.debug(f"client 풀: {get_client_pool().stats}")
+
+    def _iter_task_results(
+        self,
+        func: Callable[[boto3.Session, str, str, str], T],
+        tasks: list[_TaskSpec],
+        service: str,
+        progress_tracker: ParallelTracker | None,
+        max_in_flight: int,
+    ) -> Iterator[TaskResult[T]]:
+        """단일 작업 함수의 태스크를 ``_iter_job_results`` 로 실행하여 결과를 내보냄
+
+        Args:
+            func: (session, account_id, account_name, region) -> T 함수
+            tasks: 실행할 작업 목록
+            service: AWS 서비스 이름
+            progress_tracker: 진행 상황 추적기 (선택사항)
+            max_in_flight: 제출 후 소비되지 않은 작업 수 상한
+
+        Yields:
+            TaskResult[T]: 완료 순서대로 정렬된 결과
+        """
+        job = CollectJob(service, func, service=service)
+        for _, result in self._iter_job_results([(job, task) for task in tasks], progress_tracker, max_in_flight):
+            yield result
+
+    def _iter_job_results(
+        self,
+        items: list[tuple[CollectJob, _TaskSpec]],
+        progress_tracker: ParallelTracker | None,
+        max_in_flight: int,
+    ) -> Iterator[tuple[CollectJob, TaskResult[Any]]]:
+        """최대 ``max_in_flight``개까지 (작업, 태스크)를 제출하며 완료된 결과를 내보냄
+
+        ``execute`` / ``execute_iter`` / ``execute_many`` 가 공유하는 유일한 제출 경로입니다.
+        결과를 하나 내보낸 뒤(소비자가 다음 값을 요청할 때) 다음 태스크를 제출하므로
+        소비자가 느리면 제출이 멈추는 backpressure가 걸립니다.
+
+        자격증명 선행 획득이 켜져 있으면 대기 중인 앞쪽 태스크 중 자격증명이 준비된
+        태스크를 먼저 제출하여, 워커 슬롯이 자격증명 대기로 묶이지 않도록 합니다.
+        이때 in-flight 상한은 ``max_workers`` 이하로 줄어듭니다. 미리 제출해 두면
+        제출 시점(자격증명 대부분이 준비되기 전)의 순서로 실행 순서가 굳어지므로,
+        워커가 빌 때마다 그 시점에 준비된 태스크를 고르게 합니다.
+
+        Args:
+            items: 제출 순서의 (CollectJob, _TaskSpec) 목록
+            progress_tracker: 진행 상황 추적기 (선택사항)
+            max_in_flight: 제출 후 소비되지 않은 태스크 수 상한
+                (자격증명 선행 획득 시 ``max_workers`` 로 제한)
+
+        Yields:
+            (CollectJob, TaskResult): 완료 순서대로 정렬된 결과
+        """
         # 부모 스레드의 quiet 상태를 저장하여 워커 스레드에 전파
         parent_quiet = is_quiet()
 
         # 서비스별 rate limiter 사용
         from .rate_limiter import get_rate_limiter
 
-        rate_limiter = get_rate_limiter(service)
-
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            # 모든 작업 제출 (quiet 상태 전파)
-            futures = {}
-            for task in tasks:
-                future = executor.submit(
-                    self._execute_single,
-                    func,
-                    task,
-                    service,
-                    parent_quiet,
-                    rate_limiter,
-                )
-                futures[future] = task
+        rate_limiters = {job.service: get_rate_limiter(job.service) for job, _ in items}
+
+        prefetcher = self._start_credential_prefetch(task for _, task in items)
+        if prefetcher is not None:
+            max_in_flight = min(max_in_flight, self.config.max_workers)
+        executor = ThreadPoolExecutor(max_workers=self.config.max_workers)
+        pending: dict[Future[TaskResult[Any]], tuple[CollectJob, _TaskSpec]] = {}
+        queue = deque(items)
+
+        def submit_next() -> bool:
+            item = self._pop_next_task(queue, prefetcher)
+            if item is None:
+                return False
+            job, task = item
+            future = executor.submit(
+                self._execute_single,
+                job.func,
+                task,
+                job.service,
+                parent_quiet,
+                rate_limiters[job.service],
+                prefetcher,
+            )
+            pending[future] = item
+            return True
 
-            # 완료된 작업 수집
-            for future in as_completed(futures):
-                task = futures[future]
-                try:
-                    result = future.result()
-                    results.append(result)
+        try:
+            while len(pending) < max_in_flight and submit_next():
+                pass
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, task = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # 예상치 못한 executor 에러
+                        result = self._executor_error_result(task, e)
 
                     # progress_tracker에 완료 알림
                     if progress_tracker:
                         progress_tracker.on_complete(result.success)
-                except Exception as e:
-                    # 예상치 못한 executor 에러
-                    logger.error(f"작업 실행 중 예외 [{task.account_id}/{task.region}]: {e}")
-                    _clear_exception_chain(e)
-                    results.append(
-                        TaskResult(
-                            identifier=task.account_id,
-                            region=task.region,
-                            success=False,
-                            error=TaskError(
-                                identifier=task.account_id,
-                                region=task.region,
-                                category=ErrorCategory.UNKNOWN,
-                                error_code="ExecutorError",
-                                message=str(e),
-                                original_exception=e,
-                            ),
-                        )
-                    )
 
-                    # progress_tracker에 실패 알림
-                    if progress_tracker:
-                        progress_tracker.on_complete(success=False)
+                    yield job, result
+                    submit_next()
+        finally:
+            # 소비 중단 시 미시작 작업은 취소하고 실행 중인 작업만 대기
+            if prefetcher is not None:
+                prefetcher.close()
+            executor.shutdown(wait=True, cancel_futures=True)
 
-        total_time = (time.monotonic() - start_time) * 1000
-        exec_result = ParallelExecutionResult(results=tuple(results))
+    def _pop_next_task(
+        self,
+        queue: deque[tuple[CollectJob, _TaskSpec]],
+        prefetcher: CredentialPrefetcher | None,
+    ) -> tuple[CollectJob, _TaskSpec] | None:
+        """다음에 제출할 (작업, 태스크) 선택
+
+        앞쪽 ``max_workers`` 개 중 자격증명이 준비된 첫 태스크를 고르고,
+        준비된 태스크가 없으면 순서대로 다음 항목을 반환합니다.
 
+        Args:
+            queue: 제출 대기 (작업, 태스크) 큐
+            prefetcher: 자격증명 선행 획득기 (None이면 순서대로)
+
+        Returns:
+            제출할 (작업, 태스크) 또는 None (큐가 비었음)
+        """
+        if not queue:
+            return None
+        if prefetcher is not None:
+            for index in range(min(len(queue), self.config.max_workers)):
+                if prefetcher.is_ready(queue[index][1].credential_key):
+                    item = queue[index]
+                    del queue[index]
+                    return item
+        return queue.popleft()
+
+    def _start_credential_prefetch(self, tasks: Iterable[_TaskSpec]) -> CredentialPrefetcher | None:
+        """작업 순서대로 계정 자격증명 선행 획득 시작
+
+        credential_fetcher가 있는 작업(SSO Session)의 키별로 한 번씩 전용 풀에 예약합니다.
+
+        Args:
+            tasks: 제출 순서의 작업 목록
+
+        Returns:
+            CredentialPrefetcher 또는 None (비활성화 또는 대상 없음)
+        """
+        workers = self.config.credential_prefetch_workers
+        if workers < 1:
+            return None
+
+        fetchers: dict[str, Callable[[], Any]] = {}
+        for task in tasks:
+            if task.credential_key is not None and task.credential_fetcher is not None:
+                fetchers.setdefault(task.credential_key, task.credential_fetcher)
+        if not fetchers:
+            return None
+
+        prefetcher = CredentialPrefetcher(max_workers=min(workers, len(fetchers)))
+        for key, fetch in fetchers.items():
+            prefetcher.schedule(key, fetch)
+        return prefetcher
+
+    def execute_many(
+        self,
+        jobs: Sequence[CollectJob],
+        on_job_complete: Callable[[str, ParallelExecutionResult[Any]], None] | None = None,
+        progress_tracker: ParallelTracker | None = None,
+    ) -> dict[str, ParallelExecutionResult[Any]]:
+        """여러 수집 작업을 하나의 공유 작업 큐에서 병렬 실행
+
+        작업마다 ``execute``를 순차 호출하면 작업 수만큼 fan-out이 반복되고,
+        매 회차가 가장 느린 리전을 기다려야 합니다. 이 메서드는
+        (작업 x 계정 x 리전) 태스크를 하나의 워커 풀에서 함께 실행하여
+        전체 실행 시간이 작업 시간의 합이 아닌 가장 느린 서비스에 맞춰지도록 합니다.
+        제출은 ``execute`` 와 같은 ``_iter_job_results`` 경로를 사용하므로 자격증명 선행
+        획득 시에는 워커 수만큼만 제출하고 자격증명이 준비된 태스크를 먼저 고릅니다.
+
+        - Rate limit은 작업별 ``service``의 limiter를 그대로 사용합니다.
+        - 한 서비스의 limiter 대기가 워커를 독점하지 않도록 서비스 간 라운드로빈으로 제출합니다.
+        - 작업의 모든 태스크가 끝나는 즉시 ``on_job_complete``가 호출됩니다 (호출 스레드에서 실행).
+        - 태스크 목록은 작업별 ``scope``/``service``를 따릅니다 (글로벌 서비스 작업은 계정당 1개).
+
+        Args:
+            jobs: 실행할 CollectJob 목록 (name 중복 불가)
+            on_job_complete: (job_name, result) 콜백 (선택사항).
+                지정 시 결과는 콜백에 전달된 후 보관하지 않으므로 반환 dict에 포함되지 않습니다.
+            progress_tracker: 진행 상황 추적기 (선택사항, 전체 태스크 기준)
+
+        Returns:
+            {job_name: ParallelExecutionResult} (on_job_complete 미지정 시)
+
+        Raises:
+            ValueError: CollectJob name이 중복된 경우
+        """
+        names = [job.name for job in jobs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"CollectJob name must be unique: {names}")
+
+        task_lists: dict[tuple[str, str], list[_TaskSpec]] = {}
+        for job in jobs:
+            key = (job.scope, job.service)
+            if key not in task_lists:
+                task_lists[key] = self._build_task_list(job.scope, job.service)
+        tasks_by_job = {job.name: task_lists[(job.scope, job.service)] for job in jobs}
+        completed: dict[str, ParallelExecutionResult[Any]] = {}
+
+        def finish(name: str, job_result: ParallelExecutionResult[Any]) -> None:
+            if on_job_complete:
+                on_job_complete(name, job_result)
+            else:
+                completed[name] = job_result
+
+        runnable = [job for job in jobs if tasks_by_job[job.name]]
+        if not runnable:
+            logger.warning("실행할 작업이 없습니다")
+        for job in jobs:
+            if not tasks_by_job[job.name]:
+                finish(job.name, ParallelExecutionResult())
+        if not runnable:
+            return completed
+
+        total = sum(len(tasks_by_job[job.name]) for job in runnable)
         logger.info(
-            f"병렬 실행 완료: 성공 {exec_result.success_count}, 실패 {exec_result.error_count}, 총 {total_time:.0f}ms"
+            f"다중 병렬 실행 시작: {len(runnable)}개 작업, 총 {total}개 태스크, max_workers={self.config.max_workers}"
         )
 
-        return exec_result
+        if progress_tracker:
+            progress_tracker.set_total(total)
+
+        start_time = time.monotonic()
+        pending: dict[str, int] = {job.name: len(tasks_by_job[job.name]) for job in runnable}
+        partial: dict[str, list[TaskResult[Any]]] = {job.name: [] for job in runnable}
+
+        # 모든 태스크를 한 번에 제출 (in-flight 상한 = 태스크 수, 자격증명 선행 획득 시에는 워커 수)
+        ordered = self._interleave_by_service(runnable, tasks_by_job)
+        for job, result in self._iter_job_results(ordered, progress_tracker, max_in_flight=total):
+            partial[job.name].append(result)
+            pending[job.name] -= 1
+            if pending[job.name] == 0:
+                finish(job.name, ParallelExecutionResult(results=tuple(partial.pop(job.name))))
+
+        total_time = (time.monotonic() - start_time) * 1000
+        logger.info(f"다중 병렬 실행 완료: {len(jobs)}개 작업, 총 {total_time:.0f}ms")
+        logger.debug(f"client 풀: {get_client_pool().stats}")
+
+        return completed
+
+    @staticmethod
+    def _interleave_by_service(
+        jobs: Sequence[CollectJob],
+        tasks_by_job: dict[str, list[_TaskSpec]],
+    ) -> list[tuple[CollectJob, _TaskSpec]]:
+        """서비스 간 라운드로빈 순서로 (작업, 태스크) 목록 생성
+
+        같은 서비스 내에서는 작업 순서를 유지하여 앞선 작업이 먼저 완료되도록 하고,
+        서비스끼리는 번갈아 배치하여 rate limit이 낮은 서비스가 워커 풀 앞부분을
+        점유하지 않도록 합니다.
+
+        Args:
+            jobs: CollectJob 목록
+            tasks_by_job: {작업 이름: 태스크 목록} (작업별 scope/service 기준)
+
+        Returns:
+            제출 순서대로 정렬된 (CollectJob, _TaskSpec) 목록
+        """
+        queues: dict[str, list[tuple[CollectJob, _TaskSpec]]] = {}
+        for job in jobs:
+            queues.setdefault(job.service, []).extend((job, task) for task in tasks_by_job[job.name])
+
+        ordered: list[tuple[CollectJob, _TaskSpec]] = []
+        positions = dict.fromkeys(queues, 0)
+        while positions:
+            for service in list(positions):
+                queue = queues[service]
+                ordered.append(queue[positions[service]])
+                positions[service] += 1
+                if positions[service] >= len(queue):
+                    del positions[service]
+        return ordered
+
+    @staticmethod
+    def _executor_error_result(task: _TaskSpec, e: Exception) -> TaskResult[Any]:
+        """예상치 못한 executor 예외를 실패 TaskResult로 변환"""
+        logger.error(f"작업 실행 중 예외 [{task.account_id}/{task.region}]: {e}")
+        _clear_exception_chain(e)
+        return TaskResult(
+            identifier=task.account_id,
+            region=task.region,
+            success=False,
+            error=TaskError(
+                identifier=task.account_id,
+                region=task.region,
+                category=ErrorCategory.UNKNOWN,
+                error_code="ExecutorError",
+                message=str(e),
+                original_exception=e,
+            ),
+        )
 
-    def _build_task_list(self) -> list[_TaskSpec]:
-        """컨텍스트 유형에 따라 실행할 작업 목록 생성
+    def _build_task_list(self, scope: str = "region", service: str = "default") -> list[_TaskSpec]:
+        """컨텍스트 유형과 범위에 따라 실행할 작업 목록 생성
 
         SSO Session, 다중 프로파일, 단일 프로파일 중
         현재 ExecutionContext의 인증 모드를 감지하여 적절한 작업 목록을 구성합니다.
 
+        범위별 작업 구성:
+        - region: 계정 x 선택 리전
+        - account: 계정당 1개. 리전은 선택 리전의 파티션에 맞는 글로벌 엔드포인트
+          리전(us-east-1 / us-gov-west-1 / cn-northwest-1)이며 리전 선택과 무관하게 실행
+        - org: 전체 1개. 관리 계정(없으면 첫 대상 계정/프로파일)의 글로벌 엔드포인트 리전
+
+        region 범위는 ``config.prune_regions`` 가 켜져 있으면 실패가 확실한 작업을
+        제외합니다 (``_prune_region_tasks`` 참고).
+
+        Args:
+            scope: 태스크 범위 ("region" | "account" | "org")
+            service: AWS 서비스 이름 (서비스 제공 리전 확인용)
+
         Returns:
-            _TaskSpec 리스트 (계정 x 리전 조합)
+            _TaskSpec 리스트
+
+        Raises:
+            ValueError: 지원하지 않는 scope인 경우
         """
+        _validate_scope(scope)
+        regions = list(self.ctx.regions) if scope == "region" else [global_service_region(self.ctx.regions)]
+        single = scope == "org"
+
         tasks: list[_TaskSpec] = []
 
         if self.ctx.is_sso_session():
-            tasks = self._build_sso_tasks()
+            tasks = self._build_sso_tasks(regions, single)
         elif self.ctx.is_multi_profile():
-            tasks = self._build_multi_profile_tasks()
+            tasks = self._build_multi_profile_tasks(regions, single)
         else:
-            tasks = self._build_single_profile_tasks()
+            tasks = self._build_single_profile_tasks(regions)
+
+        if scope == "region" and self.config.prune_regions:
+            tasks = self._prune_region_tasks(tasks, service)
 
         return tasks
 
-    def _build_sso_tasks(self) -> list[_TaskSpec]:
+    def _prune_region_tasks(self, tasks: list[_TaskSpec], service: str) -> list[_TaskSpec]:
+        """실행해도 실패할 (계정, 리전) 작업 제외
+
+        - 서비스가 제공되지 않는 리전 (botocore 엔드포인트 데이터)
+        - 계정에서 활성화되지 않은 옵트인 리전 (계정별 활성 리전 파일 캐시)
+
+        기본 활성 리전만 대상이면 API를 호출하지 않으며, 활성 리전을 확인하지 못한
+        계정은 제외하지 않습니다.
+
+        Args:
+            tasks: (계정 x 리전) 작업 목록
+            service: AWS 서비스 이름
+
+        Returns:
+            실행할 작업 목록 (순서 유지)
+        """
+        offered = set(filter_service_regions(service, list(dict.fromkeys(task.region for task in tasks))))
+        kept = [task for task in tasks if task.region in offered]
+
+        opt_in_accounts: dict[str, Callable[[], boto3.Session]] = {}
+        for task in kept:
+            if requires_opt_in(task.region):
+                opt_in_accounts.setdefault(task.account_id, task.session_getter)
+
+        if opt_in_accounts:
+            enabled = self._lookup_enabled_regions(opt_in_accounts)
+
+            def is_enabled(task: _TaskSpec) -> bool:
+                account_regions = enabled.get(task.account_id)
+                return account_regions is None or task.region in account_regions
+
+            kept = [task for task in kept if not requires_opt_in(task.region) or is_enabled(task)]
+
+        if len(kept) < len(tasks):
+            logger.info(
+                f"리전 정리: {len(tasks) - len(kept)}개 작업 제외 (서비스 미제공/비활성 리전), service={service}"
+            )
+        return kept
+
+    def _lookup_enabled_regions(
+        self,
+        accounts: dict[str, Callable[[], boto3.Session]],
+    ) -> dict[str, frozenset[str] | None]:
+        """계정별 활성 리전 조회 (캐시에 없는 계정은 병렬 조회)
+
+        Args:
+            accounts: {계정 ID: session_getter}
+
+        Returns:
+            {계정 ID: 활성 리전 집합 또는 None}
+        """
+
+        def lookup(account_id: str, session_getter: Callable[[], boto3.Session]) -> frozenset[str] | None:
+            try:
+                session = session_getter()
+            except Exception as e:
+                logger.debug(f"활성 리전 조회용 세션 획득 실패 [{account_id}]: {e}")
+                return None
+            return get_enabled_regions(session, cache_key=account_id, api_region=DEFAULT_GLOBAL_REGION)
+
+        missing = {acc: getter for acc, getter in accounts.items() if acc not in self._enabled_regions}
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.config.max_workers, len(missing))) as pool:
+                futures = {acc: pool.submit(lookup, acc, getter) for acc, getter in missing.items()}
+                for acc, future in futures.items():
+                    self._enabled_regions[acc] = future.result()
+
+        return {acc: self._enabled_regions[acc] for acc in accounts}
+
+    def _build_sso_tasks(self, regions: list[str], single: bool = False) -> list[_TaskSpec]:
         """SSO Session 기반 작업 목록 생성
 
         대상 계정별 역할(role)과 리전 조합으로 작업 목록을 구성합니다.
         역할이 없는 계정은 스킵합니다.
 
+        Args:
+            regions: 작업 리전 목록
+            single: True면 관리 계정(없으면 역할이 있는 첫 계정) 하나만 사용
+
         Returns:
             _TaskSpec 리스트
         """
         tasks: list[_TaskSpec] = []
         target_accounts = self.ctx.get_target_accounts()
+        # 자격증명만 캐시에 채우는 provider만 선행 획득 대상
+        prefetch = getattr(self.ctx.provider, "prefetch_credentials", None)
+
+        if single:
+            # 관리 계정 우선 (정렬 안정성으로 나머지 순서 유지)
+            target_accounts = sorted(target_accounts, key=lambda acc: not getattr(acc, "is_management", False))
 
         for account in target_accounts:
             role_name = self.ctx.get_effective_role(account.id)
@@ -274,7 +776,18 @@ class ParallelSessionExecutor:
                 logger.warning(f"계정 {account.id}에 사용할 역할이 없어 스킵")
                 continue
 
-            for region in self.ctx.regions:
+            if single and tasks:
+                break
+
+            credential_fetcher = None
+            if callable(prefetch):
+
+                def make_credential_fetcher(acc_id=account.id, rn=role_name):
+                    return lambda: prefetch(acc_id, rn)
+
+                credential_fetcher = make_credential_fetcher()
+
+            for region in regions:
                 # 클로저 캡처를 위해 기본 인자 사용
                 def make_session_getter(acc_id=account.id, rn=role_name, reg=region):
                     return lambda: self.ctx.provider.get_session(
@@ -289,25 +802,32 @@ class ParallelSessionExecutor:
                         account_name=account.name,
                         region=region,
                         session_getter=make_session_getter(),
+                        credential_key=f"{account.id}:{role_name}",
+                        credential_fetcher=credential_fetcher,
                     )
                 )
 
         return tasks
 
-    def _build_multi_profile_tasks(self) -> list[_TaskSpec]:
+    def _build_multi_profile_tasks(self, regions: list[str], single: bool = False) -> list[_TaskSpec]:
         """다중 프로파일 기반 작업 목록 생성
 
         각 프로파일과 리전의 조합으로 작업 목록을 구성합니다.
 
+        Args:
+            regions: 작업 리전 목록
+            single: True면 첫 프로파일 하나만 사용
+
         Returns:
             _TaskSpec 리스트
         """
         from core.auth.session import get_session
 
         tasks: list[_TaskSpec] = []
+        profiles = self.ctx.profiles[:1] if single else self.ctx.profiles
 
-        for profile in self.ctx.profiles:
-            for region in self.ctx.regions:
+        for profile in profiles:
+            for region in regions:
 
                 def make_session_getter(p=profile, r=region):
                     return lambda: get_session(p, r)
@@ -323,11 +843,14 @@ class ParallelSessionExecutor:
 
         return tasks
 
-    def _build_single_profile_tasks(self) -> list[_TaskSpec]:
+    def _build_single_profile_tasks(self, regions: list[str]) -> list[_TaskSpec]:
         """단일 프로파일 기반 작업 목록 생성
 
         하나의 프로파일에 대해 각 리전별 작업 목록을 구성합니다.
 
+        Args:
+            regions: 작업 리전 목록
+
         Returns:
             _TaskSpec 리스트
         """
@@ -336,7 +859,7 @@ class ParallelSessionExecutor:
         tasks: list[_TaskSpec] = []
         profile = self.ctx.profile_name or "default"
 
-        for region in self.ctx.regions:
+        for region in regions:
 
             def make_session_getter(r=region):
                 return lambda: get_session(profile, r)
@@ -359,11 +882,14 @@ class ParallelSessionExecutor:
         service: str,
         quiet: bool = False,
         rate_limiter: TokenBucketRateLimiter | None = None,
+        prefetcher: CredentialPrefetcher | None = None,
     ) -> TaskResult[T]:
         """단일 작업 실행 (워커 스레드 내에서 호출)
 
         Rate limiting 적용 후 세션을 획득하고 재시도 로직을 포함하여
         작업 함수를 실행합니다. 부모 스레드의 quiet 상태를 전파합니다.
+        세션에는 API 호출 단위 Rate limit 훅이 등록되어, 작업 내부의 모든 호출이
+        (계정, 리전, 서비스)별 AdaptiveRateLimiter를 거칩니다.
 
         Args:
             func: (session, account_id, account_name, region) -> T 콜백 함수
@@ -371,6 +897,7 @@ class ParallelSessionExecutor:
             service: AWS 서비스 이름 (로깅용)
             quiet: quiet 모드 여부 (부모 스레드에서 전파)
             rate_limiter: 서비스별 Rate limiter
+            prefetcher: 자격증명 선행 획득기 (지정 시 계정 자격증명 준비를 기다린 후 세션 획득)
 
         Returns:
             TaskResult[T]: 성공 시 데이터, 실패 시 에러 정보 포함
@@ -380,6 +907,10 @@ class ParallelSessionExecutor:
         start_time = time.monotonic()
 
         try:
+            # 선행 획득 중인 자격증명 대기 (같은 계정 자격증명의 중복 요청 방지)
+            if prefetcher is not None:
+                prefetcher.wait(task.credential_key)
+
             # Rate limiting (서비스별 limiter 사용)
             if rate_limiter and not rate_limiter.acquire():
                 return TaskResult(
@@ -396,11 +927,15 @@ class ParallelSessionExecutor:
                     duration_ms=(time.monotonic() - start_time) * 1000,
                 )
 
-            # 세션 획득
-            session = task.session_getter()
+            with rate_limit_scope(task.account_id):
+                # 세션 획득
+                session = task.session_getter()
+
+                # API 호출 단위 Rate limit 훅 등록 (계정+리전+서비스별 limiter)
+                install_rate_limit_hooks(getattr(session, "events", None), task.account_id)
 
-            # 작업 실행 (재시도 포함)
-            return self._execute_with_retry(func, session, task, service, start_time)
+                # 작업 실행 (재시도 포함)
+                return self._execute_with_retry(func, session, task, service, start_time)
 
         except Exception as e:
             # 세션 획득 실패 등
@@ -509,6 +1044,7 @@ def parallel_collect(
     max_workers: int = 20,
     service: str = "default",
     progress_tracker: ParallelTracker | None = None,
+    scope: str = "region",
 ) -> ParallelExecutionResult[T]:
     """병렬 수집 편의 함수
 
@@ -524,6 +1060,11 @@ def parallel_collect(
             1. set_total(task_count) 호출
             2. 각 task 완료 시 on_complete(success) 호출
             ctx에 timeline이 있으면 자동으로 TimelineParallelTracker 생성.
+        scope: 태스크 범위.
+            - "region" (기본): 계정 x 리전
+            - "account": 계정당 1개 (IAM, Route53, CloudFront 등 글로벌 서비스).
+              collector_func의 region은 파티션의 글로벌 엔드포인트 리전 (예: us-east-1)
+            - "org": 전체 1개 (관리 계정 또는 첫 계정)
 
     Returns:
         ParallelExecutionResult[T]
@@ -556,23 +1097,141 @@ def parallel_collect(
     # progress_tracker가 없고 ctx에 timeline이 있으면 자동 생성
     _auto_timeline = False
     if progress_tracker is None:
-        timeline = getattr(ctx, "_timeline", None)
-        if timeline is not None:
-            collect_phase = getattr(ctx, "_timeline_collect_phase", 0)
-            progress_tracker = timeline.create_parallel_tracker(collect_phase)
-            _auto_timeline = True
+        progress_tracker = _create_timeline_tracker(ctx)
+        _auto_timeline = progress_tracker is not None
 
     config = ParallelConfig(max_workers=max_workers)
     executor = ParallelSessionExecutor(ctx, config)
-    result = executor.execute(collector_func, service, progress_tracker=progress_tracker)
+    result = executor.execute(collector_func, service, progress_tracker=progress_tracker, scope=scope)
 
     # 자동 생성된 timeline tracker인 경우, 수집 phase 완료 후 Live를 중단하여
     # 이후 도구의 console.print() 출력이 Live 렌더링과 겹치지 않도록 함
     if _auto_timeline:
-        timeline = getattr(ctx, "_timeline", None)
-        if timeline is not None:
-            collect_phase = getattr(ctx, "_timeline_collect_phase", 0)
-            timeline.complete_phase(collect_phase)
-            timeline.stop()
+        _complete_timeline(ctx)
 
     return result
+
+
+def parallel_stream(
+    ctx: ExecutionContext,
+    collector_func: Callable[[boto3.Session, str, str, str], T],
+    max_workers: int = 20,
+    service: str = "default",
+    progress_tracker: ParallelTracker | None = None,
+    max_in_flight: int | None = None,
+    scope: str = "region",
+) -> Iterator[TaskResult[T]]:
+    """병렬 수집 결과를 완료 순서대로 내보내는 스트리밍 편의 함수
+
+    ``ParallelSessionExecutor.execute_iter``의 래퍼입니다. ``parallel_collect``와 달리
+    결과를 모아 두지 않으므로, 결과를 받는 즉시 기록/집계하고 버리면 계정 수가 많아도
+    최대 메모리가 ``max_in_flight``개 결과 수준으로 유지됩니다. timeline 처리는
+    ``parallel_collect``와 동일합니다 (순회가 끝나거나 중단될 때 phase 완료).
+
+    Args:
+        ctx: ExecutionContext
+        collector_func: (session, account_id, account_name, region) -> T
+        max_workers: 최대 동시 스레드 수
+        service: AWS 서비스 이름
+        progress_tracker: 진행 상황 추적기 (선택사항)
+        max_in_flight: 동시에 제출해 둘 최대 작업 수 (None이면 max_workers x 2)
+        scope: 태스크 범위 ("region" | "account" | "org", ``parallel_collect`` 참고)
+
+    Yields:
+        TaskResult[T]: 완료된 작업 결과
+
+    Example:
+        with quiet_mode():
+            for task_result in parallel_stream(ctx, collect_sgs, service="ec2"):
+                if task_result.success:
+                    writer.add_rows(task_result.data)
+                else:
+                    errors.append(task_result.error)
+    """
+    _auto_timeline = False
+    if progress_tracker is None:
+        progress_tracker = _create_timeline_tracker(ctx)
+        _auto_timeline = progress_tracker is not None
+
+    config = ParallelConfig(max_workers=max_workers)
+    executor = ParallelSessionExecutor(ctx, config)
+    try:
+        yield from executor.execute_iter(
+            collector_func,
+            service,
+            progress_tracker=progress_tracker,
+            max_in_flight=max_in_flight,
+            scope=scope,
+        )
+    finally:
+        if _auto_timeline:
+            _complete_timeline(ctx)
+
+
+def parallel_collect_many(
+    ctx: ExecutionContext,
+    jobs: Sequence[CollectJob],
+    max_workers: int = 20,
+    on_job_complete: Callable[[str, ParallelExecutionResult[Any]], None] | None = None,
+    progress_tracker: ParallelTracker | None = None,
+) -> dict[str, ParallelExecutionResult[Any]]:
+    """여러 수집 작업을 하나의 작업 큐로 병렬 수집하는 편의 함수
+
+    ``ParallelSessionExecutor.execute_many``의 래퍼입니다. 작업마다
+    ``parallel_collect``를 반복 호출하는 대신 모든 (작업 x 계정 x 리전) 태스크를
+    한 번에 스케줄링합니다. timeline 처리는 ``parallel_collect``와 동일합니다.
+
+    Args:
+        ctx: ExecutionContext
+        jobs: CollectJob 목록
+        max_workers: 최대 동시 스레드 수
+        on_job_complete: (job_name, result) 콜백. 작업의 모든 태스크가 끝나는 즉시 호출
+        progress_tracker: 진행 상황 추적기 (선택사항, 전체 태스크 기준)
+
+    Returns:
+        {job_name: ParallelExecutionResult} (on_job_complete 지정 시 빈 dict)
+
+    Example:
+        jobs = [
+            CollectJob("vpc", collect_vpcs, service="ec2"),
+            CollectJob("rds", collect_rds_instances, service="rds"),
+        ]
+
+        def write_sheet(name, result):
+            rows = result.get_flat_data()  # 작업 완료 즉시 기록 후 해제
+            ...
+
+        parallel_collect_many(ctx, jobs, on_job_complete=write_sheet)
+    """
+    _auto_timeline = False
+    if progress_tracker is None:
+        progress_tracker = _create_timeline_tracker(ctx)
+        _auto_timeline = progress_tracker is not None
+
+    config = ParallelConfig(max_workers=max_workers)
+    executor = ParallelSessionExecutor(ctx, config)
+    results = executor.execute_many(jobs, on_job_complete=on_job_complete, progress_tracker=progress_tracker)
+
+    if _auto_timeline:
+        _complete_timeline(ctx)
+
+    return results
+
+
+def _create_timeline_tracker(ctx: ExecutionContext) -> ParallelTracker | None:
+    """ctx에 timeline이 있으면 수집 phase용 parallel tracker 생성"""
+    timeline = getattr(ctx, "_timeline", None)
+    if timeline is None:
+        return None
+    collect_phase = getattr(ctx, "_timeline_collect_phase", 0)
+    tracker: ParallelTracker = timeline.create_parallel_tracker(collect_phase)
+    return tracker
+
+
+def _complete_timeline(ctx: ExecutionContext) -> None:
+    """수집 phase 완료 처리 후 timeline Live 중단"""
+    timeline = getattr(ctx, "_timeline", None)
+    if timeline is not None:
+        collect_phase = getattr(ctx, "_timeline_collect_phase", 0)
+        timeline.complete_phase(collect_phase)
+        timeline.stop()
@@ -8,6 +8,7 @@ Thread-safe하며, 버스트 트래픽을 허용하면서 장기적으로
 주요 구성 요소:
 - RateLimiterConfig: Rate limiter 설정 (초당 요청 수, 버스트, 타임아웃)
 - TokenBucketRateLimiter: Token Bucket 알고리즘 구현
+- AdaptiveRateLimiter: 쓰로틀링 응답에 따라 속도를 조절하는 AIMD Rate limiter
 - get_rate_limiter: 서비스별 싱글톤 Rate limiter 조회
 - create_rate_limiter: 커스텀 Rate limiter 생성
 - SERVICE_RATE_LIMITS: AWS 서비스별 기본 Rate limit 설정
@@ -20,10 +21,13 @@ Example:
         ec2.describe_instances()
 """
 
+import logging
 import threading
 import time
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class RateLimiterConfig:
@@ -78,6 +82,7 @@ class TokenBucketRateLimiter:
             config: Rate limiter 설정. None이면 기본값 사용.
         """
         self.config = config or RateLimiterConfig()
+        self._rate = self.config.requests_per_second  # 현재 토큰 생성 속도
         self._tokens = float(self.config.burst_size)  # 초기에는 버스트 허용
         self._last_refill = time.monotonic()
         self._lock = threading.Lock()
@@ -111,7 +116,7 @@ class TokenBucketRateLimiter:
 
                 # 다음 토큰까지 필요한 대기 시간 계산
                 wait_time = min(
-                    (tokens - self._tokens) / self.config.requests_per_second,
+                    (tokens - self._tokens) / self._rate,
                     remaining,
                 )
                 self._condition.wait(timeout=wait_time)
@@ -145,7 +150,7 @@ class TokenBucketRateLimiter:
         elapsed = now - self._last_refill
         self._last_refill = now
 
-        new_tokens = elapsed * self.config.requests_per_second
+        new_tokens = elapsed * self._rate
         self._tokens = min(self.config.burst_size, self._tokens + new_tokens)
 
     @property
@@ -155,6 +160,98 @@ class TokenBucketRateLimiter:
             self._refill()
             return self._tokens
 
+    @property
+    def current_rate(self) -> float:
+        """현재 초당 토큰 생성 속도"""
+        with self._lock:
+            return self._rate
+
+
+class AdaptiveRateLimiter(TokenBucketRateLimiter):
+    """AIMD(Additive Increase / Multiplicative Decrease) 기반 Rate Limiter
+
+    API 응답 결과를 피드백으로 받아 토큰 생성 속도를 조절합니다.
+
+    Algorithm:
+        - 성공 응답: 초당 약 additive_increase만큼 속도 증가 (요청당 additive_increase / rate)
+        - 쓰로틀링 응답: 속도를 decrease_factor배로 감소하고 남은 토큰을 비움
+        - 동시에 도착한 쓰로틀링 응답이 연쇄 감소를 일으키지 않도록
+          decrease_cooldown 동안은 한 번만 감소
+        - 속도는 [min_rate, max_rate] 범위로 제한
+
+    Example:
+        limiter = AdaptiveRateLimiter(RateLimiterConfig(requests_per_second=20, burst_size=40))
+
+        if limiter.acquire():
+            try:
+                ec2.describe_instances()
+                limiter.on_success()
+            except ClientError as e:
+                if is_throttling(e):
+                    limiter.on_throttle()
+    """
+
+    def __init__(
+        self,
+        config: RateLimiterConfig | None = None,
+        min_rate: float | None = None,
+        max_rate: float | None = None,
+        additive_increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 1.0,
+    ):
+        """초기화
+
+        Args:
+            config: 초기 Rate limiter 설정. None이면 기본값 사용.
+            min_rate: 최소 초당 요청 수 (기본: 초기 속도의 10%, 최소 0.5)
+            max_rate: 최대 초당 요청 수 (기본: 초기 속도의 2배)
+            additive_increase: 성공 시 초당 증가량
+            decrease_factor: 쓰로틀링 시 감소 배율 (0 < x < 1)
+            decrease_cooldown: 연속 감소 사이 최소 간격 (초)
+        """
+        super().__init__(config)
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be between 0 and 1, got {decrease_factor}")
+
+        initial = self.config.requests_per_second
+        self.min_rate = min_rate if min_rate is not None else max(0.5, initial * 0.1)
+        self.max_rate = max_rate if max_rate is not None else initial * 2
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+
+        self._last_decrease = float("-inf")
+        self._throttle_count = 0
+
+    def on_success(self) -> None:
+        """성공 응답 피드백 (속도 가산 증가)"""
+        with self._lock:
+            if self._rate < self.max_rate:
+                self._refill()
+                self._rate = min(self.max_rate, self._rate + self.additive_increase / self._rate)
+
+    def on_throttle(self) -> None:
+        """쓰로틀링 응답 피드백 (속도 배수 감소)"""
+        with self._lock:
+            self._throttle_count += 1
+            now = time.monotonic()
+            if now - self._last_decrease < self.decrease_cooldown:
+                return
+
+            self._refill()
+            self._last_decrease = now
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            # 버스트로 다시 쓰로틀링되지 않도록 남은 토큰 제거
+            self._tokens = 0.0
+            logger.debug(f"쓰로틀링 감지, 요청 속도 감소: {self._rate:.2f} req/s")
+
+    @property
+    def throttle_count(self) -> int:
+        """누적 쓰로틀링 응답 수"""
+        with self._lock:
+            return self._throttle_count
+
 
 # =============================================================================
 # 서비스별 기본 Rate Limiter 설정
@@ -184,6 +281,8 @@ SERVICE_RATE_LIMITS: dict[str, RateLimiterConfig] = {
     "organizations": RateLimiterConfig(requests_per_second=5, burst_size=10),
     # SSO Admin: 초당 10회 정도
     "sso-admin": RateLimiterConfig(requests_per_second=8, burst_size=15),
+    # SSO 포털 (ListAccounts/ListAccountRoles/GetRoleCredentials): 대상 서비스와 별도로 쓰로틀링
+    "sso": RateLimiterConfig(requests_per_second=8, burst_size=15),
     # Secrets Manager: 초당 20회 정도
     "secretsmanager": RateLimiterConfig(requests_per_second=15, burst_size=30),
     # KMS: 초당 100회 이상
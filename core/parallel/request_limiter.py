@@ -0,0 +1,180 @@
+"""
+core/parallel/request_limiter.py - botocore 요청 단위 Rate limiting
+
+``get_rate_limiter``는 병렬 작업(계정 x 리전) 시작 시 한 번만 토큰을 소비하므로,
+작업 내부에서 페이지네이션 등으로 수십~수백 번 호출하는 API는 제한되지 않습니다.
+이 모듈은 botocore 이벤트 훅(``before-call`` / ``after-call``)을 client에 등록하여
+실제 API 호출마다 토큰을 소비하고, 응답의 쓰로틀링 여부로 속도를 조절(AIMD)합니다.
+
+AWS API 쓰로틀링은 계정+리전+서비스 단위로 적용되므로, limiter도
+(account_id, region, service) 조합별로 분리합니다.
+
+주요 구성 요소:
+- get_scoped_rate_limiter: (계정, 리전, 서비스)별 AdaptiveRateLimiter 조회 (싱글톤)
+- install_rate_limit_hooks: botocore 이벤트 emitter에 요청 단위 limiter 훅 등록
+- rate_limit_scope / get_current_account: 현재 스레드의 계정 scope 관리
+- THROTTLING_ERROR_CODES: 속도 감소를 유발하는 에러 코드
+- reset_scoped_rate_limiters: 모든 scope limiter 초기화
+
+Example:
+    from core.parallel.request_limiter import install_rate_limit_hooks
+
+    ec2 = session.client("ec2", region_name="ap-northeast-2")
+    install_rate_limit_hooks(ec2.meta.events, account_id="111122223333")
+
+    # 이후 모든 ec2 API 호출은 (111122223333, ap-northeast-2, ec2) limiter를 거침
+    ec2.describe_instances()
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+from .rate_limiter import SERVICE_RATE_LIMITS, AdaptiveRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# 속도 감소를 유발하는 쓰로틀링 에러 코드
+THROTTLING_ERROR_CODES: frozenset[str] = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "RateExceeded",
+        "SlowDown",
+    }
+)
+
+# 계정을 알 수 없는 호출(executor 외부)의 scope
+DEFAULT_ACCOUNT_SCOPE = "default"
+# 리전이 없는 글로벌 서비스 호출의 scope
+GLOBAL_REGION_SCOPE = "global"
+
+# botocore 이벤트 훅 중복 등록 방지용 ID
+_BEFORE_CALL_HOOK_ID = "aa-request-rate-limit-before-call"
+_AFTER_CALL_HOOK_ID = "aa-request-rate-limit-after-call"
+
+# (account_id, region, service) -> AdaptiveRateLimiter
+_scoped_limiters: dict[tuple[str, str, str], AdaptiveRateLimiter] = {}
+_scoped_lock = threading.Lock()
+
+# 스레드-로컬 계정 scope (executor 워커가 작업 실행 중 설정)
+_scope_state = threading.local()
+
+
+def get_scoped_rate_limiter(account_id: str, region: str, service: str) -> AdaptiveRateLimiter:
+    """(계정, 리전, 서비스)별 Adaptive Rate Limiter 반환 (싱글톤)
+
+    초기 속도는 ``SERVICE_RATE_LIMITS``의 서비스 설정(없으면 "default")을 사용합니다.
+
+    Args:
+        account_id: AWS 계정 ID (또는 프로파일명)
+        region: AWS 리전
+        service: botocore 서비스 이름 (예: "ec2", "cloudwatch")
+
+    Returns:
+        해당 scope의 AdaptiveRateLimiter
+    """
+    key = (account_id, region, service)
+    with _scoped_lock:
+        limiter = _scoped_limiters.get(key)
+        if limiter is None:
+            config = SERVICE_RATE_LIMITS.get(service, SERVICE_RATE_LIMITS["default"])
+            limiter = AdaptiveRateLimiter(config)
+            _scoped_limiters[key] = limiter
+        return limiter
+
+
+def reset_scoped_rate_limiters() -> None:
+    """모든 scope limiter 초기화
+
+    테스트 또는 장시간 실행 후 학습된 속도를 버려야 할 때 사용합니다.
+    """
+    with _scoped_lock:
+        _scoped_limiters.clear()
+
+
+def get_current_account() -> str | None:
+    """현재 스레드에 설정된 계정 scope 반환
+
+    Returns:
+        계정 ID 또는 None (scope 미설정)
+    """
+    return getattr(_scope_state, "account_id", None)
+
+
+@contextmanager
+def rate_limit_scope(account_id: str) -> Generator[None, None, None]:
+    """현재 스레드의 계정 scope 설정
+
+    scope 안에서 ``get_client``로 생성한 client는 해당 계정의 limiter를 사용합니다.
+
+    Args:
+        account_id: AWS 계정 ID (또는 프로파일명)
+    """
+    previous = get_current_account()
+    _scope_state.account_id = account_id
+    try:
+        yield
+    finally:
+        _scope_state.account_id = previous
+
+
+def install_rate_limit_hooks(emitter: Any, account_id: str | None = None) -> bool:
+    """botocore 이벤트 emitter에 요청 단위 Rate limit 훅 등록
+
+    - ``before-call``: (계정, 리전, 서비스) limiter에서 토큰 획득 (타임아웃 시 그대로 진행)
+    - ``after-call``: 쓰로틀링 응답이면 속도 감소, 그 외 응답이면 속도 증가
+
+    boto3 Session의 ``events``에 등록하면 이후 생성되는 모든 client에 적용되고,
+    client의 ``meta.events``에 등록하면 해당 client에만 적용됩니다.
+    같은 emitter에 여러 번 호출해도 한 번만 등록됩니다.
+
+    limiter 계정은 호출 시점의 ``rate_limit_scope``를 우선 사용하고,
+    scope가 없으면 등록 시 지정한 ``account_id``를 사용합니다.
+
+    Args:
+        emitter: botocore 이벤트 emitter (``session.events`` 또는 ``client.meta.events``)
+        account_id: scope가 없을 때 사용할 계정 (None이면 "default")
+
+    Returns:
+        등록 여부 (botocore emitter가 아니면 False)
+    """
+    from botocore.hooks import BaseEventHooks
+
+    if not isinstance(emitter, BaseEventHooks):
+        return False
+
+    fallback_account = account_id or DEFAULT_ACCOUNT_SCOPE
+
+    def _limiter_for(model: Any, context: dict[str, Any]) -> AdaptiveRateLimiter:
+        account = get_current_account() or fallback_account
+        region = context.get("client_region") or GLOBAL_REGION_SCOPE
+        return get_scoped_rate_limiter(account, region, model.service_model.service_name)
+
+    def before_call(model: Any, context: dict[str, Any], **kwargs: Any) -> None:
+        limiter = _limiter_for(model, context)
+        if not limiter.acquire():
+            logger.debug(f"요청 limiter 대기 시간 초과, 그대로 진행: {model.service_model.service_name}.{model.name}")
+
+    def after_call(
+        http_response: Any, parsed: dict[str, Any], model: Any, context: dict[str, Any], **kwargs: Any
+    ) -> None:
+        limiter = _limiter_for(model, context)
+        error_code = parsed.get("Error", {}).get("Code") if isinstance(parsed, dict) else None
+        if error_code in THROTTLING_ERROR_CODES:
+            limiter.on_throttle()
+        elif getattr(http_response, "status_code", 500) < 500:
+            limiter.on_success()
+
+    emitter.register("before-call", before_call, unique_id=_BEFORE_CALL_HOOK_ID)
+    emitter.register("after-call", after_call, unique_id=_AFTER_CALL_HOOK_ID)
+    return True
@@ -5,12 +5,22 @@ from .availability import (
     RegionAvailabilityChecker,
     RegionInfo,
     filter_available_regions,
+    filter_service_regions,
     get_available_regions,
+    get_enabled_regions,
     get_region_checker,
     reset_region_checkers,
     validate_regions,
 )
-from .data import ALL_REGIONS, COMMON_REGIONS, REGION_NAMES
+from .data import (
+    ALL_REGIONS,
+    COMMON_REGIONS,
+    DEFAULT_ENABLED_REGIONS,
+    REGION_NAMES,
+    get_global_region,
+    get_partition,
+    requires_opt_in,
+)
 from .filter import (
     AccountFilter,
     expand_region_pattern,
@@ -26,6 +36,10 @@ __all__: list[str] = [
     "ALL_REGIONS",
     "REGION_NAMES",
     "COMMON_REGIONS",
+    "DEFAULT_ENABLED_REGIONS",
+    "get_partition",
+    "get_global_region",
+    "requires_opt_in",
     # 가용성 확인
     "RegionAvailabilityChecker",
     "RegionInfo",
@@ -34,6 +48,8 @@ __all__: list[str] = [
     "filter_available_regions",
     "validate_regions",
     "reset_region_checkers",
+    "get_enabled_regions",
+    "filter_service_regions",
     # 필터링
     "AccountFilter",
     "expand_region_pattern",
@@ -17,6 +17,10 @@ Usage:
     if checker.is_region_available("ap-northeast-2"):
         print("서울 리전 사용 가능")
 
+    # 병렬 실행 전 리전 정리 (계정별 활성 리전: 파일 캐시, 서비스 제공 리전: botocore 데이터)
+    enabled = get_enabled_regions(session, cache_key=account_id)
+    regions = filter_service_regions("ec2", regions)
+
     # 리전 패턴 필터링과 함께 사용
     from core.region.filter import expand_region_pattern
     requested = expand_region_pattern("ap-*")
@@ -25,12 +29,17 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
 import threading
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from .data import get_partition
+
 if TYPE_CHECKING:
     import boto3
 
@@ -357,3 +366,129 @@ def validate_regions(session: boto3.Session, regions: list[str]) -> tuple[list[s
     available = checker.filter_available_regions(regions)
     unavailable = checker.get_unavailable_regions(regions)
     return available, unavailable
+
+
+# =============================================================================
+# 계정별 활성 리전 (파일 캐시)
+# =============================================================================
+
+# 캐시 카테고리 (temp/region/, TTL은 core/tools/cache/ttl.py의 "region")
+REGION_CACHE_CATEGORY = "region"
+
+
+def _enabled_regions_filename(cache_key: str) -> str:
+    return f"enabled_regions_{re.sub(r'[^A-Za-z0-9_.-]', '_', cache_key)}.json"
+
+
+def get_enabled_regions(
+    session: boto3.Session,
+    cache_key: str,
+    api_region: str = "us-east-1",
+) -> frozenset[str] | None:
+    """계정에서 활성화된 리전 조회 (파일 캐시)
+
+    옵트인 리전 활성화는 계정 설정이므로 계정(또는 프로파일)별로 ``temp/region/`` 에
+    저장하고 ``"region"`` TTL 동안 재사용합니다. 프로세스가 바뀌어도 API를 다시
+    호출하지 않으므로 멀티 계정 실행 전 리전 정리에 사용할 수 있습니다.
+
+    Args:
+        session: 대상 계정의 boto3 Session
+        cache_key: 캐시 키 (계정 ID 또는 프로파일명)
+        api_region: describe_regions 호출 리전 (파티션의 기본 활성 리전)
+
+    Returns:
+        활성 리전 집합. 조회 실패 시 None (판단 불가 - 필터링하지 않음)
+    """
+    from core.tools.cache.ttl import get_or_fetch
+
+    def fetch() -> dict[str, Any]:
+        ec2 = session.client("ec2", region_name=api_region)
+        response = ec2.describe_regions(AllRegions=True)
+        regions = [
+            RegionInfo(
+                region_name=region.get("RegionName", ""),
+                endpoint=region.get("Endpoint", ""),
+                opt_in_status=region.get("OptInStatus", "opt-in-not-required"),
+            ).to_dict()
+            for region in response.get("Regions", [])
+        ]
+        if not regions:
+            raise ValueError("describe_regions 응답에 리전 없음")
+        return {"regions": regions}
+
+    try:
+        data = get_or_fetch(REGION_CACHE_CATEGORY, _enabled_regions_filename(cache_key), fetch)
+        return frozenset(r["region_name"] for r in data["regions"] if r["is_opted_in"])
+    except Exception as e:
+        logger.debug(f"활성 리전 조회 실패 ({cache_key}): {e}")
+        return None
+
+
+# =============================================================================
+# 서비스 제공 리전 (botocore 엔드포인트 데이터)
+# =============================================================================
+
+# rate limit용 서비스명 -> botocore 엔드포인트 접두사 (이름이 다른 경우만)
+_ENDPOINT_PREFIXES: dict[str, str] = {
+    "cloudwatch": "monitoring",
+    "ecr": "api.ecr",
+    "efs": "elasticfilesystem",
+    "elb": "elasticloadbalancing",
+    "elbv2": "elasticloadbalancing",
+    "emr": "elasticmapreduce",
+    "opensearch": "es",
+    "resourcegroupstaggingapi": "tagging",
+    "sagemaker": "api.sagemaker",
+    "stepfunctions": "states",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_endpoint_partitions() -> dict[str, dict[str, Any]]:
+    """botocore endpoints.json을 파티션명 기준으로 로드 (프로세스당 1회)"""
+    from botocore.loaders import create_loader
+
+    data = create_loader().load_data("endpoints")
+    return {p["partition"]: p for p in data.get("partitions", [])}
+
+
+@functools.lru_cache(maxsize=256)
+def _service_regions(service: str, partition: str) -> tuple[frozenset[str], frozenset[str]] | None:
+    """(서비스 제공 리전, 파티션의 알려진 리전). 판단할 수 없으면 None"""
+    try:
+        partitions = _load_endpoint_partitions()
+    except Exception as e:
+        logger.debug(f"botocore 엔드포인트 데이터 로드 실패: {e}")
+        return None
+
+    data = partitions.get(partition)
+    if data is None:
+        return None
+    service_data = data.get("services", {}).get(_ENDPOINT_PREFIXES.get(service, service))
+    # 알 수 없는 서비스, 글로벌 엔드포인트 서비스(IAM, Health 등)는 리전과 무관
+    if not service_data or not service_data.get("isRegionalized", True) or "partitionEndpoint" in service_data:
+        return None
+
+    known = frozenset(data.get("regions", {}))
+    offered = frozenset(r for r in service_data.get("endpoints", {}) if r in known)
+    return (offered, known) if offered else None
+
+
+def filter_service_regions(service: str, regions: Sequence[str]) -> list[str]:
+    """서비스가 제공되지 않는 리전 제외 (botocore 엔드포인트 데이터 기준)
+
+    설치된 botocore보다 새로운 리전이나 데이터에 없는 서비스는 제외하지 않습니다.
+
+    Args:
+        service: 서비스명 (예: "ec2", "elbv2", "cloudwatch")
+        regions: 대상 리전 목록
+
+    Returns:
+        서비스 제공 리전 목록 (입력 순서 유지)
+    """
+    result = []
+    for region in regions:
+        info = _service_regions(service, get_partition(region))
+        if info is None or region in info[0] or region not in info[1]:
+            result.append(region)
+    return result
@@ -89,3 +89,57 @@ COMMON_REGIONS = [
     ("ap-northeast-1", "도쿄"),
     ("ap-southeast-1", "싱가포르"),
 ]
+
+# 기본 활성 리전 (옵트인 불필요 - 계정에서 비활성화할 수 없음)
+# aws 파티션에서 이 외의 리전은 옵트인 리전이므로 계정별 활성 여부 확인 필요
+DEFAULT_ENABLED_REGIONS = frozenset(
+    {
+        "ap-northeast-1",
+        "ap-northeast-2",
+        "ap-northeast-3",
+        "ap-south-1",
+        "ap-southeast-1",
+        "ap-southeast-2",
+        "ca-central-1",
+        "eu-central-1",
+        "eu-north-1",
+        "eu-west-1",
+        "eu-west-2",
+        "eu-west-3",
+        "sa-east-1",
+        "us-east-1",
+        "us-east-2",
+        "us-west-1",
+        "us-west-2",
+    }
+)
+
+# 파티션 (리전 접두사, 파티션명, 글로벌 서비스 엔드포인트 리전)
+# 접두사가 일치하지 않는 리전은 표준(aws) 파티션
+PARTITIONS = (
+    ("us-gov-", "aws-us-gov", "us-gov-west-1"),
+    ("cn-", "aws-cn", "cn-northwest-1"),
+)
+DEFAULT_PARTITION = "aws"
+DEFAULT_GLOBAL_REGION = "us-east-1"
+
+
+def get_partition(region: str) -> str:
+    """리전이 속한 파티션명 반환 (aws / aws-us-gov / aws-cn)"""
+    for prefix, partition, _ in PARTITIONS:
+        if region.startswith(prefix):
+            return partition
+    return DEFAULT_PARTITION
+
+
+def get_global_region(region: str) -> str:
+    """리전이 속한 파티션의 글로벌 서비스 엔드포인트 리전 반환 (IAM, Route53 등)"""
+    for prefix, _, global_region in PARTITIONS:
+        if region.startswith(prefix):
+            return global_region
+    return DEFAULT_GLOBAL_REGION
+
+
+def requires_opt_in(region: str) -> bool:
+    """계정별 활성화(옵트인)가 필요할 수 있는 리전인지 (aws 파티션의 비기본 리전)"""
+    return get_partition(region) == DEFAULT_PARTITION and region not in DEFAULT_ENABLED_REGIONS
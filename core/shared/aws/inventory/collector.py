@@ -35,7 +35,10 @@ Example:
 
 from __future__ import annotations
 
-from core.parallel import parallel_collect
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from core.parallel import CollectJob, ParallelExecutionResult, parallel_collect, parallel_collect_many
 
 from .services import (
     # Security - Extended
@@ -179,6 +182,83 @@ from .types import (
     WAFWebACL,
 )
 
+# InventoryCollector 메서드명 -> (서비스 수집 함수, rate limit 서비스명)
+# collect_many()가 여러 리소스 타입을 하나의 작업 큐로 스케줄링할 때 사용합니다.
+RESOURCE_COLLECTORS: dict[str, tuple[Callable[..., list[Any]], str]] = {
+    "collect_vpcs": (collect_vpcs, "ec2"),
+    "collect_subnets": (collect_subnets, "ec2"),
+    "collect_route_tables": (collect_route_tables, "ec2"),
+    "collect_internet_gateways": (collect_internet_gateways, "ec2"),
+    "collect_elastic_ips": (collect_elastic_ips, "ec2"),
+    "collect_enis": (collect_enis, "ec2"),
+    "collect_nat_gateways": (collect_nat_gateways, "ec2"),
+    "collect_vpc_endpoints": (collect_vpc_endpoints, "ec2"),
+    "collect_transit_gateways": (collect_transit_gateways, "ec2"),
+    "collect_transit_gateway_attachments": (collect_transit_gateway_attachments, "ec2"),
+    "collect_vpn_gateways": (collect_vpn_gateways, "ec2"),
+    "collect_vpn_connections": (collect_vpn_connections, "ec2"),
+    "collect_network_acls": (collect_network_acls, "ec2"),
+    "collect_vpc_peering_connections": (collect_vpc_peering_connections, "ec2"),
+    "collect_ec2": (collect_ec2_instances, "ec2"),
+    "collect_ebs_volumes": (collect_ebs_volumes, "ec2"),
+    "collect_lambda_functions": (collect_lambda_functions, "lambda"),
+    "collect_ecs_clusters": (collect_ecs_clusters, "ecs"),
+    "collect_ecs_services": (collect_ecs_services, "ecs"),
+    "collect_auto_scaling_groups": (collect_auto_scaling_groups, "autoscaling"),
+    "collect_launch_templates": (collect_launch_templates, "ec2"),
+    "collect_eks_clusters": (collect_eks_clusters, "eks"),
+    "collect_eks_node_groups": (collect_eks_node_groups, "eks"),
+    "collect_amis": (collect_amis, "ec2"),
+    "collect_snapshots": (collect_snapshots, "ec2"),
+    "collect_rds_instances": (collect_rds_instances, "rds"),
+    "collect_rds_clusters": (collect_rds_clusters, "rds"),
+    "collect_s3_buckets": (collect_s3_buckets, "s3"),
+    "collect_dynamodb_tables": (collect_dynamodb_tables, "dynamodb"),
+    "collect_elasticache_clusters": (collect_elasticache_clusters, "elasticache"),
+    "collect_redshift_clusters": (collect_redshift_clusters, "redshift"),
+    "collect_efs_file_systems": (collect_efs_file_systems, "efs"),
+    "collect_fsx_file_systems": (collect_fsx_file_systems, "fsx"),
+    "collect_security_groups": (collect_security_groups, "ec2"),
+    "collect_kms_keys": (collect_kms_keys, "kms"),
+    "collect_secrets": (collect_secrets, "secretsmanager"),
+    "collect_iam_roles": (collect_iam_roles, "iam"),
+    "collect_iam_users": (collect_iam_users, "iam"),
+    "collect_iam_policies": (collect_iam_policies, "iam"),
+    "collect_acm_certificates": (collect_acm_certificates, "acm"),
+    "collect_waf_web_acls": (collect_waf_web_acls, "wafv2"),
+    "collect_cloudfront_distributions": (collect_cloudfront_distributions, "cloudfront"),
+    "collect_route53_hosted_zones": (collect_route53_hosted_zones, "route53"),
+    "collect_load_balancers": (collect_load_balancers, "elasticloadbalancing"),
+    "collect_target_groups": (collect_target_groups, "elasticloadbalancing"),
+    "collect_sns_topics": (collect_sns_topics, "sns"),
+    "collect_sqs_queues": (collect_sqs_queues, "sqs"),
+    "collect_eventbridge_rules": (collect_eventbridge_rules, "events"),
+    "collect_step_functions": (collect_step_functions, "stepfunctions"),
+    "collect_api_gateway_apis": (collect_api_gateway_apis, "apigateway"),
+    "collect_cloudwatch_alarms": (collect_cloudwatch_alarms, "cloudwatch"),
+    "collect_cloudwatch_log_groups": (collect_cloudwatch_log_groups, "logs"),
+    "collect_kinesis_streams": (collect_kinesis_streams, "kinesis"),
+    "collect_kinesis_firehoses": (collect_kinesis_firehoses, "firehose"),
+    "collect_glue_databases": (collect_glue_databases, "glue"),
+    "collect_cloudformation_stacks": (collect_cloudformation_stacks, "cloudformation"),
+    "collect_codepipelines": (collect_codepipelines, "codepipeline"),
+    "collect_codebuild_projects": (collect_codebuild_projects, "codebuild"),
+    "collect_backup_vaults": (collect_backup_vaults, "backup"),
+    "collect_backup_plans": (collect_backup_plans, "backup"),
+}
+
+# 글로벌 서비스 수집 메서드 - 리전마다 실행하지 않고 계정당 1개 태스크(scope="account")로 수집
+GLOBAL_COLLECTORS: frozenset[str] = frozenset(
+    {
+        "collect_s3_buckets",
+        "collect_iam_roles",
+        "collect_iam_users",
+        "collect_iam_policies",
+        "collect_cloudfront_distributions",
+        "collect_route53_hosted_zones",
+    }
+)
+
 
 class InventoryCollector:
     """AWS 리소스 인벤토리 수집기.
@@ -187,8 +267,9 @@ class InventoryCollector:
     11개 카테고리, 60종의 리소스 타입을 지원하며 각 수집 메서드는 해당 타입의
     데이터 클래스 목록을 반환합니다.
 
-    글로벌 리소스(IAM, S3, CloudFront, Route53)는 us-east-1에서만 수집되며,
-    리전 리소스는 ExecutionContext에 지정된 모든 리전에서 병렬 수집됩니다.
+    글로벌 리소스(IAM, S3, CloudFront, Route53)는 계정당 1회 글로벌 엔드포인트 리전에서
+    수집되며 (``scope="account"``), 리전 리소스는 ExecutionContext에 지정된 모든 리전에서
+    병렬 수집됩니다.
 
     Example:
         >>> collector = InventoryCollector(ctx)
@@ -205,6 +286,50 @@ class InventoryCollector:
         """
         self._ctx = ctx
 
+    def collect_many(
+        self,
+        methods: Iterable[str],
+        on_complete: Callable[[str, list[Any]], None] | None = None,
+        max_workers: int = 20,
+    ) -> dict[str, list[Any]]:
+        """여러 리소스 타입을 하나의 공유 작업 큐로 동시 수집합니다.
+
+        ``collect_*`` 메서드를 순차 호출하면 리소스 타입마다 (계정 x 리전)
+        fan-out이 반복됩니다. 이 메서드는 모든 (리소스 타입 x 계정 x 리전) 태스크를
+        ``parallel_collect_many``로 한 번에 스케줄링하며, rate limit은 서비스별로 적용됩니다.
+
+        Args:
+            methods: 수집할 메서드명 목록 (예: ``["collect_vpcs", "collect_ec2"]``)
+            on_complete: (메서드명, 데이터 목록) 콜백. 리소스 타입 수집이 끝나는 즉시
+                호출되며, 지정 시 결과를 보관하지 않습니다 (스트리밍 처리용).
+            max_workers: 최대 동시 스레드 수
+
+        Returns:
+            {메서드명: 데이터 클래스 목록} (on_complete 지정 시 빈 dict)
+
+        Raises:
+            ValueError: 지원하지 않는 메서드명이 포함된 경우
+        """
+        jobs = []
+        for method in methods:
+            if method not in RESOURCE_COLLECTORS:
+                raise ValueError(f"지원하지 않는 수집 메서드: {method}")
+            func, service = RESOURCE_COLLECTORS[method]
+            scope = "account" if method in GLOBAL_COLLECTORS else "region"
+            jobs.append(CollectJob(name=method, func=func, service=service, scope=scope))
+
+        collected: dict[str, list[Any]] = {}
+
+        def _on_job_complete(name: str, result: ParallelExecutionResult[Any]) -> None:
+            data = result.get_flat_data()
+            if on_complete:
+                on_complete(name, data)
+            else:
+                collected[name] = data
+
+        parallel_collect_many(self._ctx, jobs, max_workers=max_workers, on_job_complete=_on_job_complete)
+        return collected
+
     # =========================================================================
     # Network 카테고리 (Basic)
     # =========================================================================
@@ -575,7 +700,7 @@ class InventoryCollector:
     def collect_s3_buckets(self) -> list[S3Bucket]:
         """모든 계정에서 S3 Bucket을 병렬 수집합니다.
 
-        S3는 글로벌 서비스이므로 us-east-1에서만 수집됩니다.
+        S3는 글로벌 서비스이므로 계정당 1회만 수집됩니다.
 
         Returns:
             S3Bucket 데이터 클래스 목록
@@ -584,7 +709,7 @@ class InventoryCollector:
         def _collect(session, account_id: str, account_name: str, region: str):
             return collect_s3_buckets(session, account_id, account_name, region)
 
-        result = parallel_collect(self._ctx, _collect, service="s3")
+        result = parallel_collect(self._ctx, _collect, service="s3", scope="account")
         return result.get_flat_data()
 
     def collect_dynamodb_tables(self) -> list[DynamoDBTable]:
@@ -698,7 +823,7 @@ class InventoryCollector:
     def collect_iam_roles(self) -> list[IAMRole]:
         """모든 계정에서 IAM Role을 병렬 수집합니다.
 
-        IAM은 글로벌 서비스이므로 us-east-1에서만 수집됩니다.
+        IAM은 글로벌 서비스이므로 계정당 1회만 수집됩니다.
 
         Returns:
             IAMRole 데이터 클래스 목록
@@ -707,13 +832,13 @@ class InventoryCollector:
         def _collect(session, account_id: str, account_name: str, region: str):
             return collect_iam_roles(session, account_id, account_name, region)
 
-        result = parallel_collect(self._ctx, _collect, service="iam")
+        result = parallel_collect(self._ctx, _collect, service="iam", scope="account")
         return result.get_flat_data()
 
     def collect_iam_users(self) -> list[IAMUser]:
         """모든 계정에서 IAM User를 병렬 수집합니다.
 
-        IAM은 글로벌 서비스이므로 us-east-1에서만 수집됩니다.
+        IAM은 글로벌 서비스이므로 계정당 1회만 수집됩니다.
 
         Returns:
             IAMUser 데이터 클래스 목록
@@ -722,13 +847,13 @@ class InventoryCollector:
         def _collect(session, account_id: str, account_name: str, region: str):
             return collect_iam_users(session, account_id, account_name, region)
 
-        result = parallel_collect(self._ctx, _collect, service="iam")
+        result = parallel_collect(self._ctx, _collect, service="iam", scope="account")
         return result.get_flat_data()
 
     def collect_iam_policies(self) -> list[IAMPolicy]:
         """모든 계정에서 Customer Managed IAM Policy를 병렬 수집합니다.
 
-        IAM은 글로벌 서비스이므로 us-east-1에서만 수집됩니다.
+        IAM은 글로벌 서비스이므로 계정당 1회만 수집됩니다.
         AWS Managed Policy는 제외되고 Customer Managed Policy만 포함됩니다.
 
         Returns:
@@ -738,7 +863,7 @@ class InventoryCollector:
         def _collect(session, account_id: str, account_name: str, region: str):
             return collect_iam_policies(session, account_id, account_name, region)
 
-        result = parallel_collect(self._ctx, _collect, service="iam")
+        result = parallel_collect(self._ctx, _collect, service="iam", scope="account")
         return result.get_flat_data()
 
     def collect_acm_certificates(self) -> list[ACMCertificate]:
@@ -776,7 +901,7 @@ class InventoryCollector:
     def collect_cloudfront_distributions(self) -> list[CloudFrontDistribution]:
         """모든 계정에서 CloudFront Distribution을 병렬 수집합니다.
 
-        CloudFront는 글로벌 서비스이므로 us-east-1에서만 수집됩니다.
+        CloudFront는 글로벌 서비스이므로 계정당 1회만 수집됩니다.
 
         Returns:
             CloudFrontDistribution 데이터 클래스 목록
@@ -785,13 +910,13 @@ class InventoryCollector:
         def _collect(session, account_id: str, account_name: str, region: str):
             return collect_cloudfront_distributions(session, account_id, account_name, region)
 
-        result = parallel_collect(self._ctx, _collect, service="cloudfront")
+        result = parallel_collect(self._ctx, _collect, service="cloudfront", scope="account")
         return result.get_flat_data()
 
     def collect_route53_hosted_zones(self) -> list[Route53HostedZone]:
         """모든 계정에서 Route 53 Hosted Zone을 병렬 수집합니다.
 
-        Route 53는 글로벌 서비스이므로 us-east-1에서만 수집됩니다.
+        Route 53는 글로벌 서비스이므로 계정당 1회만 수집됩니다.
 
         Returns:
             Route53HostedZone 데이터 클래스 목록
@@ -800,7 +925,7 @@ class InventoryCollector:
         def _collect(session, account_id: str, account_name: str, region: str):
             return collect_route53_hosted_zones(session, account_id, account_name, region)
 
-        result = parallel_collect(self._ctx, _collect, service="route53")
+        result = parallel_collect(self._ctx, _collect, service="route53", scope="account")
         return result.get_flat_data()
 
     # =========================================================================
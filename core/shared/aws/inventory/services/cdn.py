@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 
-from core.parallel import get_client
+from core.parallel import GLOBAL_SERVICE_REGIONS, get_client
 
 from ..types import CloudFrontDistribution, Route53HostedZone
 
@@ -20,20 +20,20 @@ def collect_cloudfront_distributions(
 ) -> list[CloudFrontDistribution]:
     """CloudFront Distribution 리소스를 수집합니다 (글로벌 서비스).
 
-    CloudFront는 글로벌 서비스이므로 us-east-1에서만 수집합니다.
+    CloudFront는 글로벌 서비스이므로 글로벌 엔드포인트 리전(us-east-1 등)에서만 수집합니다.
     Distribution 목록 조회 후 Alias, Origin 수, 태그 등 상세 정보를 함께 수집합니다.
 
     Args:
         session: boto3 Session 객체
         account_id: AWS 계정 ID
         account_name: AWS 계정 이름
-        region: AWS 리전 코드 (us-east-1이 아니면 빈 목록 반환)
+        region: AWS 리전 코드 (글로벌 엔드포인트 리전이 아니면 빈 목록 반환)
 
     Returns:
         CloudFrontDistribution 데이터 클래스 목록
     """
-    # CloudFront는 글로벌 서비스이므로 us-east-1에서만 수집
-    if region != "us-east-1":
+    # CloudFront는 글로벌 서비스이므로 글로벌 엔드포인트 리전에서만 수집
+    if region not in GLOBAL_SERVICE_REGIONS:
         return []
 
     cf = get_client(session, "cloudfront", region_name=region)
@@ -88,20 +88,20 @@ def collect_cloudfront_distributions(
 def collect_route53_hosted_zones(session, account_id: str, account_name: str, region: str) -> list[Route53HostedZone]:
     """Route 53 Hosted Zone 리소스를 수집합니다 (글로벌 서비스).
 
-    Route 53는 글로벌 서비스이므로 us-east-1에서만 수집합니다.
+    Route 53는 글로벌 서비스이므로 글로벌 엔드포인트 리전(us-east-1 등)에서만 수집합니다.
     Hosted Zone 목록 조회 후 레코드 수, Private Zone VPC 정보, 태그 등을 함께 수집합니다.
 
     Args:
         session: boto3 Session 객체
         account_id: AWS 계정 ID
         account_name: AWS 계정 이름
-        region: AWS 리전 코드 (us-east-1이 아니면 빈 목록 반환)
+        region: AWS 리전 코드 (글로벌 엔드포인트 리전이 아니면 빈 목록 반환)
 
     Returns:
         Route53HostedZone 데이터 클래스 목록
     """
-    # Route 53는 글로벌 서비스이므로 us-east-1에서만 수집
-    if region != "us-east-1":
+    # Route 53는 글로벌 서비스이므로 글로벌 엔드포인트 리전에서만 수집
+    if region not in GLOBAL_SERVICE_REGIONS:
         return []
 
     route53 = get_client(session, "route53", region_name=region)
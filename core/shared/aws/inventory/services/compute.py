@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 
-from core.parallel import get_client
+from core.parallel import describe_pages, get_client
 
 from ..types import (
     AMI,
@@ -42,8 +42,7 @@ def collect_ebs_volumes(session, account_id: str, account_name: str, region: str
     ec2 = get_client(session, "ec2", region_name=region)
     volumes = []
 
-    paginator = ec2.get_paginator("describe_volumes")
-    for page in paginator.paginate():
+    for page in describe_pages(ec2, "describe_volumes"):
         for vol in page.get("Volumes", []):
             tags = parse_tags(vol.get("Tags"))
 
@@ -532,8 +531,12 @@ def collect_amis(session, account_id: str, account_name: str, region: str) -> li
     amis = []
 
     try:
-        resp = ec2.describe_images(Owners=["self"])
-        for image in resp.get("Images", []):
+        images = [
+            image
+            for page in describe_pages(ec2, "describe_images", Owners=["self"])
+            for image in page.get("Images", [])
+        ]
+        for image in images:
             tags = parse_tags(image.get("Tags"))
 
             amis.append(
@@ -577,8 +580,7 @@ def collect_snapshots(session, account_id: str, account_name: str, region: str)
     ec2 = get_client(session, "ec2", region_name=region)
     snapshots = []
 
-    paginator = ec2.get_paginator("describe_snapshots")
-    for page in paginator.paginate(OwnerIds=["self"]):
+    for page in describe_pages(ec2, "describe_snapshots", OwnerIds=["self"]):
         for snap in page.get("Snapshots", []):
             tags = parse_tags(snap.get("Tags"))
 
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 
-from core.parallel import get_client
+from core.parallel import GLOBAL_SERVICE_REGIONS, get_client
 
 from ..types import DynamoDBTable, ElastiCacheCluster, RDSCluster, RDSInstance, RedshiftCluster, S3Bucket
 
@@ -83,20 +83,20 @@ def collect_rds_instances(session, account_id: str, account_name: str, region: s
 def collect_s3_buckets(session, account_id: str, account_name: str, region: str) -> list[S3Bucket]:
     """S3 Bucket 리소스를 수집합니다 (글로벌 서비스).
 
-    S3는 글로벌 서비스이므로 us-east-1에서만 수집합니다. 각 버킷의 리전, 버저닝, 암호화,
+    S3는 글로벌 서비스이므로 글로벌 엔드포인트 리전(us-east-1 등)에서만 수집합니다. 각 버킷의 리전, 버저닝, 암호화,
     Public Access Block, 로깅, Lifecycle 규칙 등 상세 정보와 태그를 함께 수집합니다.
 
     Args:
         session: boto3 Session 객체
         account_id: AWS 계정 ID
         account_name: AWS 계정 이름
-        region: AWS 리전 코드 (us-east-1이 아니면 빈 목록 반환)
+        region: AWS 리전 코드 (글로벌 엔드포인트 리전이 아니면 빈 목록 반환)
 
     Returns:
         S3Bucket 데이터 클래스 목록
     """
-    # S3는 글로벌 서비스이므로 us-east-1에서만 수집
-    if region != "us-east-1":
+    # S3는 글로벌 서비스이므로 글로벌 엔드포인트 리전에서만 수집
+    if region not in GLOBAL_SERVICE_REGIONS:
         return []
 
     s3 = get_client(session, "s3", region_name=region)
@@ -4,7 +4,7 @@ shared/aws/inventory/services/ec2.py - EC2 리소스 수집
 
 from __future__ import annotations
 
-from core.parallel import get_client
+from core.parallel import describe_pages, get_client
 from functions.reports.ip_search.parser import parse_eni_description
 
 from ..types import EC2Instance, SecurityGroup
@@ -29,8 +29,7 @@ def collect_ec2_instances(session, account_id: str, account_name: str, region: s
     ec2 = get_client(session, "ec2", region_name=region)
     instances = []
 
-    paginator = ec2.get_paginator("describe_instances")
-    for page in paginator.paginate():
+    for page in describe_pages(ec2, "describe_instances"):
         for reservation in page.get("Reservations", []):
             for inst in reservation.get("Instances", []):
                 # 태그 파싱
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 
-from core.parallel import get_client
+from core.parallel import GLOBAL_SERVICE_REGIONS, get_client
 
 from ..types import ACMCertificate, IAMPolicy, IAMRole, IAMUser, WAFWebACL
 
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 def collect_iam_roles(session, account_id: str, account_name: str, region: str) -> list[IAMRole]:
     """IAM Role 리소스를 수집합니다 (글로벌 서비스).
 
-    IAM은 글로벌 서비스이므로 us-east-1에서만 수집합니다. Role 목록 조회 후
+    IAM은 글로벌 서비스이므로 글로벌 엔드포인트 리전(us-east-1 등)에서만 수집합니다. Role 목록 조회 후
     각 Role의 마지막 사용 일시/리전, 연결된 정책 수(Attached/Inline) 등
     상세 정보와 태그를 함께 수집합니다.
 
@@ -26,12 +26,12 @@ def collect_iam_roles(session, account_id: str, account_name: str, region: str)
         session: boto3 Session 객체
         account_id: AWS 계정 ID
         account_name: AWS 계정 이름
-        region: AWS 리전 코드 (us-east-1이 아니면 빈 목록 반환)
+        region: AWS 리전 코드 (글로벌 엔드포인트 리전이 아니면 빈 목록 반환)
 
     Returns:
         IAMRole 데이터 클래스 목록
     """
-    if region != "us-east-1":
+    if region not in GLOBAL_SERVICE_REGIONS:
         return []
 
     iam = get_client(session, "iam", region_name=region)
@@ -98,7 +98,7 @@ def collect_iam_roles(session, account_id: str, account_name: str, region: str)
 def collect_iam_users(session, account_id: str, account_name: str, region: str) -> list[IAMUser]:
     """IAM User 리소스를 수집합니다 (글로벌 서비스).
 
-    IAM은 글로벌 서비스이므로 us-east-1에서만 수집합니다. User 목록 조회 후
+    IAM은 글로벌 서비스이므로 글로벌 엔드포인트 리전(us-east-1 등)에서만 수집합니다. User 목록 조회 후
     각 User의 Access Key, MFA, Console Access, 그룹, 정책 수 등
     상세 정보와 태그를 함께 수집합니다.
 
@@ -106,12 +106,12 @@ def collect_iam_users(session, account_id: str, account_name: str, region: str)
         session: boto3 Session 객체
         account_id: AWS 계정 ID
         account_name: AWS 계정 이름
-        region: AWS 리전 코드 (us-east-1이 아니면 빈 목록 반환)
+        region: AWS 리전 코드 (글로벌 엔드포인트 리전이 아니면 빈 목록 반환)
 
     Returns:
         IAMUser 데이터 클래스 목록
     """
-    if region != "us-east-1":
+    if region not in GLOBAL_SERVICE_REGIONS:
         return []
 
     iam = get_client(session, "iam", region_name=region)
@@ -203,7 +203,7 @@ def collect_iam_users(session, account_id: str, account_name: str, region: str)
 def collect_iam_policies(session, account_id: str, account_name: str, region: str) -> list[IAMPolicy]:
     """IAM Policy (Customer Managed) 리소스를 수집합니다 (글로벌 서비스).
 
-    IAM은 글로벌 서비스이므로 us-east-1에서만 수집합니다.
+    IAM은 글로벌 서비스이므로 글로벌 엔드포인트 리전(us-east-1 등)에서만 수집합니다.
     AWS Managed Policy는 제외하고 Customer Managed Policy만 수집합니다.
     각 Policy의 연결 수, 버전, Permissions Boundary 사용 수 등과 태그를 함께 수집합니다.
 
@@ -211,12 +211,12 @@ def collect_iam_policies(session, account_id: str, account_name: str, region: st
         session: boto3 Session 객체
         account_id: AWS 계정 ID
         account_name: AWS 계정 이름
-        region: AWS 리전 코드 (us-east-1이 아니면 빈 목록 반환)
+        region: AWS 리전 코드 (글로벌 엔드포인트 리전이 아니면 빈 목록 반환)
 
     Returns:
         IAMPolicy 데이터 클래스 목록
     """
-    if region != "us-east-1":
+    if region not in GLOBAL_SERVICE_REGIONS:
         return []
 
     iam = get_client(session, "iam", region_name=region)
@@ -7,7 +7,7 @@ AWS, GCP, Azure, Oracle Cloud, Cloudflare, Fastly 지원.
 Usage:
     from core.shared.aws.ip_ranges import (
         search_public_ip,
-        search_public_ip_optimized,  # Radix Tree / Binary Search
+        search_public_ip_optimized,  # 저장된 정렬 구간 인덱스
         search_by_filter,
         get_available_filters,
         get_public_cache_status,
@@ -18,7 +18,7 @@ Usage:
     # Search for IP in cloud ranges (original linear search)
     results = search_public_ip(["52.94.76.1"])
 
-    # Optimized search (Radix Tree / Binary Search)
+    # Optimized search (index.bin 캐시 + 세션 내 재사용)
     results = search_public_ip_optimized(["52.94.76.1"])
 
     # Filter by provider/region/service
@@ -41,6 +41,7 @@ from .providers import (
     get_fastly_ip_ranges,
     get_gcp_ip_ranges,
     get_oracle_ip_ranges,
+    get_provider_index,
     get_public_cache_status,
     get_search_backend,
     list_aws_regions,
@@ -88,6 +89,7 @@ __all__ = [
     "search_in_cloudflare",
     "search_in_fastly",
     "search_by_filter",
+    "get_provider_index",
     "get_search_backend",
     # Filter helpers
     "get_available_filters",
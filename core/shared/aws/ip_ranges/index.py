@@ -3,11 +3,18 @@ shared/aws/ip_ranges/index.py - Optimized IP Range Index
 
 고성능 IP 대역 검색을 위한 인덱스 구조:
 - pytricia 사용 시: Radix Tree 기반 O(W) 조회 (W=32/128 비트)
-- fallback: Sorted array + Binary search O(log N)
+- fallback: Sorted integer intervals + Binary search O(log N)
+
+Sorted interval backend:
+- 각 prefix를 [시작, 끝] 정수 구간으로 보관하고 시작 주소 기준으로 정렬
+- CIDR 구간은 서로 포함되거나 분리되므로, 구축 시 각 구간의 가장 가까운 상위 구간
+  (parent)을 기록하면 IP를 포함하는 모든 prefix를 bisect 한 번 + parent 체인으로 찾음
+- 메타데이터(provider/service/region/extra)는 중복 제거 후 id로 참조하여
+  바이너리 파일로 저장/로드 가능 (MultiProviderIndex.save / load)
 
 Performance:
 - Radix Tree: ~0.016ms per lookup (625x faster than linear)
-- Binary Search: ~0.1ms per lookup (100x faster than linear)
+- Binary Search: ~0.01ms per lookup
 - Linear Search: ~10ms per lookup (original)
 
 Usage:
@@ -24,7 +31,14 @@ Usage:
 from __future__ import annotations
 
 import ipaddress
+import json
 import logging
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -64,23 +78,110 @@ class IPPrefixData:
 # Type alias for network types
 IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
 IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
-NetworkPrefixPair = tuple[IPNetwork, IPPrefixData]
+
+# (provider, service, region, extra items) - 중복 제거된 메타데이터 키
+MetaKey = tuple[str, str, str, tuple[tuple[str, Any], ...]]
+
+
+@dataclass
+class _IntervalTable:
+    """시작 주소 기준으로 정렬된 prefix 구간 테이블 (IP 버전별)
+
+    Attributes:
+        starts: 구간 시작 정수 (오름차순, 같은 시작이면 큰 구간 먼저)
+        ends: 구간 끝 정수 (포함)
+        ids: 엔트리 id (IPRangeIndex 컬럼 인덱스)
+        parents: 가장 가까운 상위 구간의 테이블 위치 (-1 = 없음)
+    """
+
+    starts: list[int]
+    ends: list[int]
+    ids: list[int]
+    parents: list[int]
+
+    @classmethod
+    def build(cls, items: list[tuple[int, int, int]]) -> _IntervalTable:
+        """(start, end, entry_id) 목록으로 테이블 구축
+
+        Args:
+            items: 구간 목록 (순서 무관)
+
+        Returns:
+            정렬 및 parent 링크가 계산된 테이블
+        """
+        # 같은 시작이면 큰 구간이 앞 (동일 구간은 입력 순서 유지)
+        items = sorted(items, key=lambda x: (x[0], -x[1]))
+        parents: list[int] = []
+        stack: list[int] = []
+        for pos, (start, _end, _id) in enumerate(items):
+            while stack and items[stack[-1]][1] < start:
+                stack.pop()
+            parents.append(stack[-1] if stack else -1)
+            stack.append(pos)
+        return cls(
+            starts=[x[0] for x in items],
+            ends=[x[1] for x in items],
+            ids=[x[2] for x in items],
+            parents=parents,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def containing(self, value: int) -> list[int]:
+        """value를 포함하는 모든 구간의 엔트리 id (바깥 구간 → 안쪽 구간 순)
+
+        시작 ≤ value인 마지막 구간에서 출발하면, value를 포함하는 구간은 모두
+        그 구간 자신이거나 parent 체인 위에 있습니다.
+        """
+        pos = bisect_right(self.starts, value) - 1
+        found: list[int] = []
+        while pos >= 0:
+            if self.ends[pos] >= value:
+                found.append(self.ids[pos])
+            pos = self.parents[pos]
+        found.reverse()
+        return found
+
+    def overlapping(self, low: int, high: int) -> list[int]:
+        """[low, high] 구간과 겹치는 모든 구간의 엔트리 id (O(log N + k))
+
+        겹치는 구간은 low를 포함하는 구간(parent 체인)이거나, 시작이 (low, high]에
+        있는 구간(정렬 배열의 연속 구간)입니다.
+        """
+        first = bisect_right(self.starts, low)
+        last = bisect_right(self.starts, high)
+        return self.containing(low) + self.ids[first:last]
 
 
 class IPRangeIndex:
     """
     High-performance IP range index with automatic backend selection.
 
-    Uses pytricia (Radix Tree) when available, falls back to sorted array + binary search.
+    Uses pytricia (Radix Tree) when available, falls back to sorted intervals + binary search.
     Supports both IPv4 and IPv6 addresses.
+
+    Args:
+        use_radix: Radix Tree 사용 여부 (None이면 pytricia 설치 여부로 결정).
+            구간 테이블 백엔드만 포함하는 모든 prefix 반환과 바이너리 저장을 지원합니다.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, use_radix: bool | None = None) -> None:
         self._ipv4_tree: Any = None
         self._ipv6_tree: Any = None
-        self._ipv4_sorted: list[NetworkPrefixPair] = []
-        self._ipv6_sorted: list[NetworkPrefixPair] = []
-        self._use_radix = _HAS_PYTRICIA
+        self._use_radix = _HAS_PYTRICIA if use_radix is None else (use_radix and _HAS_PYTRICIA)
+
+        # Sorted interval backend (컬럼 저장: 엔트리 id = 리스트 인덱스)
+        self._prefixes: list[str] = []
+        self._meta_ids: list[int] = []
+        self._metas: list[MetaKey] = []
+        self._meta_lookup: dict[MetaKey, int] = {}
+        self._pending: dict[int, list[tuple[int, int, int]]] = {4: [], 6: []}
+        self._tables: dict[int, _IntervalTable] = {}
+        self._dirty = False
+        # 필터용 역색인 (첫 필터 조회 시 구축)
+        self._inverted: dict[str, dict[str, set[int]]] | None = None
+        self._entries_by_meta: dict[int, list[int]] | None = None
 
         if self._use_radix:
             self._ipv4_tree = pytricia.PyTricia(32)
@@ -106,39 +207,48 @@ class IPRangeIndex:
         """
         try:
             network = ipaddress.ip_network(prefix, strict=False)
-            data = IPPrefixData(
-                prefix=prefix,
-                provider=provider,
-                service=service,
-                region=region,
-                extra=extra or {},
-            )
 
             if self._use_radix:
+                data = IPPrefixData(
+                    prefix=prefix,
+                    provider=provider,
+                    service=service,
+                    region=region,
+                    extra=extra or {},
+                )
                 tree = self._ipv4_tree if network.version == 4 else self._ipv6_tree
                 # pytricia stores data at the prefix
                 if prefix not in tree:
                     tree[prefix] = []
                 tree[prefix].append(data)
             else:
-                if network.version == 4:
-                    self._ipv4_sorted.append((network, data))
-                else:
-                    self._ipv6_sorted.append((network, data))
+                key: MetaKey = (provider, service, region, tuple(sorted((extra or {}).items())))
+                meta_id = self._meta_lookup.get(key)
+                if meta_id is None:
+                    meta_id = self._meta_lookup[key] = len(self._metas)
+                    self._metas.append(key)
+                entry_id = len(self._prefixes)
+                self._prefixes.append(prefix)
+                self._meta_ids.append(meta_id)
+                self._pending[network.version].append(
+                    (int(network.network_address), int(network.broadcast_address), entry_id)
+                )
+                self._dirty = True
+                self._inverted = None
+                self._entries_by_meta = None
 
         except ValueError as e:
             logger.debug("Invalid prefix %s: %s", prefix, e)
 
     def build(self) -> None:
         """
-        Finalize index building (sort arrays for binary search backend).
+        Finalize index building (sort intervals for binary search backend).
 
         Call this after adding all prefixes when using binary search backend.
         """
         if not self._use_radix:
-            # Sort by network address for binary search
-            self._ipv4_sorted.sort(key=lambda x: x[0].network_address)
-            self._ipv6_sorted.sort(key=lambda x: x[0].network_address)
+            self._tables = {version: _IntervalTable.build(items) for version, items in self._pending.items()}
+            self._dirty = False
 
     def search(self, ip: str) -> list[IPPrefixData]:
         """
@@ -180,22 +290,156 @@ class IPRangeIndex:
 
         return results
 
-    def _search_binary(self, ip_obj: IPAddress) -> list[IPPrefixData]:
-        """Search using sorted array + binary search (O(log N))"""
-        sorted_list: list[NetworkPrefixPair] = self._ipv4_sorted if ip_obj.version == 4 else self._ipv6_sorted
+    def _search_binary(self, ip_obj: IPAddress, meta_ids: set[int] | None = None) -> list[IPPrefixData]:
+        """Search using sorted intervals + binary search (O(log N + depth))"""
+        if self._dirty:
+            self.build()
+        table = self._tables.get(ip_obj.version)
+        if not table:
+            return []
+        return self._entries(table.containing(int(ip_obj)), meta_ids)
+
+    def search_filtered(self, ip: str, meta_ids: set[int] | None = None) -> list[IPPrefixData]:
+        """IP를 포함하는 prefix 중 메타데이터 필터를 통과한 것만 반환
 
-        if not sorted_list:
+        Args:
+            ip: IP address to search
+            meta_ids: filter_meta_ids() 결과 (None이면 필터 없음)
+
+        Returns:
+            List of matching IPPrefixData objects
+        """
+        if self._use_radix:
+            return self.search(ip)
+        try:
+            ip_obj = ipaddress.ip_address(ip)
+        except ValueError:
             return []
+        return self._search_binary(ip_obj, meta_ids)
 
-        results: list[IPPrefixData] = []
+    def search_overlaps(self, cidr: str, meta_ids: set[int] | None = None) -> list[IPPrefixData]:
+        """CIDR과 겹치는 모든 prefix 검색 (상위/하위 prefix 모두 포함)
+
+        Args:
+            cidr: CIDR notation (e.g., "13.0.0.0/8")
+            meta_ids: filter_meta_ids() 결과 (None이면 필터 없음)
+
+        Returns:
+            겹치는 IPPrefixData 목록 (입력을 포함하는 prefix → 입력 안쪽 prefix 순)
+        """
+        try:
+            network = ipaddress.ip_network(cidr, strict=False)
+        except ValueError:
+            return []
 
-        # Binary search for potential matching prefixes
-        # Find the range of prefixes that could contain this IP
-        for network, data in sorted_list:
-            if ip_obj in network:
-                results.append(data)
+        if self._use_radix:
+            tree = self._ipv4_tree if network.version == 4 else self._ipv6_tree
+            return [
+                data
+                for prefix in tree
+                if ipaddress.ip_network(prefix, strict=False).overlaps(network)
+                for data in tree[prefix]
+            ]
+
+        if self._dirty:
+            self.build()
+        table = self._tables.get(network.version)
+        if not table:
+            return []
+        low, high = int(network.network_address), int(network.broadcast_address)
+        return self._entries(table.overlapping(low, high), meta_ids)
+
+    def _entries(self, entry_ids: list[int], meta_ids: set[int] | None) -> list[IPPrefixData]:
+        """엔트리 id 목록을 (필터 후) IPPrefixData로 변환"""
+        if meta_ids is not None:
+            entry_meta = self._meta_ids
+            entry_ids = [i for i in entry_ids if entry_meta[i] in meta_ids]
+        return [self._entry(entry_id) for entry_id in entry_ids]
+
+    def _entry(self, entry_id: int) -> IPPrefixData:
+        """엔트리 id의 IPPrefixData 생성 (조회 결과에만 객체 생성)"""
+        provider, service, region, extra = self._metas[self._meta_ids[entry_id]]
+        return IPPrefixData(
+            prefix=self._prefixes[entry_id],
+            provider=provider,
+            service=service,
+            region=region,
+            extra=dict(extra),
+        )
+
+    # -------------------------------------------------------------------------
+    # 역색인 필터 (sorted interval backend)
+    # -------------------------------------------------------------------------
+
+    def _build_inverted(self) -> dict[str, dict[str, set[int]]]:
+        """provider/region/service 값 → 메타데이터 id 역색인"""
+        if self._inverted is None:
+            inverted: dict[str, dict[str, set[int]]] = {"provider": {}, "region": {}, "service": {}}
+            for meta_id, (provider, service, region, _extra) in enumerate(self._metas):
+                inverted["provider"].setdefault(provider.lower(), set()).add(meta_id)
+                inverted["region"].setdefault(region.lower(), set()).add(meta_id)
+                inverted["service"].setdefault(service.lower(), set()).add(meta_id)
+            self._inverted = inverted
+        return self._inverted
+
+    def filter_meta_ids(
+        self,
+        providers: set[str] | None = None,
+        region: str | None = None,
+        service: str | None = None,
+    ) -> set[int] | None:
+        """필터 조건을 만족하는 메타데이터 id 집합
 
-        return results
+        region/service는 부분 일치(대소문자 무시)이며, prefix가 아닌 고유 값 목록만 검사합니다.
+
+        Args:
+            providers: 프로바이더 이름 집합 (소문자, 정확히 일치)
+            region: 리전 부분 문자열
+            service: 서비스 부분 문자열
+
+        Returns:
+            메타데이터 id 집합 (조건이 없으면 None = 전체)
+        """
+        conditions: list[tuple[str, Callable[[str], bool]]] = []
+        if providers:
+            conditions.append(("provider", lambda value: value in providers))
+        if region:
+            region_lower = region.lower()
+            conditions.append(("region", lambda value: region_lower in value))
+        if service:
+            service_lower = service.lower()
+            conditions.append(("service", lambda value: service_lower in value))
+        if not conditions:
+            return None
+
+        inverted = self._build_inverted()
+        selected: set[int] | None = None
+        for field_name, matches in conditions:
+            ids: set[int] = set()
+            for value, meta_ids in inverted[field_name].items():
+                if matches(value):
+                    ids |= meta_ids
+            selected = ids if selected is None else selected & ids
+        return selected
+
+    def entries_for_meta_ids(self, meta_ids: set[int] | None) -> list[IPPrefixData]:
+        """메타데이터 id에 해당하는 모든 prefix (추가 순서)
+
+        Args:
+            meta_ids: filter_meta_ids() 결과 (None이면 전체)
+
+        Returns:
+            IPPrefixData 목록
+        """
+        if meta_ids is None:
+            return [self._entry(i) for i in range(len(self._prefixes))]
+        if self._entries_by_meta is None:
+            by_meta: dict[int, list[int]] = {}
+            for entry_id, meta_id in enumerate(self._meta_ids):
+                by_meta.setdefault(meta_id, []).append(entry_id)
+            self._entries_by_meta = by_meta
+        entry_ids = sorted(i for meta_id in meta_ids for i in self._entries_by_meta.get(meta_id, []))
+        return [self._entry(i) for i in entry_ids]
 
     def search_batch(self, ips: list[str]) -> dict[str, list[IPPrefixData]]:
         """
@@ -215,7 +459,7 @@ class IPRangeIndex:
         if self._use_radix:
             return len(self._ipv4_tree) + len(self._ipv6_tree)
         else:
-            return len(self._ipv4_sorted) + len(self._ipv6_sorted)
+            return len(self._prefixes)
 
     @property
     def backend(self) -> str:
@@ -223,16 +467,69 @@ class IPRangeIndex:
         return "radix_tree" if self._use_radix else "binary_search"
 
 
+# =============================================================================
+# Binary serialization (sorted interval backend)
+# =============================================================================
+
+# 파일 구조:
+#   MAGIC | header 길이(uint32) | header JSON | prefix 문자열 블록 길이(uint32) | prefix 문자열("\n" 구분)
+#   | meta_ids(uint32[N])
+#   | IPv4: starts, ends (uint32[n4]), ids (uint32[n4]), parents (int32[n4])
+#   | IPv6: starts_hi, starts_lo, ends_hi, ends_lo (uint64[n6]), ids (uint32[n6]), parents (int32[n6])
+_INDEX_MAGIC = b"AAIPIDX1"
+_LEN = struct.Struct("<I")
+_MASK64 = (1 << 64) - 1
+
+
+def _u32(values: list[int]) -> bytes:
+    return array("I", values).tobytes()
+
+
+def _i32(values: list[int]) -> bytes:
+    return array("i", values).tobytes()
+
+
+def _u64(values: list[int]) -> bytes:
+    return array("Q", values).tobytes()
+
+
+class _Reader:
+    """바이너리 인덱스 순차 읽기"""
+
+    def __init__(self, blob: bytes, offset: int) -> None:
+        self._view = memoryview(blob)
+        self._offset = offset
+
+    def raw(self, size: int) -> memoryview:
+        chunk = self._view[self._offset : self._offset + size]
+        if len(chunk) != size:
+            raise ValueError("IP range index file is truncated")
+        self._offset += size
+        return chunk
+
+    def length(self) -> int:
+        value: int = _LEN.unpack(self.raw(_LEN.size))[0]
+        return value
+
+    def ints(self, typecode: str, count: int) -> list[int]:
+        values = array(typecode)
+        values.frombytes(self.raw(values.itemsize * count))
+        return values.tolist()
+
+
 class MultiProviderIndex:
     """
     Index for searching across multiple cloud providers.
 
     Combines all provider IP ranges into a single optimized index.
+    Always uses the sorted interval backend so that the built index can be
+    saved to / loaded from a compact binary file.
     """
 
     def __init__(self) -> None:
-        self._index = IPRangeIndex()
+        self._index = IPRangeIndex(use_radix=False)
         self._loaded_providers: set[str] = set()
+        self.signature: Any = None
 
     def load_provider(self, provider: str, data: dict[str, Any]) -> None:
         """
@@ -340,9 +637,151 @@ class MultiProviderIndex:
         """Finalize index building"""
         self._index.build()
 
-    def search(self, ip: str) -> list[IPPrefixData]:
+    def search(self, ip: str, meta_ids: set[int] | None = None) -> list[IPPrefixData]:
         """Search for an IP address across all loaded providers"""
-        return self._index.search(ip)
+        return self._index.search_filtered(ip, meta_ids)
+
+    def search_overlaps(self, cidr: str, meta_ids: set[int] | None = None) -> list[IPPrefixData]:
+        """Search prefixes overlapping a CIDR across all loaded providers"""
+        return self._index.search_overlaps(cidr, meta_ids)
+
+    def filter_meta_ids(
+        self,
+        providers: set[str] | None = None,
+        region: str | None = None,
+        service: str | None = None,
+    ) -> set[int] | None:
+        """provider/region/service 필터의 메타데이터 id 집합 (IPRangeIndex.filter_meta_ids)"""
+        return self._index.filter_meta_ids(providers, region, service)
+
+    def entries_for_meta_ids(self, meta_ids: set[int] | None) -> list[IPPrefixData]:
+        """필터에 해당하는 모든 prefix (IPRangeIndex.entries_for_meta_ids)"""
+        return self._index.entries_for_meta_ids(meta_ids)
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, path: str, signature: Any = None) -> None:
+        """구축된 인덱스를 바이너리 파일로 저장 (임시 파일 작성 후 교체)
+
+        Args:
+            path: 저장 경로
+            signature: 원본 데이터 식별값 (JSON 직렬화 가능, load 시 비교)
+        """
+        index = self._index
+        if index._dirty or not index._tables:
+            index.build()
+        v4, v6 = index._tables[4], index._tables[6]
+
+        header = json.dumps(
+            {
+                "signature": signature,
+                "providers": sorted(self._loaded_providers),
+                "metas": [
+                    [provider, service, region, list(extra)] for provider, service, region, extra in index._metas
+                ],
+                "entries": len(index._prefixes),
+                "ipv4": len(v4),
+                "ipv6": len(v6),
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        prefixes = "\n".join(index._prefixes).encode("utf-8")
+
+        parts = [
+            _INDEX_MAGIC,
+            _LEN.pack(len(header)),
+            header,
+            _LEN.pack(len(prefixes)),
+            prefixes,
+            _u32(index._meta_ids),
+            _u32(v4.starts),
+            _u32(v4.ends),
+            _u32(v4.ids),
+            _i32(v4.parents),
+            _u64([v >> 64 for v in v6.starts]),
+            _u64([v & _MASK64 for v in v6.starts]),
+            _u64([v >> 64 for v in v6.ends]),
+            _u64([v & _MASK64 for v in v6.ends]),
+            _u32(v6.ids),
+            _i32(v6.parents),
+        ]
+
+        directory = os.path.dirname(path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"".join(parts))
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str, signature: Any = None) -> MultiProviderIndex | None:
+        """save()로 저장한 인덱스 로드
+
+        Args:
+            path: 인덱스 파일 경로
+            signature: 기대하는 원본 데이터 식별값 (다르면 None)
+
+        Returns:
+            MultiProviderIndex 또는 None (파일 없음/손상/signature 불일치)
+        """
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+        except OSError:
+            return None
+
+        try:
+            if not blob.startswith(_INDEX_MAGIC):
+                return None
+            reader = _Reader(blob, len(_INDEX_MAGIC))
+            header = json.loads(bytes(reader.raw(reader.length())).decode("utf-8"))
+            if header.get("signature") != signature:
+                return None
+
+            entries, n4, n6 = header["entries"], header["ipv4"], header["ipv6"]
+            prefix_blob = bytes(reader.raw(reader.length())).decode("utf-8")
+            prefixes = prefix_blob.split("\n") if entries else []
+            meta_ids = reader.ints("I", entries)
+
+            v4 = _IntervalTable(
+                starts=reader.ints("I", n4),
+                ends=reader.ints("I", n4),
+                ids=reader.ints("I", n4),
+                parents=reader.ints("i", n4),
+            )
+            starts_hi, starts_lo = reader.ints("Q", n6), reader.ints("Q", n6)
+            ends_hi, ends_lo = reader.ints("Q", n6), reader.ints("Q", n6)
+            v6 = _IntervalTable(
+                starts=[(hi << 64) | lo for hi, lo in zip(starts_hi, starts_lo, strict=True)],
+                ends=[(hi << 64) | lo for hi, lo in zip(ends_hi, ends_lo, strict=True)],
+                ids=reader.ints("I", n6),
+                parents=reader.ints("i", n6),
+            )
+            if len(prefixes) != entries:
+                return None
+        except (ValueError, KeyError, TypeError, UnicodeDecodeError) as e:
+            logger.debug("Failed to load IP range index %s: %s", path, e)
+            return None
+
+        instance = cls()
+        index = instance._index
+        index._prefixes = prefixes
+        index._meta_ids = meta_ids
+        index._metas = [
+            (provider, service, region, tuple((k, v) for k, v in extra))
+            for provider, service, region, extra in header["metas"]
+        ]
+        index._meta_lookup = {key: i for i, key in enumerate(index._metas)}
+        index._tables = {4: v4, 6: v6}
+        instance._loaded_providers = set(header.get("providers", []))
+        instance.signature = signature
+        return instance
 
     @property
     def prefix_count(self) -> int:
@@ -376,6 +815,12 @@ def get_global_index() -> MultiProviderIndex:
     return _global_index
 
 
+def set_global_index(index: MultiProviderIndex) -> None:
+    """글로벌 인덱스 교체 (구축/로드 완료된 인덱스 등록)"""
+    global _global_index
+    _global_index = index
+
+
 def reset_global_index() -> None:
     """글로벌 인덱스 초기화 (캐시 갱신용)"""
     global _global_index
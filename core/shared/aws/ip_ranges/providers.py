@@ -8,7 +8,7 @@ Features:
 - 24시간 캐시로 빠른 응답
 - 병렬 데이터 로딩
 - CIDR 및 단일 IP 검색
-- Radix Tree 기반 O(1) IP 조회 (pytricia 사용 시)
+- 정렬 구간 인덱스 기반 IP 조회 (바이너리 파일로 저장, 세션 내 재사용)
 """
 
 from __future__ import annotations
@@ -19,15 +19,21 @@ import logging
 import os
 import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import requests
 
 from core.parallel import ErrorCollector, ErrorSeverity
 from core.tools.cache.path import get_cache_dir
 
+if TYPE_CHECKING:
+    from .index import MultiProviderIndex
+
 logger = logging.getLogger(__name__)
 
+# 구축된 MultiProviderIndex 바이너리 (캐시 디렉토리, 프로바이더 JSON 옆)
+_INDEX_FILE = "index.bin"
+
 # =============================================================================
 # Data Structures
 # =============================================================================
@@ -795,6 +801,9 @@ def search_public_cidr(
     """
     Search public IP ranges by CIDR overlap
 
+    입력 CIDR마다 인덱스의 구간 겹침 조회(O(log N + k))를 사용하며,
+    프로바이더/리전/서비스 필터는 역색인으로 한 번만 계산합니다.
+
     Args:
         cidr_list: List of CIDR ranges to search (e.g., ["13.0.0.0/8", "52.0.0.0/16"])
         providers: List of providers to search (None for all)
@@ -804,173 +813,36 @@ def search_public_cidr(
     Returns:
         List of overlapping IP ranges from cloud providers
     """
-    all_providers = {"aws", "gcp", "azure", "oracle", "cloudflare", "fastly"}
-    target_providers = {p.lower() for p in providers} & all_providers if providers else all_providers
-
-    data_sources = load_ip_ranges_parallel(target_providers)
+    target_providers = {p.lower() for p in providers} & set(ALL_PROVIDERS) if providers else set(ALL_PROVIDERS)
+    index = get_provider_index(sorted(target_providers))
+    meta_ids = index.filter_meta_ids(target_providers if providers else None, region_filter, service_filter)
 
     all_results: list[PublicIPResult] = []
 
-    # Normalize filters for case-insensitive matching
-    region_filter_lower = region_filter.lower() if region_filter else None
-    service_filter_lower = service_filter.lower() if service_filter else None
-
     for cidr_str in cidr_list:
         cidr_str = cidr_str.strip()
         if not cidr_str:
             continue
 
         try:
-            input_network = ipaddress.ip_network(cidr_str, strict=False)
+            ipaddress.ip_network(cidr_str, strict=False)
         except ValueError:
             continue
 
-        found = False
-
-        # Search in each provider's data
-        for provider_name, data in data_sources.items():
-            if not data:
-                continue
-
-            # Get prefixes based on provider format
-            if provider_name == "aws":
-                prefixes = data.get("prefixes", []) if input_network.version == 4 else data.get("ipv6_prefixes", [])
-                prefix_key = "ip_prefix" if input_network.version == 4 else "ipv6_prefix"
-                for prefix in prefixes:
-                    try:
-                        provider_network = ipaddress.ip_network(prefix[prefix_key])
-                        if input_network.overlaps(provider_network):
-                            # Apply filters
-                            p_region = prefix.get("region", "")
-                            p_service = prefix.get("service", "")
-                            if region_filter_lower and (not p_region or region_filter_lower not in p_region.lower()):
-                                continue
-                            if service_filter_lower and (
-                                not p_service or service_filter_lower not in p_service.lower()
-                            ):
-                                continue
-                            all_results.append(
-                                PublicIPResult(
-                                    ip_address=cidr_str,
-                                    provider="AWS",
-                                    service=p_service,
-                                    ip_prefix=prefix[prefix_key],
-                                    region=p_region,
-                                    extra={"network_border_group": prefix.get("network_border_group", "")},
-                                )
-                            )
-                            found = True
-                    except (ValueError, KeyError):
-                        continue
-
-            elif provider_name == "gcp":
-                for prefix in data.get("prefixes", []):
-                    prefix_key = "ipv4Prefix" if input_network.version == 4 else "ipv6Prefix"
-                    if prefix_key not in prefix:
-                        continue
-                    try:
-                        provider_network = ipaddress.ip_network(prefix[prefix_key])
-                        if input_network.overlaps(provider_network):
-                            p_scope = prefix.get("scope", "")
-                            p_service = prefix.get("service", "Google Cloud")
-                            if region_filter_lower and (not p_scope or region_filter_lower not in p_scope.lower()):
-                                continue
-                            if service_filter_lower and (
-                                not p_service or service_filter_lower not in p_service.lower()
-                            ):
-                                continue
-                            all_results.append(
-                                PublicIPResult(
-                                    ip_address=cidr_str,
-                                    provider="GCP",
-                                    service=p_service,
-                                    ip_prefix=prefix[prefix_key],
-                                    region=p_scope,
-                                )
-                            )
-                            found = True
-                    except ValueError:
-                        continue
-
-            elif provider_name == "azure":
-                for service in data.get("values", []):
-                    svc_name = service.get("name", "Azure")
-                    svc_region = service.get("properties", {}).get("region", "Global")
-                    if region_filter_lower and (not svc_region or region_filter_lower not in svc_region.lower()):
-                        continue
-                    if service_filter_lower and (not svc_name or service_filter_lower not in svc_name.lower()):
-                        continue
-                    for prefix_str in service.get("properties", {}).get("addressPrefixes", []):
-                        try:
-                            provider_network = ipaddress.ip_network(prefix_str)
-                            if input_network.overlaps(provider_network):
-                                all_results.append(
-                                    PublicIPResult(
-                                        ip_address=cidr_str,
-                                        provider="Azure",
-                                        service=svc_name,
-                                        ip_prefix=prefix_str,
-                                        region=svc_region,
-                                    )
-                                )
-                                found = True
-                        except ValueError:
-                            continue
-
-            elif provider_name == "oracle":
-                for region in data.get("regions", []):
-                    reg_name = region.get("region", "Unknown")
-                    if region_filter_lower and (not reg_name or region_filter_lower not in reg_name.lower()):
-                        continue
-                    for cidr_obj in region.get("cidrs", []):
-                        cidr = cidr_obj.get("cidr", "")
-                        tags = cidr_obj.get("tags", [])
-                        svc_name = ", ".join(tags) if tags else "Oracle Cloud"
-                        if service_filter_lower and (not svc_name or service_filter_lower not in svc_name.lower()):
-                            continue
-                        try:
-                            provider_network = ipaddress.ip_network(cidr)
-                            if input_network.overlaps(provider_network):
-                                all_results.append(
-                                    PublicIPResult(
-                                        ip_address=cidr_str,
-                                        provider="Oracle",
-                                        service=svc_name,
-                                        ip_prefix=cidr,
-                                        region=reg_name,
-                                    )
-                                )
-                                found = True
-                        except ValueError:
-                            continue
-
-            elif provider_name in ("cloudflare", "fastly"):
-                provider_display = provider_name.capitalize()
-                prefixes = data.get("prefixes", []) if input_network.version == 4 else data.get("ipv6_prefixes", [])
-                prefix_key = "ip_prefix" if input_network.version == 4 else "ipv6_prefix"
-                for prefix in prefixes:
-                    try:
-                        provider_network = ipaddress.ip_network(prefix[prefix_key])
-                        if input_network.overlaps(provider_network):
-                            p_service = prefix.get("service", f"{provider_display} CDN")
-                            if service_filter_lower and (
-                                not p_service or service_filter_lower not in p_service.lower()
-                            ):
-                                continue
-                            all_results.append(
-                                PublicIPResult(
-                                    ip_address=cidr_str,
-                                    provider=provider_display,
-                                    service=p_service,
-                                    ip_prefix=prefix[prefix_key],
-                                    region="Global",
-                                )
-                            )
-                            found = True
-                    except (ValueError, KeyError):
-                        continue
+        matches = index.search_overlaps(cidr_str, meta_ids)
+        for match in matches:
+            all_results.append(
+                PublicIPResult(
+                    ip_address=cidr_str,
+                    provider=match.provider,
+                    service=match.service,
+                    ip_prefix=match.prefix,
+                    region=match.region,
+                    extra=match.extra,
+                )
+            )
 
-        if not found:
+        if not matches:
             all_results.append(
                 PublicIPResult(
                     ip_address=cidr_str,
@@ -1026,142 +898,34 @@ def search_by_filter(
     """
     Search IP ranges by region or service
 
+    리전/서비스 고유 값의 역색인으로 대상 메타데이터를 고른 뒤 해당 prefix만 나열합니다.
+
     Args:
         provider: Cloud provider (aws, gcp, azure, oracle, cloudflare, fastly)
         region: Region filter (partial match)
         service: Service filter (partial match)
 
     Returns:
-        List of matching IP ranges
+        List of matching IP ranges (IPv4 and IPv6)
     """
     provider = provider.lower()
-
-    # Load data
-    loaders = {
-        "aws": get_aws_ip_ranges,
-        "gcp": get_gcp_ip_ranges,
-        "azure": get_azure_ip_ranges,
-        "oracle": get_oracle_ip_ranges,
-        "cloudflare": get_cloudflare_ip_ranges,
-        "fastly": get_fastly_ip_ranges,
-    }
-
-    if provider not in loaders:
+    if provider not in ALL_PROVIDERS:
         return []
 
-    data = loaders[provider]()
-    results: list[PublicIPResult] = []
-
-    if provider == "aws":
-        for prefix in data.get("prefixes", []):
-            p_region = prefix.get("region", "")
-            p_service = prefix.get("service", "")
-            ip_prefix = prefix.get("ip_prefix", "")
-
-            # Check filter conditions
-            if region and region.lower() not in p_region.lower():
-                continue
-            if service and service.lower() not in p_service.lower():
-                continue
+    index = get_provider_index([provider])
+    meta_ids = index.filter_meta_ids({provider}, region, service)
 
-            results.append(
-                PublicIPResult(
-                    ip_address="",
-                    provider="AWS",
-                    service=p_service,
-                    ip_prefix=ip_prefix,
-                    region=p_region,
-                    extra={"network_border_group": prefix.get("network_border_group", "")},
-                )
-            )
-
-    elif provider == "gcp":
-        for prefix in data.get("prefixes", []):
-            p_scope = prefix.get("scope", "")
-            p_service = prefix.get("service", "Google Cloud")
-            ip_prefix = prefix.get("ipv4Prefix", "") or prefix.get("ipv6Prefix", "")
-
-            if region and region.lower() not in p_scope.lower():
-                continue
-            if service and service.lower() not in p_service.lower():
-                continue
-
-            results.append(
-                PublicIPResult(
-                    ip_address="",
-                    provider="GCP",
-                    service=p_service,
-                    ip_prefix=ip_prefix,
-                    region=p_scope,
-                )
-            )
-
-    elif provider == "azure":
-        for svc in data.get("values", []):
-            svc_name = svc.get("name", "Azure")
-            svc_region = svc.get("properties", {}).get("region", "Global")
-
-            if region and region.lower() not in svc_region.lower():
-                continue
-            if service and service.lower() not in svc_name.lower():
-                continue
-
-            for ip_prefix in svc.get("properties", {}).get("addressPrefixes", []):
-                results.append(
-                    PublicIPResult(
-                        ip_address="",
-                        provider="Azure",
-                        service=svc_name,
-                        ip_prefix=ip_prefix,
-                        region=svc_region,
-                    )
-                )
-
-    elif provider == "oracle":
-        for reg in data.get("regions", []):
-            reg_name = reg.get("region", "Unknown")
-
-            if region and region.lower() not in reg_name.lower():
-                continue
-
-            for cidr_obj in reg.get("cidrs", []):
-                cidr = cidr_obj.get("cidr", "")
-                tags = cidr_obj.get("tags", [])
-                svc_name = ", ".join(tags) if tags else "Oracle Cloud"
-
-                if service and service.lower() not in svc_name.lower():
-                    continue
-
-                results.append(
-                    PublicIPResult(
-                        ip_address="",
-                        provider="Oracle",
-                        service=svc_name,
-                        ip_prefix=cidr,
-                        region=reg_name,
-                    )
-                )
-
-    elif provider in ("cloudflare", "fastly"):
-        provider_name = provider.capitalize()
-        for prefix in data.get("prefixes", []):
-            p_service = prefix.get("service", f"{provider_name} CDN")
-            ip_prefix = prefix.get("ip_prefix", "")
-
-            if service and service.lower() not in p_service.lower():
-                continue
-
-            results.append(
-                PublicIPResult(
-                    ip_address="",
-                    provider=provider_name,
-                    service=p_service,
-                    ip_prefix=ip_prefix,
-                    region="Global",
-                )
-            )
-
-    return results
+    return [
+        PublicIPResult(
+            ip_address="",
+            provider=match.provider,
+            service=match.service,
+            ip_prefix=match.prefix,
+            region=match.region,
+            extra=match.extra,
+        )
+        for match in index.entries_for_meta_ids(meta_ids)
+    ]
 
 
 def get_available_filters(provider: str = "aws") -> dict[str, list[str]]:
@@ -1230,48 +994,105 @@ def get_available_filters(provider: str = "aws") -> dict[str, list[str]]:
 # =============================================================================
 
 
+def _cache_signature(providers: list[str] | set[str]) -> list[list[Any]]:
+    """유효한(24시간 이내) 프로바이더 캐시 파일의 (이름, mtime_ns, 크기) 목록
+
+    Args:
+        providers: 확인할 프로바이더 이름 목록
+
+    Returns:
+        [[name, mtime_ns, size], ...] (이름순, 인덱스 파일의 signature로 사용)
+    """
+    cache_dir = _get_cache_dir()
+    now = time.time()
+    signature: list[list[Any]] = []
+    for name in sorted(providers):
+        try:
+            stat = os.stat(os.path.join(cache_dir, f"{name}.json"))
+        except OSError:
+            continue
+        if now - stat.st_mtime > 24 * 3600:
+            continue
+        signature.append([name, stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
+def get_provider_index(providers: list[str] | None = None) -> MultiProviderIndex:
+    """캐시된 전체 프로바이더 IP 대역 인덱스 반환
+
+    1. 같은 세션에서 캐시 파일이 그대로면 메모리의 인덱스 재사용
+    2. 캐시 디렉토리의 index.bin signature가 일치하면 바이너리 로드 (JSON 파싱 없음)
+    3. 그 외에는 JSON에서 구축 후 index.bin 저장
+
+    Args:
+        providers: 반드시 포함할 프로바이더 (캐시 없으면 다운로드, None이면 전체)
+
+    Returns:
+        유효한 캐시가 있는 모든 프로바이더를 포함한 MultiProviderIndex
+    """
+    from .index import MultiProviderIndex, get_global_index, set_global_index
+
+    required = {p.lower() for p in providers} & set(ALL_PROVIDERS) if providers else set(ALL_PROVIDERS)
+
+    signature = _cache_signature(ALL_PROVIDERS)
+    missing = required - {entry[0] for entry in signature}
+    if missing:
+        # 다운로드되면 캐시 파일이 갱신되어 signature가 바뀜
+        load_ip_ranges_parallel(missing)
+        signature = _cache_signature(ALL_PROVIDERS)
+
+    current = get_global_index()
+    if current.signature == signature:
+        return current
+
+    index_path = os.path.join(_get_cache_dir(), _INDEX_FILE)
+    index = MultiProviderIndex.load(index_path, signature)
+    if index is None:
+        data_sources = load_ip_ranges_parallel({entry[0] for entry in signature})
+        index = MultiProviderIndex()
+        for provider, data in data_sources.items():
+            if data:
+                index.load_provider(provider, data)
+        index.build()
+        try:
+            index.save(index_path, signature)
+        except OSError as e:
+            logger.debug("Failed to save IP range index: %s", e)
+        logger.debug("Built index with %d prefixes using %s backend", index.prefix_count, index.backend)
+
+    index.signature = signature
+    set_global_index(index)
+    return index
+
+
 def search_public_ip_optimized(
     ip_list: list[str],
     providers: list[str] | None = None,
+    region_filter: str | None = None,
+    service_filter: str | None = None,
 ) -> list[PublicIPResult]:
     """
-    Search public IP ranges using optimized index (Radix Tree or Binary Search).
+    Search public IP ranges using the persisted sorted-interval index.
 
-    This function provides significantly better performance than search_public_ip()
-    for large-scale searches by using pre-built indexes.
+    The index is built once from the provider caches, saved next to them as
+    ``index.bin`` and kept in memory, so repeated searches skip JSON parsing.
 
     Performance:
-    - Radix Tree (pytricia): ~0.016ms per lookup
-    - Binary Search: ~0.1ms per lookup
+    - Binary Search (cached index): ~0.01ms per lookup
     - Linear Search (original): ~10ms per lookup
 
     Args:
         ip_list: List of IP addresses to search
         providers: List of providers to search (None for all)
+        region_filter: Filter results by region (partial match, case-insensitive)
+        service_filter: Filter results by service (partial match, case-insensitive)
 
     Returns:
         List of search results
     """
-    from .index import MultiProviderIndex
-
-    all_providers = {"aws", "gcp", "azure", "oracle", "cloudflare", "fastly"}
-    target_providers = {p.lower() for p in providers} & all_providers if providers else all_providers
-
-    # Load provider data
-    data_sources = load_ip_ranges_parallel(target_providers)
-
-    # Build index
-    index = MultiProviderIndex()
-    for provider, data in data_sources.items():
-        if data:
-            index.load_provider(provider, data)
-    index.build()
-
-    logger.debug(
-        "Built index with %d prefixes using %s backend",
-        index.prefix_count,
-        index.backend,
-    )
+    target_providers = {p.lower() for p in providers} & set(ALL_PROVIDERS) if providers else set(ALL_PROVIDERS)
+    index = get_provider_index(sorted(target_providers))
+    meta_ids = index.filter_meta_ids(target_providers if providers else None, region_filter, service_filter)
 
     all_results: list[PublicIPResult] = []
 
@@ -1280,21 +1101,20 @@ def search_public_ip_optimized(
         if not ip:
             continue
 
-        matches = index.search(ip)
-
-        if matches:
-            for match in matches:
-                all_results.append(
-                    PublicIPResult(
-                        ip_address=ip,
-                        provider=match.provider,
-                        service=match.service,
-                        ip_prefix=match.prefix,
-                        region=match.region,
-                        extra=match.extra,
-                    )
+        matches = index.search(ip, meta_ids)
+        for match in matches:
+            all_results.append(
+                PublicIPResult(
+                    ip_address=ip,
+                    provider=match.provider,
+                    service=match.service,
+                    ip_prefix=match.prefix,
+                    region=match.region,
+                    extra=match.extra,
                 )
-        else:
+            )
+
+        if not matches:
             all_results.append(
                 PublicIPResult(
                     ip_address=ip,
@@ -1313,9 +1133,8 @@ def get_search_backend() -> str:
     Get the current search backend being used.
 
     Returns:
-        "radix_tree" if pytricia is available, "binary_search" otherwise
+        "binary_search" (search_public_ip_optimized always uses the persisted sorted-interval index)
     """
-    from .index import IPRangeIndex
+    from .index import MultiProviderIndex
 
-    index = IPRangeIndex()
-    return index.backend
+    return MultiProviderIndex().backend
@@ -18,7 +18,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from core.parallel import ErrorSeverity, get_client, try_or_default
-from core.shared.aws.metrics import MetricQuery, batch_get_metrics, sanitize_metric_id
+from core.shared.aws.metrics import MetricQuery, batch_get_metric_series, batch_get_metrics, sanitize_metric_id
 
 logger = logging.getLogger(__name__)
 
@@ -503,30 +503,17 @@ def _get_last_invocation_time(
     """
     from botocore.exceptions import ClientError
 
-    try:
-        response = cloudwatch.get_metric_statistics(
-            Namespace="AWS/Lambda",
-            MetricName="Invocations",
-            Dimensions=[{"Name": "FunctionName", "Value": function_name}],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=86400,
-            Statistics=["Sum"],
-        )
-
-        datapoints = sorted(
-            response.get("Datapoints", []),
-            key=lambda x: x.get("Timestamp", datetime.min),
-            reverse=True,
-        )
-
-        for dp in datapoints:
-            if dp.get("Sum", 0) > 0:
-                timestamp = dp.get("Timestamp")
-                if isinstance(timestamp, datetime):
-                    return timestamp
-                return None
+    query = MetricQuery(
+        id=f"{sanitize_metric_id(function_name)}_daily_inv",
+        namespace="AWS/Lambda",
+        metric_name="Invocations",
+        dimensions={"FunctionName": function_name},
+        stat="Sum",
+    )
 
+    try:
+        series = batch_get_metric_series(cloudwatch, [query], start_time, end_time, period=86400)
+        return series[query.id].last_nonzero()
     except ClientError:
         pass
 
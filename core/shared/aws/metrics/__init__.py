@@ -11,6 +11,7 @@ Usage:
         build_ec2_metric_queries,
         build_lambda_metric_queries,
         MetricSessionCache,  # 세션 캐싱
+        batch_get_metric_series,  # 시계열 조회
     )
 
     # 캐시 사용 예시
@@ -20,16 +21,24 @@ Usage:
 
 from .batch_metrics import (
     MetricQuery,
+    batch_get_metric_series,
     batch_get_metrics,
     batch_get_metrics_with_stats,
+    build_alarm_metric_queries,
+    build_dynamodb_metric_queries,
+    build_ebs_metric_queries,
     build_ec2_metric_queries,
     build_elasticache_metric_queries,
+    build_lambda_concurrency_metric_queries,
     build_lambda_metric_queries,
     build_nat_metric_queries,
     build_rds_metric_queries,
+    build_s3_storage_metric_queries,
     build_sagemaker_endpoint_metric_queries,
+    build_vpc_endpoint_metric_queries,
     sanitize_metric_id,
 )
+from .series import MetricSeries, MetricSeriesSet
 from .session_cache import (
     CacheStats,
     FileBackedMetricCache,
@@ -38,6 +47,7 @@ from .session_cache import (
     get_active_cache,
     get_global_cache,
     is_cache_active,
+    persistent_metric_cache,
     set_global_cache,
 )
 
@@ -45,14 +55,24 @@ __all__ = [
     # batch_metrics
     "MetricQuery",
     "batch_get_metrics",
+    "batch_get_metric_series",
     "batch_get_metrics_with_stats",
+    "build_alarm_metric_queries",
+    "build_dynamodb_metric_queries",
+    "build_ebs_metric_queries",
     "build_ec2_metric_queries",
     "build_elasticache_metric_queries",
+    "build_lambda_concurrency_metric_queries",
     "build_lambda_metric_queries",
     "build_nat_metric_queries",
     "build_rds_metric_queries",
+    "build_s3_storage_metric_queries",
     "build_sagemaker_endpoint_metric_queries",
+    "build_vpc_endpoint_metric_queries",
     "sanitize_metric_id",
+    # series
+    "MetricSeries",
+    "MetricSeriesSet",
     # session_cache
     "CacheStats",
     "FileBackedMetricCache",
@@ -61,5 +81,6 @@ __all__ = [
     "get_active_cache",
     "get_global_cache",
     "is_cache_active",
+    "persistent_metric_cache",
     "set_global_cache",
 ]
@@ -8,24 +8,47 @@ get_metric_data()는 최대 500개 메트릭을 1회 호출로 조회 가능.
 
 예시:
     Lambda 50개 함수 × 6개 메트릭 = 300 API 호출 → 1회 호출로 감소
+
+batch_get_metrics는 쿼리별 합계를, batch_get_metric_series는 쿼리별 시계열
+(MetricSeriesSet)을 반환합니다.
+
+일 단위(period=86400) 조회는 구간 안의 완전한 UTC 날짜를 (메트릭 식별자, UTC 날짜) 단위로
+캐시하므로, 매일 실행되는 30일 조회는 전날 실행 결과를 재사용하고 새로 추가된 날짜만
+API로 조회합니다. 자정에 걸치지 않은 앞뒤 부분 날짜는 캐시 없이 조회하여 합산하므로
+결과는 캐시 없이 조회한 값과 같습니다.
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import re
 import time
+from array import array
+from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 from botocore.exceptions import ClientError
 
+from .series import MetricSeriesSet, decode_points, encode_points, slice_points, to_epoch
+
 if TYPE_CHECKING:
-    from .session_cache import MetricSessionCache, SharedMetricCache
+    from .session_cache import CacheValue, FileBackedMetricCache, MetricSessionCache, SharedMetricCache
+
+    MetricCache = MetricSessionCache | SharedMetricCache | FileBackedMetricCache
 
 logger = logging.getLogger(__name__)
 
+_DAY_SECONDS = 86400
+
+# 종료 후 이 시간이 지나지 않은 날짜 버킷은 캐시하지 않음 (CloudWatch 지연 수집 datapoint 대비)
+_DAY_BUCKET_SETTLE_SECONDS = 3600
+
+# 구간을 나눠 조회한 합이 전체 구간 조회와 같은 통계 (부분 날짜 분할 조회 가능)
+_ADDITIVE_STATS = frozenset({"Sum", "SampleCount"})
+
 
 @dataclass
 class MetricQuery:
@@ -46,6 +69,64 @@ class MetricQuery:
     stat: str = "Sum"
 
 
+def _metric_identity(q: MetricQuery, period: int) -> str:
+    """조회 구간을 제외한 메트릭 식별 문자열 (namespace, metric, dimensions, stat, period)"""
+    dims = "|".join(f"{k}={v}" for k, v in sorted(q.dimensions.items()))
+    return f"{q.namespace}|{q.metric_name}|{dims}|{q.stat}|{period}"
+
+
+def _series_cache_key(q: MetricQuery, period: int) -> str:
+    """시계열 캐시 키 (조회 구간 미포함 - 저장된 구간 안의 모든 요청에 재사용)"""
+    return f"series|{_metric_identity(q, period)}"
+
+
+def _day_cache_key(q: MetricQuery, day: int) -> str:
+    """일 단위 캐시 키 (메트릭 식별자 + UTC 날짜)
+
+    Args:
+        q: 메트릭 쿼리
+        day: epoch 기준 일 번호 (epoch 초 // 86400)
+    """
+    date = datetime.fromtimestamp(day * _DAY_SECONDS, tz=timezone.utc).date()
+    return f"day|{_metric_identity(q, _DAY_SECONDS)}|{date.isoformat()}"
+
+
+def _cached_points(
+    cache: MetricCache,
+    queries: list[MetricQuery],
+    start: float,
+    end: float,
+    period: int,
+) -> dict[str, tuple[array, array]]:
+    """요청 구간을 모두 포함하는 캐시된 시계열을 구간만큼 잘라 반환
+
+    Args:
+        cache: 메트릭 캐시
+        queries: 조회할 쿼리
+        start: 요청 구간 시작 (epoch 초)
+        end: 요청 구간 종료 (epoch 초)
+        period: 집계 주기 (초)
+
+    Returns:
+        {query_id: (timestamps, values)} (캐시로 응답 가능한 쿼리만)
+    """
+    keys = {q.id: _series_cache_key(q, period) for q in queries}
+    cached = cache.get_many(list(keys.values()))
+
+    points: dict[str, tuple[array, array]] = {}
+    for q in queries:
+        blob = cached.get(keys[q.id])
+        if not isinstance(blob, bytes):
+            continue
+        try:
+            cached_start, cached_end, timestamps, values = decode_points(blob)
+        except ValueError:
+            continue
+        if cached_start <= start and end <= cached_end:
+            points[q.id] = slice_points(timestamps, values, start, end)
+    return points
+
+
 def batch_get_metrics(
     cloudwatch_client: Any,
     queries: list[MetricQuery],
@@ -53,7 +134,7 @@ def batch_get_metrics(
     end_time: datetime,
     period: int = 86400,
     max_retries: int = 3,
-    cache: MetricSessionCache | SharedMetricCache | None = None,
+    cache: MetricCache | None = None,
 ) -> dict[str, float]:
     """CloudWatch 메트릭 배치 조회 (Pagination + Retry + 캐싱 지원)
 
@@ -74,6 +155,10 @@ def batch_get_metrics(
         - 요청당 최대 500개 메트릭
         - Throttling 시 exponential backoff 적용
         - cache=None이면 전역 캐시(get_global_cache()) 자동 사용
+        - 캐시 사용 + period=86400이면 구간 안의 완전한 UTC 날짜는 날짜 버킷 캐시로 조회하고,
+          자정 경계가 아닌 앞뒤 부분 날짜는 캐시 없이 조회하여 합산
+          (Sum/SampleCount만 분할, 그 외 통계는 자정 경계 구간일 때만 날짜 버킷 사용)
+        - datapoint별 값이 필요하면 batch_get_metric_series 사용
     """
     if not queries:
         return {}
@@ -84,19 +169,68 @@ def batch_get_metrics(
 
         cache = get_global_cache()
 
+    # 일 단위 조회는 날짜 버킷 캐시로 누락된 날짜만 조회
+    if cache and period == _DAY_SECONDS:
+        split = _split_day_window(start_time, end_time)
+        if split is not None:
+            first_day, last_day, edges = split
+            bucketed = [q for q in queries if not edges or q.stat in _ADDITIVE_STATS]
+            if bucketed:
+                results = _batch_get_daily_metrics(cloudwatch_client, bucketed, first_day, last_day, max_retries, cache)
+                # 부분 날짜는 캐시 없이 조회 (진행 중인 당일 포함)
+                for edge_start, edge_end in edges:
+                    fetched = _fetch_metrics(cloudwatch_client, bucketed, edge_start, edge_end, period, max_retries)
+                    for q in bucketed:
+                        results[q.id] += fetched.get(q.id, 0.0)
+
+                remaining = [q for q in queries if q.id not in results]
+                if remaining:
+                    results.update(
+                        _batch_get_window_metrics(
+                            cloudwatch_client, remaining, start_time, end_time, period, max_retries, cache
+                        )
+                    )
+                return results
+
+    return _batch_get_window_metrics(cloudwatch_client, queries, start_time, end_time, period, max_retries, cache)
+
+
+def _batch_get_window_metrics(
+    cloudwatch_client: Any,
+    queries: list[MetricQuery],
+    start_time: datetime,
+    end_time: datetime,
+    period: int,
+    max_retries: int,
+    cache: MetricCache | None,
+) -> dict[str, float]:
+    """조회 구간 전체를 키로 캐시하는 합계 조회 (내부 함수)
+
+    Args:
+        cloudwatch_client: boto3 CloudWatch client
+        queries: 메트릭 쿼리 목록
+        start_time: 조회 시작 시간
+        end_time: 조회 종료 시간
+        period: 집계 주기 (초)
+        max_retries: Throttling 시 재시도 횟수
+        cache: 메트릭 캐시 (None이면 캐시 미사용)
+
+    Returns:
+        {query_id: aggregated_value} 딕셔너리
+    """
     results: dict[str, float] = {}
     queries_to_fetch: list[MetricQuery] = []
 
     # 캐시 키 생성 함수
     def make_cache_key(q: MetricQuery) -> str:
-        dims = "|".join(f"{k}={v}" for k, v in sorted(q.dimensions.items()))
-        return f"{q.namespace}|{q.metric_name}|{dims}|{q.stat}|{period}|{start_time.isoformat()}|{end_time.isoformat()}"
+        return f"{_metric_identity(q, period)}|{start_time.isoformat()}|{end_time.isoformat()}"
 
-    # 캐시에서 먼저 조회
+    # 캐시에서 먼저 조회 (파일 캐시는 한 번에 일괄 조회)
     if cache:
+        cache_keys = {q.id: make_cache_key(q) for q in queries}
+        cached = cache.get_many(list(cache_keys.values()))
         for q in queries:
-            cache_key = make_cache_key(q)
-            cached_value = cache.get(cache_key)
+            cached_value = _as_float(cached.get(cache_keys[q.id]))
             if cached_value is not None:
                 results[q.id] = cached_value
             else:
@@ -117,22 +251,228 @@ def batch_get_metrics(
 
         # 결과를 캐시에 저장
         if cache:
-            for q in queries_to_fetch:
-                cache_key = make_cache_key(q)
-                cache.set(cache_key, fetched.get(q.id, 0.0))
+            cache.set_many({cache_keys[q.id]: fetched.get(q.id, 0.0) for q in queries_to_fetch})
 
     return results
 
 
-def _fetch_metrics(
+def _split_day_window(
+    start_time: datetime,
+    end_time: datetime,
+) -> tuple[int, int, list[tuple[datetime, datetime]]] | None:
+    """조회 구간을 완전한 UTC 날짜 범위와 앞뒤 부분 날짜 구간으로 분리
+
+    Returns:
+        (첫 날짜, 마지막 날짜 + 1, 부분 날짜 구간 목록) 또는 None (완전한 날짜가 없음)
+        - 날짜는 epoch 일 번호, 부분 날짜 구간은 자정 경계가 아닌 앞/뒤 구간
+    """
+    start, end = to_epoch(start_time), to_epoch(end_time)
+    first_day = math.ceil(start / _DAY_SECONDS)
+    last_day = math.floor(end / _DAY_SECONDS)
+    if first_day >= last_day:
+        return None
+
+    edges: list[tuple[datetime, datetime]] = []
+    if start < first_day * _DAY_SECONDS:
+        edges.append((start_time, datetime.fromtimestamp(first_day * _DAY_SECONDS, tz=timezone.utc)))
+    if end > last_day * _DAY_SECONDS:
+        edges.append((datetime.fromtimestamp(last_day * _DAY_SECONDS, tz=timezone.utc), end_time))
+    return first_day, last_day, edges
+
+
+def _as_float(value: CacheValue | None) -> float | None:
+    """캐시 값이 스칼라 메트릭 값이면 float로 반환 (시계열 bytes/없음은 None)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def _batch_get_daily_metrics(
+    cloudwatch_client: Any,
+    queries: list[MetricQuery],
+    first_day: int,
+    last_day: int,
+    max_retries: int,
+    cache: MetricCache,
+) -> dict[str, float]:
+    """날짜 버킷 캐시를 사용한 일 단위 합계 조회 (내부 함수)
+
+    쿼리별로 캐시에 없는 날짜 범위를 구하고, 같은 범위를 가진 쿼리끼리 묶어
+    해당 범위만 GetMetricData로 조회한 뒤 캐시된 날짜 값과 합산합니다.
+
+    Args:
+        cloudwatch_client: boto3 CloudWatch client
+        queries: 메트릭 쿼리 목록
+        first_day: 첫 날짜 (epoch 일 번호, 포함)
+        last_day: 마지막 날짜 (epoch 일 번호, 미포함)
+        max_retries: Throttling 시 재시도 횟수
+        cache: 메트릭 캐시
+
+    Returns:
+        {query_id: aggregated_value} 딕셔너리
+    """
+    days = range(first_day, last_day)
+    keys = {q.id: [_day_cache_key(q, day) for day in days] for q in queries}
+    cached = cache.get_many([key for day_keys in keys.values() for key in day_keys])
+
+    # 누락 날짜 범위별 쿼리 그룹 (매일 실행 시 대부분 "어제 하루"로 묶임)
+    missing_groups: dict[tuple[int, int], list[MetricQuery]] = {}
+    for q in queries:
+        missing = [day for day, key in zip(days, keys[q.id], strict=True) if _as_float(cached.get(key)) is None]
+        if missing:
+            missing_groups.setdefault((missing[0], missing[-1] + 1), []).append(q)
+
+    daily: dict[str, float] = {}
+    if missing_groups:
+        logger.debug(
+            f"CloudWatch 일 단위 캐시: {sum(map(len, missing_groups.values()))}/{len(queries)} 쿼리 누락, "
+            f"{len(missing_groups)}개 구간 API 조회"
+        )
+        settled_before = int((time.time() - _DAY_BUCKET_SETTLE_SECONDS) // _DAY_SECONDS)
+        to_store: dict[str, CacheValue] = {}
+        for (fetch_first, fetch_last), group in missing_groups.items():
+            fetched = _fetch_daily_values(cloudwatch_client, group, fetch_first, fetch_last, max_retries)
+            for q in group:
+                values = fetched.get(q.id, {})
+                for day in range(fetch_first, fetch_last):
+                    key = _day_cache_key(q, day)
+                    daily[key] = values.get(day, 0.0)
+                    if day < settled_before:
+                        to_store[key] = daily[key]
+        cache.set_many(to_store)
+
+    results: dict[str, float] = {}
+    for q in queries:
+        total = 0.0
+        for key in keys[q.id]:
+            value = daily.get(key)
+            if value is None:
+                value = _as_float(cached.get(key))
+            total += value or 0.0
+        results[q.id] = total
+    return results
+
+
+def _fetch_daily_values(
+    cloudwatch_client: Any,
+    queries: list[MetricQuery],
+    first_day: int,
+    last_day: int,
+    max_retries: int,
+) -> dict[str, dict[int, float]]:
+    """날짜 범위를 조회하여 쿼리별 {epoch 일 번호: 값} 반환 (내부 함수)"""
+    start_time = datetime.fromtimestamp(first_day * _DAY_SECONDS, tz=timezone.utc)
+    end_time = datetime.fromtimestamp(last_day * _DAY_SECONDS, tz=timezone.utc)
+    points = _fetch_metric_points(cloudwatch_client, queries, start_time, end_time, _DAY_SECONDS, max_retries)
+
+    values: dict[str, dict[int, float]] = {}
+    for query_id, (timestamps, day_values) in points.items():
+        by_day = values.setdefault(query_id, {})
+        for ts, value in zip(timestamps, day_values, strict=True):
+            day = int(ts // _DAY_SECONDS)
+            by_day[day] = by_day.get(day, 0.0) + value
+    return values
+
+
+def batch_get_metric_series(
+    cloudwatch_client: Any,
+    queries: list[MetricQuery],
+    start_time: datetime,
+    end_time: datetime,
+    period: int = 86400,
+    max_retries: int = 3,
+    cache: MetricCache | None = None,
+) -> MetricSeriesSet:
+    """CloudWatch 메트릭 배치 조회 (쿼리별 시계열 반환)
+
+    ``batch_get_metrics``와 같은 방식으로 조회하지만 datapoint를 합산하지 않고
+    공유 timestamp 벡터 기반의 시계열로 반환합니다. 최대값/백분위/활성 일수 등
+    추가 판단에 재조회가 필요 없습니다.
+
+    캐시에는 쿼리별 시계열과 조회 구간이 저장되며, 저장된 구간이 요청 구간을
+    모두 포함하면 API 호출 없이 응답합니다. (예: 30일 조회 후 14일 요청)
+
+    Args:
+        cloudwatch_client: boto3 CloudWatch client
+        queries: 메트릭 쿼리 목록 (최대 500개씩 분할 처리)
+        start_time: 조회 시작 시간
+        end_time: 조회 종료 시간
+        period: 집계 주기 (초, 기본 86400=1일)
+        max_retries: Throttling 시 재시도 횟수
+        cache: 메트릭 캐시 (선택적, None이면 전역 캐시 자동 사용)
+
+    Returns:
+        MetricSeriesSet (모든 쿼리 ID 포함, datapoint 없는 쿼리는 NaN 시계열)
+
+    Example:
+        series = batch_get_metric_series(cw, queries, start, end)
+        for query_id, s in series.series.items():
+            print(query_id, s.sum(), s.max(), s.p95(), s.days_active(), s.last_nonzero())
+    """
+    if not queries:
+        return MetricSeriesSet()
+
+    if cache is None:
+        from .session_cache import get_global_cache
+
+        cache = get_global_cache()
+
+    start = to_epoch(start_time)
+    end = to_epoch(end_time)
+
+    points: dict[str, tuple[array, array]] = {}
+    if cache:
+        points = _cached_points(cache, queries, start, end, period)
+
+    queries_to_fetch = [q for q in queries if q.id not in points]
+    if queries_to_fetch:
+        if cache:
+            logger.debug(
+                f"CloudWatch 시계열 캐시: {len(points)}/{len(queries)} 히트, {len(queries_to_fetch)}개 API 호출 필요"
+            )
+        fetched = _fetch_metric_points(cloudwatch_client, queries_to_fetch, start_time, end_time, period, max_retries)
+        empty = (array("d"), array("d"))
+        for q in queries_to_fetch:
+            points[q.id] = fetched.get(q.id, empty)
+
+        if cache:
+            cache.set_many(
+                {_series_cache_key(q, period): encode_points(start, end, *points[q.id]) for q in queries_to_fetch}
+            )
+
+    return MetricSeriesSet.from_points({q.id: points[q.id] for q in queries})
+
+
+def _build_metric_data_queries(queries: list[MetricQuery], period: int) -> list[dict[str, Any]]:
+    """MetricQuery 목록을 GetMetricData MetricDataQueries 형식으로 변환"""
+    return [
+        {
+            "Id": q.id,
+            "MetricStat": {
+                "Metric": {
+                    "Namespace": q.namespace,
+                    "MetricName": q.metric_name,
+                    "Dimensions": [{"Name": k, "Value": v} for k, v in q.dimensions.items()],
+                },
+                "Period": period,
+                "Stat": q.stat,
+            },
+        }
+        for q in queries
+    ]
+
+
+def _iter_metric_data_results(
     cloudwatch_client: Any,
     queries: list[MetricQuery],
     start_time: datetime,
     end_time: datetime,
     period: int,
     max_retries: int,
-) -> dict[str, float]:
-    """CloudWatch API 호출 (내부 함수)
+) -> Iterator[dict[str, Any]]:
+    """GetMetricData 결과(MetricDataResults 항목)를 페이지 순서대로 반환
+
+    500개 단위 분할, pagination, Throttling 재시도를 처리합니다.
 
     Args:
         cloudwatch_client: boto3 CloudWatch client
@@ -142,28 +482,12 @@ def _fetch_metrics(
         period: 집계 주기 (초)
         max_retries: Throttling 시 재시도 횟수
 
-    Returns:
-        {query_id: aggregated_value} 딕셔너리
+    Yields:
+        MetricDataResults 항목 ({"Id", "Timestamps", "Values", ...})
     """
-    results: dict[str, float] = {}
-
     # 500개 단위로 분할 (API 제한)
     for chunk in _chunks(queries, 500):
-        metric_data_queries = [
-            {
-                "Id": q.id,
-                "MetricStat": {
-                    "Metric": {
-                        "Namespace": q.namespace,
-                        "MetricName": q.metric_name,
-                        "Dimensions": [{"Name": k, "Value": v} for k, v in q.dimensions.items()],
-                    },
-                    "Period": period,
-                    "Stat": q.stat,
-                },
-            }
-            for q in chunk
-        ]
+        metric_data_queries = _build_metric_data_queries(chunk, period)
 
         # Pagination + Retry loop
         next_token = None
@@ -181,25 +505,6 @@ def _fetch_metrics(
 
                 response = cloudwatch_client.get_metric_data(**params)
 
-                # 결과 처리
-                for result in response.get("MetricDataResults", []):
-                    values = result.get("Values", [])
-                    query_id = result["Id"]
-
-                    # 기존 값과 합산 (pagination)
-                    if values:
-                        current = results.get(query_id, 0.0)
-                        results[query_id] = current + sum(values)
-                    elif query_id not in results:
-                        results[query_id] = 0.0
-
-                # 다음 페이지 확인
-                next_token = response.get("NextToken")
-                if not next_token:
-                    break
-
-                retries = 0  # 성공 시 재시도 카운터 리셋
-
             except ClientError as e:
                 error_code = e.response.get("Error", {}).get("Code", "")
                 if error_code == "Throttling" and retries < max_retries:
@@ -211,9 +516,88 @@ def _fetch_metrics(
                 logger.warning(f"CloudWatch batch_get_metrics 오류: {error_code}")
                 raise
 
+            yield from response.get("MetricDataResults", [])
+
+            # 다음 페이지 확인
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+
+            retries = 0  # 성공 시 재시도 카운터 리셋
+
+
+def _fetch_metrics(
+    cloudwatch_client: Any,
+    queries: list[MetricQuery],
+    start_time: datetime,
+    end_time: datetime,
+    period: int,
+    max_retries: int,
+) -> dict[str, float]:
+    """CloudWatch API 호출 후 쿼리별 합계 반환 (내부 함수)
+
+    Args:
+        cloudwatch_client: boto3 CloudWatch client
+        queries: 메트릭 쿼리 목록
+        start_time: 조회 시작 시간
+        end_time: 조회 종료 시간
+        period: 집계 주기 (초)
+        max_retries: Throttling 시 재시도 횟수
+
+    Returns:
+        {query_id: aggregated_value} 딕셔너리
+    """
+    results: dict[str, float] = {}
+
+    for result in _iter_metric_data_results(cloudwatch_client, queries, start_time, end_time, period, max_retries):
+        values = result.get("Values", [])
+        query_id = result["Id"]
+
+        # 기존 값과 합산 (pagination)
+        if values:
+            current = results.get(query_id, 0.0)
+            results[query_id] = current + sum(values)
+        elif query_id not in results:
+            results[query_id] = 0.0
+
     return results
 
 
+def _fetch_metric_points(
+    cloudwatch_client: Any,
+    queries: list[MetricQuery],
+    start_time: datetime,
+    end_time: datetime,
+    period: int,
+    max_retries: int,
+) -> dict[str, tuple[array, array]]:
+    """CloudWatch API 호출 후 쿼리별 datapoint 배열 반환 (내부 함수)
+
+    Args:
+        cloudwatch_client: boto3 CloudWatch client
+        queries: 메트릭 쿼리 목록
+        start_time: 조회 시작 시간
+        end_time: 조회 종료 시간
+        period: 집계 주기 (초)
+        max_retries: Throttling 시 재시도 횟수
+
+    Returns:
+        {query_id: (timestamps, values)} (timestamp 오름차순, epoch 초)
+    """
+    collected: dict[str, dict[float, float]] = {}
+
+    for result in _iter_metric_data_results(cloudwatch_client, queries, start_time, end_time, period, max_retries):
+        datapoints = collected.setdefault(result["Id"], {})
+        for ts, value in zip(result.get("Timestamps", []), result.get("Values", []), strict=False):
+            datapoints[to_epoch(ts)] = value
+
+    points: dict[str, tuple[array, array]] = {}
+    for query_id, datapoints in collected.items():
+        ordered = sorted(datapoints)
+        points[query_id] = (array("d", ordered), array("d", (datapoints[ts] for ts in ordered)))
+    return points
+
+
 def batch_get_metrics_with_stats(
     cloudwatch_client: Any,
     queries: list[MetricQuery],
@@ -593,3 +977,201 @@ def build_sagemaker_endpoint_metric_queries(
             )
 
     return queries
+
+
+def build_lambda_concurrency_metric_queries(function_names: list[str]) -> list[MetricQuery]:
+    """Lambda 함수용 ConcurrentExecutions 최대/평균 쿼리 생성
+
+    Provisioned Concurrency 활용률 판단용으로, 시간 단위(period=3600)
+    batch_get_metric_series 조회와 함께 사용합니다. sanitize 결과가 겹치는 이름
+    (my-func / my.func)도 구분되도록 목록 순서 기반 ID를 사용합니다.
+
+    Args:
+        function_names: Lambda 함수 이름 목록
+
+    Returns:
+        MetricQuery 목록 (ID: m{i}_concurrentexecutions_max / _avg, i는 목록 인덱스)
+    """
+    queries = []
+    for i, func_name in enumerate(function_names):
+        for stat, suffix in [("Maximum", "_max"), ("Average", "_avg")]:
+            queries.append(
+                MetricQuery(
+                    id=f"m{i}_concurrentexecutions{suffix}",
+                    namespace="AWS/Lambda",
+                    metric_name="ConcurrentExecutions",
+                    dimensions={"FunctionName": func_name},
+                    stat=stat,
+                )
+            )
+
+    return queries
+
+
+def build_ebs_metric_queries(
+    volume_ids: list[str],
+    metrics: list[str] | None = None,
+) -> list[MetricQuery]:
+    """EBS 볼륨용 메트릭 쿼리 생성
+
+    Args:
+        volume_ids: EBS 볼륨 ID 목록
+        metrics: 조회할 메트릭 목록 (기본: VolumeReadOps, VolumeWriteOps)
+
+    Returns:
+        MetricQuery 목록
+    """
+    if metrics is None:
+        metrics = ["VolumeReadOps", "VolumeWriteOps"]
+
+    queries = []
+    for volume_id in volume_ids:
+        safe_id = sanitize_metric_id(volume_id)
+        dimensions = {"VolumeId": volume_id}
+
+        for metric in metrics:
+            metric_lower = metric.lower()
+            queries.append(
+                MetricQuery(
+                    id=f"{safe_id}_{metric_lower}_sum",
+                    namespace="AWS/EBS",
+                    metric_name=metric,
+                    dimensions=dimensions,
+                    stat="Sum",
+                )
+            )
+
+    return queries
+
+
+def build_s3_storage_metric_queries(bucket_names: list[str]) -> list[MetricQuery]:
+    """S3 버킷용 스토리지 메트릭 쿼리 생성
+
+    S3 스토리지 메트릭은 하루 1회 기록되므로 batch_get_metric_series로 조회 후
+    마지막 값(MetricSeries.last)을 사용합니다. 버킷 이름은 ``.`` / ``-`` 가 섞여
+    sanitize 결과가 겹칠 수 있으므로 목록 순서 기반 ID를 사용합니다.
+
+    Args:
+        bucket_names: 버킷 이름 목록
+
+    Returns:
+        MetricQuery 목록 (ID: m{i}_bucketsizebytes_avg / _numberofobjects_avg, i는 목록 인덱스)
+    """
+    queries = []
+    for i, bucket_name in enumerate(bucket_names):
+        for metric, storage_type in [("BucketSizeBytes", "StandardStorage"), ("NumberOfObjects", "AllStorageTypes")]:
+            queries.append(
+                MetricQuery(
+                    id=f"m{i}_{metric.lower()}_avg",
+                    namespace="AWS/S3",
+                    metric_name=metric,
+                    dimensions={"BucketName": bucket_name, "StorageType": storage_type},
+                    stat="Average",
+                )
+            )
+
+    return queries
+
+
+def build_dynamodb_metric_queries(table_names: list[str]) -> list[MetricQuery]:
+    """DynamoDB 테이블용 용량/쓰로틀 메트릭 쿼리 생성
+
+    Consumed*CapacityUnits는 Average/Maximum, *ThrottledRequests는 Sum으로 조회합니다.
+    테이블 이름은 ``.`` / ``-`` / 대문자를 허용하여 sanitize 결과가 겹치거나 ID 규칙
+    (소문자 시작)을 어길 수 있으므로 목록 순서 기반 ID를 사용합니다.
+
+    Args:
+        table_names: 테이블 이름 목록
+
+    Returns:
+        MetricQuery 목록 (ID: m{i}_{metric}{suffix}, i는 목록 인덱스)
+    """
+    metric_stats = [
+        ("ConsumedReadCapacityUnits", "Average", "_avg"),
+        ("ConsumedReadCapacityUnits", "Maximum", "_max"),
+        ("ConsumedWriteCapacityUnits", "Average", "_avg"),
+        ("ConsumedWriteCapacityUnits", "Maximum", "_max"),
+        ("ReadThrottledRequests", "Sum", "_sum"),
+        ("WriteThrottledRequests", "Sum", "_sum"),
+    ]
+
+    queries = []
+    for i, table_name in enumerate(table_names):
+        dimensions = {"TableName": table_name}
+
+        for metric, stat, suffix in metric_stats:
+            queries.append(
+                MetricQuery(
+                    id=f"m{i}_{metric.lower()}{suffix}",
+                    namespace="AWS/DynamoDB",
+                    metric_name=metric,
+                    dimensions=dimensions,
+                    stat=stat,
+                )
+            )
+
+    return queries
+
+
+def build_alarm_metric_queries(alarms: list[dict[str, Any]]) -> list[MetricQuery]:
+    """CloudWatch 알람 대상 지표의 SampleCount 쿼리 생성
+
+    알람 이름은 특수문자가 많아 sanitize 결과가 겹칠 수 있으므로 목록 순서 기반
+    ID(alarm0, alarm1, ...)를 사용합니다. SampleCount 합계가 0이면 데이터 없음입니다.
+
+    Args:
+        alarms: DescribeAlarms MetricAlarms 항목 (Namespace, MetricName, Dimensions)
+
+    Returns:
+        MetricQuery 목록 (alarms와 같은 순서)
+    """
+    return [
+        MetricQuery(
+            id=f"alarm{i}",
+            namespace=alarm.get("Namespace", ""),
+            metric_name=alarm.get("MetricName", ""),
+            dimensions={d["Name"]: d["Value"] for d in alarm.get("Dimensions", [])},
+            stat="SampleCount",
+        )
+        for i, alarm in enumerate(alarms)
+    ]
+
+
+def build_vpc_endpoint_metric_queries(
+    endpoints: list[tuple[str, str, str]],
+    metrics: list[str] | None = None,
+) -> list[MetricQuery]:
+    """Interface VPC Endpoint용 PrivateLink 메트릭 쿼리 생성
+
+    Args:
+        endpoints: (endpoint_id, vpc_id, service_name) 목록
+        metrics: 조회할 메트릭 목록 (기본: BytesProcessed)
+
+    Returns:
+        MetricQuery 목록
+    """
+    if metrics is None:
+        metrics = ["BytesProcessed"]
+
+    queries = []
+    for endpoint_id, vpc_id, service_name in endpoints:
+        safe_id = sanitize_metric_id(endpoint_id)
+        dimensions = {
+            "Endpoint Type": "Interface",
+            "Service Name": service_name,
+            "VPC Endpoint Id": endpoint_id,
+            "VPC Id": vpc_id,
+        }
+
+        for metric in metrics:
+            queries.append(
+                MetricQuery(
+                    id=f"{safe_id}_{metric.lower()}_sum",
+                    namespace="AWS/PrivateLinkEndpoints",
+                    metric_name=metric,
+                    dimensions=dimensions,
+                    stat="Sum",
+                )
+            )
+
+    return queries
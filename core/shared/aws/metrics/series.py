@@ -0,0 +1,297 @@
+"""
+shared/aws/metrics/series.py - CloudWatch 메트릭 시계열
+
+``batch_get_metrics``는 쿼리별 datapoint를 하나의 합계로 축약하므로, 최대값/추세/
+"최근 N일간 0" 같은 판단에는 다시 조회가 필요합니다. 이 모듈은 GetMetricData 결과를
+쿼리별 시계열로 보관하기 위한 compact 자료구조를 제공합니다.
+
+- 값은 ``array('d')``(연속 double 버퍼)로 보관하며, 모든 시계열이 하나의 timestamp
+  벡터(epoch 초, 오름차순)를 공유합니다. datapoint가 없는 칸은 NaN입니다.
+- 캐시에는 쿼리별 (timestamp, value) 배열과 조회 구간을 bytes로 직렬화하여 저장하므로,
+  30일 조회 결과 하나로 14일/7일 구간 요청에도 응답할 수 있습니다.
+
+주요 구성 요소:
+- MetricSeries: 단일 쿼리 시계열 + 리듀서 (sum, max, mean, count, last, p95, days_active, last_nonzero)
+- MetricSeriesSet: 공유 timestamp 벡터 + 쿼리 ID별 MetricSeries
+- encode_points / decode_points: 캐시 저장용 직렬화
+
+Example:
+    from core.shared.aws.metrics import batch_get_metric_series
+
+    series = batch_get_metric_series(cw, queries, start_time, end_time)
+    cpu = series["i_0123_cpuutilization_max"]
+    print(cpu.max(), cpu.p95(), cpu.days_active())
+
+    # 같은 결과에서 최근 14일만
+    recent = series.window(end_time - timedelta(days=14), end_time)
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+_NAN = float("nan")
+
+# 캐시 직렬화 헤더: (조회 시작, 조회 종료, datapoint 수)
+_HEADER = struct.Struct("<ddI")
+
+
+def to_epoch(value: datetime) -> float:
+    """datetime을 epoch 초로 변환 (naive는 UTC로 간주)
+
+    Args:
+        value: 변환할 datetime
+
+    Returns:
+        epoch 초
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _present(values: Iterable[float]) -> array[float]:
+    """NaN을 제외한 값 배열"""
+    return array("d", (v for v in values if v == v))
+
+
+@dataclass(frozen=True)
+class MetricSeries:
+    """단일 쿼리의 CloudWatch 시계열
+
+    Attributes:
+        timestamps: 공유 timestamp 벡터 (epoch 초, 오름차순)
+        values: timestamps와 같은 길이의 값 배열 (datapoint 없음 = NaN)
+    """
+
+    timestamps: array[float]
+    values: array[float]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[tuple[datetime, float]]:
+        """datapoint가 있는 (timestamp, value) 순회"""
+        for ts, value in zip(self.timestamps, self.values, strict=True):
+            if value == value:
+                yield datetime.fromtimestamp(ts, tz=timezone.utc), value
+
+    def sum(self) -> float:
+        """전체 합계 (datapoint 없으면 0.0, batch_get_metrics 결과와 동일)"""
+        return math.fsum(_present(self.values))
+
+    def max(self) -> float:
+        """최대값 (datapoint 없으면 0.0)"""
+        present = _present(self.values)
+        return max(present) if present else 0.0
+
+    def mean(self) -> float:
+        """datapoint 평균 (datapoint 없으면 0.0)"""
+        present = _present(self.values)
+        return math.fsum(present) / len(present) if present else 0.0
+
+    def count(self) -> int:
+        """datapoint 수 (NaN 제외)"""
+        return len(_present(self.values))
+
+    def last(self) -> float:
+        """마지막 datapoint 값 (datapoint 없으면 0.0)"""
+        for i in range(len(self.values) - 1, -1, -1):
+            value = self.values[i]
+            if value == value:
+                return value
+        return 0.0
+
+    def percentile(self, q: float) -> float:
+        """백분위수 (nearest-rank, datapoint 없으면 0.0)
+
+        Args:
+            q: 백분위 (0~100)
+
+        Returns:
+            해당 백분위 값
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"q must be between 0 and 100, got {q}")
+        present = sorted(_present(self.values))
+        if not present:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * len(present)))
+        return present[rank - 1]
+
+    def p95(self) -> float:
+        """95 백분위수"""
+        return self.percentile(95)
+
+    def days_active(self, threshold: float = 0.0) -> int:
+        """값이 threshold를 초과한 datapoint가 있는 날짜(UTC) 수
+
+        Args:
+            threshold: 활성으로 판단할 최소값 (초과)
+
+        Returns:
+            활성 일수
+        """
+        return len(
+            {int(ts // 86400) for ts, value in zip(self.timestamps, self.values, strict=True) if value > threshold}
+        )
+
+    def last_nonzero(self) -> datetime | None:
+        """값이 0이 아닌 마지막 datapoint 시각
+
+        Returns:
+            UTC datetime 또는 None (전 구간 0/데이터 없음)
+        """
+        for i in range(len(self.values) - 1, -1, -1):
+            value = self.values[i]
+            if value == value and value != 0:
+                return datetime.fromtimestamp(self.timestamps[i], tz=timezone.utc)
+        return None
+
+
+@dataclass
+class MetricSeriesSet:
+    """공유 timestamp 벡터를 가진 쿼리별 시계열 묶음
+
+    Attributes:
+        timestamps: 공유 timestamp 벡터 (epoch 초, 오름차순)
+        series: {query_id: MetricSeries}
+    """
+
+    timestamps: array = field(default_factory=lambda: array("d"))
+    series: dict[str, MetricSeries] = field(default_factory=dict)
+
+    @classmethod
+    def from_points(cls, points: dict[str, tuple[array, array]]) -> MetricSeriesSet:
+        """쿼리별 (timestamps, values) 희소 배열을 공유 timestamp 벡터로 정렬
+
+        Args:
+            points: {query_id: (timestamps, values)} (각 쿼리의 datapoint만 포함)
+
+        Returns:
+            MetricSeriesSet
+        """
+        grid = sorted({ts for timestamps, _ in points.values() for ts in timestamps})
+        timestamps = array("d", grid)
+        index = {ts: i for i, ts in enumerate(grid)}
+
+        series: dict[str, MetricSeries] = {}
+        for query_id, (ts_arr, val_arr) in points.items():
+            values = array("d", [_NAN]) * len(grid)
+            for ts, value in zip(ts_arr, val_arr, strict=True):
+                values[index[ts]] = value
+            series[query_id] = MetricSeries(timestamps, values)
+
+        return cls(timestamps=timestamps, series=series)
+
+    def __getitem__(self, query_id: str) -> MetricSeries:
+        return self.series[query_id]
+
+    def __contains__(self, query_id: object) -> bool:
+        return query_id in self.series
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    def get(self, query_id: str) -> MetricSeries | None:
+        """쿼리 ID의 시계열 조회 (없으면 None)"""
+        return self.series.get(query_id)
+
+    def window(self, start_time: datetime, end_time: datetime) -> MetricSeriesSet:
+        """[start_time, end_time) 구간만 잘라낸 묶음
+
+        Args:
+            start_time: 구간 시작 (포함)
+            end_time: 구간 종료 (미포함)
+
+        Returns:
+            구간에 해당하는 MetricSeriesSet (배열 복사)
+        """
+        lo = bisect_left(self.timestamps, to_epoch(start_time))
+        hi = bisect_left(self.timestamps, to_epoch(end_time))
+        timestamps = self.timestamps[lo:hi]
+        return MetricSeriesSet(
+            timestamps=timestamps,
+            series={qid: MetricSeries(timestamps, s.values[lo:hi]) for qid, s in self.series.items()},
+        )
+
+    def reduce(self, reducer: str = "sum") -> dict[str, float]:
+        """모든 시계열에 리듀서 적용
+
+        Args:
+            reducer: "sum", "max", "mean", "count", "last", "p95", "days_active"
+
+        Returns:
+            {query_id: 값}
+        """
+        if reducer not in ("sum", "max", "mean", "count", "last", "p95", "days_active"):
+            raise ValueError(f"지원하지 않는 리듀서: {reducer}")
+        return {qid: float(getattr(s, reducer)()) for qid, s in self.series.items()}
+
+
+# =============================================================================
+# 캐시 직렬화
+# =============================================================================
+
+
+def encode_points(start: float, end: float, timestamps: array, values: array) -> bytes:
+    """조회 구간과 datapoint 배열을 bytes로 직렬화
+
+    Args:
+        start: 조회 시작 (epoch 초)
+        end: 조회 종료 (epoch 초)
+        timestamps: datapoint timestamp 배열 (오름차순)
+        values: datapoint 값 배열
+
+    Returns:
+        캐시 저장용 bytes
+    """
+    return _HEADER.pack(start, end, len(timestamps)) + timestamps.tobytes() + values.tobytes()
+
+
+def decode_points(blob: bytes) -> tuple[float, float, array, array]:
+    """encode_points 결과 역직렬화
+
+    Args:
+        blob: encode_points로 만든 bytes
+
+    Returns:
+        (조회 시작, 조회 종료, timestamps, values)
+
+    Raises:
+        ValueError: 형식이 맞지 않는 경우
+    """
+    if len(blob) < _HEADER.size:
+        raise ValueError("시계열 캐시 데이터가 손상되었습니다")
+    start, end, count = _HEADER.unpack_from(blob)
+    body = memoryview(blob)[_HEADER.size :]
+    if len(body) != count * 16:
+        raise ValueError("시계열 캐시 데이터가 손상되었습니다")
+    timestamps = array("d")
+    timestamps.frombytes(body[: count * 8])
+    values = array("d")
+    values.frombytes(body[count * 8 :])
+    return start, end, timestamps, values
+
+
+def slice_points(timestamps: array, values: array, start: float, end: float) -> tuple[array, array]:
+    """[start, end) 구간 datapoint만 잘라냄
+
+    Args:
+        timestamps: 오름차순 timestamp 배열
+        values: 값 배열
+        start: 구간 시작 (epoch 초, 포함)
+        end: 구간 종료 (epoch 초, 미포함)
+
+    Returns:
+        (timestamps, values) 구간 배열
+    """
+    lo = bisect_left(timestamps, start)
+    hi = bisect_left(timestamps, end)
+    return timestamps[lo:hi], values[lo:hi]
@@ -7,10 +7,12 @@ cost_dashboard 실행 중 동일 메트릭 중복 조회 방지를 위한 캐시
 1. MetricSessionCache: ContextVar 기반, 단일 스레드 내에서만 유효
 2. SharedMetricCache: threading.Lock 기반, 멀티스레드 환경에서 공유 가능 (LRU 지원)
 3. FileBackedMetricCache: 파일 기반 캐시, 반복 실행 시에도 API 호출 절감
+   (기본 저장소: 단일 SQLite 파일, 항목당 JSON 파일 방식도 선택 가능)
 
 전역 캐시:
 - set_global_cache() / get_global_cache(): 전역 캐시 설정/조회
 - batch_get_metrics에서 cache=None 시 자동으로 전역 캐시 사용
+- persistent_metric_cache(): 실행 간 유지되는 파일 캐시를 전역 캐시로 활성화
 
 Usage:
     # 방법 1: 명시적 캐시 전달
@@ -26,20 +28,27 @@ Usage:
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
 import logging
+import sqlite3
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# 캐시 값: 스칼라 메트릭 값(float) 또는 직렬화된 시계열(bytes, series.encode_points)
+CacheValue = float | bytes
+
 # 세션별 캐시 저장소 (ContextVar로 스레드/코루틴별 독립)
-_session_cache: ContextVar[dict[str, float] | None] = ContextVar("metric_cache", default=None)
+_session_cache: ContextVar[dict[str, CacheValue] | None] = ContextVar("metric_cache", default=None)
 
 # 전역 캐시 (스레드 간 공유)
 _global_cache: SharedMetricCache | None = None
@@ -183,7 +192,7 @@ class MetricSessionCache:
 
     def __init__(self) -> None:
         self._stats = CacheStats()
-        self._token: Token[dict[str, float] | None] | None = None
+        self._token: Token[dict[str, CacheValue] | None] | None = None
 
     def __enter__(self) -> MetricSessionCache:
         """캐시 활성화"""
@@ -203,7 +212,7 @@ class MetricSessionCache:
         """캐시 통계 반환"""
         return self._stats
 
-    def get(self, key: str) -> float | None:
+    def get(self, key: str) -> CacheValue | None:
         """캐시에서 값 조회
 
         Args:
@@ -224,7 +233,7 @@ class MetricSessionCache:
 
         return value
 
-    def set(self, key: str, value: float) -> None:
+    def set(self, key: str, value: CacheValue) -> None:
         """캐시에 값 저장
 
         Args:
@@ -236,7 +245,7 @@ class MetricSessionCache:
             cache[key] = value
             self._stats.sets += 1
 
-    def get_many(self, keys: list[str]) -> dict[str, float]:
+    def get_many(self, keys: list[str]) -> dict[str, CacheValue]:
         """여러 키를 한번에 조회
 
         Args:
@@ -260,7 +269,7 @@ class MetricSessionCache:
 
         return result
 
-    def set_many(self, items: dict[str, float]) -> None:
+    def set_many(self, items: dict[str, CacheValue]) -> None:
         """여러 값을 한번에 저장
 
         Args:
@@ -329,7 +338,7 @@ class SharedMetricCache:
     """
 
     def __init__(self, max_size: int = 10000, register_global: bool = True) -> None:
-        self._cache: OrderedDict[str, float] = OrderedDict()
+        self._cache: OrderedDict[str, CacheValue] = OrderedDict()
         self._lock = threading.Lock()
         self._stats = CacheStats()
         self._active = False
@@ -371,7 +380,7 @@ class SharedMetricCache:
         if evicted:
             self._stats.add_eviction(evicted)
 
-    def get(self, key: str) -> float | None:
+    def get(self, key: str) -> CacheValue | None:
         """캐시에서 값 조회 (LRU 갱신)"""
         if not self._active:
             return None
@@ -387,7 +396,7 @@ class SharedMetricCache:
         self._stats.add_miss()
         return None
 
-    def set(self, key: str, value: float) -> None:
+    def set(self, key: str, value: CacheValue) -> None:
         """캐시에 값 저장 (LRU eviction 적용)"""
         if not self._active:
             return
@@ -401,7 +410,7 @@ class SharedMetricCache:
 
         self._stats.add_set()
 
-    def get_many(self, keys: list[str]) -> dict[str, float]:
+    def get_many(self, keys: list[str]) -> dict[str, CacheValue]:
         """여러 키를 한번에 조회"""
         if not self._active:
             self._stats.add_miss(len(keys))
@@ -427,7 +436,7 @@ class SharedMetricCache:
 
         return result
 
-    def set_many(self, items: dict[str, float]) -> None:
+    def set_many(self, items: dict[str, CacheValue]) -> None:
         """여러 값을 한번에 저장"""
         if not self._active or not items:
             return
@@ -448,6 +457,243 @@ class SharedMetricCache:
             return len(self._cache)
 
 
+# =============================================================================
+# 파일 캐시 저장소 (FileBackedMetricCache 백엔드)
+# =============================================================================
+
+
+class _DirectoryMetricStore:
+    """디렉토리 저장소: 메트릭 값 1개당 JSON 파일 1개
+
+    항목 수만큼 파일이 생성되고, 만료 정리 시 모든 파일을 stat 하므로
+    항목이 수십만 개를 넘으면 시작/조회가 파일시스템 I/O에 묶입니다.
+    (이전 버전 호환 및 벤치마크 비교용)
+    """
+
+    def __init__(self, cache_dir: Path, ttl_seconds: float) -> None:
+        self._cache_dir = cache_dir
+        self._ttl_seconds = ttl_seconds
+
+    def open(self) -> None:
+        """저장소 준비"""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def close(self) -> None:
+        """저장소 종료 (별도 자원 없음)"""
+
+    def _key_to_filename(self, key: str) -> Path:
+        """캐시 키를 SHA256 해시 기반 파일 경로로 변환"""
+        hash_val = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self._cache_dir / f"{hash_val}.json"
+
+    def _is_expired(self, filepath: Path) -> bool:
+        """파일이 없거나 mtime 기준 TTL 초과 시 True"""
+        if not filepath.exists():
+            return True
+        return (time.time() - filepath.stat().st_mtime) > self._ttl_seconds
+
+    def get_many(self, keys: list[str]) -> dict[str, CacheValue]:
+        """여러 키 조회 (만료/손상 파일은 제외)"""
+        result: dict[str, CacheValue] = {}
+        for key in keys:
+            filepath = self._key_to_filename(key)
+            if self._is_expired(filepath):
+                continue
+            try:
+                with open(filepath, encoding="utf-8") as f:
+                    data = json.load(f)
+                if "blob" in data:
+                    result[key] = base64.b64decode(data["blob"])
+                elif data.get("value") is not None:
+                    result[key] = float(data["value"])
+            except (OSError, ValueError):
+                continue
+        return result
+
+    def set_many(self, items: dict[str, CacheValue]) -> None:
+        """여러 값 저장 (키마다 파일 1개)"""
+        now = time.time()
+        for key, value in items.items():
+            try:
+                if isinstance(value, bytes):
+                    data = {"key": key, "blob": base64.b64encode(value).decode("ascii"), "ts": now}
+                else:
+                    data = {"key": key, "value": value, "ts": now}
+                with open(self._key_to_filename(key), "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+            except OSError as e:
+                logger.debug(f"파일 캐시 저장 실패: {e}")
+
+    def cleanup_expired(self) -> int:
+        """만료된 캐시 파일 삭제
+
+        Returns:
+            삭제된 파일 수
+        """
+        if not self._cache_dir.exists():
+            return 0
+
+        removed = 0
+        for filepath in self._cache_dir.glob("*.json"):
+            if self._is_expired(filepath):
+                try:
+                    filepath.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def clear(self) -> int:
+        """전체 캐시 파일 삭제
+
+        Returns:
+            삭제된 파일 수
+        """
+        removed = 0
+        if self._cache_dir.exists():
+            for filepath in self._cache_dir.glob("*.json"):
+                try:
+                    filepath.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def count(self) -> int:
+        """저장된 항목 수 (만료 포함)"""
+        if not self._cache_dir.exists():
+            return 0
+        return sum(1 for _ in self._cache_dir.glob("*.json"))
+
+
+class _SQLiteMetricStore:
+    """SQLite 저장소: 모든 항목을 단일 인덱스 파일에 저장
+
+    - 키는 PRIMARY KEY, 저장 시각(ts)은 별도 인덱스로 관리하여
+      TTL 만료를 파일 mtime 대신 인덱스 범위 삭제로 처리
+    - get_many/set_many는 하나의 트랜잭션에서 일괄 처리
+    - WAL 모드로 다른 프로세스의 동시 읽기 허용
+    """
+
+    DB_FILENAME = "metrics.sqlite3"
+    # SQLite 바인딩 변수 제한(구버전 999)을 넘지 않도록 IN 절 분할 크기
+    _IN_CHUNK = 500
+
+    def __init__(self, cache_dir: Path, ttl_seconds: float) -> None:
+        self._cache_dir = cache_dir
+        self._ttl_seconds = ttl_seconds
+        self._path = cache_dir / self.DB_FILENAME
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        """DB 연결 및 스키마 생성"""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS metric_cache (key TEXT PRIMARY KEY, value NOT NULL, ts REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_metric_cache_ts ON metric_cache (ts)")
+        self._conn = conn
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _cutoff(self) -> float:
+        return time.time() - self._ttl_seconds
+
+    def get_many(self, keys: list[str]) -> dict[str, CacheValue]:
+        """여러 키를 한 트랜잭션에서 조회 (만료 항목 제외)"""
+        result: dict[str, CacheValue] = {}
+        if not keys:
+            return result
+
+        cutoff = self._cutoff()
+        with self._lock:
+            if self._conn is None:
+                return result
+            for i in range(0, len(keys), self._IN_CHUNK):
+                chunk = keys[i : i + self._IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM metric_cache WHERE key IN ({placeholders}) AND ts >= ?",
+                    (*chunk, cutoff),
+                )
+                result.update(rows)
+        return result
+
+    def set_many(self, items: dict[str, CacheValue]) -> None:
+        """여러 값을 한 트랜잭션에서 저장 (기존 키는 덮어씀)"""
+        if not items:
+            return
+
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                with self._transaction():
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO metric_cache (key, value, ts) VALUES (?, ?, ?)",
+                        ((key, value, now) for key, value in items.items()),
+                    )
+            except sqlite3.Error as e:
+                logger.debug(f"SQLite 캐시 저장 실패: {e}")
+
+    def cleanup_expired(self) -> int:
+        """ts 인덱스 기준 만료 항목 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if self._conn is None:
+                return 0
+            with self._transaction():
+                return self._conn.execute("DELETE FROM metric_cache WHERE ts < ?", (self._cutoff(),)).rowcount
+
+    def clear(self) -> int:
+        """전체 항목 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if self._conn is None:
+                return 0
+            with self._transaction():
+                return self._conn.execute("DELETE FROM metric_cache").rowcount
+
+    def count(self) -> int:
+        """저장된 항목 수 (만료 포함)"""
+        with self._lock:
+            if self._conn is None:
+                return 0
+            return int(self._conn.execute("SELECT COUNT(*) FROM metric_cache").fetchone()[0])
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """명시적 트랜잭션 (락 내에서 호출, autocommit 연결 기준)"""
+        assert self._conn is not None
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+
+_FILE_CACHE_BACKENDS: dict[str, type[_DirectoryMetricStore] | type[_SQLiteMetricStore]] = {
+    "sqlite": _SQLiteMetricStore,
+    "files": _DirectoryMetricStore,
+}
+
+
 # =============================================================================
 # FileBackedMetricCache (파일 기반, 반복 실행 효과)
 # =============================================================================
@@ -465,6 +711,11 @@ class FileBackedMetricCache:
         - 자동 정리 (만료된 항목 제거)
         - 스레드 안전
         - 종료 시 파일 삭제 옵션
+        - get_many/set_many는 파일 캐시에 일괄 조회/저장
+
+    Backends:
+        - "sqlite" (기본): 단일 SQLite 파일, 키/저장 시각 인덱스
+        - "files": 항목당 JSON 파일 1개 (이전 방식)
 
     Args:
         cache_dir: 캐시 파일 디렉토리 (기본: ~/.aws-automation/cache/metrics)
@@ -472,6 +723,7 @@ class FileBackedMetricCache:
         max_memory_size: 메모리 캐시 최대 크기
         register_global: 전역 캐시로 등록 여부
         cleanup_on_exit: 종료 시 파일 캐시 삭제 여부 (기본 True)
+        backend: 파일 캐시 저장소 ("sqlite" 또는 "files")
 
     Usage:
         # 일회성 캐시 (실행 후 삭제, 기본값)
@@ -492,29 +744,33 @@ class FileBackedMetricCache:
         max_memory_size: int = 10000,
         register_global: bool = True,
         cleanup_on_exit: bool = True,
+        backend: str = "sqlite",
     ) -> None:
+        if backend not in _FILE_CACHE_BACKENDS:
+            raise ValueError(f"지원하지 않는 캐시 백엔드: {backend} (사용 가능: {', '.join(_FILE_CACHE_BACKENDS)})")
+
         self._cache_dir = Path(cache_dir) if cache_dir else self.DEFAULT_CACHE_DIR
         self._ttl_seconds = ttl_days * 86400
+        self._store = _FILE_CACHE_BACKENDS[backend](self._cache_dir, self._ttl_seconds)
+        self._backend = backend
         self._memory_cache = SharedMetricCache(max_size=max_memory_size, register_global=False)
-        self._lock = threading.Lock()
         self._stats = CacheStats()
         self._active = False
         self._register_global = register_global
         self._cleanup_on_exit = cleanup_on_exit
         self._file_hits = 0
-        self._files_created: set[Path] = set()  # 이 세션에서 생성된 파일 추적
 
     def __enter__(self) -> FileBackedMetricCache:
         """캐시 활성화"""
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._store.open()
         self._memory_cache.__enter__()
         self._active = True
-        self._files_created.clear()
         if self._register_global:
             set_global_cache(self)  # type: ignore[arg-type]
         self._cleanup_expired()
         logger.debug(
-            f"FileBackedMetricCache: 캐시 활성화 (dir={self._cache_dir}, cleanup_on_exit={self._cleanup_on_exit})"
+            f"FileBackedMetricCache: 캐시 활성화 "
+            f"(dir={self._cache_dir}, backend={self._backend}, cleanup_on_exit={self._cleanup_on_exit})"
         )
         return self
 
@@ -529,6 +785,7 @@ class FileBackedMetricCache:
         files_removed = 0
         if self._cleanup_on_exit:
             files_removed = self.clear_file_cache()
+        self._store.close()
 
         logger.debug(
             f"FileBackedMetricCache: 캐시 종료 "
@@ -540,137 +797,116 @@ class FileBackedMetricCache:
         """캐시 통계 반환"""
         return self._stats
 
-    def _key_to_filename(self, key: str) -> Path:
-        """캐시 키를 파일명으로 변환
-
-        Args:
-            key: 캐시 키 문자열
-
-        Returns:
-            SHA256 해시 기반의 안전한 파일 경로 (.json)
-        """
-        # SHA256 해시로 안전한 파일명 생성
-        hash_val = hashlib.sha256(key.encode()).hexdigest()[:32]
-        return self._cache_dir / f"{hash_val}.json"
-
-    def _is_expired(self, filepath: Path) -> bool:
-        """파일 캐시 만료 확인
-
-        Args:
-            filepath: 확인할 캐시 파일 경로
-
-        Returns:
-            파일이 없거나 TTL 초과 시 True
-        """
-        if not filepath.exists():
-            return True
-        mtime = filepath.stat().st_mtime
-        return (time.time() - mtime) > self._ttl_seconds
+    @property
+    def backend(self) -> str:
+        """파일 캐시 저장소 이름"""
+        return self._backend
 
     def _cleanup_expired(self) -> None:
-        """만료된 캐시 파일 정리"""
-        if not self._cache_dir.exists():
-            return
-
-        removed = 0
-        for filepath in self._cache_dir.glob("*.json"):
-            if self._is_expired(filepath):
-                try:
-                    filepath.unlink()
-                    removed += 1
-                except OSError:
-                    pass
-
+        """만료된 파일 캐시 항목 정리"""
+        removed = self._store.cleanup_expired()
         if removed:
             logger.debug(f"FileBackedMetricCache: 만료 캐시 {removed}개 정리")
 
-    def get(self, key: str) -> float | None:
+    def get(self, key: str) -> CacheValue | None:
         """캐시에서 값 조회 (메모리 → 파일)"""
         if not self._active:
             return None
+        return self.get_many([key]).get(key)
 
-        # 1. 메모리 캐시 확인
-        value = self._memory_cache.get(key)
-        if value is not None:
-            self._stats.add_hit()
-            return value
-
-        # 2. 파일 캐시 확인
-        filepath = self._key_to_filename(key)
-        if not self._is_expired(filepath):
-            try:
-                with open(filepath, encoding="utf-8") as f:
-                    data = json.load(f)
-                    value = data.get("value")
-                    if value is not None:
-                        # 메모리 캐시에 로드
-                        self._memory_cache.set(key, value)
-                        self._stats.add_hit()
-                        self._file_hits += 1
-                        return float(value)
-            except (OSError, json.JSONDecodeError):
-                pass
-
-        self._stats.add_miss()
-        return None
-
-    def set(self, key: str, value: float) -> None:
+    def set(self, key: str, value: CacheValue) -> None:
         """캐시에 값 저장 (메모리 + 파일)"""
-        if not self._active:
-            return
+        self.set_many({key: value})
 
-        # 메모리 캐시 저장
-        self._memory_cache.set(key, value)
-
-        # 파일 캐시 저장
-        filepath = self._key_to_filename(key)
-        try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump({"key": key, "value": value, "ts": time.time()}, f)
-        except OSError as e:
-            logger.debug(f"파일 캐시 저장 실패: {e}")
-
-        self._stats.add_set()
-
-    def get_many(self, keys: list[str]) -> dict[str, float]:
-        """여러 키를 한번에 조회"""
+    def get_many(self, keys: list[str]) -> dict[str, CacheValue]:
+        """여러 키를 한번에 조회 (메모리 → 파일 일괄 조회)"""
         if not self._active:
             self._stats.add_miss(len(keys))
             return {}
 
-        result = {}
-        for key in keys:
-            value = self.get(key)
-            if value is not None:
-                result[key] = value
+        # 1. 메모리 캐시 확인
+        result = self._memory_cache.get_many(keys)
+
+        # 2. 메모리 미스 항목은 파일 캐시에서 일괄 조회 후 메모리에 로드
+        missing = [key for key in keys if key not in result]
+        if missing:
+            loaded = self._store.get_many(missing)
+            if loaded:
+                self._memory_cache.set_many(loaded)
+                self._file_hits += len(loaded)
+                result.update(loaded)
+
+        hits = sum(1 for key in keys if key in result)
+        if hits:
+            self._stats.add_hit(hits)
+        if len(keys) - hits:
+            self._stats.add_miss(len(keys) - hits)
 
         return result
 
-    def set_many(self, items: dict[str, float]) -> None:
-        """여러 값을 한번에 저장"""
+    def set_many(self, items: dict[str, CacheValue]) -> None:
+        """여러 값을 한번에 저장 (파일 캐시는 단일 트랜잭션)"""
         if not self._active or not items:
             return
 
-        for key, value in items.items():
-            self.set(key, value)
+        self._memory_cache.set_many(items)
+        self._store.set_many(items)
+        self._stats.add_set(len(items))
 
     def size(self) -> int:
         """메모리 캐시 크기 반환"""
         return self._memory_cache.size()
 
+    def file_size(self) -> int:
+        """파일 캐시에 저장된 항목 수 (만료 포함)"""
+        return self._store.count()
+
     def clear_file_cache(self) -> int:
         """파일 캐시 전체 삭제
 
         Returns:
-            삭제된 캐시 파일 수
+            삭제된 캐시 항목 수
         """
-        removed = 0
-        if self._cache_dir.exists():
-            for filepath in self._cache_dir.glob("*.json"):
-                try:
-                    filepath.unlink()
-                    removed += 1
-                except OSError:
-                    pass
+        removed = self._store.clear()
         logger.info(f"FileBackedMetricCache: 파일 캐시 {removed}개 삭제")
         return removed
+
+
+@contextmanager
+def persistent_metric_cache(
+    cache_dir: Path | str | None = None,
+) -> Iterator[SharedMetricCache | FileBackedMetricCache | None]:
+    """실행 간 재사용되는 파일 기반 전역 메트릭 캐시 활성화
+
+    ``FileBackedMetricCache(cleanup_on_exit=False)`` 를 전역 캐시로 등록하여, 매일 실행되는
+    cost dashboard/정기 작업이 전날 저장된 일 단위 메트릭 버킷을 재사용하도록 합니다.
+    이미 전역 캐시가 활성화되어 있으면(중첩 실행) 그대로 사용하며, 캐시 디렉토리를
+    열 수 없으면 파일 캐시 없이 진행합니다.
+
+    Args:
+        cache_dir: 캐시 파일 디렉토리 (None이면 기본 경로)
+
+    Yields:
+        활성 전역 캐시 (파일 캐시를 열지 못하면 None)
+
+    Example:
+        with persistent_metric_cache():
+            parallel_collect(ctx, collector)  # 내부 batch_get_metrics가 전역 캐시 사용
+    """
+    existing = get_global_cache()
+    if existing is not None:
+        yield existing
+        return
+
+    cache = FileBackedMetricCache(cache_dir=cache_dir, cleanup_on_exit=False)
+    try:
+        cache.__enter__()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"메트릭 파일 캐시를 열 수 없어 캐시 없이 진행: {e}")
+        yield None
+        return
+
+    try:
+        yield cache
+    finally:
+        cache.__exit__(None, None, None)
@@ -11,6 +11,7 @@ API 실패 시 constants.py의 하드코딩 기본값으로 fallback합니다.
         - constants: 중앙 관리 상수 및 서비스별 기본 가격
         - fetcher: PricingFetcher (AWS Pricing get_products API 클라이언트)
         - cache: PriceCache (파일 기반 캐시, filelock 동시성 보호)
+        - price_db: PriceDatabase (Bulk Price List 로컬 DB, ``aa pricing sync``)
 
     PricingService 연동 모듈 (캐시/API 자동 관리):
         - ec2: EC2 인스턴스 On-Demand 가격
@@ -202,6 +203,9 @@ from .opensearch import (
     get_opensearch_storage_price,
 )
 
+# 로컬 가격 DB (Bulk Price List)
+from .price_db import PriceDatabase, sync_price_db
+
 # RDS 가격
 from .rds import (
     get_rds_instance_price,
@@ -282,6 +286,8 @@ __all__: list[str] = [
     "PriceCache",
     "clear_cache",
     "get_cache_info",
+    "PriceDatabase",
+    "sync_price_db",
     # Constants
     "HOURS_PER_MONTH",
     "DEFAULT_PRICES",
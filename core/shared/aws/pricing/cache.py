@@ -11,6 +11,11 @@ AWS Pricing API 응답을 JSON 파일로 캐싱하여 반복 API 호출을 최
     - 쓰기: ``filelock`` 라이브러리로 멀티 프로세스 환경에서 안전하게 보호
     - 읽기: 락 없이 수행하여 성능 최적화 (stale read 허용)
 
+메모리 계층:
+    파싱한 파일 내용은 프로세스 전역 LRU에 파일의 (mtime, size)와 함께 보관한다.
+    이후 조회는 ``stat`` 한 번으로 파일 변경 여부만 확인하므로, 리소스 수천 개의
+    가격을 계산해도 서비스/리전당 파일 읽기와 JSON 파싱은 한 번이다.
+
 사용법:
     from core.shared.aws.pricing.cache import PriceCache, clear_cache
 
@@ -23,6 +28,8 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -39,12 +46,64 @@ DEFAULT_TTL_DAYS = 7
 # 파일 락 타임아웃 (초)
 FILE_LOCK_TIMEOUT = 10
 
+# 메모리 계층 최대 항목 수 (캐시 파일 단위)
+MEMORY_CACHE_MAX_ENTRIES = 256
+
 
 def _get_pricing_cache_dir() -> Path:
     """pricing 캐시 디렉토리 반환"""
     return Path(get_cache_dir("pricing"))
 
 
+class _MemoryLayer:
+    """캐시 파일 내용을 보관하는 프로세스 전역 LRU (thread-safe).
+
+    항목은 파일 경로별 ``(signature, cached_at, prices)`` 이며, signature
+    (``st_mtime_ns``, ``st_size``)가 현재 파일과 다르면 무효로 취급한다.
+    """
+
+    def __init__(self, max_entries: int = MEMORY_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Path, tuple[tuple[int, int], datetime, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, signature: tuple[int, int]) -> tuple[datetime, dict[str, Any]] | None:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != signature:
+                return None
+            self._entries.move_to_end(path)
+            return entry[1], entry[2]
+
+    def put(self, path: Path, signature: tuple[int, int], cached_at: datetime, prices: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[path] = (signature, cached_at, prices)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, path: Path) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """파일 변경 감지용 (mtime_ns, size). 파일이 없으면 ``None``."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# 모든 PriceCache 인스턴스가 공유하는 메모리 계층
+_memory = _MemoryLayer()
+
+
 class PriceCache:
     """가격 정보 파일 기반 캐시 관리자.
 
@@ -94,6 +153,7 @@ class PriceCache:
 
         파일이 존재하고 TTL 이내이면 가격 딕셔너리를 반환하고,
         파일이 없거나 만료되었으면 ``None`` 을 반환한다.
+        파일이 마지막으로 읽은 이후 바뀌지 않았으면 메모리 계층에서 반환한다.
 
         Args:
             service: AWS 서비스 코드 (예: ``"ec2"``, ``"ebs"``, ``"rds"``)
@@ -105,26 +165,32 @@ class PriceCache:
         """
         cache_path = self._get_cache_path(service, region)
 
-        if not cache_path.exists():
+        signature = _file_signature(cache_path)
+        if signature is None:
+            _memory.discard(cache_path)
             return None
 
-        try:
-            with open(cache_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            # 만료 확인
-            cached_at = datetime.fromisoformat(data.get("cached_at", "2000-01-01"))
-            if datetime.now() - cached_at > timedelta(days=self.ttl_days):
-                logger.debug(f"캐시 만료: {service}/{region}")
+        entry = _memory.get(cache_path, signature)
+        if entry is None:
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                cached_at = datetime.fromisoformat(data.get("cached_at", "2000-01-01"))
+                prices = data.get("prices", {}) or {}
+            except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+                logger.warning(f"캐시 읽기 오류: {e}")
                 return None
+            _memory.put(cache_path, signature, cached_at, prices)
+        else:
+            cached_at, prices = entry
 
-            prices = data.get("prices", {})
-            return dict(prices) if prices else {}
-
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            logger.warning(f"캐시 읽기 오류: {e}")
+        # 만료 확인
+        if datetime.now() - cached_at > timedelta(days=self.ttl_days):
+            logger.debug(f"캐시 만료: {service}/{region}")
             return None
 
+        return dict(prices)
+
     def set(self, service: str, region: str, prices: dict[str, Any]) -> None:
         """가격 데이터를 캐시 파일에 저장한다 (파일 락으로 동시 쓰기 방지).
 
@@ -138,8 +204,9 @@ class PriceCache:
         cache_path = self._get_cache_path(service, region)
         lock_path = self._get_lock_path(service, region)
 
+        cached_at = datetime.now()
         data = {
-            "cached_at": datetime.now().isoformat(),
+            "cached_at": cached_at.isoformat(),
             "service": service,
             "region": region,
             "prices": prices,
@@ -149,6 +216,9 @@ class PriceCache:
             with FileLock(lock_path, timeout=FILE_LOCK_TIMEOUT):
                 with open(cache_path, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
+                signature = _file_signature(cache_path)
+                if signature is not None:
+                    _memory.put(cache_path, signature, cached_at, dict(prices))
                 logger.debug(f"캐시 저장: {service}/{region} ({len(prices)} items)")
         except Timeout:
             logger.warning(f"캐시 저장 타임아웃: {service}/{region} (락 획득 실패)")
@@ -166,6 +236,7 @@ class PriceCache:
             캐시 파일이 존재하여 삭제한 경우 ``True``, 파일이 없었으면 ``False``
         """
         cache_path = self._get_cache_path(service, region)
+        _memory.discard(cache_path)
 
         if cache_path.exists():
             cache_path.unlink()
@@ -2,7 +2,7 @@
 core/shared/aws/pricing/elasticache.py - Amazon ElastiCache 가격 조회
 
 ElastiCache 노드 타입별 시간당/월간 비용을 조회한다.
-Pricing API 직접 호출 후, 실패 시 하드코딩 가격으로 fallback한다.
+로컬 가격 DB(``aa pricing sync``) 또는 Pricing API로 조회하고, 실패 시 하드코딩 가격으로 fallback한다.
 Redis와 Memcached는 동일 노드 타입이면 동일 가격이다.
 
 사용법:
@@ -16,13 +16,13 @@ Redis와 Memcached는 동일 노드 타입이면 동일 가격이다.
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
 from botocore.exceptions import BotoCoreError, ClientError
 
-from core.parallel import get_client
+from .fetcher import PricingFetcher
+from .price_db import PriceDatabase
 
 if TYPE_CHECKING:
     import boto3
@@ -31,8 +31,6 @@ logger = logging.getLogger(__name__)
 
 from .constants import HOURS_PER_MONTH
 
-PRICING_API_REGION = "us-east-1"
-
 # ElastiCache 노드 타입별 시간당 가격 (USD) - 2025년 기준
 # https://aws.amazon.com/elasticache/pricing/
 ELASTICACHE_PRICES: dict[str, dict[str, float]] = {
@@ -68,7 +66,7 @@ DEFAULT_NODE_PRICE = 0.20  # 알 수 없는 노드 타입용 기본값
 
 
 def get_elasticache_prices_from_api(session: boto3.Session, region: str) -> dict[str, float]:
-    """AWS Pricing API를 통해 ElastiCache 노드 타입별 가격을 조회한다.
+    """로컬 가격 DB 또는 Pricing API를 통해 ElastiCache 노드 타입별 가격을 조회한다.
 
     ``cache.`` 접두사가 없는 인스턴스 타입에는 자동으로 추가한다.
 
@@ -80,20 +78,11 @@ def get_elasticache_prices_from_api(session: boto3.Session, region: str) -> dict
         ``{node_type: hourly_price}`` 딕셔너리. 조회 실패 시 빈 딕셔너리.
     """
     try:
-        pricing = get_client(session, "pricing", region_name=PRICING_API_REGION)
-        response = pricing.get_products(
-            ServiceCode="AmazonElastiCache",
-            Filters=[
-                {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                {"Type": "TERM_MATCH", "Field": "productFamily", "Value": "Cache Instance"},
-            ],
-            MaxResults=100,
-        )
+        price_list = PricingFetcher(session, price_db=PriceDatabase()).query("elasticache", region)
 
         prices: dict[str, float] = {}
 
-        for price_item in response.get("PriceList", []):
-            data = json.loads(price_item) if isinstance(price_item, str) else price_item
+        for data in price_list:
             attrs = data.get("product", {}).get("attributes", {})
             terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -7,6 +7,13 @@ Pricing API는 us-east-1에서만 사용 가능하며, 서비스별 전용 메
 ``PricingService`` (utils.py)에서 캐시/재시도 계층을 거쳐 호출되며,
 직접 사용하는 경우는 드물다.
 
+``get_products`` 는 페이지당 최대 100개만 반환하므로 모든 메서드는 paginator로
+전체 페이지를 순회한다 (첫 페이지만 읽으면 대부분의 인스턴스 타입이 누락된다).
+
+서비스별 조회 조건은 ``PRICE_QUERIES`` 에 모여 있으며, ``aa pricing sync`` 로 만든
+로컬 가격 DB(price_db.py)가 있으면 API 대신 DB에서 같은 조건으로 조회한다.
+서비스별 모듈(rds.py, elasticache.py 등)도 ``PricingFetcher.query()`` 로 같은 경로를 사용한다.
+
 지원 서비스 (15개):
     EC2, EBS, SageMaker, VPC Endpoint, Secrets Manager, KMS, ECR,
     Route53, EBS Snapshot, EIP, ELB, RDS Snapshot, CloudWatch, Lambda, DynamoDB
@@ -22,7 +29,8 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
 from botocore.exceptions import BotoCoreError, ClientError
 
@@ -31,11 +39,48 @@ from core.parallel import get_client
 if TYPE_CHECKING:
     import boto3
 
+    from .price_db import PriceDatabase
+
 logger = logging.getLogger(__name__)
 
 # Pricing API는 us-east-1에서만 사용 가능
 PRICING_API_REGION = "us-east-1"
 
+# get_products 페이지 크기 (API 최대값)
+PRICE_LIST_PAGE_SIZE = 100
+
+# 서비스별 조회 조건: service -> (ServiceCode, regionCode 외 TERM_MATCH 조건)
+# 로컬 가격 DB 동기화 범위도 이 조건으로 결정된다.
+PRICE_QUERIES: dict[str, tuple[str, dict[str, str]]] = {
+    "ec2": (
+        "AmazonEC2",
+        {"operatingSystem": "Linux", "tenancy": "Shared", "preInstalledSw": "NA", "capacitystatus": "Used"},
+    ),
+    "ebs": ("AmazonEC2", {"productFamily": "Storage"}),
+    "snapshot": ("AmazonEC2", {"productFamily": "Storage Snapshot"}),
+    "eip": ("AmazonEC2", {"productFamily": "IP Address"}),
+    "vpc_endpoint": ("AmazonVPC", {"productFamily": "VpcEndpoint", "endpointType": "Interface"}),
+    "secretsmanager": ("AWSSecretsManager", {}),
+    "kms": ("awskms", {}),
+    "ecr": ("AmazonECR", {}),
+    "route53": ("AmazonRoute53", {}),  # 글로벌 서비스 - regionCode 조건 없음
+    "elb": ("AWSELB", {}),
+    "rds_snapshot": ("AmazonRDS", {"productFamily": "Storage Snapshot"}),
+    "cloudwatch": ("AmazonCloudWatch", {}),
+    "lambda": ("AWSLambda", {}),
+    "sagemaker": ("AmazonSageMaker", {"productFamily": "ML Instance"}),
+    "dynamodb": ("AmazonDynamoDB", {}),
+    # 서비스별 모듈(rds.py 등)에서 조회 - 호출 시 추가 조건(예: databaseEngine)을 더할 수 있다
+    "rds": ("AmazonRDS", {"productFamily": "Database Instance", "deploymentOption": "Single-AZ"}),
+    "elasticache": ("AmazonElastiCache", {"productFamily": "Cache Instance"}),
+    "efs": ("AmazonEFS", {}),
+    "fsx": ("AmazonFSx", {"productFamily": "Storage"}),
+    "kinesis": ("AmazonKinesis", {}),
+    "opensearch": ("AmazonES", {}),  # OpenSearch는 여전히 ES 서비스 코드 사용
+    "redshift": ("AmazonRedshift", {}),
+    "transfer": ("AWSTransfer", {}),
+}
+
 
 class PricingFetcher:
     """AWS Pricing API를 사용하여 서비스별 가격을 조회하는 클라이언트.
@@ -46,12 +91,14 @@ class PricingFetcher:
 
     Attributes:
         session: boto3 세션 (Pricing API 호출에 사용)
+        price_db: 로컬 가격 DB (있으면 API보다 우선 조회)
     """
 
-    def __init__(self, session: boto3.Session | None = None):
+    def __init__(self, session: boto3.Session | None = None, price_db: PriceDatabase | None = None):
         """
         Args:
             session: boto3 세션 (None이면 기본 세션 사용)
+            price_db: 로컬 가격 DB (None이면 항상 API 조회)
         """
         import boto3 as _boto3
         from botocore.exceptions import BotoCoreError, ClientError
@@ -59,6 +106,7 @@ class PricingFetcher:
         self._BotoCoreError = BotoCoreError
         self._ClientError = ClientError
         self.session = session or _boto3.Session()
+        self.price_db = price_db
         self._pricing_client = None
 
     @property
@@ -74,6 +122,49 @@ class PricingFetcher:
             self._pricing_client = get_client(self.session, "pricing", region_name=PRICING_API_REGION)
         return self._pricing_client
 
+    def _iter_price_list(self, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """``get_products`` 의 모든 페이지를 순회하며 가격 항목을 반환한다.
+
+        Args:
+            **kwargs: ``get_products`` 파라미터 (``ServiceCode``, ``Filters``)
+
+        Yields:
+            JSON 파싱된 ``PriceList`` 항목
+        """
+        paginator = self.pricing_client.get_paginator("get_products")
+        for page in paginator.paginate(**kwargs, PaginationConfig={"PageSize": PRICE_LIST_PAGE_SIZE}):
+            for price_item in page.get("PriceList", []):
+                yield json.loads(price_item) if isinstance(price_item, str) else price_item
+
+    def query(
+        self, name: str, region: str | None = None, attributes: dict[str, str] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """``PRICE_QUERIES`` 조건으로 가격 항목을 조회한다.
+
+        로컬 가격 DB에 해당 서비스/리전이 동기화되어 있으면 DB에서, 아니면 API에서 읽는다.
+        API 조회는 ``get_products`` 전체 페이지를 순회한다.
+
+        Args:
+            name: ``PRICE_QUERIES`` 키 (예: ``"ec2"``)
+            region: AWS 리전 코드 (글로벌 서비스는 ``None``)
+            attributes: ``PRICE_QUERIES`` 조건에 더할 TERM_MATCH 조건 (예: ``{"databaseEngine": "MySQL"}``)
+
+        Returns:
+            ``get_products`` ``PriceList`` 항목과 같은 형식의 딕셔너리 iterator
+        """
+        service_code, conditions = PRICE_QUERIES[name]
+        conditions = {**conditions, **(attributes or {})}
+        filters = [{"Type": "TERM_MATCH", "Field": "regionCode", "Value": region}] if region else []
+        filters += [{"Type": "TERM_MATCH", "Field": field, "Value": value} for field, value in conditions.items()]
+
+        if self.price_db is not None:
+            items = self.price_db.query(service_code, filters)
+            if items is not None:
+                logger.debug(f"로컬 가격 DB 조회: {name}/{region or 'global'} ({len(items)} items)")
+                return iter(items)
+
+        return self._iter_price_list(ServiceCode=service_code, Filters=filters)
+
     def get_ec2_prices(self, region: str) -> dict[str, float]:
         """EC2 인스턴스 가격 조회 (get_products API 사용)
 
@@ -84,25 +175,10 @@ class PricingFetcher:
             {instance_type: hourly_price} 딕셔너리
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonEC2",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                    {
-                        "Type": "TERM_MATCH",
-                        "Field": "operatingSystem",
-                        "Value": "Linux",
-                    },
-                    {"Type": "TERM_MATCH", "Field": "tenancy", "Value": "Shared"},
-                    {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
-                    {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
-                ],
-                MaxResults=100,
-            )
+            price_list = self.query("ec2", region)
 
             prices = {}
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -134,22 +210,10 @@ class PricingFetcher:
             {volume_type: gb_monthly_price} 딕셔너리
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonEC2",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                    {
-                        "Type": "TERM_MATCH",
-                        "Field": "productFamily",
-                        "Value": "Storage",
-                    },
-                ],
-                MaxResults=100,
-            )
+            price_list = self.query("ebs", region)
 
             prices = {}
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -182,23 +246,7 @@ class PricingFetcher:
         """
         try:
             # Interface Endpoint 시간당 가격
-            interface_response = self.pricing_client.get_products(
-                ServiceCode="AmazonVPC",
-                Filters=[
-                    {
-                        "Type": "TERM_MATCH",
-                        "Field": "productFamily",
-                        "Value": "VpcEndpoint",
-                    },
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                    {
-                        "Type": "TERM_MATCH",
-                        "Field": "endpointType",
-                        "Value": "Interface",
-                    },
-                ],
-                MaxResults=10,
-            )
+            price_list = self.query("vpc_endpoint", region)
 
             prices = {
                 "interface_hourly": 0.0,
@@ -206,8 +254,7 @@ class PricingFetcher:
                 "data_per_gb": 0.0,
             }
 
-            for price_item in interface_response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 terms = data.get("terms", {}).get("OnDemand", {})
                 for term in terms.values():
                     for dim in term.get("priceDimensions", {}).values():
@@ -238,18 +285,11 @@ class PricingFetcher:
             {"per_secret_monthly": float, "per_10k_api_calls": float}
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AWSSecretsManager",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                ],
-                MaxResults=10,
-            )
+            price_list = self.query("secretsmanager", region)
 
             prices = {"per_secret_monthly": 0.0, "per_10k_api_calls": 0.0}
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -281,18 +321,11 @@ class PricingFetcher:
             {"customer_key_monthly": float, "per_10k_requests": float}
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="awskms",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                ],
-                MaxResults=20,
-            )
+            price_list = self.query("kms", region)
 
             prices = {"customer_key_monthly": 0.0, "per_10k_requests": 0.0}
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -325,18 +358,11 @@ class PricingFetcher:
             {"storage_per_gb_monthly": float}
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonECR",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                ],
-                MaxResults=10,
-            )
+            price_list = self.query("ecr", region)
 
             prices = {"storage_per_gb_monthly": 0.0}
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -362,11 +388,7 @@ class PricingFetcher:
             {"hosted_zone_monthly": float, "additional_zone_monthly": float, "query_per_million": float}
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonRoute53",
-                Filters=[],
-                MaxResults=20,
-            )
+            price_list = self.query("route53")
 
             prices = {
                 "hosted_zone_monthly": 0.0,
@@ -374,8 +396,7 @@ class PricingFetcher:
                 "query_per_million": 0.0,
             }
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -412,23 +433,11 @@ class PricingFetcher:
             {"storage_per_gb_monthly": float}
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonEC2",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                    {
-                        "Type": "TERM_MATCH",
-                        "Field": "productFamily",
-                        "Value": "Storage Snapshot",
-                    },
-                ],
-                MaxResults=10,
-            )
+            price_list = self.query("snapshot", region)
 
             prices = {"storage_per_gb_monthly": 0.0}
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 terms = data.get("terms", {}).get("OnDemand", {})
 
                 for term in terms.values():
@@ -455,23 +464,11 @@ class PricingFetcher:
             {"unused_hourly": float, "additional_hourly": float}
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonEC2",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                    {
-                        "Type": "TERM_MATCH",
-                        "Field": "productFamily",
-                        "Value": "IP Address",
-                    },
-                ],
-                MaxResults=10,
-            )
+            price_list = self.query("eip", region)
 
             prices = {"unused_hourly": 0.0, "additional_hourly": 0.0}
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -511,16 +508,9 @@ class PricingFetcher:
             }
 
             # ELBv2 (ALB, NLB, GLB)
-            response = self.pricing_client.get_products(
-                ServiceCode="AWSELB",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                ],
-                MaxResults=50,
-            )
-
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            price_list = self.query("elb", region)
+
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -560,23 +550,11 @@ class PricingFetcher:
             {"rds_per_gb_monthly": float, "aurora_per_gb_monthly": float}
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonRDS",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                    {
-                        "Type": "TERM_MATCH",
-                        "Field": "productFamily",
-                        "Value": "Storage Snapshot",
-                    },
-                ],
-                MaxResults=20,
-            )
+            price_list = self.query("rds_snapshot", region)
 
             prices = {"rds_per_gb_monthly": 0.0, "aurora_per_gb_monthly": 0.0}
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -608,18 +586,11 @@ class PricingFetcher:
             {"storage_per_gb_monthly": float, "ingestion_per_gb": float}
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonCloudWatch",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                ],
-                MaxResults=30,
-            )
+            price_list = self.query("cloudwatch", region)
 
             prices = {"storage_per_gb_monthly": 0.0, "ingestion_per_gb": 0.0}
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -656,13 +627,7 @@ class PricingFetcher:
             }
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AWSLambda",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                ],
-                MaxResults=50,
-            )
+            price_list = self.query("lambda", region)
 
             prices = {
                 "request_per_million": 0.0,
@@ -670,8 +635,7 @@ class PricingFetcher:
                 "provisioned_concurrency_per_gb_hour": 0.0,
             }
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -707,22 +671,10 @@ class PricingFetcher:
             {instance_type: hourly_price} 딕셔너리
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonSageMaker",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                    {
-                        "Type": "TERM_MATCH",
-                        "Field": "productFamily",
-                        "Value": "ML Instance",
-                    },
-                ],
-                MaxResults=100,
-            )
+            price_list = self.query("sagemaker", region)
 
             prices = {}
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -760,13 +712,7 @@ class PricingFetcher:
             }
         """
         try:
-            response = self.pricing_client.get_products(
-                ServiceCode="AmazonDynamoDB",
-                Filters=[
-                    {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                ],
-                MaxResults=100,
-            )
+            price_list = self.query("dynamodb", region)
 
             prices = {
                 "rcu_per_hour": 0.0,
@@ -776,8 +722,7 @@ class PricingFetcher:
                 "storage_per_gb": 0.0,
             }
 
-            for price_item in response.get("PriceList", []):
-                data = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for data in price_list:
                 attrs = data.get("product", {}).get("attributes", {})
                 terms = data.get("terms", {}).get("OnDemand", {})
 
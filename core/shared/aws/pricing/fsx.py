@@ -2,7 +2,7 @@
 core/shared/aws/pricing/fsx.py - Amazon FSx 파일시스템 가격 조회
 
 FSx 파일시스템 타입별 GB당 월간 스토리지 비용을 조회한다.
-Pricing API 직접 호출 후, 실패 시 하드코딩 가격으로 fallback한다.
+로컬 가격 DB(``aa pricing sync``) 또는 Pricing API로 조회하고, 실패 시 하드코딩 가격으로 fallback한다.
 
 지원 파일시스템 타입 및 가격 (ap-northeast-2 기준):
     - Windows File Server: SSD $0.013, HDD $0.006 /GB/월
@@ -22,22 +22,19 @@ Pricing API 직접 호출 후, 실패 시 하드코딩 가격으로 fallback한
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
 from botocore.exceptions import BotoCoreError, ClientError
 
-from core.parallel import get_client
+from .fetcher import PricingFetcher
+from .price_db import PriceDatabase
 
 if TYPE_CHECKING:
     import boto3
 
 logger = logging.getLogger(__name__)
 
-# Pricing API 리전
-PRICING_API_REGION = "us-east-1"
-
 # FSx 타입별 리전별 가격 (USD per GB-month) - 2025년 기준 폴백
 # https://aws.amazon.com/fsx/pricing/
 FSX_PRICES: dict[str, dict[str, dict[str, float]]] = {
@@ -89,7 +86,7 @@ DEFAULT_PRICES = {
 
 
 def get_fsx_prices_from_api(session: boto3.Session, region: str, fsx_type: str) -> dict[str, float]:
-    """Pricing API를 통해 FSx 가격 조회
+    """로컬 가격 DB 또는 Pricing API를 통해 FSx 가격 조회
 
     Args:
         session: boto3 세션
@@ -100,31 +97,11 @@ def get_fsx_prices_from_api(session: boto3.Session, region: str, fsx_type: str)
         {"ssd": float, "hdd": float, ...}
     """
     try:
-        pricing = get_client(session, "pricing", region_name=PRICING_API_REGION)
-
-        # 서비스 코드 매핑
-        service_codes = {
-            "WINDOWS": "AmazonFSx",
-            "LUSTRE": "AmazonFSx",
-            "ONTAP": "AmazonFSx",
-            "OPENZFS": "AmazonFSx",
-        }
-
-        service_code = service_codes.get(fsx_type.upper(), "AmazonFSx")
-
-        response = pricing.get_products(
-            ServiceCode=service_code,
-            Filters=[
-                {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                {"Type": "TERM_MATCH", "Field": "productFamily", "Value": "Storage"},
-            ],
-            MaxResults=50,
-        )
+        price_list = PricingFetcher(session, price_db=PriceDatabase()).query("fsx", region)
 
         prices: dict[str, float] = {}
 
-        for price_item in response.get("PriceList", []):
-            data = json.loads(price_item) if isinstance(price_item, str) else price_item
+        for data in price_list:
             attrs = data.get("product", {}).get("attributes", {})
             terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -2,7 +2,7 @@
 core/shared/aws/pricing/kinesis.py - Amazon Kinesis Data Streams 가격 조회
 
 Kinesis Data Streams의 Provisioned/On-Demand 모드별 비용을 조회한다.
-Pricing API 직접 호출 후, 실패 시 하드코딩 가격으로 fallback한다.
+로컬 가격 DB(``aa pricing sync``) 또는 Pricing API로 조회하고, 실패 시 하드코딩 가격으로 fallback한다.
 
 비용 구조 (ap-northeast-2 기준):
     - Provisioned: Shard-hour $0.015
@@ -21,13 +21,13 @@ Pricing API 직접 호출 후, 실패 시 하드코딩 가격으로 fallback한
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
 from botocore.exceptions import BotoCoreError, ClientError
 
-from core.parallel import get_client
+from .fetcher import PricingFetcher
+from .price_db import PriceDatabase
 
 if TYPE_CHECKING:
     import boto3
@@ -36,8 +36,6 @@ logger = logging.getLogger(__name__)
 
 from .constants import HOURS_PER_MONTH
 
-PRICING_API_REGION = "us-east-1"
-
 # Kinesis Data Streams 리전별 가격 (USD) - 2025년 기준
 # https://aws.amazon.com/kinesis/data-streams/pricing/
 KINESIS_PRICES: dict[str, dict[str, float]] = {
@@ -78,7 +76,7 @@ DEFAULT_PRICES = {
 
 
 def get_kinesis_prices_from_api(session: boto3.Session, region: str) -> dict[str, float]:
-    """AWS Pricing API를 통해 Kinesis Data Streams 가격을 조회한다.
+    """로컬 가격 DB 또는 Pricing API를 통해 Kinesis Data Streams 가격을 조회한다.
 
     Args:
         session: boto3 세션
@@ -89,19 +87,11 @@ def get_kinesis_prices_from_api(session: boto3.Session, region: str) -> dict[str
         조회 실패 시 빈 딕셔너리.
     """
     try:
-        pricing = get_client(session, "pricing", region_name=PRICING_API_REGION)
-        response = pricing.get_products(
-            ServiceCode="AmazonKinesis",
-            Filters=[
-                {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-            ],
-            MaxResults=50,
-        )
+        price_list = PricingFetcher(session, price_db=PriceDatabase()).query("kinesis", region)
 
         prices: dict[str, float] = {}
 
-        for price_item in response.get("PriceList", []):
-            data = json.loads(price_item) if isinstance(price_item, str) else price_item
+        for data in price_list:
             attrs = data.get("product", {}).get("attributes", {})
             terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -2,7 +2,7 @@
 core/shared/aws/pricing/opensearch.py - Amazon OpenSearch Service 가격 조회
 
 OpenSearch Service 인스턴스 타입별/EBS 스토리지 비용을 조회한다.
-Pricing API 직접 호출 후, 실패 시 하드코딩 가격으로 fallback한다.
+로컬 가격 DB(``aa pricing sync``) 또는 Pricing API로 조회하고, 실패 시 하드코딩 가격으로 fallback한다.
 
 비용 구조:
     - 인스턴스: 타입별 시간당 비용 (예: r6g.large.search $0.167/h)
@@ -23,13 +23,13 @@ Pricing API 직접 호출 후, 실패 시 하드코딩 가격으로 fallback한
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
 from botocore.exceptions import BotoCoreError, ClientError
 
-from core.parallel import get_client
+from .fetcher import PricingFetcher
+from .price_db import PriceDatabase
 
 if TYPE_CHECKING:
     import boto3
@@ -38,8 +38,6 @@ logger = logging.getLogger(__name__)
 
 from .constants import HOURS_PER_MONTH
 
-PRICING_API_REGION = "us-east-1"
-
 # OpenSearch 인스턴스 타입별 시간당 가격 (USD) - 2025년 기준
 # https://aws.amazon.com/opensearch-service/pricing/
 OPENSEARCH_INSTANCE_PRICES: dict[str, dict[str, float]] = {
@@ -82,7 +80,7 @@ DEFAULT_STORAGE_PRICE = 0.115
 
 
 def get_opensearch_prices_from_api(session: boto3.Session, region: str) -> dict[str, float]:
-    """AWS Pricing API를 통해 OpenSearch 인스턴스/스토리지 가격을 조회한다.
+    """로컬 가격 DB 또는 Pricing API를 통해 OpenSearch 인스턴스/스토리지 가격을 조회한다.
 
     서비스 코드는 ``AmazonES`` (레거시 Elasticsearch)를 사용한다.
     ``.search`` 접미사가 없는 인스턴스 타입에는 자동으로 추가한다.
@@ -96,19 +94,11 @@ def get_opensearch_prices_from_api(session: boto3.Session, region: str) -> dict[
         조회 실패 시 빈 딕셔너리.
     """
     try:
-        pricing = get_client(session, "pricing", region_name=PRICING_API_REGION)
-        response = pricing.get_products(
-            ServiceCode="AmazonES",  # OpenSearch는 여전히 ES 서비스 코드 사용
-            Filters=[
-                {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-            ],
-            MaxResults=100,
-        )
+        price_list = PricingFetcher(session, price_db=PriceDatabase()).query("opensearch", region)
 
         prices: dict[str, float] = {}
 
-        for price_item in response.get("PriceList", []):
-            data = json.loads(price_item) if isinstance(price_item, str) else price_item
+        for data in price_list:
             attrs = data.get("product", {}).get("attributes", {})
             terms = data.get("terms", {}).get("OnDemand", {})
 
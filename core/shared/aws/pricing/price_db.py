@@ -0,0 +1,710 @@
+"""
+core/shared/aws/pricing/price_db.py - AWS Bulk Price List 로컬 가격 DB
+
+AWS Bulk Price List offer 파일(``index.json``)을 SQLite DB로 적재하여,
+Pricing API 없이 (서비스, 리전, SKU 속성) 조건으로 가격 항목을 조회한다.
+``PricingFetcher`` 는 DB에 해당 서비스/리전이 있으면 API 대신 DB를 사용하므로,
+새 리전의 첫 실행에서 ``get_products`` 를 반복 호출하지 않고 인터넷이 차단된
+환경에서도 가격을 계산할 수 있다.
+
+적재 범위:
+    ``fetcher.PRICE_QUERIES`` 조건 중 하나라도 만족하는 SKU의 OnDemand 가격만 저장한다
+    (Reserved 조건과 조회하지 않는 SKU는 버려 DB를 작게 유지).
+    offer 파일(수백 MB~GB)은 통째로 로드하지 않고 스트리밍 파싱하여 배치로 INSERT한다.
+
+DB 경로:
+    ``{project_root}/temp/pricing/price_list.sqlite3``
+
+스키마:
+    offers(offer_code, region, version, publication_date, sku_count, synced_at)
+    products(id, offer_code, region, sku, item)   -- item: get_products PriceList 항목과 같은 JSON
+    product_attributes(product_id, name, value)   -- SKU 속성 (value 소문자), (name, value) 인덱스
+
+사용법:
+    from core.shared.aws.pricing.price_db import sync_price_db
+
+    # 로컬 디렉토리의 offer 파일 적재 (air-gapped 환경)
+    sync_price_db(source="/data/offers")
+
+    # 리전별 offer 파일 다운로드 후 적재
+    sync_price_db(regions=["ap-northeast-2", "us-east-1"])
+
+    # CLI
+    aa pricing sync -r ap-northeast-2
+    aa pricing sync --source /data/offers
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack, closing
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TextIO
+
+from core.tools.cache.path import get_cache_dir
+
+from .fetcher import PRICE_QUERIES
+
+logger = logging.getLogger(__name__)
+
+# DB 파일명 (pricing 캐시 디렉토리 하위)
+PRICE_DB_FILENAME = "price_list.sqlite3"
+
+# 스키마 버전 (PRAGMA user_version)
+PRICE_DB_SCHEMA_VERSION = 1
+
+# Bulk Price List 엔드포인트
+OFFER_BASE_URL = "https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws"
+
+# 리전별 offer 파일이 없는 글로벌 서비스
+GLOBAL_OFFERS = frozenset({"AmazonRoute53"})
+
+# offer 파일 다운로드 타임아웃 (연결, 읽기 초)
+DOWNLOAD_TIMEOUT = (10, 300)
+
+# offer 파일 스트리밍 파싱 시 한 번에 읽는 문자 수
+STREAM_CHUNK_SIZE = 1 << 20
+
+# 리전별 INSERT 배치 크기 (SKU 수)
+INGEST_BATCH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS offers (
+    offer_code TEXT NOT NULL,
+    region TEXT NOT NULL,
+    version TEXT,
+    publication_date TEXT,
+    sku_count INTEGER NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (offer_code, region)
+);
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    offer_code TEXT NOT NULL,
+    region TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    item TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS products_offer_region ON products (offer_code, region);
+CREATE TABLE IF NOT EXISTS product_attributes (
+    product_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS product_attributes_lookup ON product_attributes (name, value, product_id);
+CREATE INDEX IF NOT EXISTS product_attributes_product ON product_attributes (product_id);
+"""
+
+
+def _get_price_db_path() -> Path:
+    """로컬 가격 DB 경로 반환"""
+    return Path(get_cache_dir("pricing")) / PRICE_DB_FILENAME
+
+
+def sync_scope(services: Iterable[str] | None = None) -> dict[str, list[dict[str, str]]]:
+    """동기화 대상 offer 코드별 SKU 속성 조건 (``PRICE_QUERIES`` 기반).
+
+    Args:
+        services: ``PRICE_QUERIES`` 서비스 키 목록 (``None`` 이면 전체)
+
+    Returns:
+        ``{offer_code: [{field: value}, ...]}`` (값은 소문자)
+
+    Raises:
+        ValueError: 알 수 없는 서비스 키
+    """
+    names = list(services) if services is not None else list(PRICE_QUERIES)
+    unknown = [name for name in names if name not in PRICE_QUERIES]
+    if unknown:
+        raise ValueError(f"알 수 없는 서비스: {', '.join(unknown)}")
+
+    scope: dict[str, list[dict[str, str]]] = {}
+    for name in names:
+        offer_code, attributes = PRICE_QUERIES[name]
+        scope.setdefault(offer_code, []).append({field: value.lower() for field, value in attributes.items()})
+    return scope
+
+
+def _product_fields(product: dict[str, Any]) -> dict[str, str]:
+    """SKU의 조회 가능 속성 (attributes + productFamily, 값은 소문자)."""
+    fields = {name: str(value).lower() for name, value in product.get("attributes", {}).items()}
+    family = product.get("productFamily")
+    if family:
+        fields["productFamily"] = str(family).lower()
+    return fields
+
+
+def _matches(fields: dict[str, str], conditions: dict[str, str]) -> bool:
+    return all(fields.get(name) == value for name, value in conditions.items())
+
+
+class _JSONStream:
+    """offer 파일용 점진 JSON 리더.
+
+    파일을 ``chunk_size`` 단위로 읽으며 객체 키를 하나씩 순회하고, 값은
+    ``json.JSONDecoder.raw_decode`` 로 필요한 것만 디코드한다. 호출자는
+    ``iter_object()`` 가 반환한 키마다 ``read_value()`` 또는 ``skip_value()``
+    (또는 중첩 ``iter_object()``)로 값을 정확히 한 번 소비해야 한다.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = STREAM_CHUNK_SIZE):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """다음 청크를 버퍼에 추가 (소비한 앞부분은 버림). EOF면 False"""
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (EOF면 ``""``)"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"JSON 구조 오류: {chars!r} 기대, {char or 'EOF'!r} 발견")
+        self._pos += 1
+        return char
+
+    def read_value(self) -> Any:
+        """다음 값 하나를 디코드한다 (값이 청크 경계에 걸치면 버퍼를 늘려 재시도)."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # 숫자/리터럴이 버퍼 끝에서 끝났으면 다음 청크에 이어질 수 있음
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """객체의 키를 순서대로 반환한다."""
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError(f"JSON 구조 오류: 객체 키가 문자열이 아님 ({key!r})")
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        """배열의 원소마다 한 번씩 반환한다."""
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            if self._expect(",]") == "]":
+                return
+
+    def skip_value(self) -> None:
+        """다음 값을 디코드하지 않고 건너뛴다 (객체/배열은 원소 단위로 소비)."""
+        char = self.peek()
+        if char == "{":
+            for _ in self.iter_object():
+                self.skip_value()
+        elif char == "[":
+            for _ in self.iter_array():
+                self.skip_value()
+        else:
+            self.read_value()
+
+
+@dataclass
+class OfferSyncResult:
+    """offer 파일 1개(서비스/리전) 적재 결과.
+
+    Attributes:
+        offer_code: offer 코드 (예: ``"AmazonEC2"``)
+        region: 리전 코드 (글로벌 offer는 ``""``)
+        sku_count: 저장된 SKU 수
+    """
+
+    offer_code: str
+    region: str
+    sku_count: int
+
+
+class _OfferWriter:
+    """offer 1개의 SKU 선별과 리전별 배치 적재.
+
+    ``add_product()`` 로 범위 안의 SKU를 고르고, ``add_terms()`` 로 OnDemand 가격이
+    들어오는 대로 리전별 배치 INSERT한다. 리전의 첫 배치에서 기존 데이터를 지우므로
+    가격이 하나도 없는 리전은 건드리지 않는다. 전체가 한 트랜잭션이며,
+    ``commit()`` 전에 ``close()`` 되면 롤백한다. DB 연결은 첫 INSERT 때 연다.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        offer_code: str,
+        conditions: list[dict[str, str]],
+        regions: Iterable[str] | None = None,
+    ):
+        self.offer_code = offer_code
+        self._connect = connect
+        self._conditions = conditions
+        self._global = offer_code in GLOBAL_OFFERS
+        # 글로벌 서비스는 리전 구분 없이 적재
+        self._region_filter = set(regions) if regions is not None and not self._global else None
+        self._conn: sqlite3.Connection | None = None
+        self._products: dict[str, tuple[str, dict[str, Any], dict[str, str]]] = {}
+        self._pending: dict[str, list[tuple[str, str, dict[str, str]]]] = {}
+        self._counts: dict[str, int] = {}
+
+    def add_product(self, sku: str, product: dict[str, Any]) -> None:
+        """범위 안의 SKU면 가격 적재 대상으로 기록한다."""
+        fields = _product_fields(product)
+        if not any(_matches(fields, condition) for condition in self._conditions):
+            return
+        attributes = product.get("attributes", {})
+        region = attributes.get("regionCode", "")
+        if region and self._region_filter is not None and region not in self._region_filter:
+            return
+        summary = {"sku": sku, "productFamily": product.get("productFamily", ""), "attributes": attributes}
+        # 글로벌 서비스는 regionCode와 무관하게 하나의 범위로 조회됨
+        self._products[sku] = ("" if self._global else region, summary, fields)
+
+    def add_terms(self, sku: str, terms: dict[str, Any]) -> None:
+        """대상 SKU의 OnDemand 가격을 배치에 추가한다 (배치가 차면 INSERT)."""
+        entry = self._products.pop(sku, None)
+        if entry is None or not terms:
+            return
+        region, summary, fields = entry
+        item = {"product": summary, "terms": {"OnDemand": terms}}
+        rows = self._pending.setdefault(region, [])
+        rows.append((sku, json.dumps(item, separators=(",", ":")), fields))
+        if len(rows) >= INGEST_BATCH_SIZE:
+            self._flush(region)
+
+    def _flush(self, region: str) -> None:
+        rows = self._pending.pop(region, [])
+        if not rows:
+            return
+        if self._conn is None:
+            self._conn = self._connect()
+        conn = self._conn
+        if region not in self._counts:
+            conn.execute(
+                "DELETE FROM product_attributes WHERE product_id IN "
+                "(SELECT id FROM products WHERE offer_code = ? AND region = ?)",
+                (self.offer_code, region),
+            )
+            conn.execute("DELETE FROM products WHERE offer_code = ? AND region = ?", (self.offer_code, region))
+            self._counts[region] = 0
+        for sku, item, fields in rows:
+            product_id = conn.execute(
+                "INSERT INTO products (offer_code, region, sku, item) VALUES (?, ?, ?, ?)",
+                (self.offer_code, region, sku, item),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO product_attributes VALUES (?, ?, ?)",
+                [(product_id, name, value) for name, value in fields.items()],
+            )
+        self._counts[region] += len(rows)
+
+    def commit(self, version: str | None, publication_date: str | None) -> list[OfferSyncResult]:
+        """남은 배치를 INSERT하고 리전별 offer 메타를 기록한 뒤 커밋한다.
+
+        Returns:
+            리전별 적재 결과 (리전 순)
+        """
+        for region in list(self._pending):
+            self._flush(region)
+        if self._conn is None:
+            return []
+
+        synced_at = datetime.now().isoformat()
+        results: list[OfferSyncResult] = []
+        for region, count in sorted(self._counts.items()):
+            self._conn.execute(
+                "INSERT OR REPLACE INTO offers VALUES (?, ?, ?, ?, ?, ?)",
+                (self.offer_code, region, version, publication_date, count, synced_at),
+            )
+            results.append(OfferSyncResult(self.offer_code, region, count))
+        self._conn.commit()
+        return results
+
+    def close(self) -> None:
+        """커밋하지 않은 적재를 롤백하고 연결을 닫는다."""
+        if self._conn is not None:
+            self._conn.rollback()
+            self._conn.close()
+            self._conn = None
+
+
+class PriceDatabase:
+    """Bulk Price List 기반 로컬 가격 DB (SQLite).
+
+    조회는 호출마다 읽기 전용 연결을 열어 thread-safe하게 동작하며,
+    DB 파일이 없거나 스키마가 다르면 ``query()`` 가 ``None`` 을 반환하여
+    호출자가 Pricing API로 fallback하게 한다.
+
+    Attributes:
+        path: DB 파일 경로
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        Args:
+            path: DB 파일 경로 (None이면 pricing 캐시 디렉토리의 기본 경로)
+        """
+        self.path = Path(path) if path is not None else _get_price_db_path()
+
+    def exists(self) -> bool:
+        """DB 파일 존재 여부"""
+        return self.path.is_file()
+
+    def _connect_readonly(self) -> sqlite3.Connection | None:
+        if not self.exists():
+            return None
+        conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != PRICE_DB_SCHEMA_VERSION:
+            conn.close()
+            return None
+        return conn
+
+    def _connect_writable(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, PRICE_DB_SCHEMA_VERSION):
+            # 이전 스키마는 재적재 대상이므로 비움
+            conn.executescript(
+                "DROP TABLE IF EXISTS offers; DROP TABLE IF EXISTS products; DROP TABLE IF EXISTS product_attributes;"
+            )
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {PRICE_DB_SCHEMA_VERSION}")
+        return conn
+
+    # =========================================================================
+    # Query
+    # =========================================================================
+
+    def query(self, service_code: str, filters: list[dict[str, str]]) -> list[dict[str, Any]] | None:
+        """``get_products`` 와 같은 조건으로 가격 항목을 조회한다.
+
+        Args:
+            service_code: Pricing 서비스 코드 (예: ``"AmazonEC2"``)
+            filters: ``get_products`` ``Filters`` (TERM_MATCH만 지원)
+
+        Returns:
+            ``PriceList`` 항목 형식의 딕셔너리 목록.
+            해당 서비스/리전이 동기화되지 않았거나 DB를 읽을 수 없으면 ``None``
+        """
+        conditions: dict[str, str] = {}
+        for condition in filters:
+            if condition.get("Type", "TERM_MATCH") != "TERM_MATCH":
+                return None
+            conditions[condition["Field"]] = str(condition["Value"]).lower()
+        region = conditions.pop("regionCode", None)
+
+        try:
+            conn = self._connect_readonly()
+            if conn is None:
+                return None
+            with closing(conn):
+                if region is None:
+                    synced = conn.execute("SELECT 1 FROM offers WHERE offer_code = ? LIMIT 1", (service_code,))
+                else:
+                    synced = conn.execute(
+                        "SELECT 1 FROM offers WHERE offer_code = ? AND region = ?", (service_code, region)
+                    )
+                if synced.fetchone() is None:
+                    return None
+
+                sql = "SELECT item FROM products WHERE offer_code = ?"
+                params: list[str] = [service_code]
+                if region is not None:
+                    sql += " AND region = ?"
+                    params.append(region)
+                for name, value in conditions.items():
+                    sql += " AND id IN (SELECT product_id FROM product_attributes WHERE name = ? AND value = ?)"
+                    params.extend((name, value))
+                rows = conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"로컬 가격 DB 조회 오류: {e}")
+            return None
+
+        return [json.loads(item) for (item,) in rows]
+
+    def offers(self) -> list[dict[str, Any]]:
+        """동기화된 offer 목록 (offer 코드, 리전 순).
+
+        Returns:
+            ``[{"offer_code", "region", "version", "publication_date", "sku_count", "synced_at"}, ...]``
+        """
+        try:
+            conn = self._connect_readonly()
+            if conn is None:
+                return []
+            with closing(conn):
+                conn.row_factory = sqlite3.Row
+                rows = conn.execute("SELECT * FROM offers ORDER BY offer_code, region").fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"로컬 가격 DB 조회 오류: {e}")
+            return []
+        return [dict(row) for row in rows]
+
+    # =========================================================================
+    # Ingest
+    # =========================================================================
+
+    def ingest_offer(
+        self,
+        offer: dict[str, Any],
+        scope: dict[str, list[dict[str, str]]] | None = None,
+        regions: Iterable[str] | None = None,
+    ) -> list[OfferSyncResult]:
+        """파싱된 offer 파일을 적재한다 (같은 offer/리전의 기존 데이터는 교체).
+
+        Args:
+            offer: Bulk Price List offer 파일 내용
+            scope: ``sync_scope()`` 결과 (None이면 전체 서비스)
+            regions: 적재할 리전 (None이면 파일의 모든 리전, 글로벌 SKU는 항상 적재)
+
+        Returns:
+            리전별 적재 결과 (offer가 범위 밖이면 빈 목록)
+        """
+        scope = scope if scope is not None else sync_scope()
+        offer_code = offer.get("offerCode", "")
+        conditions = scope.get(offer_code)
+        if not conditions:
+            logger.debug(f"동기화 범위 밖 offer 건너뜀: {offer_code}")
+            return []
+
+        with closing(_OfferWriter(self._connect_writable, offer_code, conditions, regions)) as writer:
+            for sku, product in offer.get("products", {}).items():
+                writer.add_product(sku, product)
+            for sku, terms in offer.get("terms", {}).get("OnDemand", {}).items():
+                writer.add_terms(sku, terms)
+            return writer.commit(offer.get("version"), offer.get("publicationDate"))
+
+    def ingest_file(
+        self,
+        path: str | Path,
+        scope: dict[str, list[dict[str, str]]] | None = None,
+        regions: Iterable[str] | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> list[OfferSyncResult]:
+        """offer 파일(JSON)을 스트리밍 파싱하여 적재한다.
+
+        파일 전체를 메모리에 올리지 않고 ``products`` 에서 범위 안의 SKU만 고른 뒤,
+        ``terms.OnDemand`` 를 읽는 대로 배치 INSERT한다 (Reserved 등 다른 term은 건너뜀).
+        파일이 잘렸거나 JSON이 아니면 적재 전체를 롤백한다.
+
+        Args:
+            path: offer 파일 경로
+            scope: ``sync_scope()`` 결과 (None이면 전체 서비스)
+            regions: 적재할 리전 (None이면 파일의 모든 리전)
+            chunk_size: 한 번에 읽는 문자 수
+
+        Returns:
+            리전별 적재 결과 (offer 파일이 아니거나 범위 밖이면 빈 목록)
+        """
+        scope = scope if scope is not None else sync_scope()
+        try:
+            with open(path, encoding="utf-8") as f:
+                return self._ingest_stream(_JSONStream(f, chunk_size), path, scope, regions)
+        except (OSError, ValueError) as e:
+            logger.warning(f"offer 파일 읽기 실패 [{path}]: {e}")
+            return []
+
+    def _ingest_stream(
+        self,
+        stream: _JSONStream,
+        path: str | Path,
+        scope: dict[str, list[dict[str, str]]],
+        regions: Iterable[str] | None,
+    ) -> list[OfferSyncResult]:
+        if stream.peek() != "{":
+            logger.debug(f"offer 파일 아님: {path}")
+            return []
+
+        meta: dict[str, Any] = {}
+        writer: _OfferWriter | None = None
+        has_products = False
+        # 키 순서가 표준(offerCode → products → terms)과 다른 파일은 해당 부분만 메모리에 읽음
+        buffered_products: dict[str, Any] = {}
+        buffered_on_demand: dict[str, Any] = {}
+
+        with ExitStack() as stack:
+            for key in stream.iter_object():
+                if key in ("offerCode", "version", "publicationDate"):
+                    meta[key] = stream.read_value()
+                    if key != "offerCode":
+                        continue
+                    conditions = scope.get(meta[key])
+                    if not conditions:
+                        logger.debug(f"동기화 범위 밖 offer 건너뜀: {meta[key]}")
+                        return []
+                    writer = stack.enter_context(
+                        closing(_OfferWriter(self._connect_writable, meta[key], conditions, regions))
+                    )
+                elif key == "products":
+                    has_products = True
+                    if writer is None:
+                        buffered_products = stream.read_value()
+                        continue
+                    for sku in stream.iter_object():
+                        writer.add_product(sku, stream.read_value())
+                elif key == "terms":
+                    for term_type in stream.iter_object():
+                        if term_type != "OnDemand":
+                            stream.skip_value()
+                        elif writer is None or not has_products:
+                            buffered_on_demand = stream.read_value()
+                        else:
+                            for sku in stream.iter_object():
+                                writer.add_terms(sku, stream.read_value())
+                else:
+                    stream.skip_value()
+            if stream.peek():
+                raise ValueError("JSON 구조 오류: 최상위 객체 뒤에 데이터가 있음")
+
+            if writer is None or not has_products:
+                logger.debug(f"offer 파일 아님: {path}")
+                return []
+            for sku, product in buffered_products.items():
+                writer.add_product(sku, product)
+            for sku, terms in buffered_on_demand.items():
+                writer.add_terms(sku, terms)
+            return writer.commit(meta.get("version"), meta.get("publicationDate"))
+
+
+# =============================================================================
+# Download / Sync
+# =============================================================================
+
+
+def offer_url(offer_code: str, region: str | None = None) -> str:
+    """offer 파일 URL (글로벌 offer 또는 ``region`` 이 None이면 전체 리전 파일)."""
+    if region is None or offer_code in GLOBAL_OFFERS:
+        return f"{OFFER_BASE_URL}/{offer_code}/current/index.json"
+    return f"{OFFER_BASE_URL}/{offer_code}/current/{region}/index.json"
+
+
+def download_offer_file(offer_code: str, region: str | None, dest_dir: str | Path) -> Path | None:
+    """offer 파일을 ``dest_dir`` 에 스트리밍 다운로드한다.
+
+    Args:
+        offer_code: offer 코드 (예: ``"AmazonEC2"``)
+        region: 리전 코드 (글로벌 offer는 무시)
+        dest_dir: 저장 디렉토리
+
+    Returns:
+        저장된 파일 경로 (다운로드 실패 시 ``None``)
+    """
+    import requests
+
+    url = offer_url(offer_code, region)
+    dest = Path(dest_dir) / f"{offer_code}_{region or 'global'}.json"
+    try:
+        with requests.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            with open(dest, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+    except (requests.RequestException, OSError) as e:
+        logger.warning(f"offer 파일 다운로드 실패 [{url}]: {e}")
+        if dest.exists():
+            dest.unlink()
+        return None
+    return dest
+
+
+def sync_price_db(
+    source: str | Path | None = None,
+    regions: Iterable[str] | None = None,
+    services: Iterable[str] | None = None,
+    db: PriceDatabase | None = None,
+    progress: Callable[[str], None] | None = None,
+) -> list[OfferSyncResult]:
+    """offer 파일을 로컬 가격 DB에 적재한다.
+
+    ``source`` 가 있으면 그 디렉토리(하위 포함)의 ``*.json`` offer 파일을, 없으면
+    ``regions`` 의 리전별 offer 파일을 다운로드하여 적재한다. 적재한 서비스의
+    가격 파일 캐시(PriceCache)는 삭제하여 다음 조회부터 DB 값을 사용하게 한다.
+
+    Args:
+        source: offer 파일 디렉토리 (None이면 다운로드)
+        regions: 대상 리전 (다운로드 시 필수, 로컬 적재 시 None이면 전체)
+        services: ``PRICE_QUERIES`` 서비스 키 (None이면 전체)
+        db: 대상 DB (None이면 기본 경로)
+        progress: 파일/리전 단위 진행 메시지 콜백
+
+    Returns:
+        리전별 적재 결과
+
+    Raises:
+        ValueError: ``source`` 와 ``regions`` 가 모두 없거나 알 수 없는 서비스
+    """
+    from .cache import clear_cache
+
+    service_names = list(services) if services is not None else list(PRICE_QUERIES)
+    scope = sync_scope(service_names)
+    region_list = list(dict.fromkeys(regions)) if regions is not None else None
+    db = db or PriceDatabase()
+    notify = progress or (lambda message: None)
+
+    results: list[OfferSyncResult] = []
+    if source is not None:
+        for path in sorted(Path(source).rglob("*.json")):
+            notify(str(path))
+            results.extend(db.ingest_file(path, scope, region_list))
+    else:
+        if not region_list:
+            raise ValueError("다운로드할 리전이 필요합니다 (regions 또는 source 지정)")
+        with tempfile.TemporaryDirectory(prefix="aa-pricing-") as tmp_dir:
+            for offer_code in scope:
+                targets: list[str | None] = [None] if offer_code in GLOBAL_OFFERS else list(region_list)
+                for region in targets:
+                    notify(f"{offer_code}/{region or 'global'}")
+                    downloaded = download_offer_file(offer_code, region, tmp_dir)
+                    if downloaded is None:
+                        continue
+                    results.extend(db.ingest_file(downloaded, scope, region_list))
+                    os.unlink(downloaded)
+
+    synced_offers = {result.offer_code for result in results}
+    for name in service_names:
+        if PRICE_QUERIES[name][0] in synced_offers:
+            clear_cache(service=name)
+
+    return results
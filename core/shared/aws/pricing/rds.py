@@ -2,7 +2,7 @@
 core/shared/aws/pricing/rds.py - Amazon RDS 인스턴스 가격 조회
 
 RDS 인스턴스 클래스별/엔진별 시간당 비용과 스토리지 비용을 조회한다.
-Pricing API 직접 호출 후, 실패 시 하드코딩 가격(MySQL 기준)으로 fallback한다.
+로컬 가격 DB(``aa pricing sync``) 또는 Pricing API로 조회하고, 실패 시 하드코딩 가격(MySQL 기준)으로 fallback한다.
 
 비용 구조:
     - 인스턴스: 클래스/엔진별 시간당 비용
@@ -24,13 +24,13 @@ Pricing API 직접 호출 후, 실패 시 하드코딩 가격(MySQL 기준)으
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
 from botocore.exceptions import BotoCoreError, ClientError
 
-from core.parallel import get_client
+from .fetcher import PricingFetcher
+from .price_db import PriceDatabase
 
 if TYPE_CHECKING:
     import boto3
@@ -39,8 +39,6 @@ logger = logging.getLogger(__name__)
 
 from .constants import HOURS_PER_MONTH
 
-PRICING_API_REGION = "us-east-1"
-
 # RDS 인스턴스 클래스별 시간당 가격 (USD, MySQL 기준) - 2025년 기준
 # https://aws.amazon.com/rds/pricing/
 RDS_INSTANCE_PRICES: dict[str, dict[str, float]] = {
@@ -85,7 +83,7 @@ DEFAULT_STORAGE_PRICES = {"gp2": 0.115, "gp3": 0.095, "io1": 0.125, "magnetic":
 
 
 def get_rds_prices_from_api(session: boto3.Session, region: str, engine: str = "mysql") -> dict[str, float]:
-    """AWS Pricing API를 통해 RDS 인스턴스 클래스별 가격을 조회한다.
+    """로컬 가격 DB 또는 Pricing API를 통해 RDS 인스턴스 클래스별 가격을 조회한다.
 
     엔진 이름을 Pricing API 필터값으로 변환한다 (postgres -> PostgreSQL 등).
     ``db.`` 접두사가 없는 인스턴스 타입에는 자동으로 추가한다.
@@ -99,8 +97,6 @@ def get_rds_prices_from_api(session: boto3.Session, region: str, engine: str = "
         ``{instance_class: hourly_price}`` 딕셔너리. 조회 실패 시 빈 딕셔너리.
     """
     try:
-        pricing = get_client(session, "pricing", region_name=PRICING_API_REGION)
-
         # 엔진별 필터
         engine_filter = engine.lower()
         if "postgres" in engine_filter:
@@ -114,20 +110,13 @@ def get_rds_prices_from_api(session: boto3.Session, region: str, engine: str = "
         else:
             engine_filter = "MySQL"  # 기본값
 
-        response = pricing.get_products(
-            ServiceCode="AmazonRDS",
-            Filters=[
-                {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-                {"Type": "TERM_MATCH", "Field": "databaseEngine", "Value": engine_filter},
-                {"Type": "TERM_MATCH", "Field": "deploymentOption", "Value": "Single-AZ"},
-            ],
-            MaxResults=100,
+        price_list = PricingFetcher(session, price_db=PriceDatabase()).query(
+            "rds", region, attributes={"databaseEngine": engine_filter}
         )
 
         prices: dict[str, float] = {}
 
-        for price_item in response.get("PriceList", []):
-            data = json.loads(price_item) if isinstance(price_item, str) else price_item
+        for data in price_list:
             attrs = data.get("product", {}).get("attributes", {})
             terms = data.get("terms", {}).get("OnDemand", {})
 
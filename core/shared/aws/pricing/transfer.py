@@ -2,7 +2,7 @@
 core/shared/aws/pricing/transfer.py - AWS Transfer Family 가격 조회
 
 Transfer Family 프로토콜 엔드포인트의 시간당/월간 비용을 조회한다.
-Pricing API 직접 호출 후, 실패 시 하드코딩 가격으로 fallback한다.
+로컬 가격 DB(``aa pricing sync``) 또는 Pricing API로 조회하고, 실패 시 하드코딩 가격으로 fallback한다.
 
 비용 구조:
     - 프로토콜 엔드포인트: $0.30/hour (SFTP, FTPS, FTP, AS2 동일)
@@ -22,22 +22,19 @@ Pricing API 직접 호출 후, 실패 시 하드코딩 가격으로 fallback한
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
 from botocore.exceptions import BotoCoreError, ClientError
 
-from core.parallel import get_client
+from .fetcher import PricingFetcher
+from .price_db import PriceDatabase
 
 if TYPE_CHECKING:
     import boto3
 
 logger = logging.getLogger(__name__)
 
-# Pricing API 리전
-PRICING_API_REGION = "us-east-1"
-
 # Transfer Family 리전별 가격 (USD) - 2025년 기준 폴백
 # https://aws.amazon.com/aws-transfer-family/pricing/
 TRANSFER_PRICES: dict[str, dict[str, float]] = {
@@ -84,19 +81,11 @@ def get_transfer_prices_from_api(session: boto3.Session, region: str) -> dict[st
         {"hourly": float}
     """
     try:
-        pricing = get_client(session, "pricing", region_name=PRICING_API_REGION)
-        response = pricing.get_products(
-            ServiceCode="AWSTransfer",
-            Filters=[
-                {"Type": "TERM_MATCH", "Field": "regionCode", "Value": region},
-            ],
-            MaxResults=20,
-        )
+        price_list = PricingFetcher(session, price_db=PriceDatabase()).query("transfer", region)
 
         prices = {"hourly": 0.0}
 
-        for price_item in response.get("PriceList", []):
-            data = json.loads(price_item) if isinstance(price_item, str) else price_item
+        for data in price_list:
             attrs = data.get("product", {}).get("attributes", {})
             terms = data.get("terms", {}).get("OnDemand", {})
 
@@ -9,6 +9,8 @@ core/shared/aws/pricing/utils.py - 가격 조회 통합 서비스 (PricingServic
     - Exponential backoff: Throttling 시 1/2/4초 간격으로 최대 3회 재시도
     - Metrics: 캐시 히트율, API 호출 수, 에러 수, 재시도 수 추적
     - Lazy init: PricingFetcher(boto3 클라이언트)를 첫 호출 시 생성
+    - Prefetch: 멀티 리전 수집 동안 서비스 × 리전 가격을 백그라운드 스레드 풀로 미리 조회
+    - Local DB: ``aa pricing sync`` 로 적재한 Bulk Price List DB가 있으면 API 대신 사용
 
 사용법:
     from core.shared.aws.pricing.utils import pricing_service
@@ -19,6 +21,10 @@ core/shared/aws/pricing/utils.py - 가격 조회 통합 서비스 (PricingServic
     # 캐시 무효화 후 재조회
     pricing_service.invalidate("ec2", "ap-northeast-2")
 
+    # 수집(fan-out) 동안 여러 서비스/리전 가격을 백그라운드로 미리 조회
+    with pricing_service.prefetch(["ec2", "ebs"], ["ap-northeast-2", "us-east-1"]):
+        parallel_collect(...)
+
     # 메트릭 조회
     metrics = pricing_service.get_metrics()
 """
@@ -28,7 +34,9 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -37,12 +45,16 @@ from botocore.exceptions import BotoCoreError, ClientError
 from .cache import PriceCache
 from .constants import DEFAULT_PRICES
 from .fetcher import PricingFetcher
+from .price_db import PriceDatabase
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# prefetch() 기본 동시 조회 수 (Pricing API는 초당 호출 한도가 낮음)
+PREFETCH_MAX_WORKERS = 4
+
 
 @dataclass
 class PricingMetrics:
@@ -183,11 +195,15 @@ class PricingService:
     def fetcher(self) -> PricingFetcher:
         """PricingFetcher를 지연 생성(lazy init)하여 반환한다.
 
+        로컬 가격 DB(``aa pricing sync``)가 있으면 fetcher가 API보다 먼저 조회한다.
+
         Returns:
             PricingFetcher 인스턴스
         """
         if self._fetcher is None:
-            self._fetcher = PricingFetcher()
+            with self._registry_mutex:
+                if self._fetcher is None:
+                    self._fetcher = PricingFetcher(price_db=PriceDatabase())
         return self._fetcher
 
     def _get_lock(self, key: str) -> threading.Lock:
@@ -362,6 +378,45 @@ class PricingService:
         self._cache.invalidate(service, region)
         return self.get_prices(service, region, refresh=True)
 
+    @contextmanager
+    def prefetch(
+        self,
+        services: Iterable[str],
+        regions: Iterable[str],
+        max_workers: int = PREFETCH_MAX_WORKERS,
+    ) -> Iterator[None]:
+        """블록 실행 동안 서비스 × 리전 가격을 백그라운드에서 미리 조회한다.
+
+        멀티 리전 수집(fan-out)을 감싸면 수집기가 리소스 목록을 조회하는 동안 가격 캐시가
+        채워진다. 조회는 ``get_prices()`` 를 그대로 사용하므로 캐시된 항목은 API를 호출하지
+        않고, 같은 서비스/리전을 조회하는 수집기는 per-region 락에서 선행 조회를 기다린다.
+        블록을 벗어나면 시작하지 않은 조회는 취소하며, 실행 중인 조회는 기다리지 않는다.
+
+        Args:
+            services: AWS 서비스 코드 목록 (중복은 한 번만 조회)
+            regions: 대상 리전 목록 (중복은 한 번만 조회)
+            max_workers: 최대 동시 조회 수 (기본: ``PREFETCH_MAX_WORKERS``)
+        """
+        targets = [(service, region) for service in dict.fromkeys(services) for region in dict.fromkeys(regions)]
+        if not targets or max_workers < 1:
+            yield
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(targets)), thread_name_prefix="price-prefetch")
+        try:
+            for service, region in targets:
+                executor.submit(self._prefetch_one, service, region)
+            yield
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prefetch_one(self, service: str, region: str) -> None:
+        """선행 조회 1건 (실패는 무시: 수집기의 ``get_prices()`` 가 다시 조회/fallback)"""
+        try:
+            self.get_prices(service, region)
+        except Exception as e:
+            logger.debug(f"가격 선행 조회 실패 [{service}/{region}]: {e}")
+
     def get_metrics(self) -> dict[str, float | int]:
         """현재 메트릭 값을 딕셔너리로 반환한다.
 
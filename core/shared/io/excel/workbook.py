@@ -485,19 +485,21 @@ class Workbook:
         self,
         name: str,
         columns: list[ColumnDef],
+        position: int | None = None,
     ) -> Sheet:
         """새 시트 생성
 
         Args:
             name: 시트 이름
             columns: 컬럼 정의 리스트
+            position: 시트 위치 (None이면 맨 뒤)
 
         Returns:
             Sheet 인스턴스
         """
         from openpyxl.utils import get_column_letter
 
-        ws = self._wb.create_sheet(title=name)
+        ws = self._wb.create_sheet(title=name, index=position)
 
         # 헤더 행 설정
         header_font = get_header_font()
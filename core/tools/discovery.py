@@ -32,7 +32,6 @@ import importlib
 import logging
 import threading
 import time
-from pathlib import Path
 from typing import Any
 
 from core.config import (
@@ -44,6 +43,7 @@ from core.config import (
 )
 from core.exceptions import MetadataValidationError
 from core.tools.aws_categories import SERVICE_TO_CATEGORY
+from core.tools.manifest import load_manifest
 
 logger = logging.getLogger(__name__)
 
@@ -183,7 +183,8 @@ def discover_categories(
     """모든 스캔 경로에서 카테고리/도구 자동 발견
 
     각 카테고리 폴더의 __init__.py에서 CATEGORY, TOOLS를 읽어옴.
-    서브폴더도 재귀적으로 스캔함.
+    서브폴더도 재귀적으로 스캔함. 메타데이터는 도구 매니페스트(manifest.py)에서
+    읽으므로 도구 패키지를 import하지 않음 (리터럴이 아닌 패키지만 import).
 
     Args:
         include_aws_services: True면 AWS 서비스 카테고리도 포함 (기본: 분석 도구만)
@@ -219,84 +220,44 @@ def discover_categories(
     # 제외할 폴더/파일 (core.config 사용)
     exclude = settings.PLUGIN_EXCLUDE_DIRS
 
-    def scan_directory(path: Path, base_module_path: str, source: str):
-        """재귀적으로 디렉토리를 스캔"""
-        if not path.exists():
-            return
+    # 매니페스트의 리터럴 메타데이터 사용 - 도구 패키지는 import하지 않음
+    for entry in load_manifest(SCAN_PATHS, exclude):
+        module_path = entry["module_path"]
+        source = entry["source"]
 
-        for item in sorted(path.iterdir()):
-            # 폴더만, _나 .로 시작하지 않는 것만
-            if not item.is_dir():
-                continue
-            if item.name.startswith(("_", ".")) or item.name in exclude:
-                continue
-
-            try:
-                module_path = f"{base_module_path}.{item.name}"
+        try:
+            if entry["kind"] == "static":
+                raw_category = entry["category"]
+                raw_tools = entry["tools"]
+            else:
+                # 리터럴이 아닌 메타데이터는 해당 패키지만 import
                 module = importlib.import_module(module_path)
-
-                # CATEGORY와 TOOLS가 정의되어 있어야 함
-                if hasattr(module, "CATEGORY") and hasattr(module, "TOOLS"):
-                    raw_category = module.CATEGORY
-                    raw_tools = module.TOOLS
-
-                    # 메타데이터 검증
-                    if validate:
-                        cat_info, warnings = _validate_category_metadata(module_path, raw_category, raw_tools)
-                        validation_warnings.extend(warnings)
-                    else:
-                        cat_info = raw_category.copy()
-                        cat_info["tools"] = raw_tools
-
-                    cat_info["module_path"] = module_path
-                    cat_info["_source"] = source
-
-                    categories.append(cat_info)
-                    logger.debug(f"카테고리 발견: {module_path} (source={source})")
-                else:
+                if not (hasattr(module, "CATEGORY") and hasattr(module, "TOOLS")):
                     logger.debug(f"스킵 (메타데이터 없음): {module_path}")
+                    continue
+                raw_category = module.CATEGORY
+                raw_tools = module.TOOLS
 
-                # 서브디렉토리도 스캔 (재귀)
-                scan_directory(item, module_path, source)
+            # 메타데이터 검증
+            if validate:
+                cat_info, warnings = _validate_category_metadata(module_path, raw_category, raw_tools)
+                validation_warnings.extend(warnings)
+            else:
+                cat_info = raw_category.copy()
+                cat_info["tools"] = raw_tools
 
-            except ImportError as e:
-                logger.warning(f"카테고리 로드 실패: {item.name} - {e}")
-            except MetadataValidationError as e:
-                logger.error(f"메타데이터 검증 실패: {e}")
-            except Exception as e:
-                logger.warning(f"카테고리 로드 오류: {item.name} - {e}")
+            cat_info["module_path"] = module_path
+            cat_info["_source"] = source
 
-    # 모든 경로 스캔
-    for base_module, path in SCAN_PATHS:
-        source = path.name  # analysis, aws_services, tools
+            categories.append(cat_info)
+            logger.debug(f"카테고리 발견: {module_path} (source={source})")
 
-        # 루트 폴더의 __init__.py도 확인 (reports/__init__.py 등)
-        try:
-            root_module = importlib.import_module(base_module)
-            if hasattr(root_module, "CATEGORY") and hasattr(root_module, "TOOLS"):
-                raw_category = root_module.CATEGORY
-                raw_tools = root_module.TOOLS
-
-                if validate:
-                    cat_info, warnings = _validate_category_metadata(base_module, raw_category, raw_tools)
-                    validation_warnings.extend(warnings)
-                else:
-                    cat_info = raw_category.copy()
-                    cat_info["tools"] = raw_tools
-
-                cat_info["module_path"] = base_module
-                cat_info["_source"] = source
-                categories.append(cat_info)
-                logger.debug(f"루트 카테고리 발견: {base_module} (source={source})")
         except ImportError as e:
-            logger.debug(f"루트 모듈 로드 스킵: {base_module} - {e}")
+            logger.warning(f"카테고리 로드 실패: {module_path} - {e}")
         except MetadataValidationError as e:
-            logger.error(f"루트 메타데이터 검증 실패: {e}")
+            logger.error(f"메타데이터 검증 실패: {e}")
         except Exception as e:
-            logger.warning(f"루트 모듈 로드 오류: {base_module} - {e}")
-
-        # 하위 디렉토리 스캔
-        scan_directory(path, base_module, source)
+            logger.warning(f"카테고리 로드 오류: {module_path} - {e}")
 
     # 검증 경고 로깅
     if validation_warnings:
@@ -0,0 +1,259 @@
+"""도구 매니페스트 - import 없이 읽는 카테고리/도구 메타데이터 색인.
+
+discovery가 CLI 시작마다 모든 도구 패키지를 import하지 않도록, 각 패키지
+``__init__.py`` 의 ``CATEGORY``/``TOOLS`` 리터럴을 AST로 읽어 JSON 매니페스트로
+저장합니다. 매니페스트는 스캔 대상 ``__init__.py`` 의 mtime/크기 서명으로
+검증되며, 도구가 추가/수정되면 다음 실행에서 자동으로 다시 생성됩니다.
+
+리터럴이 아닌 메타데이터(다른 모듈에서 import, 계산된 값 등)를 가진 패키지는
+``"dynamic"`` 으로 기록되어 discovery 시점에 해당 패키지만 import합니다.
+
+Example:
+    ::
+
+        from core.tools.manifest import load_manifest
+
+        for entry in load_manifest(SCAN_PATHS, exclude):
+            print(entry["module_path"], len(entry["tools"]))
+
+        # 빌드/배포 시 미리 생성
+        python scripts/generate_index.py --section manifest
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Collection, Iterator, Sequence
+from pathlib import Path
+from typing import Any, TypedDict
+
+from core.tools.cache.path import get_cache_path
+
+logger = logging.getLogger(__name__)
+
+# 매니페스트 형식 버전 (구조 변경 시 증가 → 기존 파일 재생성)
+MANIFEST_VERSION = 1
+
+# 매니페스트 파일명 (temp/discovery/ 하위)
+MANIFEST_FILENAME = "tool_manifest.json"
+
+# 매니페스트가 읽는 메타데이터 이름
+_METADATA_NAMES = ("CATEGORY", "TOOLS")
+
+
+class ToolManifest(TypedDict):
+    """매니페스트 파일 구조.
+
+    Attributes:
+        version: 매니페스트 형식 버전 (``MANIFEST_VERSION``)
+        signature: 패키지 구성과 ``__init__.py`` mtime/크기 서명
+        packages: 스캔 순서의 패키지 항목 (``module_path``, ``source``, 메타데이터)
+    """
+
+    version: int
+    signature: list[list[Any]]
+    packages: list[dict[str, Any]]
+
+
+def get_manifest_path() -> Path:
+    """매니페스트 파일 경로 반환"""
+    return Path(get_cache_path("discovery", MANIFEST_FILENAME))
+
+
+def iter_packages(
+    scan_paths: Sequence[tuple[str, Path]],
+    exclude: Collection[str],
+) -> Iterator[tuple[str, str, Path]]:
+    """discovery 스캔 순서대로 패키지를 나열합니다.
+
+    루트 패키지를 먼저, 이후 하위 폴더를 이름순 전위 순회합니다.
+    ``_``/``.`` 로 시작하거나 ``exclude`` 에 있는 폴더는 건너뜁니다.
+
+    Args:
+        scan_paths: ``(base_module, path)`` 목록
+        exclude: 제외할 폴더명
+
+    Yields:
+        ``(module_path, source, directory)``
+    """
+
+    def walk(path: Path, module_path: str, source: str) -> Iterator[tuple[str, str, Path]]:
+        try:
+            items = sorted(item for item in path.iterdir() if item.is_dir())
+        except OSError:
+            return
+        for item in items:
+            if item.name.startswith(("_", ".")) or item.name in exclude:
+                continue
+            child = f"{module_path}.{item.name}"
+            yield child, source, item
+            yield from walk(item, child, source)
+
+    for base_module, path in scan_paths:
+        if not path.exists():
+            continue
+        yield base_module, path.name, path
+        yield from walk(path, base_module, path.name)
+
+
+def _source_signature(packages: list[tuple[str, str, Path]]) -> list[list[Any]]:
+    """패키지 목록과 ``__init__.py`` mtime/크기로 만든 서명"""
+    signature: list[list[Any]] = []
+    for module_path, _source, directory in packages:
+        try:
+            stat = (directory / "__init__.py").stat()
+            signature.append([module_path, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            signature.append([module_path, None, None])
+    return signature
+
+
+def read_package_metadata(init_file: Path) -> dict[str, Any] | None:
+    """``__init__.py`` 를 import하지 않고 ``CATEGORY``/``TOOLS`` 를 읽습니다.
+
+    Args:
+        init_file: 패키지 ``__init__.py`` 경로
+
+    Returns:
+        - ``{"kind": "static", "category": {...}, "tools": [...]}``: 둘 다 리터럴
+        - ``{"kind": "dynamic"}``: 리터럴이 아니어서 import가 필요
+        - ``None``: 메타데이터 없음 (카테고리 아님)
+    """
+    try:
+        tree = ast.parse(init_file.read_bytes(), filename=str(init_file))
+    except FileNotFoundError:
+        return None
+    except (OSError, SyntaxError, ValueError):
+        # import 시점의 오류 처리(경고 로그)에 맡김
+        return {"kind": "dynamic"}
+
+    literals: dict[str, Any] = {}
+    referenced: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = [t.id for t in node.targets if isinstance(t, ast.Name) and t.id in _METADATA_NAMES]
+            value = node.value
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.value is not None:
+            targets = [node.target.id] if node.target.id in _METADATA_NAMES else []
+            value = node.value
+        elif isinstance(node, ast.ImportFrom):
+            names = {alias.asname or alias.name for alias in node.names}
+            if "*" in names:
+                return {"kind": "dynamic"}
+            referenced.update(names.intersection(_METADATA_NAMES))
+            continue
+        else:
+            continue
+
+        for target in targets:
+            referenced.add(target)
+            try:
+                literals[target] = ast.literal_eval(value)
+            except (ValueError, TypeError, SyntaxError):
+                literals.pop(target, None)
+
+    if all(name in literals for name in _METADATA_NAMES):
+        return {"kind": "static", "category": literals["CATEGORY"], "tools": literals["TOOLS"]}
+    if referenced - literals.keys():
+        return {"kind": "dynamic"}
+    return None
+
+
+def build_manifest(
+    scan_paths: Sequence[tuple[str, Path]],
+    exclude: Collection[str],
+    packages: list[tuple[str, str, Path]] | None = None,
+) -> ToolManifest:
+    """스캔 경로의 매니페스트를 생성합니다.
+
+    Args:
+        scan_paths: ``(base_module, path)`` 목록
+        exclude: 제외할 폴더명
+        packages: 미리 나열한 ``iter_packages()`` 결과 (None이면 새로 나열)
+
+    Returns:
+        ``{"version", "signature", "packages": [{"module_path", "source", "kind", ...}]}``
+    """
+    if packages is None:
+        packages = list(iter_packages(scan_paths, exclude))
+
+    entries: list[dict[str, Any]] = []
+    for module_path, source, directory in packages:
+        metadata = read_package_metadata(directory / "__init__.py")
+        if metadata is not None:
+            entries.append({"module_path": module_path, "source": source, **metadata})
+
+    return {
+        "version": MANIFEST_VERSION,
+        "signature": _source_signature(packages),
+        "packages": entries,
+    }
+
+
+def write_manifest(manifest: ToolManifest, path: Path | None = None) -> Path:
+    """매니페스트를 원자적으로 저장합니다 (임시 파일 → rename).
+
+    Args:
+        manifest: ``build_manifest()`` 결과
+        path: 저장 경로 (None이면 기본 경로)
+
+    Returns:
+        저장된 파일 경로
+    """
+    path = path or get_manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".manifest-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return path
+
+
+def load_manifest(
+    scan_paths: Sequence[tuple[str, Path]],
+    exclude: Collection[str],
+    path: Path | None = None,
+) -> list[dict[str, Any]]:
+    """유효한 매니페스트의 패키지 목록을 반환합니다 (없거나 낡았으면 재생성).
+
+    유효성은 현재 패키지 구성과 각 ``__init__.py`` 의 mtime/크기 서명으로 판단하므로
+    파일 stat만으로 확인되며 도구 모듈은 import하지 않습니다.
+
+    Args:
+        scan_paths: ``(base_module, path)`` 목록
+        exclude: 제외할 폴더명
+        path: 매니페스트 경로 (None이면 기본 경로)
+
+    Returns:
+        스캔 순서의 패키지 항목 목록
+    """
+    path = path or get_manifest_path()
+    packages = list(iter_packages(scan_paths, exclude))
+    signature = _source_signature(packages)
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached: ToolManifest = json.load(f)
+        if cached.get("version") == MANIFEST_VERSION and cached.get("signature") == signature:
+            return list(cached["packages"])
+        logger.debug("도구 매니페스트 변경 감지 - 재생성")
+    except FileNotFoundError:
+        logger.debug("도구 매니페스트 없음 - 생성")
+    except (OSError, ValueError, KeyError, AttributeError) as e:
+        logger.debug(f"도구 매니페스트 읽기 실패 - 재생성: {e}")
+
+    manifest = build_manifest(scan_paths, exclude, packages)
+    try:
+        write_manifest(manifest, path)
+    except OSError as e:
+        logger.debug(f"도구 매니페스트 저장 실패: {e}")
+    return manifest["packages"]
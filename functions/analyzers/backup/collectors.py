@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 
 from botocore.exceptions import ClientError
 
-from core.parallel import get_client
+from core.parallel import describe_pages, get_client
 
 from .models import (
     BackupPlanTagCondition,
@@ -403,8 +403,7 @@ def _collect_ec2_backup_status(session, account_id: str, account_name: str, regi
     ec2 = get_client(session, "ec2", region_name=region)
 
     try:
-        paginator = ec2.get_paginator("describe_instances")
-        for page in paginator.paginate():
+        for page in describe_pages(ec2, "describe_instances"):
             for reservation in page.get("Reservations", []):
                 for instance in reservation.get("Instances", []):
                     instance_id = instance.get("InstanceId", "")
@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING
 from rich.console import Console
 
 from core.parallel import get_client, parallel_collect
+from core.shared.aws.metrics import batch_get_metrics, build_alarm_metric_queries
 from core.shared.io.output import OutputPath, get_context_identifier, open_in_explorer
 
 if TYPE_CHECKING:
@@ -30,7 +31,7 @@ console = Console()
 REQUIRED_PERMISSIONS = {
     "read": [
         "cloudwatch:DescribeAlarms",
-        "cloudwatch:GetMetricStatistics",
+        "cloudwatch:GetMetricData",
     ],
 }
 
@@ -135,48 +136,43 @@ class AlarmAnalysisResult:
     findings: list[AlarmFinding] = field(default_factory=list)
 
 
-def check_metric_has_data(cloudwatch, namespace: str, metric_name: str, dimensions: list[dict]) -> bool:
-    """지표에 최근 데이터가 있는지 확인한다.
+def check_metrics_have_data(cloudwatch, alarms: list[dict]) -> list[bool]:
+    """알람 대상 지표들에 최근 데이터가 있는지 한 번에 확인한다.
 
-    get_metric_statistics로 최근 METRIC_CHECK_DAYS일간 데이터포인트를 조회하여
+    GetMetricData 배치로 최근 METRIC_CHECK_DAYS일간 SampleCount를 조회하여
     리소스 존재 여부를 판단한다. 모든 CloudWatch 네임스페이스를 지원한다.
 
     Args:
         cloudwatch: CloudWatch boto3 클라이언트.
-        namespace: CloudWatch 네임스페이스 (AWS/EC2 등).
-        metric_name: 지표 이름.
-        dimensions: Dimension 딕셔너리 목록.
+        alarms: DescribeAlarms MetricAlarms 항목 목록 (Namespace, MetricName, Dimensions).
 
     Returns:
-        데이터포인트가 하나라도 있으면 True.
+        alarms와 같은 순서의 데이터 존재 여부 목록 (API 오류 시 모두 False).
     """
     from botocore.exceptions import ClientError
 
+    if not alarms:
+        return []
+
     now = datetime.now(timezone.utc)
     start_time = now - timedelta(days=METRIC_CHECK_DAYS)
 
     try:
-        resp = cloudwatch.get_metric_statistics(
-            Namespace=namespace,
-            MetricName=metric_name,
-            Dimensions=dimensions,
-            StartTime=start_time,
-            EndTime=now,
-            Period=86400,  # 1일
-            Statistics=["Sum", "Average", "SampleCount"],
-        )
-        # 데이터포인트가 하나라도 있으면 정상
-        return len(resp.get("Datapoints", [])) > 0
+        queries = build_alarm_metric_queries(alarms)
+        results = batch_get_metrics(cloudwatch, queries, start_time, now, period=86400)
     except ClientError:
         # API 오류는 데이터 없음으로 간주
-        return False
+        return [False] * len(alarms)
+
+    # 데이터포인트가 하나라도 있으면 정상
+    return [results.get(q.id, 0.0) > 0 for q in queries]
 
 
 def collect_alarms(session, account_id: str, account_name: str, region: str) -> list[AlarmInfo]:
     """CloudWatch MetricAlarm을 수집하고 지표 데이터 존재 여부를 확인한다.
 
     INSUFFICIENT_DATA 상태의 알람은 즉시 고아로 판단하고, 그 외 알람은
-    get_metric_statistics로 실제 데이터 존재를 확인한다.
+    리전 단위 GetMetricData 배치로 실제 데이터 존재를 확인한다.
 
     Args:
         session: boto3 Session 객체.
@@ -191,6 +187,7 @@ def collect_alarms(session, account_id: str, account_name: str, region: str) ->
 
     cloudwatch = get_client(session, "cloudwatch", region_name=region)
     alarms = []
+    to_check: list[tuple[AlarmInfo, dict]] = []
 
     try:
         paginator = cloudwatch.get_paginator("describe_alarms")
@@ -226,14 +223,18 @@ def collect_alarms(session, account_id: str, account_name: str, region: str) ->
                 if state == "INSUFFICIENT_DATA":
                     info.has_metric_data = False
                 elif namespace and metric_name:
-                    # 모든 namespace에 대해 지표 데이터 확인
-                    info.has_metric_data = check_metric_has_data(cloudwatch, namespace, metric_name, dimensions_list)
+                    # 모든 namespace에 대해 지표 데이터 확인 (수집 후 일괄 조회)
+                    to_check.append((info, alarm))
 
                 alarms.append(info)
 
     except ClientError:
         pass
 
+    has_data = check_metrics_have_data(cloudwatch, [alarm for _, alarm in to_check])
+    for (info, _), value in zip(to_check, has_data, strict=True):
+        info.has_metric_data = value
+
     return alarms
 
 
@@ -1342,6 +1342,24 @@ REGIONAL_COLLECTORS: dict[str, Callable] = {
     "fsx": collect_fsx,
 }
 
+# 리전별 수집기가 PricingService로 조회하는 가격 서비스 코드 (수집 동안 선행 조회)
+PRICING_SERVICES: dict[str, str] = {
+    "ami": "snapshot",
+    "ebs": "ebs",
+    "snapshot": "snapshot",
+    "eip": "eip",
+    "ec2_instance": "ec2",
+    "endpoint": "vpc_endpoint",
+    "elb": "elb",
+    "dynamodb": "dynamodb",
+    "rds_snapshot": "rds_snapshot",
+    "ecr": "ecr",
+    "lambda": "lambda",
+    "kms": "kms",
+    "secret": "secretsmanager",
+    "sagemaker_endpoint": "sagemaker",
+}
+
 # 글로벌 수집기 (DNS)
 GLOBAL_COLLECTORS: dict[str, Callable] = {
     "route53": collect_route53,
@@ -18,9 +18,10 @@ from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Any
 
 from core.parallel import is_quiet, parallel_collect, quiet_mode, set_quiet
+from core.shared.aws.pricing import pricing_service
 from core.shared.io.output import OutputPath, get_context_identifier, open_in_explorer
 
-from .collectors import REGIONAL_COLLECTORS, collect_route53, collect_s3
+from .collectors import PRICING_SERVICES, REGIONAL_COLLECTORS, collect_route53, collect_s3
 from .report import generate_report
 from .types import (
     RESOURCE_FIELD_MAP,
@@ -368,8 +369,14 @@ def run(ctx: ExecutionContext, resources: list[str] | None = None) -> None:
         return collect_session_resources(session, account_id, account_name, region, selected_resources=selected)
 
     # 병렬 수집 실행 (quiet_mode로 콘솔 출력 억제)
+    # pricing_service.prefetch: 선택된 수집기의 리전별 가격을 수집 동안 백그라운드로 조회
+    price_services = [svc for key, svc in PRICING_SERVICES.items() if selected is None or key in selected]
     if parallel_progress is not None:
-        with parallel_progress("리소스 수집", console=console) as tracker, quiet_mode():
+        with (
+            parallel_progress("리소스 수집", console=console) as tracker,
+            quiet_mode(),
+            pricing_service.prefetch(price_services, ctx.regions),
+        ):
             parallel_result = parallel_collect(
                 ctx,
                 collect_wrapper,
@@ -379,7 +386,7 @@ def run(ctx: ExecutionContext, resources: list[str] | None = None) -> None:
             )
     else:
         # Fallback: parallel_progress 없이 실행
-        with quiet_mode():
+        with quiet_mode(), pricing_service.prefetch(price_services, ctx.regions):
             parallel_result = parallel_collect(
                 ctx,
                 collect_wrapper,
@@ -9,6 +9,7 @@ Provisioned vs On-Demand 용량 모드 최적화 분석
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -17,6 +18,8 @@ from typing import TYPE_CHECKING
 from rich.console import Console
 
 from core.parallel import get_client, parallel_collect
+from core.parallel.decorators import get_error_code
+from core.shared.aws.metrics import batch_get_metric_series, build_dynamodb_metric_queries
 from core.shared.aws.pricing.dynamodb import (
     estimate_ondemand_cost,
     get_dynamodb_monthly_cost,
@@ -27,6 +30,7 @@ if TYPE_CHECKING:
     from core.cli.flow.context import ExecutionContext
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 # 분석 기간 (일)
 ANALYSIS_DAYS = 14
@@ -36,7 +40,7 @@ REQUIRED_PERMISSIONS = {
     "read": [
         "dynamodb:ListTables",
         "dynamodb:DescribeTable",
-        "cloudwatch:GetMetricStatistics",
+        "cloudwatch:GetMetricData",
     ],
 }
 
@@ -217,7 +221,7 @@ def collect_capacity_info(session, account_id: str, account_name: str, region: s
     """DynamoDB 테이블 용량 정보 및 CloudWatch 지표를 수집한다.
 
     ListTables + DescribeTable로 프로비저닝 설정을 수집하고,
-    CloudWatch GetMetricStatistics로 14일간 소비 용량/쓰로틀링 지표를 조회한다.
+    GetMetricData 배치로 14일간 소비 용량/쓰로틀링 지표를 조회한다.
 
     Args:
         session: boto3 Session.
@@ -267,69 +271,6 @@ def collect_capacity_info(session, account_id: str, account_name: str, region: s
                         created_at=t.get("CreationDateTime"),
                     )
 
-                    # CloudWatch 지표 조회
-                    try:
-                        # ConsumedReadCapacityUnits
-                        read_resp = cloudwatch.get_metric_statistics(
-                            Namespace="AWS/DynamoDB",
-                            MetricName="ConsumedReadCapacityUnits",
-                            Dimensions=[{"Name": "TableName", "Value": table_name}],
-                            StartTime=start_time,
-                            EndTime=now,
-                            Period=86400,
-                            Statistics=["Average", "Maximum"],
-                        )
-                        if read_resp.get("Datapoints"):
-                            table.avg_consumed_read = sum(d["Average"] for d in read_resp["Datapoints"]) / len(
-                                read_resp["Datapoints"]
-                            )
-                            table.max_consumed_read = max(d["Maximum"] for d in read_resp["Datapoints"])
-
-                        # ConsumedWriteCapacityUnits
-                        write_resp = cloudwatch.get_metric_statistics(
-                            Namespace="AWS/DynamoDB",
-                            MetricName="ConsumedWriteCapacityUnits",
-                            Dimensions=[{"Name": "TableName", "Value": table_name}],
-                            StartTime=start_time,
-                            EndTime=now,
-                            Period=86400,
-                            Statistics=["Average", "Maximum"],
-                        )
-                        if write_resp.get("Datapoints"):
-                            table.avg_consumed_write = sum(d["Average"] for d in write_resp["Datapoints"]) / len(
-                                write_resp["Datapoints"]
-                            )
-                            table.max_consumed_write = max(d["Maximum"] for d in write_resp["Datapoints"])
-
-                        # ThrottledRequests (Read)
-                        read_throttle = cloudwatch.get_metric_statistics(
-                            Namespace="AWS/DynamoDB",
-                            MetricName="ReadThrottledRequests",
-                            Dimensions=[{"Name": "TableName", "Value": table_name}],
-                            StartTime=start_time,
-                            EndTime=now,
-                            Period=86400,
-                            Statistics=["Sum"],
-                        )
-                        if read_throttle.get("Datapoints"):
-                            table.throttled_read = sum(d["Sum"] for d in read_throttle["Datapoints"])
-
-                        # ThrottledRequests (Write)
-                        write_throttle = cloudwatch.get_metric_statistics(
-                            Namespace="AWS/DynamoDB",
-                            MetricName="WriteThrottledRequests",
-                            Dimensions=[{"Name": "TableName", "Value": table_name}],
-                            StartTime=start_time,
-                            EndTime=now,
-                            Period=86400,
-                            Statistics=["Sum"],
-                        )
-                        if write_throttle.get("Datapoints"):
-                            table.throttled_write = sum(d["Sum"] for d in write_throttle["Datapoints"])
-
-                    except ClientError:
-                        pass
-
                     tables.append(table)
 
                 except ClientError:
@@ -338,6 +279,26 @@ def collect_capacity_info(session, account_id: str, account_name: str, region: s
     except ClientError:
         pass
 
+    # CloudWatch 지표 배치 조회 (테이블 전체 1회)
+    if tables:
+        try:
+            queries = build_dynamodb_metric_queries([t.table_name for t in tables])
+            series = batch_get_metric_series(cloudwatch, queries, start_time, now, period=86400)
+        except ClientError as e:
+            # 지표 없이 반환하면 모든 테이블이 사용량 0으로 보고되므로 경고를 남긴다
+            logger.warning(f"DynamoDB 지표 조회 실패 [{account_id}/{region}]: {get_error_code(e)}")
+            return tables
+
+        # 쿼리 ID는 테이블 목록 순서 기반 (m{i}_...)
+        for i, table in enumerate(tables):
+            # 일별 평균의 평균, 일별 최대값의 최대
+            table.avg_consumed_read = series[f"m{i}_consumedreadcapacityunits_avg"].mean()
+            table.max_consumed_read = series[f"m{i}_consumedreadcapacityunits_max"].max()
+            table.avg_consumed_write = series[f"m{i}_consumedwritecapacityunits_avg"].mean()
+            table.max_consumed_write = series[f"m{i}_consumedwritecapacityunits_max"].max()
+            table.throttled_read = series[f"m{i}_readthrottledrequests_sum"].sum()
+            table.throttled_write = series[f"m{i}_writethrottledrequests_sum"].sum()
+
     return tables
 
 
@@ -25,7 +25,7 @@ from typing import TYPE_CHECKING
 from dateutil.parser import parse
 from rich.console import Console
 
-from core.parallel import get_client, is_quiet, parallel_collect
+from core.parallel import describe_pages, get_client, is_quiet, parallel_collect
 from core.shared.aws.pricing import get_snapshot_monthly_cost
 from core.shared.io.output import OutputPath, get_context_identifier, open_in_explorer
 
@@ -241,10 +241,14 @@ def collect_amis(session, account_id: str, account_name: str, region: str) -> li
     try:
         ec2 = get_client(session, "ec2", region_name=region)
 
-        # 자체 소유 AMI 조회
-        response = ec2.describe_images(Owners=["self"])
+        # 자체 소유 AMI 조회 (snapshot_audit의 AMI 매핑과 응답 공유)
+        images = [
+            image
+            for page in describe_pages(ec2, "describe_images", Owners=["self"])
+            for image in page.get("Images", [])
+        ]
 
-        for data in response.get("Images", []):
+        for data in images:
             if data.get("State") != "available":
                 continue
 
@@ -320,9 +324,7 @@ def get_used_ami_ids(session, region: str) -> set[str]:
 
     try:
         ec2 = get_client(session, "ec2", region_name=region)
-        paginator = ec2.get_paginator("describe_instances")
-
-        for page in paginator.paginate():
+        for page in describe_pages(ec2, "describe_instances"):
             for reservation in page.get("Reservations", []):
                 for instance in reservation.get("Instances", []):
                     ami_id = instance.get("ImageId", "")
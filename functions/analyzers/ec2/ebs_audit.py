@@ -19,7 +19,8 @@ from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 
-from core.parallel import get_client, is_quiet, parallel_collect
+from core.parallel import describe_pages, get_client, is_quiet, parallel_collect
+from core.shared.aws.metrics import batch_get_metrics, build_ebs_metric_queries, sanitize_metric_id
 from core.shared.aws.pricing import get_ebs_monthly_cost
 from core.shared.io.output import OutputPath, get_context_identifier, open_in_explorer
 
@@ -38,7 +39,7 @@ IDLE_IOPS_THRESHOLD = 1
 REQUIRED_PERMISSIONS = {
     "read": [
         "ec2:DescribeVolumes",
-        "cloudwatch:GetMetricStatistics",
+        "cloudwatch:GetMetricData",
     ],
 }
 
@@ -233,8 +234,8 @@ class EBSAnalysisResult:
 def collect_ebs(session, account_id: str, account_name: str, region: str) -> list[EBSInfo]:
     """EBS 볼륨 목록 수집 및 CloudWatch I/O 메트릭 조회
 
-    모든 EBS 볼륨을 페이지네이션으로 수집하고, in-use 볼륨에 대해
-    CloudWatch GetMetricStatistics로 VolumeReadOps/VolumeWriteOps를 조회합니다.
+    모든 EBS 볼륨을 페이지네이션으로 수집하고, in-use 볼륨 전체의
+    VolumeReadOps/VolumeWriteOps를 GetMetricData 배치로 조회합니다.
 
     Args:
         session: boto3 Session 객체
@@ -256,9 +257,7 @@ def collect_ebs(session, account_id: str, account_name: str, region: str) -> lis
     try:
         ec2 = get_client(session, "ec2", region_name=region)
         cloudwatch = get_client(session, "cloudwatch", region_name=region)
-        paginator = ec2.get_paginator("describe_volumes")
-
-        for page in paginator.paginate():
+        for page in describe_pages(ec2, "describe_volumes"):
             for data in page.get("Volumes", []):
                 # 태그 파싱
                 tags = {
@@ -285,7 +284,7 @@ def collect_ebs(session, account_id: str, account_name: str, region: str) -> lis
                     availability_zone=data.get("AvailabilityZone", ""),
                     create_time=data.get("CreateTime"),
                     snapshot_id=data.get("SnapshotId", ""),
-                    attachments=data.get("Attachments", []),
+                    attachments=[dict(a) for a in data.get("Attachments", [])],
                     tags=tags,
                     account_id=account_id,
                     account_name=account_name,
@@ -293,39 +292,21 @@ def collect_ebs(session, account_id: str, account_name: str, region: str) -> lis
                     monthly_cost=monthly_cost,
                 )
 
-                # in-use 볼륨에 대해 CloudWatch 메트릭 수집 (AWS Trusted Advisor 기준)
-                if volume.state == "in-use":
-                    try:
-                        # VolumeReadOps
-                        read_resp = cloudwatch.get_metric_statistics(
-                            Namespace="AWS/EBS",
-                            MetricName="VolumeReadOps",
-                            Dimensions=[{"Name": "VolumeId", "Value": volume.id}],
-                            StartTime=start_time,
-                            EndTime=now,
-                            Period=86400,
-                            Statistics=["Sum"],
-                        )
-                        if read_resp.get("Datapoints"):
-                            volume.read_ops = sum(d["Sum"] for d in read_resp["Datapoints"])
-
-                        # VolumeWriteOps
-                        write_resp = cloudwatch.get_metric_statistics(
-                            Namespace="AWS/EBS",
-                            MetricName="VolumeWriteOps",
-                            Dimensions=[{"Name": "VolumeId", "Value": volume.id}],
-                            StartTime=start_time,
-                            EndTime=now,
-                            Period=86400,
-                            Statistics=["Sum"],
-                        )
-                        if write_resp.get("Datapoints"):
-                            volume.write_ops = sum(d["Sum"] for d in write_resp["Datapoints"])
-                    except ClientError:
-                        pass
-
                 volumes.append(volume)
 
+        # in-use 볼륨에 대해 CloudWatch 메트릭 배치 수집 (AWS Trusted Advisor 기준)
+        in_use = [v for v in volumes if v.state == "in-use"]
+        if in_use:
+            try:
+                queries = build_ebs_metric_queries([v.id for v in in_use])
+                results = batch_get_metrics(cloudwatch, queries, start_time, now, period=86400)
+                for volume in in_use:
+                    safe_id = sanitize_metric_id(volume.id)
+                    volume.read_ops = results.get(f"{safe_id}_volumereadops_sum", 0.0)
+                    volume.write_ops = results.get(f"{safe_id}_volumewriteops_sum", 0.0)
+            except ClientError:
+                pass
+
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "Unknown")
         if not is_quiet():
@@ -24,7 +24,7 @@ from typing import TYPE_CHECKING
 
 from rich.console import Console
 
-from core.parallel import get_client, is_quiet, parallel_collect
+from core.parallel import describe_pages, get_client, is_quiet, parallel_collect
 from core.shared.aws.pricing import get_snapshot_monthly_cost
 from core.shared.io.output import OutputPath, get_context_identifier, open_in_explorer
 
@@ -239,8 +239,7 @@ def collect_snapshots(session, account_id: str, account_name: str, region: str)
         ec2 = get_client(session, "ec2", region_name=region)
 
         # 자체 소유 스냅샷만 조회
-        paginator = ec2.get_paginator("describe_snapshots")
-        for page in paginator.paginate(OwnerIds=["self"]):
+        for page in describe_pages(ec2, "describe_snapshots", OwnerIds=["self"]):
             for data in page.get("Snapshots", []):
                 # 태그 파싱
                 tags = {
@@ -298,8 +297,7 @@ def get_ami_snapshot_mapping(session, region: str) -> dict[str, list[str]]:
         ec2 = get_client(session, "ec2", region_name=region)
 
         # 자체 소유 AMI만 조회
-        paginator = ec2.get_paginator("describe_images")
-        for page in paginator.paginate(Owners=["self"]):
+        for page in describe_pages(ec2, "describe_images", Owners=["self"]):
             for ami in page.get("Images", []):
                 ami_id = ami.get("ImageId", "")
 
@@ -33,7 +33,7 @@ from typing import TYPE_CHECKING
 
 from rich.console import Console
 
-from core.parallel import get_client, parallel_collect
+from core.parallel import describe_pages, get_client, parallel_collect
 from core.shared.aws.metrics import MetricQuery, batch_get_metrics, sanitize_metric_id
 from core.shared.aws.pricing import get_ec2_monthly_cost
 from core.shared.io.output import OutputPath, get_context_identifier
@@ -225,8 +225,7 @@ def collect_ec2_instances(session, account_id: str, account_name: str, region: s
 
     try:
         # 1단계: 인스턴스 목록 수집
-        paginator = ec2.get_paginator("describe_instances")
-        for page in paginator.paginate():
+        for page in describe_pages(ec2, "describe_instances"):
             for reservation in page.get("Reservations", []):
                 for inst in reservation.get("Instances", []):
                     instance_id = inst.get("InstanceId", "")
@@ -188,12 +188,13 @@ def collect_redis_clusters(session, account_id: str, account_name: str, region:
                     created_at=None,
                 )
 
-                # CloudWatch 지표 조회
-                _fetch_cloudwatch_metrics(cloudwatch, cluster, cluster_id, "ReplicationGroupId", start_time, now)
                 clusters.append(cluster)
     except ClientError:
         pass
 
+    # CloudWatch 지표 배치 조회
+    _fetch_cloudwatch_metrics(cloudwatch, clusters, "ReplicationGroupId", start_time, now)
+
     return clusters
 
 
@@ -243,58 +244,44 @@ def collect_memcached_clusters(session, account_id: str, account_name: str, regi
                     created_at=cc.get("CacheClusterCreateTime"),
                 )
 
-                # CloudWatch 지표 조회
-                _fetch_cloudwatch_metrics(cloudwatch, cluster, cluster_id, "CacheClusterId", start_time, now)
                 clusters.append(cluster)
     except ClientError:
         pass
 
+    # CloudWatch 지표 배치 조회
+    _fetch_cloudwatch_metrics(cloudwatch, clusters, "CacheClusterId", start_time, now)
+
     return clusters
 
 
-def _fetch_cloudwatch_metrics(
-    cloudwatch, cluster: ClusterInfo, cluster_id: str, dimension_name: str, start_time, end_time
-):
-    """개별 클러스터의 CurrConnections, CPUUtilization CloudWatch 지표를 조회한다.
+def _fetch_cloudwatch_metrics(cloudwatch, clusters: list[ClusterInfo], dimension_name: str, start_time, end_time):
+    """클러스터 전체의 CurrConnections, CPUUtilization CloudWatch 지표를 배치 조회한다.
 
     Args:
         cloudwatch: CloudWatch boto3 client.
-        cluster: 지표를 설정할 ClusterInfo 객체 (in-place 수정).
-        cluster_id: CloudWatch Dimension 값.
+        clusters: 지표를 설정할 ClusterInfo 목록 (in-place 수정).
         dimension_name: CloudWatch Dimension 이름 (ReplicationGroupId 또는 CacheClusterId).
         start_time: 조회 시작 시각.
         end_time: 조회 종료 시각.
     """
     from botocore.exceptions import ClientError
 
+    from core.shared.aws.metrics import batch_get_metric_series, build_elasticache_metric_queries, sanitize_metric_id
+
+    if not clusters:
+        return
+
     try:
-        # CurrConnections
-        conn_resp = cloudwatch.get_metric_statistics(
-            Namespace="AWS/ElastiCache",
-            MetricName="CurrConnections",
-            Dimensions=[{"Name": dimension_name, "Value": cluster_id}],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=86400,
-            Statistics=["Average"],
-        )
-        if conn_resp.get("Datapoints"):
-            cluster.avg_connections = sum(d["Average"] for d in conn_resp["Datapoints"]) / len(conn_resp["Datapoints"])
-
-        # CPUUtilization
-        cpu_resp = cloudwatch.get_metric_statistics(
-            Namespace="AWS/ElastiCache",
-            MetricName="CPUUtilization",
-            Dimensions=[{"Name": dimension_name, "Value": cluster_id}],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=86400,
-            Statistics=["Average"],
-        )
-        if cpu_resp.get("Datapoints"):
-            cluster.avg_cpu = sum(d["Average"] for d in cpu_resp["Datapoints"]) / len(cpu_resp["Datapoints"])
+        queries = build_elasticache_metric_queries([c.cluster_id for c in clusters], dimension_name=dimension_name)
+        series = batch_get_metric_series(cloudwatch, queries, start_time, end_time, period=86400)
     except ClientError:
-        pass
+        return
+
+    # 일별 평균의 평균 (datapoint가 있는 날 기준)
+    for cluster in clusters:
+        safe_id = sanitize_metric_id(cluster.cluster_id)
+        cluster.avg_connections = series[f"{safe_id}_currconnections_avg"].mean()
+        cluster.avg_cpu = series[f"{safe_id}_cpuutilization_avg"].mean()
 
 
 # =============================================================================
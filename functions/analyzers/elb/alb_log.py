@@ -131,25 +131,17 @@ def run(ctx: ExecutionContext) -> None:
             max_workers=5,
         )
 
-        # Step 2: 로그 다운로드
-        print_step_header(2, "로그 다운로드 및 압축 해제 중...")
-        downloaded_files = analyzer.download_logs()
-        if not downloaded_files:
+        # Step 2: 로그 다운로드 + DuckDB 적재 (.gz 직접 읽기, 다운로드와 적재를 배치 단위로 병행)
+        print_step_header(2, "로그 다운로드 및 적재 중...")
+        loaded_files = analyzer.download_and_load_logs()
+        if not loaded_files:
             print_sub_warning("요청 범위에 해당하는 ALB 로그 파일이 없습니다.")
             print_sub_info("ALB는 5분 단위로 파일을 생성하며, 트래픽이 없으면 파일이 생성되지 않을 수 있습니다.")
             return
 
-        # 압축 해제
-        if isinstance(downloaded_files, list) and downloaded_files:
-            gz_directory = os.path.dirname(downloaded_files[0]) if isinstance(downloaded_files[0], str) else gz_dir
-        else:
-            gz_directory = gz_dir
-
-        log_directory = analyzer.decompress_logs(gz_directory)
-
         # Step 3: 로그 분석
         print_step_header(3, "로그 분석 중...")
-        analysis_results = analyzer.analyze_logs(log_directory)
+        analysis_results = analyzer.analyze_logs()
 
         # abuse_ips 처리
         if isinstance(analysis_results.get("abuse_ips"), (dict, set)):
@@ -172,7 +164,7 @@ def run(ctx: ExecutionContext) -> None:
         print_report_complete(report_paths)
 
         # Step 5: 임시 파일 정리
-        _cleanup_temp_files(analyzer, gz_directory, log_directory)
+        _cleanup_temp_files(analyzer, gz_dir, log_dir)
 
         # 자동으로 보고서 폴더 열기 (Excel이 있으면 Explorer로, HTML만 있으면 브라우저로)
         if report_paths.get("excel"):
@@ -12,6 +12,7 @@ Lambda Provisioned Concurrency 최적화 분석:
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -20,6 +21,13 @@ from typing import TYPE_CHECKING
 from rich.console import Console
 
 from core.parallel import get_client, is_quiet, parallel_collect
+from core.parallel.decorators import get_error_code
+from core.shared.aws.metrics import (
+    MetricQuery,
+    batch_get_metric_series,
+    batch_get_metrics,
+    build_lambda_concurrency_metric_queries,
+)
 from core.shared.aws.pricing import get_lambda_provisioned_monthly_cost
 from core.shared.io.output import OutputPath, get_context_identifier, open_in_explorer
 
@@ -27,6 +35,7 @@ if TYPE_CHECKING:
     from core.cli.flow.context import ExecutionContext
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 # 필요한 AWS 권한 목록
 REQUIRED_PERMISSIONS = {
@@ -34,7 +43,7 @@ REQUIRED_PERMISSIONS = {
         "lambda:ListFunctions",
         "lambda:ListProvisionedConcurrencyConfigs",
         "lambda:GetFunctionConcurrency",
-        "cloudwatch:GetMetricStatistics",
+        "cloudwatch:GetMetricData",
     ],
 }
 
@@ -268,60 +277,6 @@ def collect_pc_info(
                 except ClientError:
                     pass
 
-                # CloudWatch 메트릭
-                dimensions = [{"Name": "FunctionName", "Value": function_name}]
-
-                # Invocations
-                try:
-                    inv_response = cloudwatch.get_metric_statistics(
-                        Namespace="AWS/Lambda",
-                        MetricName="Invocations",
-                        Dimensions=dimensions,
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=86400 * 30,
-                        Statistics=["Sum"],
-                    )
-                    for dp in inv_response.get("Datapoints", []):
-                        info.invocations_30d += int(dp.get("Sum", 0))
-                except ClientError:
-                    pass
-
-                # ConcurrentExecutions
-                try:
-                    conc_response = cloudwatch.get_metric_statistics(
-                        Namespace="AWS/Lambda",
-                        MetricName="ConcurrentExecutions",
-                        Dimensions=dimensions,
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=3600,  # 1시간 단위
-                        Statistics=["Maximum", "Average"],
-                    )
-                    for dp in conc_response.get("Datapoints", []):
-                        max_val = int(dp.get("Maximum", 0))
-                        if max_val > info.max_concurrent:
-                            info.max_concurrent = max_val
-                        info.avg_concurrent = max(info.avg_concurrent, dp.get("Average", 0))
-                except ClientError:
-                    pass
-
-                # Throttles
-                try:
-                    throttle_response = cloudwatch.get_metric_statistics(
-                        Namespace="AWS/Lambda",
-                        MetricName="Throttles",
-                        Dimensions=dimensions,
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=86400 * 30,
-                        Statistics=["Sum"],
-                    )
-                    for dp in throttle_response.get("Datapoints", []):
-                        info.throttles_30d += int(dp.get("Sum", 0))
-                except ClientError:
-                    pass
-
                 # 비용 계산
                 if info.total_provisioned > 0:
                     info.monthly_cost = get_lambda_provisioned_monthly_cost(
@@ -332,6 +287,9 @@ def collect_pc_info(
 
                 functions.append(info)
 
+        # CloudWatch 메트릭 배치 조회
+        _collect_pc_metrics(cloudwatch, functions, start_time, end_time)
+
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "Unknown")
         if not is_quiet():
@@ -340,6 +298,77 @@ def collect_pc_info(
     return functions
 
 
+def _build_pc_total_queries(function_names: list[str]) -> list[MetricQuery]:
+    """함수별 Invocations/Throttles 합계 쿼리를 목록 순서 기반 ID(m{i}_...)로 생성한다.
+
+    Args:
+        function_names: Lambda 함수 이름 목록.
+
+    Returns:
+        MetricQuery 목록 (ID: m{i}_invocations_sum / m{i}_throttles_sum).
+    """
+    return [
+        MetricQuery(
+            id=f"m{i}_{metric.lower()}_sum",
+            namespace="AWS/Lambda",
+            metric_name=metric,
+            dimensions={"FunctionName": name},
+            stat="Sum",
+        )
+        for i, name in enumerate(function_names)
+        for metric in ("Invocations", "Throttles")
+    ]
+
+
+def _collect_pc_metrics(cloudwatch, functions: list[LambdaPCInfo], start_time: datetime, end_time: datetime) -> None:
+    """함수 전체의 Invocations/Throttles 합계와 시간 단위 ConcurrentExecutions를 배치 조회한다.
+
+    함수 이름은 sanitize 결과가 겹칠 수 있으므로(my-func / my.func) 쿼리 ID는
+    목록 순서 기반(m{i}_...)이며, 조회 실패는 경고로 남긴다.
+
+    Args:
+        cloudwatch: CloudWatch boto3 클라이언트.
+        functions: 메트릭을 설정할 LambdaPCInfo 목록 (in-place 수정).
+        start_time: 조회 시작 시각.
+        end_time: 조회 종료 시각.
+    """
+    from botocore.exceptions import ClientError
+
+    if not functions:
+        return
+
+    names = [info.function_name for info in functions]
+
+    try:
+        totals = batch_get_metrics(
+            cloudwatch,
+            _build_pc_total_queries(names),
+            start_time,
+            end_time,
+            period=86400,
+        )
+        for i, info in enumerate(functions):
+            info.invocations_30d = int(totals.get(f"m{i}_invocations_sum", 0))
+            info.throttles_30d = int(totals.get(f"m{i}_throttles_sum", 0))
+    except ClientError as e:
+        logger.warning(f"Lambda 호출 지표 조회 실패 ({len(names)}개 함수): {get_error_code(e)}")
+
+    # ConcurrentExecutions (1시간 단위)
+    try:
+        series = batch_get_metric_series(
+            cloudwatch,
+            build_lambda_concurrency_metric_queries(names),
+            start_time,
+            end_time,
+            period=3600,
+        )
+        for i, info in enumerate(functions):
+            info.max_concurrent = int(series[f"m{i}_concurrentexecutions_max"].max())
+            info.avg_concurrent = series[f"m{i}_concurrentexecutions_avg"].max()
+    except ClientError as e:
+        logger.warning(f"Lambda 동시 실행 지표 조회 실패 ({len(names)}개 함수): {get_error_code(e)}")
+
+
 # =============================================================================
 # 분석
 # =============================================================================
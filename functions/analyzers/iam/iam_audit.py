@@ -82,11 +82,11 @@ def run(ctx: ExecutionContext) -> None:
     """
     console.print("[bold]IAM 종합 점검 시작...[/bold]")
 
-    # 1. 데이터 수집 (IAM은 글로벌이지만 병렬 처리 프레임워크 사용)
+    # 1. 데이터 수집 (IAM은 글로벌 서비스 - 계정당 1개 태스크)
     console.print("[#FF9900]Step 1: IAM 데이터 수집 중...[/#FF9900]")
 
     # 병렬 수집 및 분석
-    result = parallel_collect(ctx, _collect_and_analyze, max_workers=20, service="iam")
+    result = parallel_collect(ctx, _collect_and_analyze, max_workers=20, service="iam", scope="account")
 
     # 결과 분리
     all_results = []
@@ -34,7 +34,8 @@ UNUSED_ROLE_THRESHOLD_DAYS = 365
 def _collect_role_data(session, account_id: str, account_name: str, region: str) -> IAMData | None:
     """parallel_collect 콜백: 단일 계정의 IAM 데이터를 수집한다.
 
-    IAM은 글로벌 서비스이므로 region 파라미터는 사용되지 않는다.
+    IAM은 글로벌 서비스이므로 region 파라미터는 사용되지 않으며, ``scope="account"`` 로
+    계정당 한 번만 실행된다.
 
     Args:
         session: boto3 Session.
@@ -64,7 +65,7 @@ def run(ctx: ExecutionContext) -> None:
     # 1. 데이터 수집
     console.print("[#FF9900]Step 1: IAM 데이터 수집 중...[/#FF9900]")
 
-    result = parallel_collect(ctx, _collect_role_data, max_workers=20, service="iam")
+    result = parallel_collect(ctx, _collect_role_data, max_workers=20, service="iam", scope="account")
 
     # 결과 수집
     iam_data_list: list[IAMData] = []
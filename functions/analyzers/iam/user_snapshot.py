@@ -30,7 +30,8 @@ console = Console()
 def _collect_user_data(session, account_id: str, account_name: str, region: str) -> IAMData | None:
     """parallel_collect 콜백: 단일 계정의 IAM 사용자 데이터를 수집한다.
 
-    IAM은 글로벌 서비스이므로 region 파라미터는 사용되지 않는다.
+    IAM은 글로벌 서비스이므로 region 파라미터는 사용되지 않으며, ``scope="account"`` 로
+    계정당 한 번만 실행된다.
 
     Args:
         session: boto3 Session.
@@ -59,7 +60,7 @@ def run(ctx: ExecutionContext) -> None:
     # 1. 데이터 수집
     console.print("[#FF9900]Step 1: IAM 데이터 수집 중...[/#FF9900]")
 
-    result = parallel_collect(ctx, _collect_user_data, max_workers=20, service="iam")
+    result = parallel_collect(ctx, _collect_user_data, max_workers=20, service="iam", scope="account")
 
     # 결과 수집
     iam_data_list: list[IAMData] = []
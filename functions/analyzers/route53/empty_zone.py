@@ -341,7 +341,7 @@ def _collect_and_analyze(session, account_id: str, account_name: str, region: st
     """단일 계정의 Hosted Zone을 수집하고 분석한다.
 
     parallel_collect 콜백으로 사용된다. Route53는 글로벌 서비스이므로 region 파라미터는
-    무시되며, parallel_collect의 중복 제거가 계정당 한 번만 실행되도록 보장한다.
+    무시되며, ``scope="account"`` 로 계정당 한 번만 실행된다.
 
     Args:
         session: boto3 Session 객체.
@@ -368,7 +368,7 @@ def run(ctx: ExecutionContext) -> None:
     """
     console.print("[bold]Route53 빈 Hosted Zone 분석 시작...[/bold]\n")
 
-    result = parallel_collect(ctx, _collect_and_analyze, max_workers=20, service="route53")
+    result = parallel_collect(ctx, _collect_and_analyze, max_workers=20, service="route53", scope="account")
     results: list[Route53AnalysisResult] = [r for r in result.get_data() if r is not None]
 
     if result.error_count > 0:
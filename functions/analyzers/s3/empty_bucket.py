@@ -9,6 +9,7 @@ functions/analyzers/s3/empty_bucket.py - 빈 S3 버킷 탐지
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -17,12 +18,15 @@ from typing import TYPE_CHECKING
 from rich.console import Console
 
 from core.parallel import get_client, parallel_collect
+from core.parallel.decorators import get_error_code
+from core.shared.aws.metrics import batch_get_metric_series, build_s3_storage_metric_queries
 from core.shared.io.output import OutputPath, get_context_identifier, open_in_explorer
 
 if TYPE_CHECKING:
     from core.cli.flow.context import ExecutionContext
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 # 필요한 AWS 권한 목록
 REQUIRED_PERMISSIONS = {
@@ -34,6 +38,7 @@ REQUIRED_PERMISSIONS = {
         "s3:GetBucketLogging",
         "s3:GetBucketReplication",
         "s3:ListBucket",
+        "cloudwatch:GetMetricData",
     ],
 }
 
@@ -171,66 +176,63 @@ def get_bucket_region(s3_client, bucket_name: str) -> str:
         return "unknown"
 
 
-def get_bucket_size_from_cloudwatch(cw_client, bucket_name: str) -> tuple:
-    """CloudWatch 메트릭에서 버킷 크기와 객체 수를 조회한다.
+def get_bucket_sizes_from_cloudwatch(cw_client, bucket_names: list[str]) -> dict[str, tuple[int, int]]:
+    """CloudWatch 메트릭에서 여러 버킷의 크기와 객체 수를 한 번에 조회한다.
 
-    BucketSizeBytes와 NumberOfObjects 메트릭을 사용하며,
-    ListObjects 대비 API 비용이 적다.
+    BucketSizeBytes와 NumberOfObjects 메트릭을 GetMetricData 배치로 조회하며,
+    버킷별 ListObjects 대비 API 호출이 적다. 하루 1회 기록되는 메트릭이므로
+    최근 2일 중 마지막 datapoint 값을 사용한다.
 
     Args:
-        cw_client: CloudWatch 클라이언트.
-        bucket_name: 버킷 이름.
+        cw_client: 버킷 리전의 CloudWatch 클라이언트.
+        bucket_names: 같은 리전의 버킷 이름 목록.
 
     Returns:
-        (크기 바이트, 객체 수, 성공 여부) 튜플.
+        {버킷 이름: (크기 바이트, 객체 수)}. 조회 실패 시 경고를 남기고 빈 딕셔너리
+        (호출자는 ListObjectsV2로 확인).
     """
     from botocore.exceptions import ClientError
 
-    try:
-        now = datetime.now(timezone.utc)
-        start_time = now - timedelta(days=2)
-
-        # BucketSizeBytes 메트릭
-        size_response = cw_client.get_metric_statistics(
-            Namespace="AWS/S3",
-            MetricName="BucketSizeBytes",
-            Dimensions=[
-                {"Name": "BucketName", "Value": bucket_name},
-                {"Name": "StorageType", "Value": "StandardStorage"},
-            ],
-            StartTime=start_time,
-            EndTime=now,
-            Period=86400,
-            Statistics=["Average"],
-        )
+    if not bucket_names:
+        return {}
 
-        # NumberOfObjects 메트릭
-        count_response = cw_client.get_metric_statistics(
-            Namespace="AWS/S3",
-            MetricName="NumberOfObjects",
-            Dimensions=[
-                {"Name": "BucketName", "Value": bucket_name},
-                {"Name": "StorageType", "Value": "AllStorageTypes"},
-            ],
-            StartTime=start_time,
-            EndTime=now,
-            Period=86400,
-            Statistics=["Average"],
+    now = datetime.now(timezone.utc)
+    start_time = now - timedelta(days=2)
+
+    try:
+        queries = build_s3_storage_metric_queries(bucket_names)
+        series = batch_get_metric_series(cw_client, queries, start_time, now, period=86400)
+    except ClientError as e:
+        logger.warning(f"S3 스토리지 지표 조회 실패 ({len(bucket_names)}개 버킷): {get_error_code(e)}")
+        return {}
+
+    # 쿼리 ID는 버킷 목록 순서 기반 (m{i}_...)
+    sizes: dict[str, tuple[int, int]] = {}
+    for i, bucket_name in enumerate(bucket_names):
+        sizes[bucket_name] = (
+            int(series[f"m{i}_bucketsizebytes_avg"].last()),
+            int(series[f"m{i}_numberofobjects_avg"].last()),
         )
+    return sizes
 
-        size = 0
-        count = 0
 
-        if size_response.get("Datapoints"):
-            size = int(size_response["Datapoints"][-1].get("Average", 0))
+def get_bucket_size_from_cloudwatch(cw_client, bucket_name: str) -> tuple:
+    """CloudWatch 메트릭에서 단일 버킷의 크기와 객체 수를 조회한다.
 
-        if count_response.get("Datapoints"):
-            count = int(count_response["Datapoints"][-1].get("Average", 0))
+    여러 버킷을 조회할 때는 get_bucket_sizes_from_cloudwatch()를 사용한다.
 
-        return size, count, True
+    Args:
+        cw_client: CloudWatch 클라이언트.
+        bucket_name: 버킷 이름.
 
-    except ClientError:
+    Returns:
+        (크기 바이트, 객체 수, 성공 여부) 튜플.
+    """
+    sizes = get_bucket_sizes_from_cloudwatch(cw_client, [bucket_name])
+    if bucket_name not in sizes:
         return 0, 0, False
+    size, count = sizes[bucket_name]
+    return size, count, True
 
 
 def collect_buckets(session, account_id: str, account_name: str) -> list[BucketInfo]:
@@ -257,31 +259,38 @@ def collect_buckets(session, account_id: str, account_name: str) -> list[BucketI
     except ClientError:
         return []
 
+    bucket_infos: list[BucketInfo] = []
     for bucket in response.get("Buckets", []):
         bucket_name = bucket.get("Name", "")
-        region = get_bucket_region(s3, bucket_name)
-
-        bucket_info = BucketInfo(
-            account_id=account_id,
-            account_name=account_name,
-            name=bucket_name,
-            region=region,
-            created_at=bucket.get("CreationDate"),
+        bucket_infos.append(
+            BucketInfo(
+                account_id=account_id,
+                account_name=account_name,
+                name=bucket_name,
+                region=get_bucket_region(s3, bucket_name),
+                created_at=bucket.get("CreationDate"),
+            )
         )
 
-        # CloudWatch에서 크기/객체수 조회 시도
+    # CloudWatch에서 크기/객체수 조회 (리전별 1회 배치 조회)
+    by_region: dict[str, list[BucketInfo]] = {}
+    for bucket_info in bucket_infos:
+        cw_region = bucket_info.region if bucket_info.region != "unknown" else "us-east-1"
+        by_region.setdefault(cw_region, []).append(bucket_info)
+
+    for cw_region, region_buckets in by_region.items():
         try:
-            cw = get_client(
-                session,
-                "cloudwatch",
-                region_name=region if region != "unknown" else "us-east-1",
-            )
-            size, count, success = get_bucket_size_from_cloudwatch(cw, bucket_name)
-            if success:
-                bucket_info.total_size_bytes = size
-                bucket_info.object_count = count
+            cw = get_client(session, "cloudwatch", region_name=cw_region)
+            sizes = get_bucket_sizes_from_cloudwatch(cw, [b.name for b in region_buckets])
         except ClientError:
-            pass
+            continue
+        for bucket_info in region_buckets:
+            if bucket_info.name in sizes:
+                bucket_info.total_size_bytes, bucket_info.object_count = sizes[bucket_info.name]
+
+    for bucket_info in bucket_infos:
+        bucket_name = bucket_info.name
+        region = bucket_info.region
 
         # CloudWatch 메트릭이 없으면 list_objects_v2로 확인 (첫 1000개만)
         if bucket_info.object_count == 0:
@@ -501,7 +510,7 @@ def _collect_and_analyze(session, account_id: str, account_name: str, region: st
     """단일 계정의 S3 버킷을 수집하고 분석한다.
 
     parallel_collect 콜백으로 사용된다. S3는 글로벌 서비스이므로 region 파라미터는
-    무시되며, parallel_collect의 중복 제거가 계정당 한 번만 실행되도록 보장한다.
+    무시되며, ``scope="account"`` 로 계정당 한 번만 실행된다.
 
     Args:
         session: boto3 Session 객체.
@@ -528,7 +537,7 @@ def run(ctx: ExecutionContext) -> None:
     """
     console.print("[bold]S3 빈 버킷 분석 시작...[/bold]\n")
 
-    result = parallel_collect(ctx, _collect_and_analyze, max_workers=20, service="s3")
+    result = parallel_collect(ctx, _collect_and_analyze, max_workers=20, service="s3", scope="account")
     results: list[S3AnalysisResult] = [r for r in result.get_data() if r is not None]
 
     if result.error_count > 0:
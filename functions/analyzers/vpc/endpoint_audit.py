@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING
 from rich.console import Console
 
 from core.parallel import get_client, parallel_collect
+from core.shared.aws.metrics import batch_get_metric_series, build_vpc_endpoint_metric_queries, sanitize_metric_id
 from core.shared.aws.pricing import get_endpoint_monthly_cost
 from core.shared.io.output import OutputPath, get_context_identifier, open_in_explorer
 
@@ -29,7 +30,7 @@ console = Console()
 REQUIRED_PERMISSIONS = {
     "read": [
         "ec2:DescribeVpcEndpoints",
-        "cloudwatch:GetMetricStatistics",
+        "cloudwatch:GetMetricData",
     ],
 }
 
@@ -193,53 +194,45 @@ def collect_endpoints(session, account_id: str, account_name: str, region: str)
     return endpoints
 
 
-def check_endpoint_usage(session, region: str, endpoint_id: str, days: int = 7) -> bool:
-    """CloudWatch 메트릭으로 Endpoint 사용량 확인
+def check_endpoints_usage(session, region: str, endpoints: list[VPCEndpointInfo], days: int = 7) -> dict[str, bool]:
+    """CloudWatch 메트릭으로 Interface Endpoint 사용량을 일괄 확인
 
-    PrivateLinkEndpoints의 BytesProcessed 메트릭을 조회하여
-    트래픽 존재 여부를 확인합니다.
+    PrivateLinkEndpoints의 BytesProcessed 메트릭을 GetMetricData 배치로 조회하여
+    Endpoint별 트래픽 존재 여부를 확인합니다.
 
     Args:
         session: boto3 Session 객체
         region: AWS 리전
-        endpoint_id: VPC Endpoint ID
+        endpoints: 확인할 VPC Endpoint 목록 (Interface 유형)
         days: 분석 기간 (일, 기본 7일)
 
     Returns:
-        트래픽이 있으면 True. 메트릭 없으면 보수적으로 True 반환.
+        {endpoint_id: 트래픽 여부}. 메트릭 없거나 조회 실패 시 보수적으로 True.
     """
     from botocore.exceptions import ClientError
 
+    usage = {ep.endpoint_id: True for ep in endpoints}
+    if not endpoints:
+        return usage
+
     cloudwatch = get_client(session, "cloudwatch", region_name=region)
 
     end_time = datetime.now(timezone.utc)
     start_time = end_time - timedelta(days=days)
 
     try:
-        # PrivateLink 메트릭 확인
-        response = cloudwatch.get_metric_statistics(
-            Namespace="AWS/PrivateLinkEndpoints",
-            MetricName="BytesProcessed",
-            Dimensions=[
-                {"Name": "VPC Id", "Value": endpoint_id.split("-")[0]},  # Approximation
-                {"Name": "Endpoint Type", "Value": "Interface"},
-            ],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=86400,  # 1 day
-            Statistics=["Sum"],
-        )
-
-        datapoints = response.get("Datapoints", [])
-        if datapoints:
-            total_bytes = sum(dp.get("Sum", 0) for dp in datapoints)
-            return bool(total_bytes > 0)
-
+        queries = build_vpc_endpoint_metric_queries([(ep.endpoint_id, ep.vpc_id, ep.service_name) for ep in endpoints])
+        series = batch_get_metric_series(cloudwatch, queries, start_time, end_time, period=86400)
     except ClientError:
-        pass
+        return usage
+
+    for ep in endpoints:
+        bytes_processed = series[f"{sanitize_metric_id(ep.endpoint_id)}_bytesprocessed_sum"]
+        # 메트릭이 없으면 사용 중으로 간주 (보수적 접근)
+        if bytes_processed.count():
+            usage[ep.endpoint_id] = bytes_processed.sum() > 0
 
-    # 메트릭이 없으면 사용 중으로 간주 (보수적 접근)
-    return True
+    return usage
 
 
 # =============================================================================
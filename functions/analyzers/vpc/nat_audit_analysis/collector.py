@@ -21,7 +21,7 @@ from datetime import datetime, timedelta, timezone
 from botocore.exceptions import ClientError
 
 from core.parallel import get_client
-from core.shared.aws.metrics import MetricQuery, batch_get_metrics, sanitize_metric_id
+from core.shared.aws.metrics import batch_get_metric_series, build_nat_metric_queries, sanitize_metric_id
 
 logger = logging.getLogger(__name__)
 
@@ -268,11 +268,12 @@ class NATCollector:
         - PacketsInFromSource: 들어온 패킷 수
         - ActiveConnectionCount: 활성 연결 수
         - ConnectionAttemptCount: 연결 시도 수
+
+        BytesOutToDestination은 일별 시계열로 받아 daily_bytes_out/days_with_traffic을 계산한다.
         """
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(days=self.METRIC_PERIOD_DAYS)
 
-        # 모든 NAT의 메트릭 쿼리 생성
         metrics_to_fetch = [
             ("BytesOutToDestination", "bytes_out_total"),
             ("BytesInFromSource", "bytes_in_total"),
@@ -282,94 +283,34 @@ class NATCollector:
             ("ConnectionAttemptCount", "connection_attempt_count"),
         ]
 
-        queries = []
-        for nat in nat_gateways:
-            safe_id = sanitize_metric_id(nat.nat_gateway_id)
-            for metric_name, _ in metrics_to_fetch:
-                metric_key = metric_name.lower()
-                queries.append(
-                    MetricQuery(
-                        id=f"{safe_id}_{metric_key}",
-                        namespace="AWS/NATGateway",
-                        metric_name=metric_name,
-                        dimensions={"NatGatewayId": nat.nat_gateway_id},
-                        stat="Sum",
-                    )
-                )
+        # 모든 NAT의 메트릭 쿼리 생성
+        queries = build_nat_metric_queries(
+            [nat.nat_gateway_id for nat in nat_gateways],
+            [metric_name for metric_name, _ in metrics_to_fetch],
+        )
 
         # 배치 조회
         try:
-            results = batch_get_metrics(cloudwatch, queries, start_time, end_time, period=86400)
+            series = batch_get_metric_series(cloudwatch, queries, start_time, end_time, period=86400)
 
             # 결과 매핑
             for nat in nat_gateways:
                 safe_id = sanitize_metric_id(nat.nat_gateway_id)
 
                 for metric_name, attr_name in metrics_to_fetch:
-                    metric_key = metric_name.lower()
-                    value = results.get(f"{safe_id}_{metric_key}", 0.0)
-                    setattr(nat, attr_name, value)
-
-                # days_with_traffic는 BytesOut 기반으로 추정
-                # (정확한 일별 데이터는 별도 조회 필요)
-                if nat.bytes_out_total > 0:
-                    # 트래픽이 있으면 일부 날에 트래픽이 있었다고 가정
-                    nat.days_with_traffic = min(
-                        self.METRIC_PERIOD_DAYS, max(1, int(nat.bytes_out_total / (1024 * 1024)))
-                    )
-                else:
-                    nat.days_with_traffic = 0
+                    setattr(nat, attr_name, series[f"{safe_id}_{metric_name.lower()}_sum"].sum())
+
+                bytes_out = series[f"{safe_id}_bytesouttodestination_sum"]
+                nat.daily_bytes_out = [value for _, value in bytes_out]
+                nat.days_with_traffic = bytes_out.days_active()
 
         except ClientError as e:
             logger.warning(f"NAT 메트릭 배치 조회 실패: {e}")
-            # 실패 시 개별 조회로 폴백
-            for nat in nat_gateways:
-                self._collect_metrics_single(cloudwatch, nat, start_time, end_time, metrics_to_fetch)
 
         # 비용 계산
         for nat in nat_gateways:
             self._calculate_costs(nat)
 
-    def _collect_metrics_single(
-        self,
-        cloudwatch,
-        nat: NATGateway,
-        start_time: datetime,
-        end_time: datetime,
-        metrics_to_fetch: list[tuple[str, str]],
-    ) -> None:
-        """단일 NAT Gateway의 메트릭을 개별 API 호출로 수집한다 (배치 실패 시 폴백)."""
-        dimensions = [{"Name": "NatGatewayId", "Value": nat.nat_gateway_id}]
-
-        for metric_name, attr_name in metrics_to_fetch:
-            try:
-                response = cloudwatch.get_metric_statistics(
-                    Namespace="AWS/NATGateway",
-                    MetricName=metric_name,
-                    Dimensions=dimensions,
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=86400,
-                    Statistics=["Sum"],
-                )
-
-                datapoints = response.get("Datapoints", [])
-
-                if datapoints:
-                    total = sum(dp.get("Sum", 0) for dp in datapoints)
-                    setattr(nat, attr_name, total)
-
-                    if metric_name == "BytesOutToDestination":
-                        sorted_points = sorted(datapoints, key=lambda x: x["Timestamp"])
-                        nat.daily_bytes_out = [dp.get("Sum", 0) for dp in sorted_points]
-                        nat.days_with_traffic = sum(1 for dp in datapoints if dp.get("Sum", 0) > 0)
-
-            except ClientError as e:
-                logger.debug(f"메트릭 조회 실패 [{nat.nat_gateway_id}/{metric_name}]: {e}")
-
-        # 비용 계산
-        self._calculate_costs(nat)
-
     def _calculate_costs(self, nat: NATGateway) -> None:
         """NAT Gateway의 월간 고정 비용과 데이터 처리 비용을 계산한다."""
         from core.shared.aws.pricing import get_nat_data_price, get_nat_monthly_fixed_cost
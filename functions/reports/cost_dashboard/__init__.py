@@ -12,7 +12,7 @@ AWS 전 서비스에 걸쳐 미사용 리소스를 병렬로 수집하고 분석
     - 기타: Route53, API Gateway, EventBridge, SQS, SNS
 
 병렬 처리 전략:
-    1. 계정/리전 레벨: ``parallel_collect``로 멀티 계정/리전 병렬 처리
+    1. 계정/리전 레벨: ``parallel_stream``으로 멀티 계정/리전 병렬 처리 (결과는 도착 즉시 병합)
     2. 리소스 타입 레벨: ``ThreadPoolExecutor``로 리소스 유형별 병렬 수집
 
 플러그인 규약:
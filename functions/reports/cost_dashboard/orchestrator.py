@@ -1,7 +1,8 @@
 """functions/reports/cost_dashboard/orchestrator.py - 병렬 수집 오케스트레이션.
 
 세션별 병렬 수집 및 결과 집계 로직을 담당합니다.
-parallel_collect를 통해 멀티 계정/멀티 리전 환경에서 미사용 리소스를 수집하고,
+parallel_stream을 통해 멀티 계정/멀티 리전 환경에서 미사용 리소스를 수집하고
+(세션 결과는 완료 즉시 병합 후 해제),
 ThreadPoolExecutor로 세션 내 리소스별 병렬 수집을 수행합니다.
 """
 
@@ -11,13 +12,15 @@ import re
 import threading
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any
 
-from core.parallel import is_quiet, parallel_collect, quiet_mode, set_quiet
-from core.shared.aws.metrics import SharedMetricCache
+from core.parallel import describe_store_scope, is_quiet, parallel_stream, quiet_mode, set_quiet
+from core.shared.aws.metrics import SharedMetricCache, get_global_cache, persistent_metric_cache
+from core.shared.aws.pricing import pricing_service
 from core.shared.io.output import OutputPath, get_context_identifier, open_in_explorer
 
-from .collectors import REGIONAL_COLLECTORS, collect_route53, collect_s3
+from .collectors import PRICING_SERVICES, REGIONAL_COLLECTORS, collect_route53, collect_s3
 from .report import generate_report
 from .types import (
     RESOURCE_FIELD_MAP,
@@ -28,7 +31,10 @@ from .types import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from core.cli.flow.context import ExecutionContext
+    from core.parallel import TaskResult
 
 from core.cli.ui import (
     console,
@@ -181,7 +187,8 @@ def collect_session_resources(
     Note:
         SharedMetricCache를 사용하여 세션 내 동일 메트릭 중복 조회 방지.
         SharedMetricCache는 스레드 간 공유가 가능하여 ThreadPoolExecutor
-        워커들도 캐시에 접근할 수 있습니다.
+        워커들도 캐시에 접근할 수 있습니다. run()이 실행 간 유지되는 파일 캐시를
+        전역 캐시로 등록한 경우에는 그 캐시를 그대로 사용합니다.
     """
     summary = UnusedResourceSummary(
         account_id=account_id,
@@ -199,7 +206,8 @@ def collect_session_resources(
         collectors_to_run = {k: v for k, v in REGIONAL_COLLECTORS.items() if k in selected_resources}
 
     # SharedMetricCache로 세션 내 메트릭 캐싱 활성화 (스레드 간 공유 가능)
-    with SharedMetricCache():
+    # 전역 캐시(실행 간 파일 캐시)가 이미 있으면 덮어쓰지 않고 공유
+    with SharedMetricCache() if get_global_cache() is None else nullcontext():
         # 리전별 리소스 병렬 수집 (최대 10개 동시 실행)
         with ThreadPoolExecutor(max_workers=10) as executor:
             futures_map: dict[Future[Any], str] = {}
@@ -373,42 +381,69 @@ def run(ctx: ExecutionContext, resources: list[str] | None = None) -> None:
     def collect_wrapper(session, account_id, account_name, region):
         return collect_session_resources(session, account_id, account_name, region, selected_resources=selected)
 
+    # 결과 집계 (세션 결과는 도착 즉시 병합 후 해제)
+    final_result = UnusedAllResult()
+    all_errors: list[str] = []
+    success_count = error_count = 0
+
+    def merge_results(task_results: Iterator[TaskResult[SessionCollectionResult]]) -> None:
+        nonlocal success_count, error_count
+        for task_result in task_results:
+            if task_result.success:
+                success_count += 1
+            else:
+                error_count += 1
+
+            if task_result.success and task_result.data:
+                session_result = task_result.data
+                _merge_session_result(final_result, session_result)
+
+                # 세션별 에러 수집
+                if session_result.errors:
+                    for err in session_result.errors:
+                        all_errors.append(f"{task_result.identifier}/{task_result.region}: {err}")
+            elif task_result.error:
+                all_errors.append(str(task_result.error))
+
     # 병렬 수집 실행 (quiet_mode로 콘솔 출력 억제)
-    # timeline이 ctx에 있으면 parallel_collect가 자동으로 프로그레스 연결
+    # timeline이 ctx에 있으면 parallel_stream이 자동으로 프로그레스 연결
+    # describe_store_scope: EC2/EBS/AMI/Snapshot 수집기가 같은 describe 목록을 공유
+    # persistent_metric_cache: 일 단위 CloudWatch 버킷을 다음 실행에서도 재사용
+    # pricing_service.prefetch: 선택된 수집기의 리전별 가격을 수집 동안 백그라운드로 조회
+    price_services = [svc for key, svc in PRICING_SERVICES.items() if selected is None or key in selected]
     if parallel_progress is not None:
-        with parallel_progress("리소스 수집", console=console) as tracker, quiet_mode():
-            parallel_result = parallel_collect(
-                ctx,
-                collect_wrapper,
-                max_workers=20,
-                service="multi",
-                progress_tracker=tracker,
+        with (
+            parallel_progress("리소스 수집", console=console) as tracker,
+            quiet_mode(),
+            describe_store_scope(),
+            persistent_metric_cache(),
+            pricing_service.prefetch(price_services, ctx.regions),
+        ):
+            merge_results(
+                parallel_stream(
+                    ctx,
+                    collect_wrapper,
+                    max_workers=20,
+                    service="multi",
+                    progress_tracker=tracker,
+                )
             )
     else:
-        with quiet_mode():
-            parallel_result = parallel_collect(
-                ctx,
-                collect_wrapper,
-                max_workers=20,
-                service="multi",
+        with (
+            quiet_mode(),
+            describe_store_scope(),
+            persistent_metric_cache(),
+            pricing_service.prefetch(price_services, ctx.regions),
+        ):
+            merge_results(
+                parallel_stream(
+                    ctx,
+                    collect_wrapper,
+                    max_workers=20,
+                    service="multi",
+                )
             )
 
-    # 결과 집계
-    final_result = UnusedAllResult()
-    all_errors: list[str] = []
-
-    for task_result in parallel_result.results:
-        if task_result.success and task_result.data:
-            session_result = task_result.data
-            _merge_session_result(final_result, session_result)
-
-            # 세션별 에러 수집
-            if session_result.errors:
-                for err in session_result.errors:
-                    all_errors.append(f"{task_result.identifier}/{task_result.region}: {err}")
-        elif task_result.error:
-            all_errors.append(str(task_result.error))
-
     if not final_result.summaries:
         print_warning("분석 결과 없음")
         return
@@ -437,7 +472,7 @@ def run(ctx: ExecutionContext, resources: list[str] | None = None) -> None:
         console.print(f"\n[bold yellow]총 월간 절감 가능: ${total_waste:,.2f}[/bold yellow]")
 
     # 실행 통계
-    print_sub_info(f"계정/리전: {parallel_result.success_count}개 성공, {parallel_result.error_count}개 실패")
+    print_sub_info(f"계정/리전: {success_count}개 성공, {error_count}개 실패")
 
     # 보고서 생성
 
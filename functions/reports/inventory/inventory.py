@@ -1,17 +1,18 @@
 """functions/reports/inventory/inventory.py - 종합 인벤토리 조회 (스트리밍 방식).
 
-60개 리소스 타입을 카테고리별로 수집하여 즉시 Excel에 기록합니다.
+60개 리소스 타입을 하나의 작업 큐로 동시 수집하여 완료되는 즉시 Excel에 기록합니다.
 메모리 효율적인 스트리밍 처리 방식으로 수집 -> 쓰기 -> 해제 순환을 반복합니다.
 
 처리 흐름:
-    1. InventoryCollector를 통해 리소스 수집
-    2. 카테고리별로 Excel 시트에 즉시 기록 (메모리 해제)
+    1. InventoryCollector.collect_many로 (리소스 타입 x 계정 x 리전) 태스크를 한 번에 스케줄링
+    2. 리소스 타입 수집이 끝나는 즉시 Excel 시트에 기록 (메모리 해제, 시트 순서는 정의 순서 유지)
     3. 요약 시트 생성 (전체 리소스 수, 카테고리별 통계, 경고)
     4. Excel 파일 저장 후 탐색기에서 열기
 """
 
 from __future__ import annotations
 
+import bisect
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -78,8 +79,8 @@ class CategoryStats:
 def run(ctx: ExecutionContext) -> None:
     """종합 리소스 인벤토리를 수집하고 Excel 보고서를 생성합니다.
 
-    60개 이상의 리소스 타입을 카테고리별로 스트리밍 수집하여
-    Excel 파일에 기록합니다. 수집 완료 후 요약 시트를 추가하고
+    60개 이상의 리소스 타입을 하나의 공유 작업 큐로 동시 수집하고,
+    타입별 수집이 끝나는 즉시 Excel 파일에 기록합니다. 수집 완료 후 요약 시트를 추가하고
     파일 탐색기에서 결과를 엽니다.
 
     Args:
@@ -103,34 +104,47 @@ def run(ctx: ExecutionContext) -> None:
     categories = _define_categories()
 
     # =========================================================================
-    # 스트리밍 처리: 카테고리별로 수집 → Excel 쓰기 → 메모리 해제
+    # 스트리밍 처리: 전체 (리소스 타입 x 계정 x 리전)을 하나의 작업 큐로 수집하고
+    # 리소스 타입 수집이 끝나는 즉시 Excel 쓰기 → 메모리 해제
     # =========================================================================
+    res_index: dict[str, tuple[int, ResourceDef, CategoryStats]] = {}
     for category in categories:
         stats = CategoryStats(name=category.name)
-
         for res_def in category.resources:
-            with console.status(f"[yellow]{res_def.name} 수집 중...[/yellow]"):
-                # 수집
-                method = getattr(collector, res_def.method)
-                data = method()
-                count = len(data)
-                stats.counts[res_def.name] = count
-                total_resources += count
+            res_index[res_def.method] = (len(res_index), res_def, stats)
+            stats.counts[res_def.name] = 0  # 정의 순서 유지
+        all_stats.append(stats)
 
-                # Excel 쓰기 (데이터가 있을 때만)
-                if data:
-                    sheet = wb.new_sheet(res_def.name, res_def.columns)
-                    for item in data:
-                        sheet.add_row(res_def.row_mapper(item))
+    # 완료 순서와 무관하게 시트를 정의 순서대로 배치하기 위한 기록된 인덱스 목록
+    written: list[int] = []
 
-                    # 특수 경고 수집
-                    _collect_warnings(res_def.name, data, stats)
+    def _on_complete(method: str, data: list) -> None:
+        nonlocal total_resources
+        order, res_def, stats = res_index[method]
+        count = len(data)
+        stats.counts[res_def.name] = count
+        total_resources += count
 
-                # 메모리 해제
-                del data
+        # Excel 쓰기 (데이터가 있을 때만)
+        if data:
+            position = bisect.bisect_left(written, order)
+            bisect.insort(written, order)
+            sheet = wb.new_sheet(res_def.name, res_def.columns, position=position)
+            for item in data:
+                sheet.add_row(res_def.row_mapper(item))
 
-        all_stats.append(stats)
-        console.print(f"[dim]  {category.name}: {sum(stats.counts.values()):,}개 수집 완료[/dim]")
+            # 특수 경고 수집
+            _collect_warnings(res_def.name, data, stats)
+
+        written_types.append(res_def.name)
+        status.update(f"[yellow]리소스 수집 중... ({len(written_types)}/{len(res_index)}) {res_def.name} 완료[/yellow]")
+
+    written_types: list[str] = []
+    with console.status(f"[yellow]{len(res_index)}개 리소스 타입 동시 수집 중...[/yellow]") as status:
+        collector.collect_many(res_index.keys(), on_complete=_on_complete)
+
+    for stats in all_stats:
+        console.print(f"[dim]  {stats.name}: {sum(stats.counts.values()):,}개 수집 완료[/dim]")
 
     # =========================================================================
     # 콘솔 출력
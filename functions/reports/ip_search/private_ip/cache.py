@@ -1,9 +1,10 @@
 """functions/reports/ip_search/private_ip/cache.py - 멀티 프로파일 ENI 캐시 관리.
 
-msgpack 직렬화 기반의 ENI 캐시를 관리합니다.
+mmap 스냅샷 + msgpack 델타 레코드 기반의 ENI 캐시를 관리합니다.
 캐시 파일 명명 규칙: {profile_name}_{account_id}_eni.msgpack
 단일 캐시(ENICache) 및 멀티 캐시 검색(MultiCacheSearch)을 지원하며,
-IP 정렬 배열(bisect)과 보조 인덱스(region, VPC)로 고속 검색을 제공합니다.
+스냅샷의 정렬 IP 열 이진 탐색과 변경분 오버레이(ENI ID 테이블, IP 포스팅,
+보조 인덱스)로 역직렬화 없이 고속 검색을 제공합니다.
 """
 
 from __future__ import annotations
@@ -17,13 +18,26 @@ import time
 from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, cast
+from operator import itemgetter
+from typing import Any
 
 import msgpack
 from botocore.exceptions import ClientError
 
 from core.parallel import ErrorCollector, ErrorSeverity, get_client, safe_collect
 
+from .snapshot import (
+    SNAPSHOT_VERSION,
+    ENISnapshot,
+    eni_ip_list,
+    ip_key,
+    key_to_ip,
+    network_key_range,
+    read_snapshot_meta,
+    write_snapshot,
+)
+from .text_index import ENITextIndex
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -143,6 +157,111 @@ def _parse_cache_filename(filename: str) -> tuple[str, str] | None:
     return parts[0], parts[1]  # profile_name, account_id
 
 
+# =============================================================================
+# Cache File Format
+# =============================================================================
+
+# 캐시 파일은 mmap 스냅샷(snapshot.py) 뒤에 델타 레코드(msgpack)가 이어지는 구조입니다.
+#   델타 레코드: {"v": 3, "enis": {eni_id: eni}, "updated": {eni_id: ts}, "ip_count": n, "regions": [...]}
+#     (모든 ENI가 갱신된 경우 "updated" 대신 "updated_all": ts)
+#     ip_count/regions는 기록 시점의 전체 값으로, 캐시 목록 표시에 사용됩니다.
+# 이전 포맷(IP별 msgpack 맵, v2 msgpack 레코드 스트림)은 로드 시 변환 후 스냅샷으로 재작성됩니다.
+_CACHE_FORMAT_VERSION = SNAPSHOT_VERSION
+
+# 델타 레코드가 이 수에 도달하면 다음 save()에서 스냅샷 재작성 (compaction)
+_MAX_DELTA_RECORDS = 16
+
+# 정렬 IP 배열 변경이 이 수 이하이면 bisect로 삽입/삭제, 초과하면 병합 정렬
+_INSORT_THRESHOLD = 256
+
+_KEY = itemgetter(0)
+
+
+def _convert_datetime(obj: Any) -> Any:
+    """Convert datetime objects to strings for serialization."""
+    if isinstance(obj, dict):
+        return {k: _convert_datetime(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_convert_datetime(e) for e in obj]
+    elif isinstance(obj, datetime):
+        return obj.isoformat()
+    return obj
+
+
+def _eni_key(eni: dict[str, Any], ips: list[str]) -> str:
+    """ENI 테이블 키 (ENI ID, 없으면 리전+IP 조합)."""
+    return eni.get("NetworkInterfaceId") or f"{eni.get('Region', '')}:{','.join(ips)}"
+
+
+def _convert_legacy(data: dict[str, Any]) -> tuple[dict[str, dict[str, Any]], dict[str, float]]:
+    """IP별 ENI 사본을 저장하던 이전 포맷({ip: {"interfaces", "last_accessed"}})을 ENI 테이블로 변환."""
+    enis: dict[str, dict[str, Any]] = {}
+    updated: dict[str, float] = {}
+    for entry in data.values():
+        if not isinstance(entry, dict):
+            continue
+        ts = entry.get("last_accessed", 0)
+        for eni in entry.get("interfaces", []):
+            eni_id = _eni_key(eni, eni_ip_list(eni))
+            enis[eni_id] = eni
+            updated[eni_id] = max(ts, updated.get(eni_id, 0))
+    return enis, updated
+
+
+def _read_msgpack_cache(filepath: str) -> tuple[dict[str, dict[str, Any]], dict[str, float]]:
+    """이전 msgpack 포맷 캐시를 읽어 ENI 테이블 복원.
+
+    Args:
+        filepath: 캐시 파일 경로.
+
+    Returns:
+        (ENI ID -> ENI, ENI ID -> 갱신 시각)
+    """
+    with open(filepath, "rb") as f:
+        unpacker = msgpack.Unpacker(f, raw=False, strict_map_key=False)
+        base = next(unpacker, None)
+        if not isinstance(base, dict):
+            return {}, {}
+        if base.get("v") != 2:
+            return _convert_legacy(base)
+
+        enis = base.get("enis", {})
+        updated = base.get("updated", {})
+        for record in unpacker:
+            if not isinstance(record, dict):
+                break
+            enis.update(record.get("enis", {}))
+            if "updated_all" in record:
+                updated = dict.fromkeys(enis, record["updated_all"])
+            else:
+                updated.update(record.get("updated", {}))
+    return enis, updated
+
+
+def _read_deltas(filepath: str, offset: int) -> tuple[list[dict[str, Any]], bool]:
+    """스냅샷 뒤의 델타 레코드 읽기.
+
+    Args:
+        filepath: 캐시 파일 경로.
+        offset: 스냅샷 끝 오프셋.
+
+    Returns:
+        (델타 레코드 목록, 끝에 잘린 레코드가 있는지 여부)
+    """
+    with open(filepath, "rb") as f:
+        f.seek(offset)
+        unpacker = msgpack.Unpacker(f, raw=False, strict_map_key=False)
+        records = []
+        for record in unpacker:
+            if not isinstance(record, dict):
+                break
+            records.append(record)
+
+        # 저장 중단으로 잘린 마지막 레코드는 버리고 다음 저장에서 재작성
+        truncated = offset + unpacker.tell() < os.fstat(f.fileno()).st_size
+    return records, truncated
+
+
 # =============================================================================
 # Cache Discovery
 # =============================================================================
@@ -152,6 +271,8 @@ def list_available_caches(expiry_hours: int = 24) -> list[CacheInfo]:
     """
     List all available ENI cache files.
 
+    스냅샷 캐시는 헤더 메타와 델타 레코드만 읽고 ENI 레코드는 디코딩하지 않습니다.
+
     Args:
         expiry_hours: Hours after which cache is considered expired
 
@@ -159,7 +280,7 @@ def list_available_caches(expiry_hours: int = 24) -> list[CacheInfo]:
         List of CacheInfo objects
     """
     cache_dir = _get_cache_dir()
-    caches = []
+    caches: list[CacheInfo] = []
 
     if not os.path.exists(cache_dir):
         return caches
@@ -181,27 +302,35 @@ def list_available_caches(expiry_hours: int = 24) -> list[CacheInfo]:
             age_hours = (time.time() - mtime) / 3600
             is_valid = age_hours < expiry_hours
 
-            # Load to get ENI count and regions
-            with open(filepath, "rb") as f:
-                data = cast(dict[str, Any], msgpack.load(f))
-
-            eni_count = len(data)
-            regions: set[str] = set()
-            for entry in data.values():
-                for eni in entry.get("interfaces", []):
-                    region = eni.get("Region")
-                    if region:
-                        regions.add(region)
+            meta = read_snapshot_meta(filepath)
+            if meta is not None:
+                ip_count = meta["ip_count"]
+                regions = list(meta["regions"])
+                deltas, _ = _read_deltas(filepath, meta["snapshot_end"])
+                if deltas and "ip_count" in deltas[-1]:
+                    ip_count = deltas[-1]["ip_count"]
+                    regions = list(deltas[-1].get("regions", regions))
+            else:
+                # 이전 포맷: 전체 로드 후 IP 수/리전 계산
+                enis, _ = _read_msgpack_cache(filepath)
+                ips: set[str] = set()
+                region_set: set[str] = set()
+                for eni in enis.values():
+                    ips.update(eni_ip_list(eni))
+                    if eni.get("Region"):
+                        region_set.add(eni["Region"])
+                ip_count = len(ips)
+                regions = sorted(region_set)
 
             caches.append(
                 CacheInfo(
                     filepath=filepath,
                     profile_name=profile_name,
                     account_id=account_id,
-                    eni_count=eni_count,
+                    eni_count=ip_count,
                     created_at=created_at,
                     is_valid=is_valid,
-                    regions=sorted(regions),
+                    regions=regions,
                 )
             )
         except Exception as e:
@@ -255,8 +384,12 @@ def delete_all_caches() -> int:
 class ENICache:
     """단일 프로파일/계정의 ENI 캐시.
 
-    msgpack 파일로 IP-ENI 매핑을 저장하고, 정렬된 IP 배열과
-    보조 인덱스(region, VPC)를 구축하여 고속 검색을 지원합니다.
+    캐시 파일의 스냅샷은 mmap으로 열어, IP/CIDR 조회는 정렬된 IP 열을 이진 탐색하고
+    ENI 레코드는 결과에 포함될 때만 디코딩합니다.
+    스냅샷 이후 변경된 ENI(델타 레코드, update())는 메모리 오버레이
+    (ENI ID 테이블, IP 포스팅, 정렬 IP 배열, 보조/텍스트 색인)에 두고,
+    오버레이가 대체하거나 만료된 스냅샷 ENI는 가립니다(shadowed).
+    save()는 변경분을 델타 레코드로 추가하고, 필요할 때 스냅샷을 다시 씁니다.
     캐시 파일: {profile}_{account}_eni.msgpack
     """
 
@@ -275,84 +408,302 @@ class ENICache:
         filename = _get_cache_filename(profile_name, account_id)
         self.cache_file = os.path.join(self.cache_dir, filename)
         self.expiry = timedelta(hours=expiry_hours)
-
-        # Cache data
-        self.cache: dict[str, dict[str, Any]] = {}
-        self.sorted_ips: list[ipaddress.IPv4Address | ipaddress.IPv6Address] = []
         self.lock = threading.Lock()
 
-        # Secondary indices
+        # mmap snapshot (ENI ordinal based)
+        self._snapshot: ENISnapshot | None = None
+        self._shadowed: set[int] = set()
+        self._snapshot_updated: dict[int, float] = {}
+        self._updated_floor = 0.0
+
+        # Overlay: ENI table (ENI ID -> ENI) and IP -> ENI ID postings
+        self._enis: dict[str, dict[str, Any]] = {}
+        self._eni_updated: dict[str, float] = {}
+        self._eni_ips: dict[str, list[str]] = {}
+        self._ip_postings: dict[str, list[str]] = {}
+        # (ip_key, ip_str) sorted for CIDR range search
+        self.sorted_ips: list[tuple[bytes, str]] = []
+
+        # Overlay secondary indices (value -> ENI IDs)
         self._region_index: dict[str, set[str]] = {}
         self._vpc_index: dict[str, set[str]] = {}
+        self._text_index: ENITextIndex[str] = ENITextIndex()
+
+        # Changes since last save (delta records)
+        self._dirty: set[str] = set()
+        self._touched: set[str] = set()
+        self._delta_records = 0
+        self._needs_rewrite = True
+        self._ip_count: int | None = None
 
         # Load existing cache
         self._load_cache()
 
     def _load_cache(self) -> None:
-        """Load cache from file."""
+        """Load cache from file (snapshot is memory-mapped, deltas go to the overlay)."""
         if not os.path.exists(self.cache_file):
             return
 
+        deltas: list[dict[str, Any]]
         try:
-            with open(self.cache_file, "rb") as f:
-                data = cast(dict[str, Any], msgpack.load(f))
-
-            current = time.time()
-            expiry_secs = self.expiry.total_seconds()
-
-            self.cache = {
-                ip_str: entry
-                for ip_str, entry in data.items()
-                if isinstance(entry, dict) and current - entry.get("last_accessed", 0) < expiry_secs
-            }
-
-            self._rebuild_indices()
+            snapshot = ENISnapshot.open(self.cache_file)
+            if snapshot is None:
+                enis, updated = _read_msgpack_cache(self.cache_file)
+                deltas, truncated = [], True
+            else:
+                deltas, truncated = _read_deltas(self.cache_file, snapshot.meta["snapshot_end"])
+                enis, updated = {}, {}
         except Exception as e:
             logger.debug("Failed to load cache: %s", e)
-            self.cache = {}
-
-    def _rebuild_indices(self) -> None:
-        """Rebuild IP index and secondary indices."""
-        parsed = []
-        self._region_index.clear()
-        self._vpc_index.clear()
+            return
 
-        for ip_str, entry in self.cache.items():
-            try:
-                parsed.append(ipaddress.ip_address(ip_str))
-            except ValueError:
+        for record in deltas:
+            enis.update(record.get("enis", {}))
+            updated.update(record.get("updated", {}))
+            if "updated_all" in record:
+                self._updated_floor = max(self._updated_floor, record["updated_all"])
+
+        cutoff = time.time() - self.expiry.total_seconds()
+        expired = False
+        self._snapshot = snapshot
+        if snapshot is not None:
+            for eni_id, ts in updated.items():
+                ordinal = snapshot.ordinal_of(eni_id) if eni_id not in enis else None
+                if ordinal is not None:
+                    self._snapshot_updated[ordinal] = ts
+            for eni_id in enis:
+                ordinal = snapshot.ordinal_of(eni_id)
+                if ordinal is not None:
+                    self._shadowed.add(ordinal)
+            if self._updated_floor <= cutoff:
+                for ordinal in range(snapshot.eni_count):
+                    ts = max(snapshot.updated_at(ordinal), self._snapshot_updated.get(ordinal, 0.0))
+                    if ts <= cutoff:
+                        self._shadowed.add(ordinal)
+                        expired = True
+
+        changed: set[tuple[bytes, str]] = set()
+        for eni_id, eni in enis.items():
+            ts = max(updated.get(eni_id, 0), self._updated_floor)
+            if ts <= cutoff or not isinstance(eni, dict):
+                expired = True
                 continue
+            changed.update(self._link(eni_id, eni, eni_ip_list(eni)))
+            self._eni_updated[eni_id] = ts
+
+        self._apply_key_changes(changed)
+        self._delta_records = len(deltas)
+        if deltas and not expired and "ip_count" in deltas[-1]:
+            self._ip_count = deltas[-1]["ip_count"]
+        # 만료 ENI는 스냅샷 재작성으로 파일에서 제거
+        self._needs_rewrite = truncated or expired
+
+    def close(self) -> None:
+        """Release the memory-mapped snapshot."""
+        with self.lock:
+            if self._snapshot is not None:
+                self._snapshot.close()
+                self._snapshot = None
+
+    # =========================================================================
+    # Index maintenance
+    # =========================================================================
+
+    def _live_ordinal(self, eni_id: str) -> int | None:
+        """오버레이에 가려지지 않은 스냅샷 ENI 번호."""
+        if self._snapshot is None:
+            return None
+        ordinal = self._snapshot.ordinal_of(eni_id)
+        if ordinal is None or ordinal in self._shadowed:
+            return None
+        return ordinal
+
+    def _link(self, eni_id: str, eni: dict[str, Any], ips: list[str]) -> list[tuple[bytes, str]]:
+        """ENI를 오버레이 테이블/포스팅/보조 인덱스에 연결하고, 새로 생긴 IP의 정렬 키를 반환."""
+        self._enis[eni_id] = eni
+        self._eni_ips[eni_id] = ips
+
+        new_keys = []
+        for ip in ips:
+            posting = self._ip_postings.get(ip)
+            if posting is None:
+                self._ip_postings[ip] = [eni_id]
+                key = ip_key(ip)
+                if key:
+                    new_keys.append((key, ip))
+            else:
+                posting.append(eni_id)
+
+        region = eni.get("Region", "")
+        if region:
+            self._region_index.setdefault(region, set()).add(eni_id)
+        vpc_id = eni.get("VpcId", "")
+        if vpc_id:
+            self._vpc_index.setdefault(vpc_id, set()).add(eni_id)
+        self._text_index.add(eni_id, eni)
+
+        return new_keys
+
+    def _unlink(self, eni_id: str) -> list[tuple[bytes, str]]:
+        """ENI를 오버레이 인덱스에서 제거하고, 더 이상 참조되지 않는 IP의 정렬 키를 반환."""
+        eni = self._enis.pop(eni_id, None)
+        if eni is None:
+            return []
 
-            for eni in entry.get("interfaces", []):
-                region = eni.get("Region", "")
-                vpc_id = eni.get("VpcId", "")
-
-                if region:
-                    if region not in self._region_index:
-                        self._region_index[region] = set()
-                    self._region_index[region].add(ip_str)
+        gone = []
+        for ip in self._eni_ips.pop(eni_id, []):
+            posting = self._ip_postings.get(ip)
+            if posting is None:
+                continue
+            posting.remove(eni_id)
+            if not posting:
+                del self._ip_postings[ip]
+                key = ip_key(ip)
+                if key:
+                    gone.append((key, ip))
+
+        for index, value in ((self._region_index, eni.get("Region")), (self._vpc_index, eni.get("VpcId"))):
+            if not isinstance(value, str):
+                continue
+            ids = index.get(value)
+            if ids is not None:
+                ids.discard(eni_id)
+                if not ids:
+                    del index[value]
+        self._text_index.remove(eni_id, eni)
+
+        return gone
+
+    def _apply_key_changes(self, keys: set[tuple[bytes, str]]) -> None:
+        """포스팅 상태에 맞춰 정렬 IP 배열에 키를 삽입/삭제."""
+        self._ip_count = None
+        if not keys:
+            return
 
-                if vpc_id:
-                    if vpc_id not in self._vpc_index:
-                        self._vpc_index[vpc_id] = set()
-                    self._vpc_index[vpc_id].add(ip_str)
+        if len(keys) > _INSORT_THRESHOLD:
+            merged = [key for key in self.sorted_ips if key not in keys]
+            merged.extend(key for key in keys if key[1] in self._ip_postings)
+            merged.sort()
+            self.sorted_ips = merged
+            return
 
-        self.sorted_ips = sorted(parsed)
+        for key in keys:
+            idx = bisect_left(self.sorted_ips, key)
+            present = idx < len(self.sorted_ips) and self.sorted_ips[idx] == key
+            if key[1] in self._ip_postings:
+                if not present:
+                    self.sorted_ips.insert(idx, key)
+            elif present:
+                del self.sorted_ips[idx]
+
+    def _reset(self) -> None:
+        """스냅샷을 닫고 오버레이/변경 추적 초기화 (lock 보유 상태에서 호출)."""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+        self._shadowed.clear()
+        self._snapshot_updated.clear()
+        self._updated_floor = 0.0
+        self._enis.clear()
+        self._eni_updated.clear()
+        self._eni_ips.clear()
+        self._ip_postings.clear()
+        self.sorted_ips.clear()
+        self._region_index.clear()
+        self._vpc_index.clear()
+        self._text_index = ENITextIndex()
+        self._dirty.clear()
+        self._touched.clear()
+        self._delta_records = 0
+        self._ip_count = None
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def _live_eni_count(self) -> int:
+        snapshot_count = self._snapshot.eni_count - len(self._shadowed) if self._snapshot else 0
+        return snapshot_count + len(self._enis)
+
+    def _updated_of(self, eni_id: str) -> float:
+        if eni_id in self._eni_updated:
+            return self._eni_updated[eni_id]
+        ordinal = self._live_ordinal(eni_id)
+        if ordinal is None or self._snapshot is None:
+            return 0.0
+        return max(self._snapshot.updated_at(ordinal), self._snapshot_updated.get(ordinal, 0.0))
 
     def save(self) -> None:
-        """Save cache to file."""
-        with self.lock, open(self.cache_file, "wb") as f:
-            msgpack.dump(self._convert_datetime(self.cache), f)
-
-    def _convert_datetime(self, obj: Any) -> Any:
-        """Convert datetime objects to strings for serialization."""
-        if isinstance(obj, dict):
-            return {k: self._convert_datetime(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_datetime(e) for e in obj]
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        return obj
+        """Save cache to file (append delta record, or rewrite snapshot when compaction is due)."""
+        with self.lock:
+            if (
+                self._needs_rewrite
+                or self._snapshot is None
+                or self._delta_records >= _MAX_DELTA_RECORDS
+                or not os.path.exists(self.cache_file)
+            ):
+                self._write_full()
+            elif self._dirty or self._touched:
+                refreshed = self._dirty | self._touched
+                if self._ip_count is None:
+                    self._ip_count = self._compute_ip_count()
+                record: dict[str, Any] = {
+                    "v": _CACHE_FORMAT_VERSION,
+                    "enis": {eni_id: self._enis[eni_id] for eni_id in self._dirty},
+                    "ip_count": self._ip_count,
+                    "regions": self.get_regions(),
+                }
+                if len(refreshed) == self._live_eni_count():
+                    # 전체 재조회: ENI별 시각 대신 가장 이른 갱신 시각 하나만 기록
+                    record["updated_all"] = min(self._updated_of(eni_id) for eni_id in refreshed)
+                else:
+                    record["updated"] = {eni_id: self._updated_of(eni_id) for eni_id in refreshed}
+                with open(self.cache_file, "ab") as f:
+                    f.write(msgpack.packb(record))
+                self._delta_records += 1
+            else:
+                # 변경 없음: 유효기간(mtime)만 갱신
+                os.utime(self.cache_file)
+
+            self._dirty.clear()
+            self._touched.clear()
+
+    def _materialize(self) -> tuple[dict[str, dict[str, Any]], dict[str, float]]:
+        """스냅샷(가려지지 않은 ENI)과 오버레이를 합친 전체 ENI 테이블."""
+        enis: dict[str, dict[str, Any]] = {}
+        updated: dict[str, float] = {}
+        snapshot = self._snapshot
+        if snapshot is not None:
+            for ordinal, eni_id in enumerate(snapshot.ids):
+                if ordinal in self._shadowed:
+                    continue
+                enis[eni_id] = snapshot.decode(ordinal)
+                updated[eni_id] = max(
+                    snapshot.updated_at(ordinal), self._snapshot_updated.get(ordinal, 0.0), self._updated_floor
+                )
+        for eni_id, eni in self._enis.items():
+            enis[eni_id] = eni
+            updated[eni_id] = max(self._eni_updated.get(eni_id, 0.0), self._updated_floor)
+        return enis, updated
+
+    def _write_full(self) -> None:
+        """전체 ENI 테이블로 스냅샷을 재작성하고 다시 mmap으로 연다 (lock 보유 상태에서 호출)."""
+        enis, updated = self._materialize()
+        # Windows는 mmap된 파일을 교체할 수 없으므로 먼저 닫는다
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+        try:
+            write_snapshot(self.cache_file, enis, updated)
+        except Exception:
+            # 기존 파일은 그대로이므로 다시 열어 오버레이 상태를 유지
+            if os.path.exists(self.cache_file):
+                self._snapshot = ENISnapshot.open(self.cache_file)
+            raise
+
+        self._reset()
+        self._snapshot = ENISnapshot.open(self.cache_file)
+        self._needs_rewrite = False
 
     def is_valid(self) -> bool:
         """Check if cache is valid (exists and not expired)."""
@@ -364,66 +715,93 @@ class ENICache:
 
     def count(self) -> int:
         """Return number of cached IP addresses."""
-        return len(self.cache)
+        with self.lock:
+            if self._ip_count is None:
+                self._ip_count = self._compute_ip_count()
+            return self._ip_count
+
+    def _compute_ip_count(self) -> int:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return len(self._ip_postings)
+        if not self._shadowed and not self._enis:
+            return snapshot.ip_count
+
+        keys = {
+            key for key, ordinal in zip(snapshot.keys(), snapshot.rows(), strict=True) if ordinal not in self._shadowed
+        }
+        keys.update(key for key, _ in self.sorted_ips)
+        return len(keys)
 
     def get_regions(self) -> list[str]:
         """Get list of regions in cache."""
-        return sorted(self._region_index.keys())
+        regions = set(self._region_index)
+        if self._snapshot is not None:
+            regions.update(self._snapshot.regions)
+        return sorted(regions)
 
     def clear(self) -> None:
         """Clear cache and delete file."""
         with self.lock:
-            self.cache.clear()
-            self.sorted_ips.clear()
-            self._region_index.clear()
-            self._vpc_index.clear()
+            self._reset()
+            self._needs_rewrite = True
 
         if os.path.exists(self.cache_file):
             os.remove(self.cache_file)
 
     def update(self, interfaces: list[dict[str, Any]]) -> None:
-        """Update cache with ENI data."""
+        """Update cache with ENI data (only changed ENIs are re-indexed)."""
         current = time.time()
 
         with self.lock:
+            changed: set[tuple[bytes, str]] = set()
             for eni in interfaces:
-                # Add private IPs
-                for priv_ip in eni.get("PrivateIpAddresses", []):
-                    ip = priv_ip.get("PrivateIpAddress")
-                    if ip:
-                        self._add_to_cache(ip, eni, current)
-
-                    # Add public IP
-                    pub_ip = priv_ip.get("Association", {}).get("PublicIp")
-                    if pub_ip:
-                        self._add_to_cache(pub_ip, eni, current)
-
-                # Add IPv6
-                for ipv6 in eni.get("Ipv6Addresses", []):
-                    ip = ipv6.get("Ipv6Address")
-                    if ip:
-                        self._add_to_cache(ip, eni, current)
-
-        self._rebuild_indices()
-
-    def _add_to_cache(self, ip: str, eni: dict[str, Any], timestamp: float) -> None:
-        """Add IP-ENI mapping to cache."""
-        if ip not in self.cache:
-            self.cache[ip] = {"interfaces": [], "last_accessed": timestamp}
-
-        if eni not in self.cache[ip]["interfaces"]:
-            self.cache[ip]["interfaces"].append(eni)
-
-        self.cache[ip]["last_accessed"] = timestamp
+                record = _convert_datetime(eni)
+                ips = eni_ip_list(record)
+                if not ips:
+                    continue
+
+                eni_id = _eni_key(record, ips)
+                ordinal = self._live_ordinal(eni_id)
+                existing = self._enis.get(eni_id)
+                if existing is None and ordinal is not None and self._snapshot is not None:
+                    existing = self._snapshot.decode(ordinal)
+
+                if existing == record:
+                    # 내용 동일: 갱신 시각만 델타에 기록
+                    if eni_id in self._enis:
+                        self._eni_updated[eni_id] = current
+                    elif ordinal is not None:
+                        self._snapshot_updated[ordinal] = current
+                    if eni_id not in self._dirty:
+                        self._touched.add(eni_id)
+                    continue
+
+                if ordinal is not None:
+                    self._shadowed.add(ordinal)
+                changed.update(self._unlink(eni_id))
+                changed.update(self._link(eni_id, record, ips))
+                self._eni_updated[eni_id] = current
+                self._dirty.add(eni_id)
+                self._touched.discard(eni_id)
+
+            self._apply_key_changes(changed)
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
 
     def get_by_ip(self, ip: str) -> list[dict[str, Any]]:
         """Get ENI data by IP address."""
+        key = ip_key(ip)
         with self.lock:
-            entry = self.cache.get(ip)
-            if entry:
-                entry["last_accessed"] = time.time()
-                return entry["interfaces"]
-        return []
+            results = []
+            if self._snapshot is not None and key is not None:
+                for ordinal in self._snapshot.lookup(key):
+                    if ordinal not in self._shadowed:
+                        results.append(self._snapshot.eni(ordinal))
+            results.extend(self._enis[eni_id] for eni_id in self._ip_postings.get(ip, []))
+            return results
 
     def get_by_cidr(self, cidr: str) -> list[tuple[str, dict[str, Any]]]:
         """Get ENI data by CIDR range."""
@@ -432,37 +810,61 @@ class ENICache:
         except ValueError:
             return []
 
-        min_ip = network.network_address
-        max_ip = network.broadcast_address
-
-        left = bisect_left(self.sorted_ips, min_ip)
-        right = bisect_right(self.sorted_ips, max_ip)
+        low, high = network_key_range(network)
 
-        results = []
+        matches: list[tuple[bytes, str, dict[str, Any]]] = []
         with self.lock:
-            for idx in range(left, right):
-                ip_obj = self.sorted_ips[idx]
-                if ip_obj in network:
-                    ip_str = str(ip_obj)
-                    entry = self.cache.get(ip_str)
-                    if entry:
-                        entry["last_accessed"] = time.time()
-                        for intf in entry["interfaces"]:
-                            results.append((ip_str, intf))
-
+            if self._snapshot is not None:
+                for key, ordinal in self._snapshot.scan(low, high):
+                    if ordinal not in self._shadowed:
+                        matches.append((key, key_to_ip(key), self._snapshot.eni(ordinal)))
+
+            left = bisect_left(self.sorted_ips, low, key=_KEY)
+            right = bisect_right(self.sorted_ips, high, key=_KEY)
+            for key, ip_str in self.sorted_ips[left:right]:
+                for eni_id in self._ip_postings.get(ip_str, []):
+                    matches.append((key, ip_str, self._enis[eni_id]))
+
+        matches.sort(key=_KEY)
+        return [(ip_str, eni) for _, ip_str, eni in matches]
+
+    def _snapshot_hits(self, ordinals: list[int]) -> list[tuple[str, dict[str, Any]]]:
+        """스냅샷 ENI 번호를 (IP, ENI) 결과로 변환 (가려진 ENI 제외, lock 보유 상태에서 호출)."""
+        results: list[tuple[str, dict[str, Any]]] = []
+        if self._snapshot is None:
+            return results
+        for ordinal in ordinals:
+            if ordinal in self._shadowed:
+                continue
+            eni = self._snapshot.eni(ordinal)
+            for ip_str in eni_ip_list(eni):
+                results.append((ip_str, eni))
         return results
 
     def search_by_vpc(self, vpc_id: str) -> list[tuple[str, dict[str, Any]]]:
         """Search by VPC ID using secondary index."""
-        results = []
         with self.lock:
-            ip_set = self._vpc_index.get(vpc_id, set())
-            for ip_str in ip_set:
-                entry = self.cache.get(ip_str)
-                if entry:
-                    for eni in entry["interfaces"]:
-                        if eni.get("VpcId") == vpc_id:
-                            results.append((ip_str, eni))
+            results = self._snapshot_hits(self._snapshot.vpc_ordinals(vpc_id) if self._snapshot else [])
+            for eni_id in self._vpc_index.get(vpc_id, set()):
+                eni = self._enis[eni_id]
+                for ip_str in self._eni_ips[eni_id]:
+                    results.append((ip_str, eni))
+        return results
+
+    def search_text(self, text: str) -> list[tuple[str, dict[str, Any]]]:
+        """Search by text using the inverted text index.
+
+        3자 이상은 부분 문자열, 3자 미만은 단어 접두사 검색입니다 (대소문자 무시).
+        검색 필드: Description, Name 태그, RequesterId, InstanceId, Security Group 이름, ENI ID, Subnet ID.
+        """
+        with self.lock:
+            results = self._snapshot_hits(sorted(self._snapshot.text_index.search(text)) if self._snapshot else [])
+            for eni_id in sorted(self._text_index.search(text)):
+                eni = self._enis.get(eni_id)
+                if eni is None:
+                    continue
+                for ip_str in self._eni_ips[eni_id]:
+                    results.append((ip_str, eni))
         return results
 
 
@@ -520,22 +922,12 @@ class MultiCacheSearch:
     def search_text(self, text: str) -> list[PrivateIPResult]:
         """Search by text in description/name across all caches."""
         results = []
-        text_lower = text.lower()
 
         for cache in self.caches:
-            with cache.lock:
-                for ip_str, entry in cache.cache.items():
-                    for eni in entry.get("interfaces", []):
-                        description = eni.get("Description", "").lower()
-                        name = ""
-                        for tag in eni.get("TagSet", []):
-                            if tag.get("Key") == "Name":
-                                name = tag.get("Value", "").lower()
-                                break
-
-                        if text_lower in description or text_lower in name:
-                            result = _eni_to_result(ip_str, eni, cache.profile_name)
-                            results.append(result)
+            matches = cache.search_text(text)
+            for ip_str, eni in matches:
+                result = _eni_to_result(ip_str, eni, cache.profile_name)
+                results.append(result)
 
         return results
 
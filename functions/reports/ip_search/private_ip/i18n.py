@@ -367,8 +367,8 @@ MESSAGES = {
         "en": "• ENI ID: eni-abc123",
     },
     "help_text": {
-        "ko": "• 텍스트: 이름, 설명 등으로 검색",
-        "en": "• Text: Search by name, description, etc.",
+        "ko": "• 텍스트: 이름, 설명, 인스턴스 ID, 보안 그룹 이름 등으로 검색 (3자 미만은 단어 접두사)",
+        "en": "• Text: Search by name, description, instance ID, security group name, etc. (prefix under 3 chars)",
     },
     "help_shortcuts": {
         "ko": "단축키:",
@@ -0,0 +1,400 @@
+"""functions/reports/ip_search/private_ip/snapshot.py - mmap 기반 ENI 캐시 스냅샷.
+
+캐시 파일을 역직렬화하지 않고 mmap으로 읽어, IP/CIDR 조회는 고정폭 IP 열을 이진 탐색하고
+ENI 레코드는 결과를 표시할 때만 디코딩합니다.
+
+파일 레이아웃 (배열은 네이티브 바이트 순서, 섹션은 8바이트 정렬):
+    [0:12]   매직 b"AAENIDX1" + 메타 길이 (uint32)
+    [12:..]  메타 (msgpack): 버전, 개수, 리전 목록, 섹션 위치, 스냅샷 끝 오프셋
+    섹션:
+        keys     IP 키 (17바이트 고정폭: 버전 1바이트 + 16바이트 빅엔디언 정수), 정렬됨
+        rows     IP 키별 ENI 번호 (uint32, keys와 같은 순서)
+        offsets  ENI 레코드 오프셋 (uint64, ENI 수 + 1)
+        records  ENI 레코드 영역 (msgpack 연결)
+        updated  ENI별 갱신 시각 (float64)
+        ids      ENI ID 목록 (msgpack)
+        vpcs     VPC ID -> ENI 번호 (msgpack, uint32 bytes)
+        text     텍스트 색인 (msgpack, ENITextIndex.to_record())
+    [snapshot_end:]  델타 레코드 (msgpack 스트림, ENICache.save()가 추가)
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import mmap
+import os
+import socket
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Literal
+
+import msgpack
+
+from .text_index import ENITextIndex
+
+SNAPSHOT_MAGIC = b"AAENIDX1"
+SNAPSHOT_VERSION = 3
+
+_HEADER = struct.Struct("<8sI")
+_KEY_WIDTH = 17
+_SECTIONS = ("keys", "rows", "offsets", "records", "updated", "ids", "vpcs", "text")
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+# =============================================================================
+# IP Keys
+# =============================================================================
+
+
+def ip_key(ip: str) -> bytes | None:
+    """고정폭 정렬 키 (버전 1바이트 + 16바이트 빅엔디언 정수). 잘못된 IP는 None."""
+    try:
+        if ":" in ip:
+            return b"\x06" + socket.inet_pton(socket.AF_INET6, ip)
+        return b"\x04" + bytes(12) + socket.inet_pton(socket.AF_INET, ip)
+    except OSError:
+        return None
+
+
+def network_key_range(network: ipaddress.IPv4Network | ipaddress.IPv6Network) -> tuple[bytes, bytes]:
+    """네트워크의 첫/마지막 주소 키 (양 끝 포함)."""
+    prefix = bytes([network.version])
+    return (
+        prefix + int(network.network_address).to_bytes(16, "big"),
+        prefix + int(network.broadcast_address).to_bytes(16, "big"),
+    )
+
+
+def key_to_ip(key: bytes) -> str:
+    """ip_key()의 역변환."""
+    if key[0] == 4:
+        return socket.inet_ntop(socket.AF_INET, key[13:])
+    return socket.inet_ntop(socket.AF_INET6, key[1:])
+
+
+def eni_ip_list(eni: dict[str, Any]) -> list[str]:
+    """ENI에 할당된 IP 목록 (Private, Public, IPv6 순, 중복 제거)."""
+    ips: list[str] = []
+    for priv_ip in eni.get("PrivateIpAddresses", []):
+        ip = priv_ip.get("PrivateIpAddress")
+        if ip:
+            ips.append(ip)
+        pub_ip = priv_ip.get("Association", {}).get("PublicIp")
+        if pub_ip:
+            ips.append(pub_ip)
+    for ipv6 in eni.get("Ipv6Addresses", []):
+        ip = ipv6.get("Ipv6Address")
+        if ip:
+            ips.append(ip)
+    return list(dict.fromkeys(ips))
+
+
+# =============================================================================
+# Writer
+# =============================================================================
+
+
+def write_snapshot(path: str, enis: dict[str, dict[str, Any]], updated: dict[str, float]) -> None:
+    """ENI 테이블을 스냅샷 파일로 원자적 저장 (기존 델타 레코드는 사라짐).
+
+    Args:
+        path: 캐시 파일 경로.
+        enis: ENI ID -> ENI (직렬화 가능한 값만 포함).
+        updated: ENI ID -> 갱신 시각.
+    """
+    ids = list(enis)
+    records = [msgpack.packb(enis[eni_id]) for eni_id in ids]
+    offsets = array("Q", [0])
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+
+    rows: list[tuple[bytes, int]] = []
+    vpcs: dict[str, array] = {}
+    regions: set[str] = set()
+    text_index: ENITextIndex[int] = ENITextIndex()
+    for ordinal, eni_id in enumerate(ids):
+        eni = enis[eni_id]
+        for ip in eni_ip_list(eni):
+            key = ip_key(ip)
+            if key:
+                rows.append((key, ordinal))
+        vpc_id = eni.get("VpcId")
+        if vpc_id:
+            vpcs.setdefault(vpc_id, array("I")).append(ordinal)
+        region = eni.get("Region")
+        if region:
+            regions.add(region)
+        text_index.add(ordinal, eni)
+    rows.sort()
+
+    sections = {
+        "keys": b"".join(key for key, _ in rows),
+        "rows": array("I", [ordinal for _, ordinal in rows]).tobytes(),
+        "offsets": offsets.tobytes(),
+        "records": b"".join(records),
+        "updated": array("d", [updated.get(eni_id, 0.0) for eni_id in ids]).tobytes(),
+        "ids": msgpack.packb(ids),
+        "vpcs": msgpack.packb({vpc_id: ordinals.tobytes() for vpc_id, ordinals in vpcs.items()}),
+        "text": msgpack.packb(text_index.to_record()),
+    }
+
+    # 섹션 위치는 데이터 영역 시작 기준 (메타 길이와 무관)
+    layout: dict[str, list[int]] = {}
+    position = 0
+    for name in _SECTIONS:
+        layout[name] = [position, len(sections[name])]
+        position = _align(position + len(sections[name]))
+
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "byteorder": sys.byteorder,
+        "eni_count": len(ids),
+        "row_count": len(rows),
+        "ip_count": len({key for key, _ in rows}),
+        "regions": sorted(regions),
+        "sections": layout,
+        "data_size": position,
+    }
+    meta_bytes = msgpack.packb(meta)
+    data_start = _align(_HEADER.size + len(meta_bytes))
+    header = _HEADER.pack(SNAPSHOT_MAGIC, len(meta_bytes)) + meta_bytes
+
+    parts = [header, bytes(data_start - len(header))]
+    for name in _SECTIONS:
+        data = sections[name]
+        parts.append(data)
+        parts.append(bytes(_align(len(data)) - len(data)))
+
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"".join(parts))
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+# =============================================================================
+# Reader
+# =============================================================================
+
+
+def read_snapshot_meta(path: str) -> dict[str, Any] | None:
+    """스냅샷 메타만 읽기 (스냅샷 파일이 아니거나 손상되었으면 None)."""
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return None
+        magic, meta_len = _HEADER.unpack(header)
+        if magic != SNAPSHOT_MAGIC:
+            return None
+        try:
+            meta = msgpack.unpackb(f.read(meta_len), raw=False)
+        except Exception:
+            return None
+
+    if not isinstance(meta, dict) or meta.get("version") != SNAPSHOT_VERSION or meta.get("byteorder") != sys.byteorder:
+        return None
+    meta["data_start"] = _align(_HEADER.size + meta_len)
+    meta["snapshot_end"] = meta["data_start"] + meta["data_size"]
+    return meta
+
+
+class _KeyColumn:
+    """mmap의 고정폭 IP 키 열 (bisect용 시퀀스)."""
+
+    def __init__(self, mm: mmap.mmap, offset: int, count: int):
+        self._mm = mm
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> bytes:
+        start = self._offset + index * _KEY_WIDTH
+        return self._mm[start : start + _KEY_WIDTH]
+
+    def slice(self, start: int, stop: int) -> list[bytes]:
+        data = self._mm[self._offset + start * _KEY_WIDTH : self._offset + stop * _KEY_WIDTH]
+        return [data[i : i + _KEY_WIDTH] for i in range(0, len(data), _KEY_WIDTH)]
+
+
+class ENISnapshot:
+    """mmap으로 연 읽기 전용 ENI 스냅샷.
+
+    ENI는 스냅샷 내 번호(ordinal)로 식별하며, 레코드/ID/VPC/텍스트 색인은
+    처음 필요할 때 디코딩합니다.
+
+    Attributes:
+        meta: 스냅샷 메타 (read_snapshot_meta()).
+    """
+
+    def __init__(self, path: str, meta: dict[str, Any]):
+        self.path = path
+        self.meta = meta
+        self._file = open(path, "rb")  # noqa: SIM115 - close()에서 닫음
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), meta["snapshot_end"], access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        base = memoryview(self._mm)
+        self._views: list[memoryview[Any]] = [base]
+        self._keys = _KeyColumn(self._mm, self._section_start("keys"), meta["row_count"])
+        self._rows = self._array_view(base, "rows", "I")
+        self._offsets = self._array_view(base, "offsets", "Q")
+        self._updated = self._float_view(base, "updated")
+        self._records_start = self._section_start("records")
+
+        self._decoded: dict[int, dict[str, Any]] = {}
+        self._ids: list[str] | None = None
+        self._id_ordinals: dict[str, int] | None = None
+        self._vpcs: dict[str, array] | None = None
+        self._text_index: ENITextIndex[int] | None = None
+
+    @classmethod
+    def open(cls, path: str) -> ENISnapshot | None:
+        """스냅샷 파일 열기 (스냅샷 형식이 아니면 None)."""
+        meta = read_snapshot_meta(path)
+        if meta is None or os.path.getsize(path) < meta["snapshot_end"]:
+            return None
+        return cls(path, meta)
+
+    def close(self) -> None:
+        """mmap 해제 (Windows에서 파일 교체/삭제 전에 호출 필요)."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mm.close()
+        self._file.close()
+
+    def _section_start(self, name: str) -> int:
+        return int(self.meta["data_start"]) + int(self.meta["sections"][name][0])
+
+    def _section_range(self, name: str) -> tuple[int, int]:
+        start = self._section_start(name)
+        return start, start + int(self.meta["sections"][name][1])
+
+    def _section_bytes(self, name: str) -> bytes:
+        start, end = self._section_range(name)
+        return self._mm[start:end]
+
+    def _array_view(self, base: memoryview, name: str, typecode: Literal["I", "Q"]) -> memoryview[int]:
+        start, end = self._section_range(name)
+        raw = base[start:end]
+        view = raw.cast(typecode)
+        self._views.extend([raw, view])
+        return view
+
+    def _float_view(self, base: memoryview, name: str) -> memoryview[float]:
+        start, end = self._section_range(name)
+        raw = base[start:end]
+        view = raw.cast("d")
+        self._views.extend([raw, view])
+        return view
+
+    # =========================================================================
+    # Metadata
+    # =========================================================================
+
+    @property
+    def eni_count(self) -> int:
+        return int(self.meta["eni_count"])
+
+    @property
+    def ip_count(self) -> int:
+        return int(self.meta["ip_count"])
+
+    @property
+    def regions(self) -> list[str]:
+        regions: list[str] = self.meta["regions"]
+        return regions
+
+    def updated_at(self, ordinal: int) -> float:
+        return self._updated[ordinal]
+
+    def eni_id(self, ordinal: int) -> str:
+        return self.ids[ordinal]
+
+    @property
+    def ids(self) -> list[str]:
+        if self._ids is None:
+            self._ids = msgpack.unpackb(self._section_bytes("ids"), raw=False)
+        return self._ids
+
+    def ordinal_of(self, eni_id: str) -> int | None:
+        """ENI ID의 스냅샷 번호."""
+        if self._id_ordinals is None:
+            self._id_ordinals = {value: ordinal for ordinal, value in enumerate(self.ids)}
+        return self._id_ordinals.get(eni_id)
+
+    # =========================================================================
+    # Records
+    # =========================================================================
+
+    def decode(self, ordinal: int) -> dict[str, Any]:
+        """ENI 레코드 디코딩 (캐시하지 않음)."""
+        start = self._records_start + self._offsets[ordinal]
+        end = self._records_start + self._offsets[ordinal + 1]
+        eni: dict[str, Any] = msgpack.unpackb(self._mm[start:end], raw=False, strict_map_key=False)
+        return eni
+
+    def eni(self, ordinal: int) -> dict[str, Any]:
+        """검색 결과용 ENI 레코드 (번호별로 한 번만 디코딩)."""
+        eni = self._decoded.get(ordinal)
+        if eni is None:
+            eni = self._decoded[ordinal] = self.decode(ordinal)
+        return eni
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    def lookup(self, key: bytes) -> list[int]:
+        """IP 키에 연결된 ENI 번호 목록."""
+        left = bisect_left(self._keys, key)
+        right = bisect_right(self._keys, key, lo=left)
+        return [self._rows[i] for i in range(left, right)]
+
+    def scan(self, low: bytes, high: bytes) -> list[tuple[bytes, int]]:
+        """low <= 키 <= high 인 (IP 키, ENI 번호) 목록 (키 순서)."""
+        left = bisect_left(self._keys, low)
+        right = bisect_right(self._keys, high, lo=left)
+        return list(zip(self._keys.slice(left, right), self._rows[left:right].tolist(), strict=True))
+
+    def keys(self) -> list[bytes]:
+        """모든 IP 키 (행 순서, 중복 포함)."""
+        return self._keys.slice(0, len(self._keys))
+
+    def rows(self) -> list[int]:
+        """모든 행의 ENI 번호 (keys()와 같은 순서)."""
+        return self._rows.tolist()
+
+    def vpc_ordinals(self, vpc_id: str) -> list[int]:
+        """VPC에 속한 ENI 번호 목록."""
+        if self._vpcs is None:
+            self._vpcs = {}
+            for vpc, raw in msgpack.unpackb(self._section_bytes("vpcs"), raw=False).items():
+                ordinals = array("I")
+                ordinals.frombytes(raw)
+                self._vpcs[vpc] = ordinals
+        return self._vpcs.get(vpc_id, array("I")).tolist()
+
+    @property
+    def text_index(self) -> ENITextIndex[int]:
+        """ENI 번호를 소유자로 하는 텍스트 색인 (첫 사용 시 디코딩)."""
+        if self._text_index is None:
+            record = msgpack.unpackb(self._section_bytes("text"), raw=False, strict_map_key=False)
+            self._text_index = ENITextIndex.from_record(record) or ENITextIndex()
+        return self._text_index
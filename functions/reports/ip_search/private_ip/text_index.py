@@ -0,0 +1,263 @@
+"""functions/reports/ip_search/private_ip/text_index.py - ENI 텍스트 역색인.
+
+Private IP 텍스트 검색용 trigram 역색인입니다.
+색인 필드: Description, Name 태그, RequesterId, 연결 InstanceId, Security Group 이름,
+ENI ID, Subnet ID (모두 소문자).
+
+- 필드 값은 고유 값 테이블에 한 번만 저장되고, trigram -> 값 번호 포스팅(array)으로 색인됩니다.
+- 3자 이상 질의: 질의 trigram 포스팅 교집합 후보만 부분 문자열 검증 (선형 스캔 없음)
+- 3자 미만 질의: 정렬된 단어/값 목록에서 접두사(bisect) 검색
+- 소유자는 메모리 캐시에서는 ENI ID, 스냅샷에서는 ENI 번호(int)입니다.
+- to_record()/from_record()로 스냅샷에 함께 저장되어 로드 시 trigram 생성을 건너뜁니다.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Hashable, Iterable
+from typing import Any, Generic, TypeVar
+
+# 접두사 검색용 단어 분리 (영숫자 외 문자 기준)
+_TERM_SPLIT_RE = re.compile(r"[^0-9a-z]+")
+
+# trigram 길이
+_GRAM = 3
+
+# 소유자 타입 (메모리 캐시: ENI ID str, 스냅샷: ENI 번호 int)
+_Owner = TypeVar("_Owner", bound=Hashable)
+
+
+def eni_text_values(eni: dict[str, Any]) -> list[str]:
+    """ENI의 색인 대상 필드 값 (소문자, 중복/빈 값 제거, 순서 없음).
+
+    Args:
+        eni: describe_network_interfaces 응답의 ENI 딕셔너리.
+
+    Returns:
+        색인할 필드 값 목록.
+    """
+    values = {
+        eni.get("Description", ""),
+        eni.get("RequesterId", ""),
+        eni.get("Attachment", {}).get("InstanceId", ""),
+        eni.get("NetworkInterfaceId", ""),
+        eni.get("SubnetId", ""),
+    }
+    for tag in eni.get("TagSet", []):
+        if tag.get("Key") == "Name":
+            values.add(tag.get("Value", ""))
+            break
+    for sg in eni.get("Groups", []):
+        values.add(sg.get("GroupName", ""))
+    lowered = {value.lower() for value in values}
+    lowered.discard("")
+    return list(lowered)
+
+
+def _grams(value: str) -> set[str]:
+    return {value[i : i + _GRAM] for i in range(len(value) - _GRAM + 1)}
+
+
+class ENITextIndex(Generic[_Owner]):
+    """ENI 텍스트 필드 trigram 역색인.
+
+    ENI 추가/제거는 값별 소유자 집합만 갱신하며, 더 이상 참조되지 않는 값은
+    검색 시 건너뜁니다 (스냅샷 재작성 시 새로 구축).
+    """
+
+    VERSION = 2
+
+    def __init__(self) -> None:
+        self._values: list[str] = []
+        self._value_ids: dict[str, int] = {}
+        # 값 번호 -> 소유자 (대부분 값은 ENI 하나이므로 단일 값, 여럿이면 set, 없으면 None)
+        self._value_enis: list[_Owner | set[_Owner] | None] = []
+        # trigram -> 값 번호 (로드 직후에는 bytes, 사용 시 array로 변환)
+        self._grams: dict[str, array | bytes] = {}
+        # 접두사 검색용 (단어/값 -> 값 번호), 변경 시 무효화
+        self._terms: list[str] | None = None
+        self._term_values: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _intern(self, value: str) -> int:
+        """값 번호 반환 (새 값이면 trigram 포스팅에 추가)."""
+        idx = self._value_ids.get(value)
+        if idx is not None:
+            return idx
+
+        idx = len(self._values)
+        self._values.append(value)
+        self._value_ids[value] = idx
+        self._value_enis.append(None)
+        for gram in _grams(value):
+            postings = self._postings(gram)
+            if postings is None:
+                self._grams[gram] = array("I", [idx])
+            else:
+                postings.append(idx)
+        self._terms = None
+        return idx
+
+    def _postings(self, gram: str) -> array | None:
+        postings = self._grams.get(gram)
+        if isinstance(postings, bytes):
+            decoded = array("I")
+            decoded.frombytes(postings)
+            self._grams[gram] = postings = decoded
+        return postings
+
+    def add(self, eni_id: _Owner, eni: dict[str, Any]) -> None:
+        """ENI의 필드 값을 색인에 추가 (eni_id: ENI ID 또는 스냅샷 ENI 번호)."""
+        for value in eni_text_values(eni):
+            idx = self._intern(value)
+            owners = self._value_enis[idx]
+            if owners is None:
+                self._value_enis[idx] = eni_id
+            elif isinstance(owners, set):
+                owners.add(eni_id)
+            elif owners != eni_id:
+                self._value_enis[idx] = {owners, eni_id}
+
+    def remove(self, eni_id: _Owner, eni: dict[str, Any]) -> None:
+        """ENI를 색인에서 제거."""
+        for value in eni_text_values(eni):
+            idx = self._value_ids.get(value)
+            if idx is None:
+                continue
+            owners = self._value_enis[idx]
+            if isinstance(owners, set):
+                owners.discard(eni_id)
+            elif owners == eni_id:
+                self._value_enis[idx] = None
+
+    def _owners(self, indices: Iterable[int]) -> set[_Owner]:
+        """값 번호들을 참조하는 소유자 집합."""
+        result: set[_Owner] = set()
+        for idx in indices:
+            owners = self._value_enis[idx]
+            if isinstance(owners, set):
+                result.update(owners)
+            elif owners is not None:
+                result.add(owners)
+        return result
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def search(self, text: str) -> set[_Owner]:
+        """부분 문자열(3자 이상) 또는 접두사(3자 미만) 검색.
+
+        Args:
+            text: 검색어 (대소문자 무시).
+
+        Returns:
+            일치하는 소유자(ENI ID 또는 ENI 번호) 집합.
+        """
+        query = text.lower()
+        if len(query) < _GRAM:
+            return self._search_prefix(query)
+
+        postings = []
+        for gram in _grams(query):
+            gram_postings = self._postings(gram)
+            if gram_postings is None:
+                return set()
+            postings.append(gram_postings)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for gram_postings in postings[1:]:
+            candidates.intersection_update(gram_postings)
+            if not candidates:
+                return set()
+
+        return self._owners(idx for idx in candidates if query in self._values[idx])
+
+    def _search_prefix(self, prefix: str) -> set[_Owner]:
+        if self._terms is None:
+            self._build_terms()
+        terms = self._terms or []
+
+        matched: set[int] = set()
+        pos = bisect_left(terms, prefix)
+        while pos < len(terms) and terms[pos].startswith(prefix):
+            matched.update(self._term_values[terms[pos]])
+            pos += 1
+        return self._owners(matched)
+
+    def _build_terms(self) -> None:
+        term_values: dict[str, list[int]] = {}
+        for idx, value in enumerate(self._values):
+            for term in {value, *_TERM_SPLIT_RE.split(value)}:
+                if term:
+                    term_values.setdefault(term, []).append(idx)
+        self._term_values = term_values
+        self._terms = sorted(term_values)
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_record(self: ENITextIndex[int]) -> dict[str, Any]:
+        """msgpack 직렬화용 레코드 (값 목록 + trigram 포스팅 + 값별 소유자, 모두 uint32 bytes).
+
+        소유자는 스냅샷 ENI 번호(int)여야 합니다.
+        """
+        grams = {
+            gram: postings if isinstance(postings, bytes) else postings.tobytes()
+            for gram, postings in self._grams.items()
+        }
+        owner_offsets = array("I", [0])
+        owner_ids = array("I")
+        for owners in self._value_enis:
+            if isinstance(owners, set):
+                owner_ids.extend(sorted(owners))
+            elif owners is not None:
+                owner_ids.append(owners)
+            owner_offsets.append(len(owner_ids))
+        return {
+            "version": self.VERSION,
+            "byteorder": sys.byteorder,
+            "values": self._values,
+            "grams": grams,
+            "owner_offsets": owner_offsets.tobytes(),
+            "owners": owner_ids.tobytes(),
+        }
+
+    @classmethod
+    def from_record(cls, record: Any) -> ENITextIndex[int] | None:
+        """to_record() 결과로 색인 복원 (버전/바이트 순서 불일치 시 None)."""
+        if (
+            not isinstance(record, dict)
+            or record.get("version") != cls.VERSION
+            or record.get("byteorder") != sys.byteorder
+        ):
+            return None
+
+        index: ENITextIndex[int] = ENITextIndex()
+        index._values = list(record.get("values", []))
+        index._value_ids = {value: idx for idx, value in enumerate(index._values)}
+        index._grams = dict(record.get("grams", {}))
+
+        owner_offsets = array("I")
+        owner_offsets.frombytes(record.get("owner_offsets", b""))
+        owner_ids = array("I")
+        owner_ids.frombytes(record.get("owners", b""))
+        if len(owner_offsets) != len(index._values) + 1:
+            return None
+        value_enis: list[int | set[int] | None] = []
+        for start, end in zip(owner_offsets, owner_offsets[1:], strict=False):
+            if end - start == 1:
+                value_enis.append(owner_ids[start])
+            elif end > start:
+                value_enis.append(set(owner_ids[start:end]))
+            else:
+                value_enis.append(None)
+        index._value_enis = value_enis
+        return index
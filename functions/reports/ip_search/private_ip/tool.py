@@ -124,15 +124,41 @@ def _select_caches(caches: list[CacheInfo]) -> list[CacheInfo]:
 
 
 def _load_selected_caches(cache_infos: list[CacheInfo]) -> list[ENICache]:
-    """Load ENICache instances for selected caches."""
-    caches = []
-    for info in cache_infos:
-        cache = ENICache(profile_name=info.profile_name, account_id=info.account_id)
-        if cache.count() > 0:
-            caches.append(cache)
+    """Load ENICache instances for selected caches.
+
+    Empty caches are closed right away; the caller closes the returned caches
+    (each holds an open snapshot file and mmap).
+    """
+    caches: list[ENICache] = []
+    try:
+        for info in cache_infos:
+            cache = ENICache(profile_name=info.profile_name, account_id=info.account_id)
+            if cache.count() > 0:
+                caches.append(cache)
+            else:
+                cache.close()
+    except BaseException:
+        _close_caches(caches)
+        raise
     return caches
 
 
+def _close_caches(caches: list[ENICache]) -> None:
+    """Release the snapshot file handles and mmaps of loaded caches."""
+    for cache in caches:
+        cache.close()
+
+
+def _search_selected_caches(ctx, cache_infos: list[CacheInfo], session_name: str) -> None:
+    """Load the selected caches, run the search loop, and close them on exit."""
+    loaded_caches = _load_selected_caches(cache_infos)
+    try:
+        if loaded_caches:
+            _run_search_loop(ctx, loaded_caches, session_name)
+    finally:
+        _close_caches(loaded_caches)
+
+
 # =============================================================================
 # Cache Creation UI
 # =============================================================================
@@ -504,8 +530,8 @@ def _run_search_loop(
                 if session is None:
                     cache = caches[0]
                     profile_name = cache.profile_name
-                    # ENICache uses _region_index, get first available region
-                    available_regions = list(cache._region_index.keys()) if cache._region_index else []
+                    # Use the first region in the cache
+                    available_regions = list(cache.get_regions())
                     region = available_regions[0] if available_regions else "ap-northeast-2"
                     try:
                         session = get_session(profile_name, region)
@@ -618,7 +644,9 @@ def run(ctx: ExecutionContext) -> None:
                     console.print(f"\n[yellow]{t('cache_none_auto')}[/yellow]")
 
                 if Confirm.ask(t("cache_create_confirm"), default=True):
-                    _create_cache(ctx)
+                    created = _create_cache(ctx)
+                    if created is not None:
+                        created.close()
                     # Refresh cache list and try again
                     available_caches = list_available_caches()
                     valid_caches = [c for c in available_caches if c.is_valid]
@@ -627,21 +655,19 @@ def run(ctx: ExecutionContext) -> None:
                 else:
                     continue
 
-            loaded_caches = _load_selected_caches(valid_caches)
-            if loaded_caches:
-                _run_search_loop(ctx, loaded_caches, session_name)
+            _search_selected_caches(ctx, valid_caches, session_name)
 
         elif choice == "2":
             # Select caches
             selected = _select_caches(available_caches)
             if selected:
-                loaded_caches = _load_selected_caches(selected)
-                if loaded_caches:
-                    _run_search_loop(ctx, loaded_caches, session_name)
+                _search_selected_caches(ctx, selected, session_name)
 
         elif choice == "3":
             # Create cache
-            _create_cache(ctx)
+            created = _create_cache(ctx)
+            if created is not None:
+                created.close()
 
         elif choice == "4":
             # Delete caches
@@ -27,7 +27,7 @@ from core.shared.aws.ip_ranges import (
     refresh_public_cache,
     search_by_filter,
     search_public_cidr,
-    search_public_ip,
+    search_public_ip_optimized,
 )
 from core.shared.io.output.builder import OutputPath
 
@@ -661,7 +661,7 @@ def _search_by_ip(session_name: str) -> None:
         with console.status(f"[bold yellow]{t('searching')}[/bold yellow]"):
             # Search for individual IPs
             if valid_ips:
-                ip_results = search_public_ip(
+                ip_results = search_public_ip_optimized(
                     valid_ips,
                     providers=providers_list if isinstance(providers_list, list) else None,
                     region_filter=region_filter if isinstance(region_filter, str) else None,
@@ -2,7 +2,7 @@
 """functions/reports/log_analyzer/alb_log_analyzer.py - DuckDB 기반 ALB 로그 분석기.
 
 기존 파싱 로직을 DuckDB SQL로 교체하여 초고속 분석을 제공합니다.
-ALB 액세스 로그 파일을 DuckDB로 로드하고, SQL MACRO와 쿼리를 통해
+ALB 액세스 로그 파일을 줄당 한 번 토큰화하여 DuckDB 컬럼 테이블로 로드하고, SQL 쿼리를 통해
 요약 통계, 상태 코드 분석, 응답 시간 분석, TPS, URL 분석,
 국가별 통계, SSL 보안 분석, SLA 분석 등을 수행합니다.
 """
@@ -54,6 +54,7 @@ except ImportError:
 from core.tools.cache import get_cache_dir
 
 from .alb_log_downloader import ALBLogDownloader
+from .alb_log_store import ALBLogStore
 from .ip_intelligence import IPIntelligence
 
 
@@ -79,8 +80,18 @@ class ALBLogAnalyzer:
         end_datetime: Any | None = None,
         timezone: str = "Asia/Seoul",
         max_workers: int = 5,
+        keep_raw_line: bool = False,
+        log_store_dir: str | None = None,
     ):
-        """ALB 로그 분석기를 초기화합니다."""
+        """ALB 로그 분석기를 초기화합니다.
+
+        Args:
+            keep_raw_line: True이면 alb_logs 테이블에 원본 로그 줄(raw_line)도 저장합니다.
+                디버깅용이며 테이블 크기가 크게 늘어나므로 기본값은 False입니다.
+            log_store_dir: 파싱된 로그를 보관할 로컬 Parquet 저장소 기본 디렉토리
+                (기본: 환경변수 AA_ALB_LOG_STORE_DIR, 미설정 시 저장소 미사용).
+                지정하면 이미 적재된 S3 객체는 다시 다운로드하지 않고 Parquet에서 분석합니다.
+        """
         # DuckDB 설치 확인
         _check_duckdb()
 
@@ -116,6 +127,7 @@ class ALBLogAnalyzer:
 
         self.console = console
         self.max_workers = max_workers
+        self.keep_raw_line = keep_raw_line
 
         # ALBLogDownloader 인스턴스 생성
         self.downloader = ALBLogDownloader(
@@ -148,6 +160,15 @@ class ALBLogAnalyzer:
         self.conn = duckdb.connect(self.duckdb_db_path, read_only=False)
         self._setup_duckdb()
 
+        # alb_logs 테이블 적재 여부 (download_and_load_logs / _load_logs_to_duckdb)
+        self._logs_loaded = False
+
+        # 📦 로컬 Parquet 저장소 (선택)
+        store_base = log_store_dir or os.getenv("AA_ALB_LOG_STORE_DIR")
+        self.log_store: ALBLogStore | None = (
+            ALBLogStore(ALBLogStore.default_root(bucket_name, self.prefix, base_dir=store_base)) if store_base else None
+        )
+
         # 🌍 IP 인텔리전스 초기화 (국가 매핑 + 악성 IP)
         self.ip_intel = IPIntelligence()
 
@@ -169,198 +190,212 @@ class ALBLogAnalyzer:
             self.conn.execute(f"SET threads={threads}")
             self.conn.execute("SET enable_progress_bar=false")
 
-            # ALB 로그 파싱을 위한 사용자 정의 함수들
-            self._create_alb_parsing_functions()
-
             logger.debug("✅ DuckDB 초기화 완료")
 
         except Exception as e:
             logger.error(f"❌ DuckDB 설정 실패: {str(e)}")
             raise
 
-    def _create_alb_parsing_functions(self):
-        """ALB 로그 파싱을 위한 사용자 정의 함수 생성"""
-
-        # 간단한 정규식 기반 파싱 매크로들 (DuckDB MACRO)
-        # 타임존 변환: ALB 로그는 UTC로 기록되므로, 사용자 타임존으로 변환
-        tz_name = self.timezone.zone if hasattr(self.timezone, "zone") else str(self.timezone)
-        functions = [
-            # UTC 타임스탬프를 파싱 후 사용자 타임존으로 변환
-            f"""CREATE OR REPLACE MACRO extract_timestamp(log_line) AS (
-                   timezone('{tz_name}',
-                       strptime(regexp_extract(log_line, '\\S+ (\\S+) ', 1), '%Y-%m-%dT%H:%M:%S.%fZ')
-                       AT TIME ZONE 'UTC'
-                   )
-               )""",
-            """CREATE OR REPLACE MACRO extract_client_ip(log_line) AS (
-                   split_part(regexp_extract(log_line, '\\S+ \\S+ \\S+ (\\S+) ', 1), ':', 1)
-               )""",
-            """CREATE OR REPLACE MACRO extract_target_ip(log_line) AS (
-                   CASE
-                       WHEN regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) = '-' THEN ''
-                       ELSE split_part(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ (\\S+) ', 1), ':', 1)
-                   END
-               )""",
-            """CREATE OR REPLACE MACRO extract_elb_status(log_line) AS (
-                   regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1)
-               )""",
-            """CREATE OR REPLACE MACRO extract_target_status(log_line) AS (
-                   regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1)
-               )""",
-            """CREATE OR REPLACE MACRO extract_response_time(log_line) AS (
-                   CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS DOUBLE) +
-                   CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS DOUBLE) +
-                   CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS DOUBLE)
-               )""",
-            """CREATE OR REPLACE MACRO extract_request(log_line) AS (
-                   regexp_extract(log_line, '"([^\"]*)"', 1)
-               )""",
-            """CREATE OR REPLACE MACRO extract_method(log_line) AS (
-                   split_part(regexp_extract(log_line, '"([^\"]*)"', 1), ' ', 1)
-               )""",
-            """CREATE OR REPLACE MACRO extract_url(log_line) AS (
-                   split_part(regexp_extract(log_line, '"([^\"]*)"', 1), ' ', 2)
-               )""",
-            """CREATE OR REPLACE MACRO extract_user_agent(log_line) AS (
-                   coalesce(regexp_extract(log_line, '"[^\"]*"\\s+"([^\"]*)"', 1), '')
-               )""",
-            """CREATE OR REPLACE MACRO extract_received_bytes(log_line) AS (
-                   CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS BIGINT)
-               )""",
-            """CREATE OR REPLACE MACRO extract_sent_bytes(log_line) AS (
-                   CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS BIGINT)
-               )""",
-            # 추가 필드: target_port
-            """CREATE OR REPLACE MACRO extract_target_port(log_line) AS (
-                   CASE
-                       WHEN regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) = '-' THEN ''
-                       ELSE split_part(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ (\\S+) ', 1), ':', 2)
-                   END
-               )""",
-            # 처리 시간 3필드 분리 (-1은 타임아웃/연결실패를 의미, NULL로 처리)
-            """CREATE OR REPLACE MACRO extract_request_proc_time(log_line) AS (
-                   CASE WHEN regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) IN ('-', '-1') THEN NULL
-                        WHEN CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS DOUBLE) < 0 THEN NULL
-                        ELSE CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS DOUBLE) END
-               )""",
-            """CREATE OR REPLACE MACRO extract_target_proc_time(log_line) AS (
-                   CASE WHEN regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) IN ('-', '-1') THEN NULL
-                        WHEN CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS DOUBLE) < 0 THEN NULL
-                        ELSE CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS DOUBLE) END
-               )""",
-            """CREATE OR REPLACE MACRO extract_response_proc_time(log_line) AS (
-                   CASE WHEN regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) IN ('-', '-1') THEN NULL
-                        WHEN CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS DOUBLE) < 0 THEN NULL
-                        ELSE CAST(regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) AS DOUBLE) END
-               )""",
-            # 총 응답 시간: 모든 필드가 NULL이면 NULL, 아니면 합산 (NULL은 0으로 처리)
-            """CREATE OR REPLACE MACRO extract_total_response_time(log_line) AS (
-                   CASE
-                       WHEN extract_request_proc_time(log_line) IS NULL
-                            AND extract_target_proc_time(log_line) IS NULL
-                            AND extract_response_proc_time(log_line) IS NULL
-                       THEN NULL
-                       ELSE coalesce(extract_request_proc_time(log_line), 0) +
-                            coalesce(extract_target_proc_time(log_line), 0) +
-                            coalesce(extract_response_proc_time(log_line), 0)
-                   END
-               )""",
-            # target 필드 (5번째 space-separated field, target:port 형태)
-            """CREATE OR REPLACE MACRO extract_target(log_line) AS (
-                   CASE
-                       WHEN regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ (\\S+) ', 1) = '-' THEN ''
-                       ELSE regexp_extract(log_line, '\\S+ \\S+ \\S+ \\S+ (\\S+) ', 1)
-                   END
-               )""",
-            # target_group_arn 및 name (라인 내 어디서든 안전하게 추출)
-            """CREATE OR REPLACE MACRO extract_target_group_arn(log_line) AS (
-                   coalesce(regexp_extract(log_line, '(arn:aws:elasticloadbalancing:[^\\s]+:targetgroup/[^\\s]+)', 1), '')
-               )""",
-            """CREATE OR REPLACE MACRO extract_target_group_name(log_line) AS (
-                   coalesce(regexp_extract(log_line, 'targetgroup/([^/]+)/', 1), '')
-               )""",
-            # redirect_url (마지막 7개 quoted field 중 두 번째)
-            """CREATE OR REPLACE MACRO extract_redirect_url(log_line) AS (
-                   coalesce(regexp_extract(log_line, '"[^\"]*"\\s+"([^\"]*)"\\s+"[^\"]*"\\s+"[^\"]*"\\s+"[^\"]*"\\s+"[^\"]*"\\s+"[^\"]*"\\s+\\S+\\s*$', 1), '')
-               )""",
-            # error_reason (마지막 7개 quoted field 중 세 번째)
-            """CREATE OR REPLACE MACRO extract_error_reason(log_line) AS (
-                   coalesce(regexp_extract(log_line, '"[^\"]*"\\s+"[^\"]*"\\s+"([^\"]*)"\\s+"[^\"]*"\\s+"[^\"]*"\\s+"[^\"]*"\\s+"[^\"]*"\\s+\\S+\\s*$', 1), '')
-               )""",
-            # elb 이름 추출 (예: app/my-alb-name/50dc6... -> my-alb-name)
-            """CREATE OR REPLACE MACRO extract_elb_full(log_line) AS (
-                   regexp_extract(log_line, '\\S+ \\S+ (\\S+) ', 1)
-               )""",
-            """CREATE OR REPLACE MACRO extract_elb_name(log_line) AS (
-                   coalesce(regexp_extract(extract_elb_full(log_line), '^[^/]+/([^/]+)/', 1), '')
-               )""",
-            # ========== 추가 분석 필드 (Phase 2) ==========
-            # HTTP 버전 추출 (request 필드에서: "GET /path HTTP/1.1")
-            """CREATE OR REPLACE MACRO extract_http_version(log_line) AS (
-                   CASE
-                       WHEN regexp_extract(log_line, '"[^"]*\\s+HTTP/2[^"]*"', 0) IS NOT NULL THEN 'HTTP/2'
-                       WHEN regexp_extract(log_line, '"[^"]*\\s+HTTP/1\\.1[^"]*"', 0) IS NOT NULL THEN 'HTTP/1.1'
-                       WHEN regexp_extract(log_line, '"[^"]*\\s+HTTP/1\\.0[^"]*"', 0) IS NOT NULL THEN 'HTTP/1.0'
-                       WHEN log_line LIKE '%grpc%' OR log_line LIKE '%gRPC%' THEN 'gRPC'
-                       WHEN log_line LIKE 'h2 %' OR log_line LIKE 'grpcs %' THEN 'HTTP/2'
-                       WHEN log_line LIKE 'wss %' OR log_line LIKE 'ws %' THEN 'WebSocket'
-                       ELSE 'Unknown'
-                   END
-               )""",
-            # SSL/TLS 프로토콜 (필드 15: ssl_protocol - TLSv1.2, TLSv1.3 등)
-            """CREATE OR REPLACE MACRO extract_ssl_protocol(log_line) AS (
-                   coalesce(
-                       regexp_extract(log_line, '\\s(TLSv1\\.[0-3])\\s', 1),
-                       CASE WHEN log_line LIKE 'http %' THEN 'None' ELSE '-' END
-                   )
-               )""",
-            # SSL/TLS 암호 스위트 (필드 14: ssl_cipher)
-            """CREATE OR REPLACE MACRO extract_ssl_cipher(log_line) AS (
-                   coalesce(
-                       regexp_extract(log_line, '\\s([A-Z][A-Z0-9]+-[A-Z0-9-]+)\\s+TLSv', 1),
-                       CASE WHEN log_line LIKE 'http %' THEN 'None' ELSE '-' END
-                   )
-               )""",
-            # Actions Executed (필드 22: "waf,forward", "authenticate,forward" 등)
-            """CREATE OR REPLACE MACRO extract_actions(log_line) AS (
-                   coalesce(
-                       regexp_extract(log_line, '"(waf[^"]*|forward|redirect|fixed-response|authenticate[^"]*)"', 1),
-                       '-'
-                   )
-               )""",
-            # Classification (필드 28: Acceptable, Ambiguous, Severe)
-            """CREATE OR REPLACE MACRO extract_classification(log_line) AS (
-                   coalesce(
-                       regexp_extract(log_line, '"(Acceptable|Ambiguous|Severe)"', 1),
-                       'Unknown'
-                   )
-               )""",
-            # Classification Reason (필드 29)
-            """CREATE OR REPLACE MACRO extract_classification_reason(log_line) AS (
-                   coalesce(
-                       regexp_extract(log_line, '"(Acceptable|Ambiguous|Severe)"\\s+"([^"]*)"', 2),
-                       '-'
-                   )
-               )""",
-        ]
-
-        # 함수들을 개별적으로 실행
-        for func_sql in functions:
-            try:
-                self.conn.execute(func_sql)
-            except Exception as e:
-                logger.debug(f"함수 생성 중 오류 (무시됨): {str(e)}")
+    def _build_parse_query(self, file_list_sql: str, tz_name: str | None = None, source_file: bool = False) -> str:
+        """ALB 로그 파일을 타입 컬럼으로 변환하는 SELECT 쿼리 생성
+
+        필드마다 정규식을 다시 실행하지 않고, 각 줄을 한 번만 토큰화합니다.
+
+        - ``string_split(line, '"')``: 따옴표 기준 분할 -> 짝수 번째가 quoted 필드
+          (q[2] request, q[4] user_agent, q[12] actions_executed, q[14] redirect_url,
+          q[16] error_reason, q[22] classification, q[24] classification_reason)
+          이스케이프된 따옴표(``\\"``)는 분할 전에 치환했다가 request/user_agent에서 복원
+        - q[1]: 공백 구분 필드 12개 (type ~ sent_bytes)
+        - q[5]: ssl_cipher, ssl_protocol, target_group_arn
+
+        구버전 로그처럼 후행 필드가 없으면 리스트 인덱스가 NULL이 되어 기본값으로 채워집니다.
+        https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-access-logs.html
+
+        Args:
+            file_list_sql: read_csv에 전달할 파일 경로 리스트 리터럴 내용
+            tz_name: timestamp 컬럼 타임존 (기본: 분석기 타임존, 저장소 적재 시 "UTC")
+            source_file: True이면 줄의 원본 파일 경로(source_file) 컬럼 추가 (저장소 파티션용)
+
+        Returns:
+            SELECT 쿼리 문자열
+        """
+        # ALB 로그는 UTC로 기록되므로, 사용자 타임존으로 변환
+        if tz_name is None:
+            tz_name = self.timezone.zone if hasattr(self.timezone, "zone") else str(self.timezone)
+        # 파싱 없이 그대로 전달하는 컬럼 (원본 줄, 원본 파일 경로)
+        passthrough_sql = "line AS raw_line," if self.keep_raw_line else ""
+        passthrough_column = "raw_line," if self.keep_raw_line else ""
+        if source_file:
+            passthrough_sql += " filename AS source_file,"
+            passthrough_column += " source_file,"
+
+        # 처리 시간 3필드 (-1은 타임아웃/연결실패를 의미, NULL로 처리)
+        def proc_time(index: int) -> str:
+            return f"CASE WHEN TRY_CAST(h[{index}] AS DOUBLE) >= 0 THEN TRY_CAST(h[{index}] AS DOUBLE) END"
+
+        return f"""
+            WITH tokens AS (
+                SELECT {passthrough_column} q, string_split(q[1], ' ') AS h, string_split(trim(q[5]), ' ') AS m
+                FROM (
+                    SELECT {passthrough_sql} string_split(
+                        CASE WHEN contains(line, '\\"') THEN replace(line, '\\"', chr(1)) ELSE line END, '"'
+                    ) AS q
+                    FROM read_csv([{file_list_sql}],
+                                  delim='\\t',
+                                  quote='',
+                                  escape='',
+                                  header=false,
+                                  columns={{'line': 'VARCHAR'}},
+                                  filename={str(source_file).lower()},
+                                  ignore_errors=true)
+                    WHERE line IS NOT NULL
+                      AND length(line) > 50
+                )
+            ),
+            parsed AS (
+                SELECT
+                    {passthrough_column}
+                    timezone('{tz_name}',
+                        try_strptime(h[2], '%Y-%m-%dT%H:%M:%S.%fZ') AT TIME ZONE 'UTC'
+                    ) AS timestamp,
+                    split_part(h[4], ':', 1) AS client_ip,
+                    CASE WHEN h[5] = '-' THEN '' ELSE split_part(h[5], ':', 1) END AS target_ip,
+                    CASE WHEN h[5] = '-' THEN '' ELSE split_part(h[5], ':', 2) END AS target_port,
+                    CASE WHEN h[5] = '-' THEN '' ELSE h[5] END AS target,
+                    h[3] AS elb_full,
+                    split_part(h[3], '/', 2) AS elb_name,
+                    h[9] AS elb_status_code,
+                    h[10] AS target_status_code,
+                    {proc_time(6)} AS request_processing_time,
+                    {proc_time(7)} AS target_processing_time,
+                    {proc_time(8)} AS response_processing_time,
+                    replace(q[2], chr(1), '"') AS request,
+                    split_part(q[2], ' ', 1) AS http_method,
+                    replace(split_part(q[2], ' ', 2), chr(1), '"') AS url,
+                    replace(q[4], chr(1), '"') AS user_agent,
+                    CASE WHEN coalesce(m[3], '-') = '-' THEN '' ELSE m[3] END AS target_group_arn,
+                    split_part(split_part(coalesce(m[3], ''), 'targetgroup/', 2), '/', 1) AS target_group_name,
+                    coalesce(q[14], '') AS redirect_url,
+                    coalesce(q[16], '') AS error_reason,
+                    TRY_CAST(h[11] AS BIGINT) AS received_bytes,
+                    TRY_CAST(h[12] AS BIGINT) AS sent_bytes,
+                    -- 추가 분석 필드 (Phase 2)
+                    CASE
+                        WHEN split_part(q[2], ' ', 3) LIKE 'HTTP/2%' THEN 'HTTP/2'
+                        WHEN split_part(q[2], ' ', 3) = 'HTTP/1.1' THEN 'HTTP/1.1'
+                        WHEN split_part(q[2], ' ', 3) = 'HTTP/1.0' THEN 'HTTP/1.0'
+                        WHEN h[1] = 'grpcs' THEN 'gRPC'
+                        WHEN h[1] = 'h2' THEN 'HTTP/2'
+                        WHEN h[1] IN ('ws', 'wss') THEN 'WebSocket'
+                        ELSE 'Unknown'
+                    END AS http_version,
+                    CASE WHEN h[1] = 'http' THEN 'None' ELSE coalesce(m[2], '-') END AS ssl_protocol,
+                    CASE WHEN h[1] = 'http' THEN 'None' ELSE coalesce(m[1], '-') END AS ssl_cipher,
+                    coalesce(nullif(q[12], ''), '-') AS actions_executed,
+                    CASE
+                        WHEN q[22] IN ('Acceptable', 'Ambiguous', 'Severe') THEN q[22]
+                        ELSE 'Unknown'
+                    END AS classification,
+                    coalesce(nullif(q[24], ''), '-') AS classification_reason
+                FROM tokens
+                -- 공백 필드 12개 + request/user_agent가 없는 줄은 ALB 로그가 아님
+                WHERE len(h) >= 13 AND len(q) >= 5
+            )
+            SELECT
+                *,
+                -- 총 응답 시간: 모든 필드가 NULL이면 NULL, 아니면 합산 (NULL은 0으로 처리)
+                CASE
+                    WHEN request_processing_time IS NULL
+                         AND target_processing_time IS NULL
+                         AND response_processing_time IS NULL
+                    THEN NULL
+                    ELSE coalesce(request_processing_time, 0) +
+                         coalesce(target_processing_time, 0) +
+                         coalesce(response_processing_time, 0)
+                END AS response_time
+            FROM parsed
+        """
 
     def download_logs(self) -> list[str]:
         """S3에서 로그 파일을 다운로드합니다."""
         return self.downloader.download_logs()
 
+    def download_and_load_logs(self) -> int:
+        """S3 로그를 다운로드하면서 배치 단위로 바로 DuckDB에 적재합니다.
+
+        다운로드 작업자가 다음 파일을 받는 동안 이전 배치의 .gz 파일을 DuckDB가 직접 읽어
+        alb_logs 테이블에 추가하므로, 압축 해제 단계와 전체 다운로드 완료 대기가 없습니다.
+        적재가 끝난 .gz 파일은 바로 삭제하여 디스크에는 DuckDB 테이블만 남깁니다.
+
+        로컬 Parquet 저장소(log_store)를 사용하면 저장소에 없는 파일만 다운로드하여
+        Parquet로 추가하고, alb_logs는 분석 구간의 시간 파티션을 읽는 뷰가 됩니다.
+
+        Returns:
+            분석 구간의 로그 파일 수 (저장소에서 재사용한 파일 포함, 0이면 분석할 로그 없음)
+
+        Raises:
+            LogDownloadError: S3 접근 실패 또는 다운로드된 파일이 없는 경우
+        """
+        store = self.log_store
+        exclude = store.ingested_files(self.conn) if store else set()
+
+        loaded_files = 0
+        for batch in self.downloader.iter_download_batches(exclude=exclude):
+            if store:
+                file_list_sql = self._file_list_sql(batch)
+                store.ingest(
+                    self.conn,
+                    self._build_parse_query(file_list_sql, tz_name="UTC", source_file=True),
+                    [os.path.basename(p) for p in batch],
+                    source_file_column="source_file",
+                )
+            else:
+                self._ingest_log_files(batch, append=loaded_files > 0)
+            loaded_files += len(batch)
+            for path in batch:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+        if store:
+            loaded_files += self.downloader.excluded_count
+            if loaded_files and store.has_data():
+                self._create_store_view(store)
+
+        # 로드된 파일 메타 저장 (Summary 시트 표시용)
+        self.loaded_log_files_count = loaded_files
+        self.loaded_log_directory = str(store.root) if store else self.temp_dir
+
+        # 저장소에 데이터가 없으면 alb_logs 뷰를 만들지 않으므로 적재 여부로 확인
+        if loaded_files and self._logs_loaded:
+            count_result = self.conn.execute("SELECT COUNT(*) FROM alb_logs").fetchone()
+            total_records = count_result[0] if count_result else 0
+            logger.debug(f"✅ {loaded_files}개 파일, 총 {total_records:,}개의 로그 레코드 적재 완료")
+        return loaded_files
+
+    def _create_store_view(self, store: ALBLogStore) -> None:
+        """분석 구간의 저장소 파티션을 읽는 alb_logs 뷰 생성"""
+        tz_name = self.timezone.zone if hasattr(self.timezone, "zone") else str(self.timezone)
+        start_utc, end_utc = (
+            (dt if dt.tzinfo else self.timezone.localize(dt)).astimezone(pytz.UTC)
+            for dt in (self.start_datetime, self.end_datetime)
+        )
+
+        # 이전 실행의 alb_logs 테이블이 남아 있으면 뷰로 교체
+        self._drop_alb_logs()
+        store.create_view(self.conn, "alb_logs", tz_name, start_utc, end_utc)
+        self._logs_loaded = True
+
     def decompress_logs(self, gz_directory: str) -> str:
         """압축된 로그 파일을 해제합니다."""
         return self.downloader.decompress_logs(gz_directory)
 
-    def analyze_logs(self, log_directory: str) -> dict[str, Any]:
-        """DuckDB 기반 로그 파일들을 분석합니다."""
+    def analyze_logs(self, log_directory: str | None = None) -> dict[str, Any]:
+        """DuckDB 기반 로그 파일들을 분석합니다.
+
+        Args:
+            log_directory: 로그 파일(.log 또는 .gz) 디렉토리.
+                None이면 download_and_load_logs()로 이미 적재된 alb_logs 테이블을 분석합니다.
+        """
         try:
             print_sub_info("ALB 로그 분석을 시작합니다...")
 
@@ -374,9 +409,12 @@ class ALBLogAnalyzer:
             ) as progress:
                 task = progress.add_task("[#FF9900]분석 중...", total=7)
 
-                # 1) 로그 파일들을 DuckDB로 로드
+                # 1) 로그 파일들을 DuckDB로 로드 (이미 스트리밍 적재된 경우 생략)
                 progress.update(task, description="[#FF9900]로그 파일 로드 중...")
-                table_name = self._load_logs_to_duckdb(log_directory)
+                if log_directory is None:
+                    table_name = "alb_logs" if self._logs_loaded else None
+                else:
+                    table_name = self._load_logs_to_duckdb(log_directory)
                 if not table_name:
                     logger.warning("분석할 로그가 없습니다.")
                     return self._get_empty_analysis_results()
@@ -421,7 +459,8 @@ class ALBLogAnalyzer:
             log_files = []
             for root, _, files in os.walk(log_directory):
                 for file in files:
-                    if file.endswith(".log"):
+                    # .gz는 DuckDB가 직접 압축 해제하며 읽음
+                    if file.endswith((".log", ".log.gz", ".gz")):
                         log_files.append(os.path.join(root, file))
 
             if not log_files:
@@ -494,60 +533,7 @@ class ALBLogAnalyzer:
             except Exception:
                 pass  # nosec B110 - Non-critical metadata assignment
 
-            # 파일 리스트를 DuckDB가 이해할 수 있는 리스트 리터럴로 변환
-            backslash = "\\"
-            file_list_sql = ", ".join([f"'{p.replace(backslash, '/')}'" for p in log_files])
-
-            # 로그 파일들을 하나의 테이블로 로드
-            create_table_query = f"""
-            CREATE OR REPLACE TABLE alb_logs AS
-            SELECT
-                line as raw_line,
-                extract_timestamp(line) as timestamp,
-                extract_client_ip(line) as client_ip,
-                extract_target_ip(line) as target_ip,
-                extract_target_port(line) as target_port,
-                extract_target(line) as target,
-                extract_elb_full(line) as elb_full,
-                extract_elb_name(line) as elb_name,
-                extract_elb_status(line) as elb_status_code,
-                extract_target_status(line) as target_status_code,
-                extract_request_proc_time(line) as request_processing_time,
-                extract_target_proc_time(line) as target_processing_time,
-                extract_response_proc_time(line) as response_processing_time,
-                extract_total_response_time(line) as response_time,
-                extract_request(line) as request,
-                extract_method(line) as http_method,
-                extract_url(line) as url,
-                extract_user_agent(line) as user_agent,
-                extract_target_group_arn(line) as target_group_arn,
-                extract_target_group_name(line) as target_group_name,
-                extract_redirect_url(line) as redirect_url,
-                extract_error_reason(line) as error_reason,
-                extract_received_bytes(line) as received_bytes,
-                extract_sent_bytes(line) as sent_bytes,
-                -- 추가 분석 필드 (Phase 2)
-                extract_http_version(line) as http_version,
-                extract_ssl_protocol(line) as ssl_protocol,
-                extract_ssl_cipher(line) as ssl_cipher,
-                extract_actions(line) as actions_executed,
-                extract_classification(line) as classification,
-                extract_classification_reason(line) as classification_reason
-            FROM read_csv_auto([{file_list_sql}],
-                              delim='\\t',
-                              header=false,
-                              columns={{'line': 'VARCHAR'}},
-                              ignore_errors=true)
-            WHERE line IS NOT NULL
-              AND line != ''
-              AND length(line) > 50
-            """
-
-            # 로그 로드 및 체크포인트 (상위 Progress에서 관리)
-            self.conn.execute(create_table_query)
-            # 로드 직후 디스크에 플러시하여 메모리 압박을 줄임
-            with contextlib.suppress(Exception):
-                self.conn.execute("CHECKPOINT")
+            self._ingest_log_files(log_files, append=False)
 
             # 로드된 레코드 수 확인
             count_result = self.conn.execute("SELECT COUNT(*) FROM alb_logs").fetchone()
@@ -561,6 +547,41 @@ class ALBLogAnalyzer:
             logger.error(f"❌ 로그 파일 로드 실패: {str(e)}")
             return None
 
+    def _drop_alb_logs(self) -> None:
+        """alb_logs 테이블 또는 뷰 삭제 (DuckDB는 DROP 시 객체 종류가 일치해야 함)"""
+        row = self.conn.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = 'alb_logs'"
+        ).fetchone()
+        if row:
+            self.conn.execute(f"DROP {'VIEW' if row[0] == 'VIEW' else 'TABLE'} alb_logs")
+
+    @staticmethod
+    def _file_list_sql(log_files: list[str]) -> str:
+        """파일 리스트를 DuckDB가 이해할 수 있는 리스트 리터럴 내용으로 변환"""
+        backslash = "\\"
+        return ", ".join([f"'{p.replace(backslash, '/')}'" for p in log_files])
+
+    def _ingest_log_files(self, log_files: list[str], append: bool) -> None:
+        """로그 파일(.log/.gz)을 파싱하여 alb_logs 테이블에 적재합니다.
+
+        Args:
+            log_files: 로그 파일 경로 목록
+            append: True면 기존 테이블에 INSERT, False면 테이블을 새로 생성
+        """
+        # 줄당 1회 토큰화
+        parse_query = self._build_parse_query(self._file_list_sql(log_files))
+        if append:
+            self.conn.execute(f"INSERT INTO alb_logs {parse_query}")
+        else:
+            # 저장소 모드에서 만든 alb_logs 뷰가 남아 있으면 테이블로 교체
+            self._drop_alb_logs()
+            self.conn.execute(f"CREATE TABLE alb_logs AS {parse_query}")
+        self._logs_loaded = True
+
+        # 적재 직후 디스크에 플러시하여 메모리 압박을 줄임
+        with contextlib.suppress(Exception):
+            self.conn.execute("CHECKPOINT")
+
     def _analyze_with_duckdb(
         self,
         progress: Progress | None = None,
@@ -1660,7 +1681,7 @@ class ALBLogAnalyzer:
                     country_mapping = self.ip_intel.get_country_codes_batch(unique_ips)
 
                     # 국가별 통계 생성
-                    country_stats = self.ip_intel.get_country_statistics(unique_ips)
+                    country_stats = self.ip_intel.get_country_statistics(unique_ips, country_mapping)
 
                     # 결과에 추가
                     analysis_results["ip_country_mapping"] = country_mapping
@@ -1,8 +1,9 @@
 """functions/reports/log_analyzer/alb_log_downloader.py - S3 ALB 로그 다운로더.
 
-S3에 저장된 ALB 액세스 로그를 병렬 다운로드하고 .gz 압축을 해제합니다.
+S3에 저장된 ALB 액세스 로그(.gz)를 병렬 다운로드합니다.
 스마트 필터링(S3 prefix 기반 시간 범위 필터)으로 불필요한 파일 다운로드를 방지하며,
-배치 처리와 메모리 효율적인 스트리밍 압축 해제를 지원합니다.
+다운로드가 끝난 파일을 배치 단위로 넘겨(iter_download_batches) 다운로드와 적재를
+파이프라인으로 처리할 수 있습니다. DuckDB가 .gz를 직접 읽으므로 압축 해제는 필요하지 않습니다.
 """
 
 from __future__ import annotations
@@ -13,6 +14,7 @@ import gc
 import gzip
 import os
 import shutil
+from collections.abc import Collection, Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, NamedTuple
@@ -193,6 +195,9 @@ class ALBLogDownloader:
         # 요청 범위 미스매치 시 사용자 안내를 위해 S3에서 확인된 실제 로그 범위(KST)를 저장
         self.available_range_local: tuple[datetime, datetime] | None = None
 
+        # iter_download_batches(exclude=...)에서 제외된 파일 수
+        self.excluded_count = 0
+
         # 디렉토리 생성
         os.makedirs(self.temp_dir, exist_ok=True)
         os.makedirs(self.decompressed_dir, exist_ok=True)
@@ -581,6 +586,25 @@ class ALBLogDownloader:
 
     def download_logs(self) -> list[str]:
         """최적화된 방식으로 S3에서 로그 파일을 다운로드합니다."""
+        return [path for batch in self.iter_download_batches() for path in batch]
+
+    def iter_download_batches(self, exclude: Collection[str] = ()) -> Iterator[list[str]]:
+        """S3 로그 파일을 병렬 다운로드하며, 완료된 파일을 배치 단위로 반환합니다.
+
+        다운로드 작업자는 호출자가 이전 배치를 처리하는 동안에도 계속 다음 파일을
+        받으므로, 호출자는 배치를 받는 즉시 적재(DuckDB INSERT 등)를 시작할 수 있습니다.
+
+        Args:
+            exclude: 다운로드하지 않을 로그 파일명(basename) 목록 (예: 로컬 저장소에 이미 적재된 파일).
+                시간 범위에 해당하지만 제외된 파일 수는 ``excluded_count``에 기록됩니다.
+
+        Yields:
+            다운로드 완료된 로컬 .gz 파일 경로 목록 (적응형 배치 크기 단위)
+
+        Raises:
+            LogDownloadError: S3 접근 실패 또는 다운로드된 파일이 하나도 없는 경우
+        """
+        self.excluded_count = 0
         try:
             # 🔐 S3 버킷 접근 권한 사전 검증
             self._verify_s3_access()
@@ -596,7 +620,7 @@ class ALBLogDownloader:
 
             if not date_prefixes:
                 print_sub_warning("생성된 날짜별 접두사가 없습니다.")
-                return []
+                return
 
             # S3에서 로그 파일 검색 및 시간 필터링
             all_log_files = self._get_log_files_from_s3(date_prefixes)
@@ -621,13 +645,23 @@ class ALBLogDownloader:
                         print_sub_warning(
                             f"실제 로그 범위({self.timezone.zone}): {earliest_local} ~ {latest_local}"
                         )  # Fallback
-                return []
+                return
+
+            # 이미 적재된 파일 제외
+            if exclude:
+                before = len(filtered_files)
+                filtered_files = [f for f in filtered_files if os.path.basename(f.key) not in exclude]
+                self.excluded_count = before - len(filtered_files)
+                if self.excluded_count:
+                    print_sub_task_done(f"로컬 저장소에 적재된 {self.excluded_count}개 파일은 다운로드하지 않습니다.")
+                if not filtered_files:
+                    return
 
             total_files = len(filtered_files)
             total_size = sum(f.size for f in filtered_files)
             avg_file_size = total_size / total_files if total_files > 0 else 0
 
-            # 적응형 배치 크기 계산
+            # 적응형 배치 크기 계산 (호출자에게 넘기는 단위)
             adaptive_batch_size = self._adaptive_batch_size(total_files, avg_file_size)
 
             print_sub_task_done(
@@ -637,8 +671,8 @@ class ALBLogDownloader:
             # 파일 크기별 정렬 (큰 파일 먼저 - 병렬 처리 효율성 향상)
             filtered_files.sort(key=lambda x: x.size, reverse=True)
 
-            # 배치 단위로 다운로드
-            downloaded_files = []
+            downloaded_count = 0
+            batch: list[str] = []
 
             with Progress(
                 SpinnerColumn(),
@@ -653,45 +687,41 @@ class ALBLogDownloader:
                     total=total_files,
                 )
 
-                # 적응형 배치로 다운로드
-                for i in range(0, total_files, adaptive_batch_size):
-                    batch = filtered_files[i : i + adaptive_batch_size]
-                    batch_size_mb = sum(f.size for f in batch) / 1024 / 1024
-
-                    logger.debug(f"배치 {i // adaptive_batch_size + 1}: {len(batch)}개 파일, {batch_size_mb:.1f}MB")
-
-                    with concurrent.futures.ThreadPoolExecutor(
-                        max_workers=min(self.max_workers, len(batch))
-                    ) as executor:
-                        future_to_file = {
-                            executor.submit(
-                                self._download_single_file,
-                                f.key,
-                                progress,
-                                download_task,
-                            ): f
-                            for f in batch
-                        }
-
-                        for future in concurrent.futures.as_completed(future_to_file):
-                            log_file = future_to_file[future]
-                            try:
-                                result = future.result()
-                                if result:
-                                    downloaded_files.append(result)
-                                progress.update(download_task, advance=1)
-                            except Exception as e:
-                                logger.error(f"❌ 파일 다운로드 실패 ({log_file.key}): {str(e)}")
-                                progress.update(download_task, advance=1)
-
-                    # 배치 완료 후 메모리 정리
-                    gc.collect()
-
-            if not downloaded_files:
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, total_files))
+                try:
+                    future_to_file = {
+                        executor.submit(self._download_single_file, f.key, progress, download_task): f
+                        for f in filtered_files
+                    }
+
+                    for future in concurrent.futures.as_completed(future_to_file):
+                        log_file = future_to_file[future]
+                        try:
+                            result = future.result()
+                            if result:
+                                batch.append(result)
+                                downloaded_count += 1
+                        except Exception as e:
+                            logger.error(f"❌ 파일 다운로드 실패 ({log_file.key}): {str(e)}")
+                        progress.update(download_task, advance=1)
+
+                        if len(batch) >= adaptive_batch_size:
+                            logger.debug(f"배치 전달: {len(batch)}개 파일 (누적 {downloaded_count}/{total_files})")
+                            yield batch
+                            batch = []
+                            # 배치 처리 후 메모리 정리
+                            gc.collect()
+
+                    if batch:
+                        yield batch
+                finally:
+                    # 호출자가 중간에 중단한 경우 대기 중인 다운로드 취소
+                    executor.shutdown(wait=True, cancel_futures=True)
+
+            if downloaded_count == 0:
                 raise LogDownloadError("다운로드된 파일이 없습니다.")
 
-            print_sub_task_done(f"다운로드 완료: {len(downloaded_files)}개 파일")
-            return downloaded_files
+            print_sub_task_done(f"다운로드 완료: {downloaded_count}개 파일")
 
         except Exception as e:
             logger.error(f"로그 다운로드 중 오류 발생: {str(e)}")
@@ -761,7 +791,12 @@ class ALBLogDownloader:
             return None
 
     def decompress_logs(self, gz_directory: str | None = None) -> str:
-        """압축된 로그 파일을 해제합니다."""
+        """압축된 로그 파일을 해제합니다.
+
+        Note:
+            ALBLogAnalyzer는 .gz 파일을 직접 읽으므로 분석 경로에서는 사용하지 않습니다.
+            압축 해제된 .log 파일이 별도로 필요한 경우를 위해 유지됩니다.
+        """
         if gz_directory is None:
             gz_directory = self.temp_dir
 
@@ -0,0 +1,199 @@
+"""functions/reports/log_analyzer/alb_log_store.py - ALB 로그 로컬 Parquet 저장소.
+
+파싱된 ALB 로그를 로드밸런서/시간(UTC) 단위 Hive 파티션 Parquet로 보관하여,
+같은 기간을 다시 분석할 때 이미 적재된 S3 객체는 다운로드/파싱하지 않도록 합니다.
+
+디렉토리 구조:
+    {root}/elb={elb_name}/hour={YYYY-MM-DDTHH}/part_{batch_id}_{uuid}.parquet
+    {root}/_manifest/{batch_id}.parquet   # 배치별 적재 완료 S3 객체 파일명
+
+- 타임스탬프는 UTC로 저장하고, 분석 시 뷰에서 사용자 타임존으로 변환합니다.
+- 타임스탬프를 파싱하지 못한 줄도 버리지 않고, 원본 S3 객체명의 시각
+  (``..._20240101T0005Z_...``)에 해당하는 시간 파티션에 보관합니다.
+- 매니페스트는 데이터 파일을 쓴 뒤에 기록되며, 매니페스트가 없는 배치의 데이터 파일
+  (적재 중 중단)은 저장소를 열 때 삭제되어 중복 적재되지 않습니다.
+
+Example:
+    store = ALBLogStore(ALBLogStore.default_root(bucket, prefix))
+    exclude = store.ingested_files(conn)
+    ...
+    store.ingest(conn, parse_query, [os.path.basename(p) for p in batch])
+    store.create_view(conn, "alb_logs", "Asia/Seoul", start_utc, end_utc)
+"""
+
+from __future__ import annotations
+
+import re
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from core.tools.cache import get_cache_dir
+
+# 데이터 파일명: part_{batch_id}_{uuid}.parquet
+_PART_FILE_RE = re.compile(r"^part_([0-9a-f]{32})_[0-9a-f-]+\.parquet$")
+
+# ALB 로그 객체명의 구간 종료 시각 ({account}_elasticloadbalancing_{region}_{lb}_{YYYYMMDDTHHMMZ}_{ip}_{random}.log.gz)
+_FILE_TIME_SQL_RE = r"_(\d{8}T\d{4})Z_"
+
+# 타임스탬프와 파일명 모두에서 시각을 얻지 못한 줄의 시간 파티션
+UNKNOWN_HOUR = "unknown"
+
+
+def _sql_path(path: Path | str) -> str:
+    """DuckDB 리터럴용 경로 (슬래시 통일, 작은따옴표 이스케이프)"""
+    return Path(path).as_posix().replace("'", "''")
+
+
+class ALBLogStore:
+    """파싱된 ALB 로그를 보관하는 로컬 Parquet 저장소
+
+    Attributes:
+        root: 저장소 루트 디렉토리 (S3 버킷/접두사별)
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.manifest_dir = self.root / "_manifest"
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        self._prune_orphan_parts()
+
+    @staticmethod
+    def default_root(bucket_name: str, prefix: str, base_dir: str | None = None) -> Path:
+        """S3 버킷/접두사별 저장소 경로
+
+        Args:
+            bucket_name: S3 버킷 이름
+            prefix: 로그 접두사
+            base_dir: 저장소 기본 디렉토리 (기본: temp/alb_store)
+
+        Returns:
+            저장소 루트 경로
+        """
+        base = Path(base_dir) if base_dir else Path(get_cache_dir("alb_store"))
+        scope = re.sub(r"[^A-Za-z0-9._-]+", "_", f"{bucket_name}/{prefix.strip('/')}").strip("_")
+        return base / scope
+
+    # =========================================================================
+    # 매니페스트
+    # =========================================================================
+
+    def _manifest_batches(self) -> set[str]:
+        return {p.stem for p in self.manifest_dir.glob("*.parquet")}
+
+    def _prune_orphan_parts(self) -> None:
+        """매니페스트에 없는 배치의 데이터 파일 삭제 (적재 중 중단된 배치)"""
+        committed = self._manifest_batches()
+        for part in self.root.glob("elb=*/hour=*/part_*.parquet"):
+            match = _PART_FILE_RE.match(part.name)
+            if match and match.group(1) not in committed:
+                part.unlink(missing_ok=True)
+
+    def ingested_files(self, conn: Any) -> set[str]:
+        """적재 완료된 S3 객체 파일명 목록
+
+        Args:
+            conn: DuckDB 연결
+
+        Returns:
+            로그 파일명(basename) 집합
+        """
+        if not any(self.manifest_dir.glob("*.parquet")):
+            return set()
+        rows = conn.execute(
+            f"SELECT DISTINCT file FROM read_parquet('{_sql_path(self.manifest_dir)}/*.parquet')"
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    def has_data(self) -> bool:
+        """저장된 데이터 파일이 하나라도 있는지 여부"""
+        return any(self.root.glob("elb=*/hour=*/*.parquet"))
+
+    # =========================================================================
+    # 적재 / 조회
+    # =========================================================================
+
+    def ingest(
+        self,
+        conn: Any,
+        parse_query: str,
+        file_names: list[str],
+        source_file_column: str | None = None,
+    ) -> None:
+        """파싱 쿼리 결과를 파티션 Parquet로 추가하고 매니페스트에 기록
+
+        타임스탬프가 NULL인 줄도 저장합니다 (비저장소 적재와 동일). 이런 줄의 시간 파티션은
+        source_file_column의 로그 객체명 시각, 없으면 ``hour=unknown`` 입니다.
+
+        Args:
+            conn: DuckDB 연결
+            parse_query: UTC 타임스탬프로 파싱하는 SELECT 쿼리
+            file_names: 이 배치에 포함된 로그 파일명 (매니페스트 기록용)
+            source_file_column: 줄의 원본 파일 경로 컬럼 (저장하지 않고 파티션 결정에만 사용)
+        """
+        batch_id = uuid.uuid4().hex
+        if source_file_column:
+            exclude_sql = f" EXCLUDE ({source_file_column})"
+            file_hour_sql = (
+                f"strftime(try_strptime(regexp_extract({source_file_column}, '{_FILE_TIME_SQL_RE}', 1),"
+                " '%Y%m%dT%H%M'), '%Y-%m-%dT%H'), "
+            )
+        else:
+            exclude_sql = file_hour_sql = ""
+        conn.execute(
+            f"""
+            COPY (
+                SELECT *{exclude_sql},
+                       coalesce(nullif(elb_name, ''), 'unknown') AS elb,
+                       coalesce(strftime(timestamp, '%Y-%m-%dT%H'), {file_hour_sql}'{UNKNOWN_HOUR}') AS hour
+                FROM ({parse_query})
+            ) TO '{_sql_path(self.root)}'
+            (FORMAT PARQUET, COMPRESSION ZSTD, PARTITION_BY (elb, hour),
+             APPEND, FILENAME_PATTERN 'part_{batch_id}_{{uuid}}')
+            """
+        )
+
+        # 데이터 파일 기록 후 매니페스트 커밋
+        names_sql = ", ".join("'" + name.replace("'", "''") + "'" for name in file_names)
+        manifest_path = self.manifest_dir / f"{batch_id}.parquet"
+        conn.execute(
+            f"""
+            COPY (SELECT unnest([{names_sql}]::VARCHAR[]) AS file, now() AS loaded_at)
+            TO '{_sql_path(manifest_path)}' (FORMAT PARQUET)
+            """
+        )
+
+    def create_view(
+        self,
+        conn: Any,
+        view_name: str,
+        tz_name: str,
+        start_utc: datetime,
+        end_utc: datetime,
+    ) -> None:
+        """분석 구간 시간 파티션만 읽는 뷰 생성 (타임스탬프는 tz_name으로 변환)
+
+        ``hour=unknown`` 파티션(시각을 알 수 없는 줄)은 어느 구간에도 속하지 않아 제외됩니다.
+
+        Args:
+            conn: DuckDB 연결
+            view_name: 생성할 뷰 이름
+            tz_name: 분석 타임존
+            start_utc: 분석 시작 (UTC)
+            end_utc: 분석 종료 (UTC)
+        """
+        start_hour = start_utc.strftime("%Y-%m-%dT%H")
+        end_hour = (end_utc + timedelta(hours=1)).strftime("%Y-%m-%dT%H")
+        conn.execute(
+            f"""
+            CREATE OR REPLACE VIEW {view_name} AS
+            SELECT * EXCLUDE (elb, hour)
+                     REPLACE (timezone('{tz_name}', timestamp AT TIME ZONE 'UTC') AS timestamp)
+            FROM read_parquet('{_sql_path(self.root)}/elb=*/hour=*/*.parquet',
+                              hive_partitioning = true,
+                              hive_types = {{'elb': VARCHAR, 'hour': VARCHAR}},
+                              union_by_name = true)
+            WHERE hour >= '{start_hour}' AND hour < '{end_hour}'
+            """
+        )
@@ -7,6 +7,8 @@ GeoIP 국가 매핑과 악성 IP 탐지 기능을 제공하며, 로컬 JSON 캐
     IPDataCache        - 캐시 공통 로직 (JSON 파일 기반, 만료 시간 관리).
     IPDenyProvider     - IPDeny 데이터 제공자 (국가별 CIDR 블록 다운로드).
     AbuseIPDBProvider  - AbuseIPDB 데이터 제공자 (API 키 기반 악성 IP 조회).
+    IPRangeTable       - 겹치지 않는 정수 구간 테이블 (이진 탐색 기반 국가 조회,
+                         numpy 설치 시 일괄 조회는 searchsorted 벡터화).
     IPIntelligence     - 통합 IP 인텔리전스 (국가 매핑 + 악성 IP 체크).
 """
 
@@ -16,11 +18,15 @@ import contextlib
 import ipaddress
 import json
 import os
+import socket
 import tarfile
 import tempfile
+from bisect import bisect_right
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from ipaddress import AddressValueError, IPv4Network, IPv6Network
-from typing import Any
+from itertools import repeat
+from typing import Any, overload
 
 import requests
 from rich.console import Console
@@ -36,6 +42,12 @@ except ImportError:
     console = Console()
     logger = logging.getLogger(__name__)
 
+# numpy가 있으면 IPv4 일괄 조회를 벡터화 (선택 의존성: performance extra)
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]  # Optional dependency
+
 
 # =============================================================================
 # 캐시 공통 클래스
@@ -283,6 +295,137 @@ class AbuseIPDBProvider:
         return ip in data.get("abuse_ips", set())
 
 
+# =============================================================================
+# 구간 테이블 (Longest-Prefix 조회)
+# =============================================================================
+
+
+class IPRangeTable:
+    """겹치지 않는 [start, end] 정수 구간 → 국가 코드 테이블
+
+    CIDR 블록은 서로 포함되거나 완전히 분리되므로, 한 번의 스윕으로 안쪽(더 긴 prefix)
+    블록이 바깥 블록을 덮어쓴 분리 구간 목록을 만들 수 있습니다. 조회는 시작 주소
+    목록에 대한 이진 탐색 한 번으로 끝나며, 결과는 Longest-Prefix-Win과 동일합니다.
+
+    Attributes:
+        starts: 구간 시작 (오름차순, 0번은 sentinel -1)
+        ends: 구간 끝 (포함)
+        codes: 구간 국가 코드 (0번 sentinel은 None)
+    """
+
+    def __init__(self, starts: list[int], ends: list[int], codes: list[str]):
+        # 맨 앞 sentinel 덕분에 bisect 결과 - 1이 항상 유효한 인덱스
+        self.starts: list[int] = [-1, *starts]
+        self.ends: list[int] = [-1, *ends]
+        self.codes: list[str | None] = [None, *codes]
+        # numpy 일괄 조회용 (starts, ends) int64 배열 (첫 lookup_many 시 생성)
+        self._arrays: tuple[Any, Any] | None = None
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int, str]]) -> IPRangeTable:
+        """포함 관계가 있는 (start, end, code) 구간들을 분리 구간 테이블로 변환
+
+        Args:
+            ranges: (시작 정수, 끝 정수, 국가 코드) 목록
+
+        Returns:
+            IPRangeTable
+        """
+        # 시작 오름차순, 같은 시작이면 큰 블록 먼저 (바깥 → 안쪽 순서로 스택에 쌓임)
+        # 동일 블록이 여러 국가에 있으면 먼저 나온 국가 유지 (기존 선형 탐색과 동일)
+        ordered: list[tuple[int, int, str]] = []
+        seen: set[tuple[int, int]] = set()
+        for start, end, code in ranges:
+            if (start, end) not in seen:
+                seen.add((start, end))
+                ordered.append((start, end, code))
+        ordered.sort(key=lambda r: (r[0], -r[1]))
+
+        starts: list[int] = []
+        ends: list[int] = []
+        codes: list[str] = []
+
+        def emit(start: int, end: int, code: str) -> None:
+            # 인접한 같은 국가 구간은 병합
+            if codes and codes[-1] == code and ends[-1] + 1 == start:
+                ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+                codes.append(code)
+
+        stack: list[tuple[int, str]] = []
+        cursor = 0
+        for start, end, code in ordered:
+            # 현재 블록 시작 전에 끝나는 블록들의 남은 꼬리 구간 출력
+            while stack and stack[-1][0] < start:
+                top_end, top_code = stack.pop()
+                if cursor <= top_end:
+                    emit(cursor, top_end, top_code)
+                    cursor = top_end + 1
+            if stack and cursor < start:
+                emit(cursor, start - 1, stack[-1][1])
+            cursor = max(cursor, start)
+            stack.append((end, code))
+        while stack:
+            top_end, top_code = stack.pop()
+            if cursor <= top_end:
+                emit(cursor, top_end, top_code)
+                cursor = top_end + 1
+
+        return cls(starts, ends, codes)
+
+    def __len__(self) -> int:
+        return len(self.codes) - 1
+
+    def lookup(self, value: int) -> str | None:
+        """정수 주소가 속한 구간의 국가 코드 (없으면 None)"""
+        i = bisect_right(self.starts, value) - 1
+        return self.codes[i] if value <= self.ends[i] else None
+
+    @overload
+    def lookup_many(self, values: list[int], default: str) -> list[str]: ...
+
+    @overload
+    def lookup_many(self, values: list[int], default: None = None) -> list[str | None]: ...
+
+    def lookup_many(self, values: list[int], default: str | None = None) -> list[str] | list[str | None]:
+        """여러 정수 주소 일괄 조회
+
+        이진 탐색은 map으로 C 레벨에서 연속 실행하고, 구간 끝 확인만 한 번 순회합니다.
+
+        numpy가 설치되어 있고 구간이 int64 범위(IPv4)이면 searchsorted로 한 번에 조회합니다.
+
+        Args:
+            values: 정수 주소 목록 (numpy 정수 배열도 가능)
+            default: 매칭 없을 때 값
+
+        Returns:
+            values와 같은 순서의 국가 코드 목록
+        """
+        if np is not None and self.ends[-1] < 1 << 63:
+            return self._lookup_many_numpy(values, default)
+
+        ends, codes = self.ends, self.codes
+        positions = map(bisect_right, repeat(self.starts), values)
+        return [codes[i - 1] if v <= ends[i - 1] else default for i, v in zip(positions, values, strict=True)]
+
+    def _lookup_many_numpy(self, values: Any, default: str | None) -> list[str | None]:
+        """lookup_many의 numpy 구현 (구간 끝을 넘으면 sentinel 0번 → default)"""
+        if self._arrays is None:
+            self._arrays = (np.array(self.starts, dtype=np.int64), np.array(self.ends, dtype=np.int64))
+        starts, ends = self._arrays
+
+        points = np.asarray(values, dtype=np.int64)
+        # 정렬된 조회 값으로 탐색하면 캐시 적중이 좋아 무작위 순서보다 몇 배 빠름
+        order = np.argsort(points)
+        idx = np.empty_like(order)
+        idx[order] = np.searchsorted(starts, points[order], side="right") - 1
+        idx[points > ends[idx]] = 0
+        codes = [default, *self.codes[1:]]
+        return list(map(codes.__getitem__, idx.tolist()))
+
+
 # =============================================================================
 # 통합 IP 인텔리전스 클래스
 # =============================================================================
@@ -294,7 +437,7 @@ class IPIntelligence:
     IPDeny (국가 매핑) + AbuseIPDB (악성 IP) 기능을 통합 제공합니다.
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """IP 인텔리전스 초기화"""
         self._ipdeny = IPDenyProvider()
         self._abuseipdb = AbuseIPDBProvider()
@@ -303,9 +446,9 @@ class IPIntelligence:
         self._ipv4_networks: dict[str, list[ipaddress.IPv4Network]] = {}
         self._ipv6_networks: dict[str, list[ipaddress.IPv6Network]] = {}
 
-        # 빠른 조회를 위한 버킷 인덱스
-        self._ipv4_index: dict[int, list[tuple[ipaddress.IPv4Network, str]]] = {}
-        self._ipv6_index: dict[int, list[tuple[ipaddress.IPv6Network, str]]] = {}
+        # 빠른 조회를 위한 구간 테이블
+        self._ipv4_table: IPRangeTable = IPRangeTable([], [], [])
+        self._ipv6_table: IPRangeTable = IPRangeTable([], [], [])
 
         # IP 결과 캐시
         self._ip_cache: dict[str, str | None] = {}
@@ -370,30 +513,21 @@ class IPIntelligence:
             return False
 
     def _build_indexes(self) -> None:
-        """빠른 조회를 위한 인덱스 구축"""
-        # IPv4 인덱스 (첫 옥텟 기준)
-        self._ipv4_index.clear()
-        for country, networks_v4 in self._ipv4_networks.items():
-            for network_v4 in networks_v4:
-                start = int(network_v4.network_address) >> 24
-                end = int(network_v4.broadcast_address) >> 24
-                for octet in range(start, end + 1):
-                    self._ipv4_index.setdefault(octet, []).append((network_v4, country))
-        for bucket_v4 in self._ipv4_index.values():
-            bucket_v4.sort(key=lambda x: x[0].prefixlen, reverse=True)
-
-        # IPv6 인덱스 (상위 8비트 기준)
-        self._ipv6_index.clear()
-        for country, networks_v6 in self._ipv6_networks.items():
-            for network_v6 in networks_v6:
-                start = int(network_v6.network_address) >> 120
-                end = int(network_v6.broadcast_address) >> 120
-                for b in range(start, end + 1):
-                    self._ipv6_index.setdefault(b, []).append((network_v6, country))
-        for bucket_v6 in self._ipv6_index.values():
-            bucket_v6.sort(key=lambda x: x[0].prefixlen, reverse=True)
-
-        logger.debug(f"인덱스 구축 완료: IPv4 {len(self._ipv4_index):,}개, IPv6 {len(self._ipv6_index):,}개 버킷")
+        """빠른 조회를 위한 구간 테이블 구축"""
+        self._ipv4_table = IPRangeTable.from_ranges(
+            (
+                (int(network.network_address), int(network.broadcast_address), country)
+                for country, networks in self._ipv4_networks.items()
+                for network in networks
+            )
+        )
+        self._ipv6_table = IPRangeTable.from_ranges(
+            (int(network.network_address), int(network.broadcast_address), country)
+            for country, networks in self._ipv6_networks.items()
+            for network in networks
+        )
+
+        logger.debug(f"구간 테이블 구축 완료: IPv4 {len(self._ipv4_table):,}개, IPv6 {len(self._ipv6_table):,}개 구간")
 
     # -------------------------------------------------------------------------
     # 국가 매핑 API
@@ -422,7 +556,7 @@ class IPIntelligence:
 
         try:
             ip = ipaddress.ip_address(ip_str)
-        except ipaddress.AddressValueError:
+        except ValueError:
             return None
 
         # 특수 IP 처리
@@ -439,49 +573,11 @@ class IPIntelligence:
 
     def _match_ipv4(self, ip: ipaddress.IPv4Address) -> str | None:
         """IPv4 주소 국가 매칭 (Longest-Prefix-Win)"""
-        first_octet = int(ip) >> 24
-        candidates = self._ipv4_index.get(first_octet, [])
-
-        best_country: str | None = None
-        best_prefix: int = -1
-
-        for network, country in candidates:
-            if ip in network and network.prefixlen > best_prefix:
-                best_prefix = network.prefixlen
-                best_country = country
-
-        # Fallback: 전체 탐색
-        if best_country is None:
-            for country, networks in self._ipv4_networks.items():
-                for network in networks:
-                    if ip in network and network.prefixlen > best_prefix:
-                        best_prefix = network.prefixlen
-                        best_country = country
-
-        return best_country
+        return self._ipv4_table.lookup(int(ip))
 
     def _match_ipv6(self, ip: ipaddress.IPv6Address) -> str | None:
         """IPv6 주소 국가 매칭 (Longest-Prefix-Win)"""
-        first_byte = int(ip) >> 120
-        candidates = self._ipv6_index.get(first_byte, [])
-
-        best_country: str | None = None
-        best_prefix: int = -1
-
-        for network, country in candidates:
-            if ip in network and network.prefixlen > best_prefix:
-                best_prefix = network.prefixlen
-                best_country = country
-
-        # Fallback: 전체 탐색
-        if best_country is None:
-            for country, networks in self._ipv6_networks.items():
-                for network in networks:
-                    if ip in network and network.prefixlen > best_prefix:
-                        best_prefix = network.prefixlen
-                        best_country = country
-
-        return best_country
+        return self._ipv6_table.lookup(int(ip))
 
     def _get_special_ip_type(self, ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> str:
         """특수 IP 타입 반환"""
@@ -502,29 +598,62 @@ class IPIntelligence:
             ip_addresses: IP 주소 목록
 
         Returns:
-            {IP: 국가코드} 딕셔너리 (매칭 없으면 "ZZ")
+            {IP: 국가코드} 딕셔너리 (매칭 없음/특수 IP/잘못된 주소는 "ZZ")
+
+        Note:
+            IP 객체를 만들지 않고 inet_pton 결과 정수 목록으로 구간 테이블을 일괄 조회합니다.
+            numpy가 있으면 inet_pton 바이트를 이어 붙여 정수 배열로 바로 해석합니다.
+            IPDeny 블록에는 사설/예약 대역이 없으므로 특수 IP는 별도 판정 없이 "ZZ"가 됩니다.
         """
         if not self._initialized and not self.initialize():
             return {ip: "ZZ" for ip in ip_addresses}
 
-        special_types = {"PRIVATE", "LOOPBACK", "LINK_LOCAL", "MULTICAST", "UNKNOWN"}
-        results = {}
+        inet_pton, from_bytes, af_inet = socket.inet_pton, int.from_bytes, socket.AF_INET
+        ipv4 = [ip for ip in ip_addresses if ":" not in ip]
+        values: Any
+        try:
+            if np is not None:
+                values = np.frombuffer(b"".join(map(inet_pton, repeat(af_inet), ipv4)), dtype=">u4")
+            else:
+                values = [from_bytes(inet_pton(af_inet, ip), "big") for ip in ipv4]
+        except (OSError, TypeError):
+            # 잘못된 주소가 섞인 경우 개별 조회
+            return {ip: self._lookup_ip_str(ip) or "ZZ" for ip in ip_addresses}
+
+        results: dict[str, str] = dict(zip(ipv4, self._ipv4_table.lookup_many(values, "ZZ"), strict=True))
+        if len(ipv4) != len(ip_addresses):
+            for ip in ip_addresses:
+                if ":" in ip:
+                    results[ip] = self._lookup_ip_str(ip) or "ZZ"
+        return results
 
-        for ip in ip_addresses:
-            country = self.get_country_code(ip)
-            results[ip] = "ZZ" if country in special_types or not country else country
+    def _lookup_ip_str(self, ip: str) -> str | None:
+        """IP 문자열 구간 테이블 조회 (특수 IP 판정 없음, 잘못된 주소는 None)"""
+        for family, table in ((socket.AF_INET, self._ipv4_table), (socket.AF_INET6, self._ipv6_table)):
+            try:
+                return table.lookup(int.from_bytes(socket.inet_pton(family, ip), "big"))
+            except (OSError, TypeError):
+                continue
+        return None
 
-        return results
+    def get_country_statistics(
+        self, ip_addresses: list[str], country_mapping: dict[str, str] | None = None
+    ) -> dict[str, int]:
+        """IP 주소 목록의 국가별 통계
 
-    def get_country_statistics(self, ip_addresses: list[str]) -> dict[str, int]:
-        """IP 주소 목록의 국가별 통계"""
-        counts: dict[str, int] = {}
-        special_types = {"PRIVATE", "LOOPBACK", "LINK_LOCAL", "MULTICAST", "UNKNOWN"}
+        Args:
+            ip_addresses: IP 주소 목록
+            country_mapping: get_country_codes_batch 결과 (있으면 재조회하지 않음)
+
+        Returns:
+            {국가코드: IP 수}
+        """
+        if country_mapping is None:
+            country_mapping = self.get_country_codes_batch(ip_addresses)
 
+        counts: dict[str, int] = {}
         for ip in ip_addresses:
-            country = self.get_country_code(ip)
-            if not country or country in special_types:
-                country = "ZZ"
+            country = country_mapping.get(ip, "ZZ")
             counts[country] = counts.get(country, 0) + 1
 
         return counts
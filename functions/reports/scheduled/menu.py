@@ -39,6 +39,8 @@ def run(ctx: ExecutionContext) -> None:
         ctx: 실행 컨텍스트 (사용되지 않음 - 메뉴 전용)
     """
     from core.cli.flow import create_flow_runner
+    from core.parallel.describe_store import describe_store_scope
+    from core.shared.aws.metrics import persistent_metric_cache
 
     console = Console()
     lang = get_lang()
@@ -51,34 +53,37 @@ def run(ctx: ExecutionContext) -> None:
         history = ScheduledRunHistory()
         current_company = resolve_company(None)
 
-        for task in tasks:
-            # tool_ref에서 category/module 분리하여 실행
-            parts = task.tool_ref.split("/")
-            if len(parts) >= 2:
-                category = parts[0]
-                module = "/".join(parts[1:])  # 서브모듈 지원
-
-                start_time = time.time()
-                try:
-                    runner.run_tool_directly(category, module)
-                    duration = time.time() - start_time
-                    history.add(
-                        task_id=task.id,
-                        task_name=task.name,
-                        company=current_company,
-                        status="success",
-                        duration_sec=duration,
-                    )
-                except Exception as e:
-                    duration = time.time() - start_time
-                    history.add(
-                        task_id=task.id,
-                        task_name=task.name,
-                        company=current_company,
-                        status="failed",
-                        duration_sec=duration,
-                        error_msg=str(e),
-                    )
+        # 일괄 실행 동안 describe 응답 공유 (작업 간 같은 목록 중복 조회 방지)
+        # 메트릭 파일 캐시는 다음 정기 실행까지 유지 (일 단위 버킷 재사용)
+        with describe_store_scope(), persistent_metric_cache():
+            for task in tasks:
+                # tool_ref에서 category/module 분리하여 실행
+                parts = task.tool_ref.split("/")
+                if len(parts) >= 2:
+                    category = parts[0]
+                    module = "/".join(parts[1:])  # 서브모듈 지원
+
+                    start_time = time.time()
+                    try:
+                        runner.run_tool_directly(category, module)
+                        duration = time.time() - start_time
+                        history.add(
+                            task_id=task.id,
+                            task_name=task.name,
+                            company=current_company,
+                            status="success",
+                            duration_sec=duration,
+                        )
+                    except Exception as e:
+                        duration = time.time() - start_time
+                        history.add(
+                            task_id=task.id,
+                            task_name=task.name,
+                            company=current_company,
+                            status="failed",
+                            duration_sec=duration,
+                            error_msg=str(e),
+                        )
 
 
 def show_scheduled_menu(
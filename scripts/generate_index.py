@@ -6,7 +6,9 @@ Project Index Generator
 Claude Code의 토큰 사용량을 줄이고 프로젝트 탐색을 빠르게 합니다.
 
 Usage:
-    python scripts/generate_index.py [--section analyzers|core|git|all]
+    python scripts/generate_index.py [--section analyzers|core|git|manifest|all]
+
+``--section manifest`` 는 CLI discovery가 읽는 도구 매니페스트(temp/discovery/)만 생성합니다.
 """
 
 from __future__ import annotations
@@ -391,6 +393,20 @@ def render_index_md(
     return "\n".join(lines)
 
 
+def generate_tool_manifest() -> Path:
+    """Write the tool manifest that CLI discovery reads instead of importing every package."""
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+    from core.config import settings
+    from core.tools.discovery import SCAN_PATHS
+    from core.tools.manifest import build_manifest, write_manifest
+
+    manifest = build_manifest(SCAN_PATHS, settings.PLUGIN_EXCLUDE_DIRS)
+    print(f"  Tool manifest: {len(manifest['packages'])} packages")
+    return write_manifest(manifest)
+
+
 def main():
     """Generate project index."""
     import argparse
@@ -398,11 +414,17 @@ def main():
     parser = argparse.ArgumentParser(description="Generate project index")
     parser.add_argument(
         "--section",
-        choices=["analyzers", "core", "git", "all"],
+        choices=["analyzers", "core", "git", "manifest", "all"],
         default="all",
         help="Section to regenerate (default: all)",
     )
-    parser.parse_args()
+    args = parser.parse_args()
+
+    if args.section in ("manifest", "all"):
+        path = generate_tool_manifest()
+        print(f"Generated: {path}")
+        if args.section == "manifest":
+            return
 
     print(f"Scanning project at {PROJECT_ROOT}...")
 
@@ -12,6 +12,7 @@ Tests cover:
 - Category command registration
 """
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -525,6 +526,49 @@ class TestGroupCommands:
 # =============================================================================
 
 
+class TestPricingCommands:
+    """Test local price database commands"""
+
+    @pytest.fixture
+    def runner(self):
+        return CliRunner()
+
+    def test_pricing_sync_requires_source_or_region(self, runner):
+        """Sync without --source or --region fails"""
+        from core.cli.app import cli
+
+        result = runner.invoke(cli, ["pricing", "sync"])
+        assert result.exit_code == 1
+
+    @patch("core.shared.aws.pricing.price_db.sync_price_db")
+    def test_pricing_sync_passes_options(self, mock_sync, runner):
+        """Sync forwards regions and services"""
+        from core.cli.app import cli
+        from core.shared.aws.pricing.price_db import OfferSyncResult
+
+        mock_sync.return_value = [OfferSyncResult("AmazonEC2", "ap-northeast-2", 1234)]
+
+        result = runner.invoke(cli, ["pricing", "sync", "-r", "ap-northeast-2", "-s", "ec2"])
+        assert result.exit_code == 0
+        assert "AmazonEC2" in result.output
+        kwargs = mock_sync.call_args.kwargs
+        assert kwargs["regions"] == ["ap-northeast-2"]
+        assert kwargs["services"] == ["ec2"]
+
+    @patch("core.shared.aws.pricing.price_db.PriceDatabase")
+    def test_pricing_status_json(self, mock_db, runner):
+        """Status with JSON output"""
+        from core.cli.app import cli
+
+        mock_db.return_value.offers.return_value = [
+            {"offer_code": "AmazonEC2", "region": "us-east-1", "sku_count": 10, "synced_at": "2026-01-01T00:00:00"}
+        ]
+
+        result = runner.invoke(cli, ["pricing", "status", "--json"])
+        assert result.exit_code == 0
+        assert json.loads(result.output)[0]["offer_code"] == "AmazonEC2"
+
+
 class TestCategoryCommands:
     """Test category command auto-registration"""
 
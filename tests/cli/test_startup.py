@@ -0,0 +1,69 @@
+"""
+tests/cli/test_startup.py - CLI 시작 성능 회귀 테스트
+
+``aa --help`` 가 도구 패키지와 무거운 의존성(boto3, openpyxl)을 import하지 않는지
+별도 프로세스에서 확인합니다. 시간 예산 검사는 머신 부하에 따라 흔들리므로 slow로 분리합니다.
+"""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# aa --help 시간 예산 (초) - 도구 전체 import 시 수 초가 걸리던 회귀를 잡기 위한 상한
+HELP_TIME_BUDGET = 1.0
+
+_PROBE = """
+import json, sys
+from core.cli.app import cli
+try:
+    cli(sys.argv[1:])
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)), file=sys.stderr)
+"""
+
+
+def _run_cli(*args: str) -> tuple[float, set[str], str]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        timeout=60,
+    )
+    elapsed = time.perf_counter() - start
+    modules = set(json.loads(result.stderr.strip().splitlines()[-1]))
+    return elapsed, modules, result.stdout
+
+
+class TestStartup:
+    """CLI 시작 시 import 범위와 시간"""
+
+    def test_help_imports_no_tool_packages(self):
+        _, modules, output = _run_cli("--help")
+
+        assert "ec2" in output
+        assert not [name for name in modules if name.startswith("functions.analyzers.")]
+        assert "boto3" not in modules
+        assert "openpyxl" not in modules
+
+    def test_category_help_imports_no_tool_packages(self):
+        _, modules, output = _run_cli("ec2", "--help")
+
+        assert "EBS" in output
+        assert not [name for name in modules if name.startswith("functions.analyzers.")]
+
+    @pytest.mark.slow
+    def test_help_within_time_budget(self):
+        # 첫 실행은 매니페스트 생성/바이트코드 컴파일 비용을 포함하므로 최솟값 사용
+        best = min(_run_cli("--help")[0] for _ in range(3))
+
+        assert best < HELP_TIME_BUDGET, f"aa --help took {best:.2f}s (budget {HELP_TIME_BUDGET}s)"
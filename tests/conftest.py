@@ -40,7 +40,12 @@ def setup_test_environment():
 
     yield
 
-    # 정리 (필요시)
+    # 정리: 테스트 간 boto3 client 재사용 방지
+    from core.parallel.client_pool import reset_client_pool
+    from core.parallel.request_limiter import reset_scoped_rate_limiters
+
+    reset_client_pool()
+    reset_scoped_rate_limiters()
 
 
 # =============================================================================
@@ -0,0 +1,21 @@
+"""
+tests/core/auth/conftest.py - 인증 테스트 공통 픽스처
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from core.auth.cache import AccountFileCache
+
+
+@pytest.fixture(autouse=True)
+def account_file_cache_dir(tmp_path):
+    """SSO 계정 파일 캐시를 테스트별 임시 디렉토리로 격리 (~/.aws/sso/cache 미사용)"""
+    cache_dir = tmp_path / "sso-cache"
+
+    def factory(session_name, start_url):
+        return AccountFileCache(session_name=session_name, start_url=start_url, cache_dir=str(cache_dir))
+
+    with patch("core.auth.provider.sso_session.AccountFileCache", side_effect=factory):
+        yield cache_dir
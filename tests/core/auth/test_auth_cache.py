@@ -2,14 +2,17 @@
 """
 core/auth/cache/cache.py 단위 테스트
 
-CacheEntry, TokenCache, TokenCacheManager, AccountCache, CredentialsCache 테스트.
+CacheEntry, TokenCache, TokenCacheManager, AccountFileCache, AccountCache, CredentialsCache 테스트.
 """
 
+import json
 import threading
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 from core.auth.cache.cache import (
     AccountCache,
+    AccountFileCache,
     CacheEntry,
     CredentialsCache,
     TokenCache,
@@ -352,6 +355,96 @@ class TestTokenCacheManager:
         assert manager.delete() is True  # 에러 없이 성공
 
 
+# =============================================================================
+# AccountFileCache 테스트
+# =============================================================================
+
+
+class TestAccountFileCache:
+    """AccountFileCache 테스트"""
+
+    ACCOUNTS = {
+        "111111111111": AccountInfo(id="111111111111", name="prod", email="prod@example.com", roles=["Admin"]),
+        "222222222222": AccountInfo(id="222222222222", name="dev", roles=["Admin", "ReadOnly"], is_management=True),
+    }
+
+    def _cache(self, tmp_path):
+        return AccountFileCache(session_name="my-sso", start_url="https://example.com", cache_dir=str(tmp_path))
+
+    def test_roundtrip_with_same_token(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.save("token-1", self.ACCOUNTS)
+
+        loaded = self._cache(tmp_path).load("token-1")
+
+        assert loaded == self.ACCOUNTS
+        assert list(loaded) == ["111111111111", "222222222222"]
+
+    def test_token_change_invalidates(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.save("token-1", self.ACCOUNTS)
+
+        assert cache.load("token-2") is None
+
+    def test_file_does_not_contain_plaintext(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.save("token-1", self.ACCOUNTS)
+
+        content = cache.cache_path.read_text(encoding="utf-8")
+
+        assert "token-1" not in content
+        assert "prod@example.com" not in content
+        assert json.loads(content)["_encrypted"] is True
+
+    def test_missing_corrupt_or_old_version(self, tmp_path):
+        cache = self._cache(tmp_path)
+        assert cache.load("token-1") is None
+
+        cache.cache_path.write_text("{not json", encoding="utf-8")
+        assert cache.load("token-1") is None
+
+        cache.save("token-1", self.ACCOUNTS)
+        data = json.loads(cache.cache_path.read_text(encoding="utf-8"))
+        data["version"] = 0
+        cache.cache_path.write_text(json.dumps(data), encoding="utf-8")
+        assert cache.load("token-1") is None
+
+    def test_save_replaces_file_atomically(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.save("token-1", self.ACCOUNTS)
+        cache.save("token-1", {"111111111111": self.ACCOUNTS["111111111111"]})
+
+        assert [p.name for p in tmp_path.iterdir() if not p.name.endswith(".lock")] == [cache.cache_path.name]
+        assert list(cache.load("token-1")) == ["111111111111"]
+
+    def test_lock_timeout_is_miss(self, tmp_path):
+        import filelock
+
+        cache = self._cache(tmp_path)
+        cache.save("token-1", self.ACCOUNTS)
+
+        with patch.object(cache, "_get_lock", side_effect=filelock.Timeout(str(cache.cache_path))):
+            assert cache.load("token-1") is None
+
+    def test_is_stale_uses_saved_at(self, tmp_path):
+        cache = self._cache(tmp_path)
+        assert cache.is_stale(3600)
+
+        cache.save("token-1", self.ACCOUNTS)
+        cache.load("token-1")
+        assert not cache.is_stale(3600)
+
+        cache.saved_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        assert cache.is_stale(3600)
+
+    def test_delete(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.save("token-1", self.ACCOUNTS)
+
+        assert cache.delete() is True
+        assert not cache.cache_path.exists()
+
+
 # =============================================================================
 # AccountCache 테스트
 # =============================================================================
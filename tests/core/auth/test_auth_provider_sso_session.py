@@ -7,10 +7,13 @@ core/auth/provider/sso_session.py 테스트
 - SSOSessionProvider: SSO 세션 기반 인증 Provider
 """
 
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 from core.auth.cache import TokenCache
 from core.auth.provider.sso_session import SSOSessionConfig, SSOSessionProvider
@@ -314,11 +317,12 @@ class TestSSOSessionProvider:
             ]
             mock_sso.get_paginator.return_value = mock_paginator
 
-            # 역할 목록 조회 응답
-            mock_sso.list_account_roles.side_effect = [
-                {"roleList": [{"roleName": "AdminRole"}, {"roleName": "ReadOnlyRole"}]},
-                {"roleList": [{"roleName": "DeveloperRole"}]},
-            ]
+            # 역할 목록 조회 응답 (계정별 병렬 조회이므로 계정 ID로 응답)
+            roles = {
+                "111111111111": {"roleList": [{"roleName": "AdminRole"}, {"roleName": "ReadOnlyRole"}]},
+                "222222222222": {"roleList": [{"roleName": "DeveloperRole"}]},
+            }
+            mock_sso.list_account_roles.side_effect = lambda **kwargs: roles[kwargs["accountId"]]
 
             mock_session.client.side_effect = lambda service, **kwargs: {
                 "sso": mock_sso,
@@ -737,3 +741,172 @@ class TestSSOSessionProviderEdgeCases:
 
         assert "region_name" in aws_config
         assert "credentials" in aws_config
+
+
+class TestSSOSessionAccountDiscovery:
+    """계정/역할 병렬 조회, 파일 캐시, 역할 자격증명 획득 테스트"""
+
+    ACCOUNT_IDS = [f"{i:012d}" for i in range(1, 13)]
+
+    @pytest.fixture
+    def config(self):
+        return SSOSessionConfig(
+            session_name="test-sso",
+            start_url="https://test.awsapps.com/start",
+            region="ap-northeast-2",
+            role_discovery_workers=4,
+        )
+
+    @pytest.fixture
+    def make_provider(self, config):
+        """토큰/SSO client가 모킹된 Provider 생성 함수"""
+        patchers = []
+
+        def factory(access_token="access-token", config=config, roles=None):
+            future_time = (datetime.now(timezone.utc) + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            cache_manager = MagicMock()
+            cache_manager.load.return_value = TokenCache(access_token=access_token, expires_at=future_time)
+
+            sso = MagicMock()
+            paginator = MagicMock()
+            paginator.paginate.return_value = [
+                {"accountList": [{"accountId": aid, "accountName": f"acct-{aid[-2:]}"} for aid in self.ACCOUNT_IDS]}
+            ]
+            sso.get_paginator.return_value = paginator
+            sso.list_account_roles.side_effect = roles or (lambda **kwargs: {"roleList": [{"roleName": "Admin"}]})
+
+            session = MagicMock()
+            session.client.side_effect = lambda service, **kwargs: sso if service == "sso" else MagicMock()
+
+            for patcher in (
+                patch("core.auth.provider.sso_session.TokenCacheManager", return_value=cache_manager),
+                patch("core.auth.provider.sso_session.boto3.Session", return_value=session),
+            ):
+                patcher.start()
+                patchers.append(patcher)
+
+            provider = SSOSessionProvider(config)
+            provider.authenticate()
+            return provider, sso
+
+        yield factory
+        for patcher in reversed(patchers):
+            patcher.stop()
+
+    def test_roles_are_listed_in_parallel_with_bounded_workers(self, make_provider):
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def list_roles(**kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return {"roleList": [{"roleName": f"Role-{kwargs['accountId'][-2:]}"}]}
+
+        provider, _ = make_provider(roles=list_roles)
+        accounts = provider.list_accounts()
+
+        assert list(accounts) == self.ACCOUNT_IDS
+        assert accounts["000000000003"].roles == ["Role-03"]
+        assert 1 < peak[0] <= 4
+
+    def test_role_pagination_and_throttle_retry(self, make_provider):
+        throttle = ClientError({"Error": {"Code": "ThrottlingException"}}, "ListAccountRoles")
+        calls: dict[str, int] = {}
+
+        def list_roles(**kwargs):
+            account_id = kwargs["accountId"]
+            calls[account_id] = calls.get(account_id, 0) + 1
+            if calls[account_id] == 1:
+                raise throttle
+            if "nextToken" not in kwargs:
+                return {"roleList": [{"roleName": "Admin"}], "nextToken": "page-2"}
+            return {"roleList": [{"roleName": "ReadOnly"}]}
+
+        provider, _ = make_provider(roles=list_roles)
+        accounts = provider.list_accounts()
+
+        assert all(account.roles == ["Admin", "ReadOnly"] for account in accounts.values())
+
+    def test_file_cache_reused_across_processes_until_token_changes(self, make_provider, config):
+        first, _ = make_provider()
+        first.list_accounts()
+
+        no_refresh = SSOSessionConfig(**{**config.__dict__, "background_account_refresh": False})
+        second, sso = make_provider(config=no_refresh)
+        accounts = second.list_accounts()
+
+        assert list(accounts) == self.ACCOUNT_IDS
+        sso.get_paginator.assert_not_called()
+        sso.list_account_roles.assert_not_called()
+
+        third, sso = make_provider(access_token="new-token", config=no_refresh)
+        third.list_accounts()
+
+        sso.get_paginator.assert_called_once_with("list_accounts")
+
+    def test_fresh_file_cache_hit_skips_refresh(self, make_provider):
+        first, _ = make_provider()
+        first.list_accounts()
+
+        second, sso = make_provider()
+        second.list_accounts()
+
+        assert second._account_refresh_thread is None
+        sso.get_paginator.assert_not_called()
+
+    def test_stale_file_cache_hit_refreshes_in_background(self, make_provider, config):
+        first, _ = make_provider()
+        first.list_accounts()
+
+        renamed = {"roleList": [{"roleName": "NewRole"}]}
+        stale = SSOSessionConfig(**{**config.__dict__, "account_refresh_age": 0})
+        second, sso = make_provider(config=stale, roles=lambda **kwargs: renamed)
+        accounts = second.list_accounts()
+        assert accounts["000000000001"].roles == ["Admin"]
+
+        second._account_refresh_thread.join(timeout=5)
+
+        sso.get_paginator.assert_called_once_with("list_accounts")
+        assert second.list_accounts()["000000000001"].roles == ["NewRole"]
+        assert second._account_file_cache.load("access-token")["000000000001"].roles == ["NewRole"]
+
+    def test_incomplete_roles_are_not_persisted(self, make_provider):
+        def list_roles(**kwargs):
+            if kwargs["accountId"] == "000000000005":
+                raise Exception("AccessDenied")
+            return {"roleList": [{"roleName": "Admin"}]}
+
+        provider, _ = make_provider(roles=list_roles)
+        accounts = provider.list_accounts()
+
+        assert accounts["000000000005"].roles == []
+        assert provider._account_file_cache.load("access-token") is None
+
+    ROLE_CREDENTIALS = {
+        "roleCredentials": {"accessKeyId": "AKIATEST", "secretAccessKey": "secret", "sessionToken": "token"}
+    }
+
+    def test_prefetch_credentials_fills_cache(self, make_provider):
+        provider, sso = make_provider()
+        sso.get_role_credentials.return_value = self.ROLE_CREDENTIALS
+
+        provider.prefetch_credentials("000000000001", "Admin")
+        provider.get_session("000000000001", "Admin", "us-east-1")
+        provider.get_session("000000000001", "Admin", "eu-west-1")
+
+        sso.get_role_credentials.assert_called_once_with(
+            roleName="Admin", accountId="000000000001", accessToken="access-token"
+        )
+
+    def test_role_credentials_throttle_retry(self, make_provider):
+        throttle = ClientError({"Error": {"Code": "TooManyRequestsException"}}, "GetRoleCredentials")
+        provider, sso = make_provider()
+        sso.get_role_credentials.side_effect = [throttle, self.ROLE_CREDENTIALS]
+
+        assert provider.get_session("000000000001", "Admin") is not None
+        assert sso.get_role_credentials.call_count == 2
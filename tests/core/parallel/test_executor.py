@@ -2,13 +2,22 @@
 tests/core/parallel/test_executor.py - ParallelSessionExecutor 테스트
 """
 
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 from botocore.exceptions import ClientError
 
-from core.parallel.executor import ParallelConfig, ParallelSessionExecutor, parallel_collect
+from core.parallel.executor import (
+    CollectJob,
+    ParallelConfig,
+    ParallelSessionExecutor,
+    global_service_region,
+    parallel_collect,
+    parallel_collect_many,
+    parallel_stream,
+)
 from core.parallel.types import ErrorCategory
 
 
@@ -450,6 +459,572 @@ class TestParallelCollect:
         assert "account_name" in first_item
 
 
+class TestExecuteIter:
+    """execute_iter / parallel_stream 스트리밍 테스트"""
+
+    REGIONS = [f"region-{i}" for i in range(10)]
+
+    def test_yields_every_result_in_completion_order(self, sso_context):
+        """모든 결과를 완료 순서대로 내보냄"""
+        sso_context.regions = ["slow", "fast"]
+
+        def collector(session, account_id, account_name, region):
+            time.sleep(0.1 if region == "slow" else 0)
+            return [region]
+
+        results = list(parallel_stream(sso_context, collector, max_workers=2, service="test"))
+
+        assert [r.region for r in results] == ["fast", "slow"]
+        assert all(r.success for r in results)
+
+    def test_in_flight_window_applies_backpressure(self, sso_context):
+        """소비되지 않은 제출 작업 수가 max_in_flight를 넘지 않음"""
+        sso_context.regions = self.REGIONS
+        lock = threading.Lock()
+        started = []
+
+        def collector(session, account_id, account_name, region):
+            with lock:
+                started.append(region)
+            return [region]
+
+        executor = ParallelSessionExecutor(sso_context, ParallelConfig(max_workers=2))
+        consumed = 0
+        for _ in executor.execute_iter(collector, service="test", max_in_flight=3):
+            consumed += 1
+            time.sleep(0.01)  # 느린 소비자
+            with lock:
+                assert len(started) <= consumed + 3
+
+        assert consumed == len(self.REGIONS)
+
+    def test_early_stop_cancels_queued_tasks(self, sso_context):
+        """소비를 중단하면 아직 시작하지 않은 작업은 실행되지 않음"""
+        sso_context.regions = self.REGIONS
+        started = []
+
+        def collector(session, account_id, account_name, region):
+            started.append(region)
+            time.sleep(0.02)
+            return [region]
+
+        executor = ParallelSessionExecutor(sso_context, ParallelConfig(max_workers=1))
+        stream = executor.execute_iter(collector, service="test", max_in_flight=2)
+        next(stream)
+        stream.close()
+
+        assert len(started) <= 3
+
+    def test_progress_tracker_and_errors(self, sso_context):
+        """progress_tracker 연동 및 실패 결과 포함"""
+        sso_context.regions = ["ok", "bad"]
+        tracker = MagicMock()
+
+        def collector(session, account_id, account_name, region):
+            if region == "bad":
+                raise ValueError("boom")
+            return [region]
+
+        results = list(parallel_stream(sso_context, collector, progress_tracker=tracker))
+
+        tracker.set_total.assert_called_once_with(2)
+        assert sorted(call.args[0] for call in tracker.on_complete.call_args_list) == [False, True]
+        assert sorted(r.success for r in results) == [False, True]
+
+    def test_timeline_completed_after_stream(self, sso_context):
+        """ctx timeline이 있으면 순회 종료 시 phase 완료"""
+        timeline = MagicMock()
+        sso_context._timeline = timeline
+
+        list(parallel_stream(sso_context, lambda s, a, n, r: [r]))
+
+        timeline.create_parallel_tracker.assert_called_once()
+        timeline.complete_phase.assert_called_once()
+        timeline.stop.assert_called_once()
+
+    def test_empty_task_list(self):
+        """세션이 없으면 아무것도 내보내지 않음"""
+        from core.cli.flow.context import ExecutionContext
+
+        ctx = ExecutionContext()
+        ctx.regions = []
+
+        assert list(ParallelSessionExecutor(ctx).execute_iter(lambda s, a, n, r: [])) == []
+
+    def test_invalid_window(self, sso_context):
+        """max_in_flight < 1은 ValueError"""
+        with pytest.raises(ValueError):
+            list(ParallelSessionExecutor(sso_context).execute_iter(lambda s, a, n, r: [], max_in_flight=0))
+
+
+class TestExecuteMany:
+    """execute_many / parallel_collect_many 테스트"""
+
+    def test_returns_result_per_job(self, sso_context):
+        """작업별 결과 반환"""
+        sso_context.regions = ["us-east-1", "ap-northeast-2"]
+
+        jobs = [
+            CollectJob("vpc", lambda s, a, n, r: [f"vpc-{r}"], service="ec2"),
+            CollectJob("rds", lambda s, a, n, r: [f"db-{r}"], service="rds"),
+        ]
+        results = parallel_collect_many(sso_context, jobs)
+
+        assert set(results) == {"vpc", "rds"}
+        assert sorted(results["vpc"].get_flat_data()) == ["vpc-ap-northeast-2", "vpc-us-east-1"]
+        assert results["rds"].success_count == 2
+
+    def test_on_job_complete_streams_results(self, sso_context):
+        """콜백 지정 시 작업 완료마다 호출되고 결과는 보관하지 않음"""
+        sso_context.regions = ["us-east-1", "us-west-2"]
+        completed = {}
+
+        def fast(session, account_id, account_name, region):
+            return [region]
+
+        def slow(session, account_id, account_name, region):
+            time.sleep(0.05)
+            return [region]
+
+        jobs = [CollectJob("slow", slow, service="iam"), CollectJob("fast", fast, service="ec2")]
+        results = parallel_collect_many(
+            sso_context,
+            jobs,
+            max_workers=4,
+            on_job_complete=lambda name, result: completed.setdefault(name, result.total_count),
+        )
+
+        assert results == {}
+        assert completed == {"fast": 2, "slow": 2}
+        # 빠른 작업이 먼저 완료되어 전달됨
+        assert list(completed) == ["fast", "slow"]
+
+    def test_errors_isolated_per_job(self, sso_context):
+        """한 작업의 실패가 다른 작업 결과에 섞이지 않음"""
+
+        def failing(session, account_id, account_name, region):
+            raise ValueError("boom")
+
+        jobs = [
+            CollectJob("ok", lambda s, a, n, r: [1], service="test"),
+            CollectJob("fail", failing, service="test"),
+        ]
+        results = parallel_collect_many(sso_context, jobs)
+
+        assert results["ok"].error_count == 0
+        assert results["fail"].success_count == 0
+
+    def test_progress_tracker_counts_all_tasks(self, sso_context):
+        """progress_tracker는 (작업 x 세션) 전체 기준"""
+        sso_context.regions = ["us-east-1", "us-west-2", "eu-west-1"]
+        tracker = MagicMock()
+        jobs = [CollectJob(f"job{i}", lambda s, a, n, r: [], service="test") for i in range(4)]
+
+        parallel_collect_many(sso_context, jobs, progress_tracker=tracker)
+
+        tracker.set_total.assert_called_once_with(12)
+        assert tracker.on_complete.call_count == 12
+
+    def test_duplicate_job_names_rejected(self, sso_context):
+        """중복 작업 이름은 ValueError"""
+        jobs = [CollectJob("dup", lambda s, a, n, r: []), CollectJob("dup", lambda s, a, n, r: [])]
+
+        with pytest.raises(ValueError):
+            ParallelSessionExecutor(sso_context).execute_many(jobs)
+
+    def test_empty_task_list_completes_all_jobs(self):
+        """세션이 없어도 모든 작업에 빈 결과 전달"""
+        from core.cli.flow.context import ExecutionContext
+
+        ctx = ExecutionContext()
+        ctx.regions = []
+        completed = []
+
+        ParallelSessionExecutor(ctx).execute_many(
+            [CollectJob("a", lambda s, a, n, r: []), CollectJob("b", lambda s, a, n, r: [])],
+            on_job_complete=lambda name, result: completed.append((name, result.total_count)),
+        )
+
+        assert completed == [("a", 0), ("b", 0)]
+
+    def test_interleave_by_service(self, sso_context):
+        """서비스 간 라운드로빈, 서비스 내 작업 순서 유지"""
+        sso_context.regions = ["us-east-1", "us-west-2"]
+        executor = ParallelSessionExecutor(sso_context)
+        tasks = executor._build_task_list()
+        jobs = [
+            CollectJob("vpc", lambda s, a, n, r: [], service="ec2"),
+            CollectJob("subnet", lambda s, a, n, r: [], service="ec2"),
+            CollectJob("zone", lambda s, a, n, r: [], service="route53"),
+        ]
+
+        ordered = executor._interleave_by_service(jobs, {job.name: tasks for job in jobs})
+
+        assert [job.name for job, _ in ordered] == ["vpc", "zone", "vpc", "zone", "subnet", "subnet"]
+
+
+@pytest.fixture
+def multi_account_context(sso_context):
+    """계정 3개 (두 번째가 관리 계정) x 리전 3개 SSO 컨텍스트"""
+    from core.auth import AccountInfo
+
+    sso_context.accounts = [
+        AccountInfo(id="111111111111", name="dev"),
+        AccountInfo(id="222222222222", name="mgmt", is_management=True),
+        AccountInfo(id="333333333333", name="prod"),
+    ]
+    sso_context.role_selection.role_account_map = {"AdminRole": [acc.id for acc in sso_context.accounts]}
+    sso_context.regions = ["ap-northeast-2", "us-west-2", "eu-west-1"]
+    return sso_context
+
+
+class TestTaskScope:
+    """scope (region / account / org) 태스크 구성 테스트"""
+
+    def test_account_scope_one_task_per_account(self, multi_account_context):
+        """account 범위는 리전 수와 무관하게 계정당 1개, 글로벌 엔드포인트 리전"""
+        tasks = ParallelSessionExecutor(multi_account_context)._build_task_list("account")
+
+        assert [(t.account_id, t.region) for t in tasks] == [
+            ("111111111111", "us-east-1"),
+            ("222222222222", "us-east-1"),
+            ("333333333333", "us-east-1"),
+        ]
+
+    def test_org_scope_prefers_management_account(self, multi_account_context):
+        """org 범위는 관리 계정 1개"""
+        tasks = ParallelSessionExecutor(multi_account_context)._build_task_list("org")
+
+        assert [(t.account_id, t.region) for t in tasks] == [("222222222222", "us-east-1")]
+
+    def test_org_scope_without_management_uses_first_account(self, multi_account_context):
+        """관리 계정이 없으면 첫 대상 계정"""
+        multi_account_context.accounts[1].is_management = False
+
+        tasks = ParallelSessionExecutor(multi_account_context)._build_task_list("org")
+
+        assert [t.account_id for t in tasks] == ["111111111111"]
+
+    @patch("core.auth.session.get_session")
+    def test_multi_profile_scopes(self, mock_get_session):
+        """다중 프로파일: account는 프로파일당 1개, org는 첫 프로파일"""
+        from core.cli.flow.context import ExecutionContext, ProviderKind
+
+        ctx = ExecutionContext()
+        ctx.provider_kind = ProviderKind.STATIC_CREDENTIALS
+        ctx.profiles = ["profile1", "profile2"]
+        ctx.regions = ["us-east-1", "ap-northeast-2"]
+        executor = ParallelSessionExecutor(ctx)
+
+        assert [(t.account_id, t.region) for t in executor._build_task_list("account")] == [
+            ("profile1", "us-east-1"),
+            ("profile2", "us-east-1"),
+        ]
+        assert [t.account_id for t in executor._build_task_list("org")] == ["profile1"]
+
+    def test_account_scope_without_selected_regions(self, sso_context):
+        """리전 선택이 비어 있어도 글로벌 태스크는 실행"""
+        sso_context.regions = []
+        executor = ParallelSessionExecutor(sso_context)
+
+        assert executor._build_task_list() == []
+        assert [t.region for t in executor._build_task_list("account")] == ["us-east-1"]
+
+    @pytest.mark.parametrize(
+        "regions, expected",
+        [
+            (["ap-northeast-2", "us-west-2"], "us-east-1"),
+            (["us-gov-east-1"], "us-gov-west-1"),
+            (["cn-north-1"], "cn-northwest-1"),
+            ([], "us-east-1"),
+        ],
+    )
+    def test_global_service_region_by_partition(self, regions, expected):
+        """선택 리전의 파티션에 맞는 엔드포인트 리전"""
+        assert global_service_region(regions) == expected
+
+    def test_invalid_scope(self, sso_context):
+        """지원하지 않는 scope는 ValueError"""
+        with pytest.raises(ValueError):
+            ParallelSessionExecutor(sso_context)._build_task_list("global")
+        with pytest.raises(ValueError):
+            CollectJob("iam", lambda s, a, n, r: [], scope="global")
+
+    def test_parallel_collect_account_scope(self, multi_account_context):
+        """글로벌 수집기는 계정 수만큼만 호출됨 (리전 중복 없음)"""
+        calls = []
+
+        def collect_zones(session, account_id, account_name, region):
+            calls.append((account_id, region))
+            return [f"zone-{account_id}"]
+
+        result = parallel_collect(multi_account_context, collect_zones, service="route53", scope="account")
+
+        assert sorted(calls) == [
+            ("111111111111", "us-east-1"),
+            ("222222222222", "us-east-1"),
+            ("333333333333", "us-east-1"),
+        ]
+        assert sorted(result.get_flat_data()) == ["zone-111111111111", "zone-222222222222", "zone-333333333333"]
+
+    def test_execute_many_mixed_scopes(self, multi_account_context):
+        """작업별 scope에 맞는 태스크 수로 실행"""
+        tracker = MagicMock()
+        jobs = [
+            CollectJob("vpc", lambda s, a, n, r: [r], service="ec2"),
+            CollectJob("iam", lambda s, a, n, r: [r], service="iam", scope="account"),
+        ]
+
+        results = parallel_collect_many(multi_account_context, jobs, progress_tracker=tracker)
+
+        assert results["vpc"].total_count == 9
+        assert results["iam"].get_flat_data() == ["us-east-1"] * 3
+        tracker.set_total.assert_called_once_with(12)
+
+    def test_execute_many_runs_global_jobs_without_regions(self, sso_context):
+        """리전이 없으면 리전 작업만 빈 결과, 글로벌 작업은 실행"""
+        sso_context.regions = []
+        jobs = [
+            CollectJob("vpc", lambda s, a, n, r: [r], service="ec2"),
+            CollectJob("iam", lambda s, a, n, r: [r], service="iam", scope="account"),
+        ]
+
+        results = parallel_collect_many(sso_context, jobs)
+
+        assert results["vpc"].total_count == 0
+        assert results["iam"].get_flat_data() == ["us-east-1"]
+
+
+class TestRegionPruning:
+    """비활성 옵트인 리전 / 서비스 미제공 리전 작업 제외 테스트"""
+
+    def test_default_regions_skip_availability_lookup(self, multi_account_context):
+        """기본 활성 리전만 선택하면 활성 리전 조회를 하지 않음"""
+        with patch("core.parallel.executor.get_enabled_regions") as mock_enabled:
+            tasks = ParallelSessionExecutor(multi_account_context)._build_task_list(service="ec2")
+
+        mock_enabled.assert_not_called()
+        assert len(tasks) == 9
+
+    def test_disabled_opt_in_region_pruned_per_account(self, multi_account_context):
+        """옵트인 리전은 활성화한 계정에서만 실행, 조회 실패 계정은 유지"""
+        multi_account_context.regions = ["ap-northeast-2", "me-south-1"]
+        enabled = {
+            "111111111111": frozenset({"ap-northeast-2", "me-south-1"}),
+            "222222222222": frozenset({"ap-northeast-2"}),
+            "333333333333": None,
+        }
+
+        with patch(
+            "core.parallel.executor.get_enabled_regions",
+            side_effect=lambda session, cache_key, api_region: enabled[cache_key],
+        ) as mock_enabled:
+            executor = ParallelSessionExecutor(multi_account_context)
+            tasks = executor._build_task_list(service="ec2")
+            executor._build_task_list(service="rds")
+
+        assert [(t.account_id, t.region) for t in tasks] == [
+            ("111111111111", "ap-northeast-2"),
+            ("111111111111", "me-south-1"),
+            ("222222222222", "ap-northeast-2"),
+            ("333333333333", "ap-northeast-2"),
+            ("333333333333", "me-south-1"),
+        ]
+        # 계정당 1회만 조회 (실행기 내 재사용)
+        assert mock_enabled.call_count == 3
+
+    def test_service_unavailable_region_pruned(self, multi_account_context):
+        """서비스가 제공되지 않는 리전 작업 제외"""
+        with patch(
+            "core.parallel.executor.filter_service_regions",
+            side_effect=lambda service, regions: [r for r in regions if r != "eu-west-1"],
+        ):
+            tasks = ParallelSessionExecutor(multi_account_context)._build_task_list(service="kendra")
+
+        assert {t.region for t in tasks} == {"ap-northeast-2", "us-west-2"}
+        assert len(tasks) == 6
+
+    def test_prune_regions_disabled(self, multi_account_context):
+        """prune_regions=False면 모든 작업 유지"""
+        multi_account_context.regions = ["ap-northeast-2", "me-south-1"]
+
+        with patch("core.parallel.executor.get_enabled_regions") as mock_enabled:
+            executor = ParallelSessionExecutor(multi_account_context, ParallelConfig(prune_regions=False))
+            tasks = executor._build_task_list(service="ec2")
+
+        mock_enabled.assert_not_called()
+        assert len(tasks) == 6
+
+
+class PrefetchingProvider:
+    """prefetch_credentials를 지원하는 테스트용 Provider (자격증명 획득 기록)"""
+
+    def __init__(self, delay: float = 0.0, fail: tuple[str, ...] = ()):
+        self.delay = delay
+        self.fail = fail
+        self.prefetched: list[str] = []
+        self.cold_sessions: list[str] = []
+        self._warm: set[str] = set()
+        self._lock = threading.Lock()
+
+    def prefetch_credentials(self, account_id, role_name):
+        time.sleep(self.delay)
+        with self._lock:
+            self.prefetched.append(account_id)
+        if account_id in self.fail:
+            raise RuntimeError("AccessDenied")
+        with self._lock:
+            self._warm.add(account_id)
+
+    def get_session(self, account_id=None, role_name=None, region=None):
+        with self._lock:
+            if account_id not in self._warm:
+                self.cold_sessions.append(account_id)
+        if account_id in self.fail:
+            raise RuntimeError("AccessDenied")
+        return MagicMock()
+
+
+def _collect(session, account_id, account_name, region):
+    return [account_id]
+
+
+class TestCredentialPrefetch:
+    """SSO 자격증명 선행 획득 파이프라인 테스트"""
+
+    def test_credentials_prefetched_once_per_account(self, multi_account_context):
+        provider = PrefetchingProvider(delay=0.01)
+        multi_account_context.provider = provider
+
+        result = ParallelSessionExecutor(multi_account_context, ParallelConfig(max_workers=4)).execute(
+            _collect, service="test"
+        )
+
+        assert result.success_count == 9
+        assert sorted(provider.prefetched) == ["111111111111", "222222222222", "333333333333"]
+        assert provider.cold_sessions == []
+
+    def test_disabled_with_zero_workers(self, multi_account_context):
+        provider = PrefetchingProvider()
+        multi_account_context.provider = provider
+        config = ParallelConfig(max_workers=4, credential_prefetch_workers=0)
+
+        result = ParallelSessionExecutor(multi_account_context, config).execute(_collect, service="test")
+
+        assert result.success_count == 9
+        assert provider.prefetched == []
+        assert len(provider.cold_sessions) == 9
+
+    def test_prefetch_failure_reported_by_task(self, multi_account_context):
+        """선행 획득 실패 시 워커가 직접 세션을 요청하여 원래 에러를 보고"""
+        provider = PrefetchingProvider(fail=("222222222222",))
+        multi_account_context.provider = provider
+
+        result = ParallelSessionExecutor(multi_account_context).execute(_collect, service="test")
+
+        failed = [r for r in result.results if not r.success]
+        assert result.success_count == 6
+        assert {r.identifier for r in failed} == {"222222222222"}
+        assert all("AccessDenied" in r.error.message for r in failed)
+
+    def test_stream_and_many_share_prefetch(self, multi_account_context):
+        provider = PrefetchingProvider()
+        multi_account_context.provider = provider
+        executor = ParallelSessionExecutor(multi_account_context, ParallelConfig(max_workers=2))
+
+        streamed = list(executor.execute_iter(_collect, service="test", max_in_flight=2))
+        assert len(streamed) == 9
+        assert len(provider.prefetched) == 3
+
+        provider.prefetched.clear()
+        results = executor.execute_many(
+            [CollectJob("vpc", _collect, service="ec2"), CollectJob("users", _collect, service="iam", scope="account")]
+        )
+
+        assert results["vpc"].success_count == 9
+        assert results["users"].success_count == 3
+        assert len(provider.prefetched) == 3
+        assert provider.cold_sessions == []
+
+    def test_ready_tasks_are_submitted_first(self, multi_account_context):
+        from collections import deque
+
+        from core.parallel.credential_prefetch import CredentialPrefetcher
+
+        release = threading.Event()
+        multi_account_context.provider = PrefetchingProvider()
+        executor = ParallelSessionExecutor(multi_account_context, ParallelConfig(max_workers=4))
+        tasks = executor._build_task_list("account")
+
+        job = CollectJob("test", _collect)
+        items = [(job, task) for task in tasks]
+
+        with CredentialPrefetcher(max_workers=2) as prefetcher:
+            prefetcher.schedule(tasks[0].credential_key, release.wait)
+            prefetcher.schedule(tasks[1].credential_key, lambda: None)
+            prefetcher.wait(tasks[1].credential_key)
+            queue = deque(items)
+
+            assert executor._pop_next_task(queue, prefetcher) is items[1]
+            release.set()
+            prefetcher.wait(tasks[0].credential_key)
+            assert executor._pop_next_task(queue, prefetcher) is items[0]
+            assert executor._pop_next_task(queue, None) is items[2]
+            assert executor._pop_next_task(queue, prefetcher) is None
+
+    @pytest.mark.parametrize("many", [False, True], ids=["execute", "execute_many"])
+    def test_ready_accounts_run_while_other_credentials_pending(self, multi_account_context, many):
+        """선행 획득 중인 계정이 워커를 모두 묶지 않고, 준비된 계정 작업이 먼저 실행됨"""
+        from core.parallel.executor import _TaskSpec
+
+        release = threading.Event()
+        timed_out: list[bool] = []
+
+        def slow_fetch():
+            timed_out.append(not release.wait(5))
+
+        def task(account_id, region, fetch):
+            return _TaskSpec(
+                account_id, account_id, region, MagicMock, credential_key=account_id, credential_fetcher=fetch
+            )
+
+        def fast_fetch():
+            time.sleep(0.05)
+
+        tasks = [
+            task(account_id, region, slow_fetch if account_id == "A" else fast_fetch)
+            for region in ("r1", "r2", "r3")
+            for account_id in ("A", "B")
+        ]
+
+        def work(session, account_id, account_name, region):
+            # B의 두 번째 작업이 실행되어야 A의 자격증명이 준비됨
+            if (account_id, region) == ("B", "r2"):
+                release.set()
+            return region
+
+        executor = ParallelSessionExecutor(multi_account_context, ParallelConfig(max_workers=2))
+        with patch.object(executor, "_build_task_list", return_value=tasks):
+            if many:
+                result = executor.execute_many([CollectJob("scan", work, service="test")])["scan"]
+            else:
+                result = executor.execute(work, service="test")
+
+        assert result.success_count == 6
+        assert timed_out == [False]
+
+    def test_provider_without_prefetch_support(self, multi_account_context):
+        """prefetch_credentials가 없는 provider는 선행 획득 대상이 아님"""
+        tasks = ParallelSessionExecutor(multi_account_context)._build_task_list()
+
+        assert all(task.credential_fetcher is None for task in tasks)
+        assert tasks[0].credential_key == "111111111111:AdminRole"
+
+    def test_invalid_prefetch_workers(self):
+        with pytest.raises(ValueError):
+            ParallelConfig(credential_prefetch_workers=-1)
+
+
 class TestExecutorErrorScenarios:
     """Executor 에러 시나리오 테스트"""
 
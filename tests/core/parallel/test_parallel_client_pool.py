@@ -0,0 +1,257 @@
+"""
+tests/core/parallel/test_parallel_client_pool.py - core/parallel/client_pool.py 테스트
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.credentials import RefreshableCredentials
+
+from core.parallel.client import get_client
+from core.parallel.client_pool import ClientPool, ClientPoolStats, get_client_pool, reset_client_pool
+
+
+def _session(access_key="AKIATEST", secret="secret", token=None, region="ap-northeast-2"):
+    return boto3.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret,
+        aws_session_token=token,
+        region_name=region,
+    )
+
+
+class TestClientPoolStats:
+    """ClientPoolStats 테스트"""
+
+    def test_hit_rate(self):
+        assert ClientPoolStats(hits=3, misses=1).hit_rate == 0.75
+
+    def test_hit_rate_empty(self):
+        assert ClientPoolStats().hit_rate == 0.0
+
+
+class TestClientPool:
+    """ClientPool 테스트"""
+
+    def test_reuses_client_across_sessions_with_same_credentials(self):
+        """Session이 달라도 자격증명이 같으면 client 재사용"""
+        pool = ClientPool()
+
+        first = pool.get(_session(), "ec2", "ap-northeast-2")
+        second = pool.get(_session(), "ec2", "ap-northeast-2")
+
+        assert first is second
+        assert pool.stats.hits == 1
+        assert pool.stats.misses == 1
+
+    def test_separates_by_service_region_and_credentials(self):
+        """서비스/리전/자격증명이 다르면 별도 client"""
+        pool = ClientPool()
+        session = _session()
+
+        ec2 = pool.get(session, "ec2", "ap-northeast-2")
+        assert pool.get(session, "cloudwatch", "ap-northeast-2") is not ec2
+        assert pool.get(session, "ec2", "us-east-1") is not ec2
+        assert pool.get(_session(token="other-token"), "ec2", "ap-northeast-2") is not ec2
+        assert pool.stats.misses == 4
+
+    def test_separates_by_config(self):
+        """client 설정이 다르면 별도 client"""
+        pool = ClientPool()
+        session = _session()
+
+        a = pool.get(session, "ec2", "ap-northeast-2", config=Config(read_timeout=30))
+        b = pool.get(session, "ec2", "ap-northeast-2", config=Config(read_timeout=60))
+        c = pool.get(session, "ec2", "ap-northeast-2", config=Config(read_timeout=30))
+
+        assert a is not b
+        assert a is c
+
+    def test_region_defaults_to_session_region(self):
+        """region_name 생략 시 세션 리전 기준으로 키 생성"""
+        pool = ClientPool()
+        session = _session(region="eu-west-1")
+
+        assert pool.get(session, "ec2") is pool.get(session, "ec2", "eu-west-1")
+
+    def test_bypasses_session_without_identifiable_credentials(self):
+        """mock 등 식별 불가한 자격증명은 풀을 거치지 않음"""
+        pool = ClientPool()
+        session = MagicMock()
+
+        pool.get(session, "ec2", "ap-northeast-2")
+        pool.get(session, "ec2", "ap-northeast-2")
+
+        assert session.client.call_count == 2
+        assert pool.stats.bypassed == 2
+        assert len(pool) == 0
+
+    def test_lru_eviction(self):
+        """최대 개수 초과 시 가장 오래 사용하지 않은 client 제거"""
+        pool = ClientPool(max_size=2)
+        session = _session()
+
+        ec2 = pool.get(session, "ec2", "us-east-1")
+        pool.get(session, "ec2", "us-west-2")
+        pool.get(session, "ec2", "us-east-1")  # us-east-1 최근 사용
+        pool.get(session, "ec2", "eu-west-1")  # us-west-2 제거
+
+        assert len(pool) == 2
+        assert pool.stats.evictions == 1
+        assert pool.get(session, "ec2", "us-east-1") is ec2
+
+    def test_max_age_eviction(self):
+        """최대 보관 시간 초과 시 재생성"""
+        pool = ClientPool(max_age_seconds=0.01)
+        session = _session()
+
+        first = pool.get(session, "ec2", "us-east-1")
+        time.sleep(0.02)
+        second = pool.get(session, "ec2", "us-east-1")
+
+        assert first is not second
+        assert pool.stats.evictions == 1
+
+    @staticmethod
+    def _refreshable(expires_in: timedelta) -> RefreshableCredentials:
+        return RefreshableCredentials(
+            access_key="AKIAREFRESH",
+            secret_key="secret",
+            token="token",
+            expiry_time=datetime.now(timezone.utc) + expires_in,
+            refresh_using=MagicMock(),
+            method="test",
+        )
+
+    def test_reuses_client_until_credential_expiry(self):
+        """자격증명 만료까지 여유가 있으면 재사용"""
+        pool = ClientPool(expiry_buffer_seconds=300)
+        session = _session()
+
+        with patch.object(session, "get_credentials", return_value=self._refreshable(timedelta(hours=1))):
+            first = pool.get(session, "ec2", "us-east-1")
+            assert pool.get(session, "ec2", "us-east-1") is first
+            assert pool.evict_expired() == 0
+
+    def test_credential_expiry_eviction(self):
+        """자격증명 만료 임박 시 재사용하지 않고 제거"""
+        pool = ClientPool(expiry_buffer_seconds=1800)
+        session = _session()
+
+        # botocore 자체 갱신 구간(15분)보다 길고, 풀 만료 여유 시간(30분)보다 짧은 자격증명
+        with patch.object(session, "get_credentials", return_value=self._refreshable(timedelta(minutes=20))):
+            first = pool.get(session, "ec2", "us-east-1")
+            second = pool.get(session, "ec2", "us-east-1")
+
+        assert first is not second
+        assert pool.stats.evictions == 1
+        assert pool.evict_expired() == 1
+        assert len(pool) == 0
+
+    def test_single_flight_creation(self):
+        """같은 키의 동시 요청은 client를 한 번만 생성"""
+        pool = ClientPool()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.02)
+            return object()
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(pool._get_or_create(("id", "ec2", "us-east-1", ""), factory, None))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len({id(r) for r in results}) == 1
+        assert pool.stats.hits == 7
+
+    def test_creation_marker_cleared_only_after_store(self):
+        """생성 중 표시가 사라지는 시점에는 항상 client가 저장되어 있음 (중복 생성 방지)"""
+        pool = ClientPool()
+        key = ("id", "ec2", "us-east-1", "")
+        stored_at_pop = []
+
+        class RecordingDict(dict):
+            def pop(self, k, *default):
+                stored_at_pop.append(k in pool._entries)
+                return super().pop(k, *default)
+
+        pool._creating = RecordingDict()
+        pool._get_or_create(key, object, None)
+
+        assert stored_at_pop == [True]
+        assert pool._creating == {}
+
+    def test_failed_creation_clears_marker(self):
+        pool = ClientPool()
+        key = ("id", "ec2", "us-east-1", "")
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            pool._get_or_create(key, failing, None)
+
+        assert pool._creating == {}
+        assert pool._get_or_create(key, object, None) is not None
+
+    def test_clear(self):
+        pool = ClientPool()
+        pool.get(_session(), "ec2", "us-east-1")
+
+        pool.clear()
+
+        assert len(pool) == 0
+        assert pool.stats == ClientPoolStats()
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            ClientPool(max_size=0)
+
+
+class TestGetClientPooling:
+    """get_client 풀 연동 테스트"""
+
+    def test_get_client_uses_global_pool(self):
+        session = _session()
+
+        first = get_client(session, "ec2", region_name="us-east-1")
+        second = get_client(_session(), "ec2", region_name="us-east-1")
+
+        assert first is second
+        assert get_client_pool().stats.hits == 1
+
+    def test_get_client_pooled_false_creates_new_client(self):
+        session = _session()
+
+        first = get_client(session, "ec2", region_name="us-east-1", pooled=False)
+        second = get_client(session, "ec2", region_name="us-east-1", pooled=False)
+
+        assert first is not second
+        assert get_client_pool().stats.misses == 0
+
+    def test_get_client_config_applied(self):
+        client = get_client(_session(), "ec2", region_name="us-east-1", read_timeout=45)
+
+        assert client.meta.config.read_timeout == 45
+
+    def test_reset_client_pool(self):
+        pool = get_client_pool()
+        reset_client_pool()
+
+        assert get_client_pool() is not pool
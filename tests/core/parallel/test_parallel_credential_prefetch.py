@@ -0,0 +1,90 @@
+"""
+tests/core/parallel/test_parallel_credential_prefetch.py - core/parallel/credential_prefetch.py 테스트
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.parallel.credential_prefetch import CredentialPrefetcher, CredentialPrefetchStats
+
+
+class TestCredentialPrefetcher:
+    """CredentialPrefetcher 테스트"""
+
+    def test_each_key_is_fetched_once(self):
+        calls: list[str] = []
+
+        with CredentialPrefetcher(max_workers=2) as prefetcher:
+            for key in ["a", "b", "a", "b", "a"]:
+                prefetcher.schedule(key, lambda k=key: calls.append(k))
+            prefetcher.wait("a")
+            prefetcher.wait("b")
+
+            assert sorted(calls) == ["a", "b"]
+            assert prefetcher.stats.scheduled == 2
+            assert prefetcher.stats.ready == 2
+
+    def test_keys_are_fetched_in_schedule_order(self):
+        order: list[str] = []
+        keys = [f"acct-{i}" for i in range(6)]
+
+        with CredentialPrefetcher(max_workers=1) as prefetcher:
+            for key in keys:
+                prefetcher.schedule(key, lambda k=key: order.append(k))
+            prefetcher.wait(keys[-1])
+
+        assert order == keys
+
+    def test_wait_blocks_until_ready_and_records_wait(self):
+        release = threading.Event()
+
+        with CredentialPrefetcher(max_workers=1) as prefetcher:
+            prefetcher.schedule("slow", release.wait)
+            assert not prefetcher.is_ready("slow")
+
+            threading.Timer(0.05, release.set).start()
+            start = time.monotonic()
+            prefetcher.wait("slow")
+
+            assert time.monotonic() - start >= 0.04
+            assert prefetcher.is_ready("slow")
+            assert prefetcher.stats.waits == 1
+
+    def test_unknown_or_none_key_is_ready(self):
+        with CredentialPrefetcher() as prefetcher:
+            assert prefetcher.is_ready(None)
+            assert prefetcher.is_ready("missing")
+            prefetcher.wait("missing")
+            prefetcher.wait(None)
+
+            assert prefetcher.stats == CredentialPrefetchStats()
+
+    def test_failure_is_swallowed_and_counted(self):
+        def fail():
+            raise RuntimeError("AccessDenied")
+
+        with CredentialPrefetcher() as prefetcher:
+            prefetcher.schedule("bad", fail)
+            prefetcher.wait("bad")
+
+            assert prefetcher.stats.failed == 1
+            assert prefetcher.stats.ready == 0
+
+    def test_close_cancels_queued_fetches(self):
+        release = threading.Event()
+        calls: list[str] = []
+
+        prefetcher = CredentialPrefetcher(max_workers=1)
+        prefetcher.schedule("running", release.wait)
+        prefetcher.schedule("queued", lambda: calls.append("queued"))
+        prefetcher.close()
+        release.set()
+
+        prefetcher.wait("queued")
+        assert calls == []
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            CredentialPrefetcher(max_workers=0)
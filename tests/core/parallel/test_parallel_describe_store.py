@@ -0,0 +1,191 @@
+"""
+tests/core/parallel/test_parallel_describe_store.py - core/parallel/describe_store.py 테스트
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+
+from core.parallel.describe_store import (
+    DescribeStore,
+    DescribeStoreStats,
+    describe_pages,
+    describe_store_scope,
+    get_describe_store,
+)
+
+PAGES = [
+    {"Volumes": [{"VolumeId": "vol-1", "Tags": [{"Key": "Name", "Value": "a"}]}]},
+    {"Volumes": [{"VolumeId": "vol-2"}]},
+]
+
+
+def _client(access_key="AKIATEST", region="ap-northeast-2", pages=None, delay=0.0):
+    """paginate 호출을 기록하는 실제 ec2 client"""
+    session = boto3.Session(aws_access_key_id=access_key, aws_secret_access_key="secret", region_name=region)
+    client = session.client("ec2", region_name=region)
+
+    def paginate(**params):
+        time.sleep(delay)
+        return iter(pages if pages is not None else PAGES)
+
+    paginator = MagicMock()
+    paginator.paginate.side_effect = paginate
+    client.get_paginator = MagicMock(return_value=paginator)
+    return client, paginator
+
+
+class TestDescribeStoreStats:
+    """DescribeStoreStats 테스트"""
+
+    def test_hit_rate(self):
+        assert DescribeStoreStats(hits=3, misses=1).hit_rate == 0.75
+
+    def test_hit_rate_empty(self):
+        assert DescribeStoreStats().hit_rate == 0.0
+
+
+class TestDescribeStore:
+    """DescribeStore 테스트"""
+
+    def test_reuses_pages_and_counts_saved(self):
+        store = DescribeStore()
+        client, paginator = _client()
+
+        first = store.paginate(client, "describe_volumes")
+        second = store.paginate(client, "describe_volumes")
+
+        assert first is second
+        assert paginator.paginate.call_count == 1
+        assert store.stats == DescribeStoreStats(hits=1, misses=1, pages_fetched=2, pages_saved=2, size=1)
+
+    def test_params_are_normalized(self):
+        """파라미터 순서/None 값은 키에 영향 없음"""
+        store = DescribeStore()
+        client, paginator = _client()
+
+        store.paginate(client, "describe_snapshots", OwnerIds=["self"], MaxResults=100)
+        store.paginate(client, "describe_snapshots", MaxResults=100, OwnerIds=["self"], Filters=None)
+
+        assert paginator.paginate.call_count == 1
+
+    def test_separates_by_params_region_and_credentials(self):
+        store = DescribeStore()
+        client, _ = _client()
+
+        store.paginate(client, "describe_images", Owners=["self"])
+        store.paginate(client, "describe_images", Owners=["amazon"])
+        store.paginate(_client(region="us-east-1")[0], "describe_images", Owners=["self"])
+        store.paginate(_client(access_key="AKIAOTHER")[0], "describe_images", Owners=["self"])
+
+        assert store.stats.misses == 4
+        assert store.stats.hits == 0
+
+    def test_pages_are_read_only(self):
+        store = DescribeStore()
+        client, _ = _client()
+
+        page = store.paginate(client, "describe_volumes")[0]
+
+        with pytest.raises(TypeError):
+            page["Volumes"] = []  # type: ignore[index]
+        assert isinstance(page["Volumes"], tuple)
+        with pytest.raises(TypeError):
+            page["Volumes"][0]["Tags"][0]["Value"] = "b"  # type: ignore[index]
+        assert page["Volumes"][0]["Tags"][0].get("Value") == "a"
+
+    def test_concurrent_requests_are_single_flight(self):
+        store = DescribeStore()
+        client, paginator = _client(delay=0.1)
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.append(store.paginate(client, "describe_volumes"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert paginator.paginate.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert store.stats.pages_saved == 14
+
+    def test_failure_is_not_stored(self):
+        store = DescribeStore()
+        client, paginator = _client()
+        paginator.paginate.side_effect = [RuntimeError("throttled"), iter(PAGES)]
+
+        with pytest.raises(RuntimeError):
+            store.paginate(client, "describe_volumes")
+
+        assert len(store.paginate(client, "describe_volumes")) == 2
+        assert store.stats.misses == 1
+
+    def test_unidentifiable_client_bypasses_store(self):
+        store = DescribeStore()
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.return_value = [{"Reservations": []}]
+
+        store.paginate(client, "describe_instances")
+        store.paginate(client, "describe_instances")
+
+        assert client.get_paginator.return_value.paginate.call_count == 2
+        assert store.stats.bypassed == 2
+        assert len(store) == 0
+
+
+class TestDescribeStoreScope:
+    """describe_store_scope / describe_pages 테스트"""
+
+    def test_without_scope_always_fetches(self):
+        client, paginator = _client()
+
+        describe_pages(client, "describe_volumes")
+        pages = describe_pages(client, "describe_volumes")
+
+        assert paginator.paginate.call_count == 2
+        assert isinstance(pages, tuple)
+        assert get_describe_store() is None
+
+    def test_scope_shares_across_threads(self):
+        client, paginator = _client()
+
+        with describe_store_scope() as store:
+            thread = threading.Thread(target=describe_pages, args=(client, "describe_volumes"))
+            thread.start()
+            thread.join()
+            describe_pages(client, "describe_volumes")
+
+            assert store.stats.pages_saved == 2
+
+        assert paginator.paginate.call_count == 1
+        assert get_describe_store() is None
+
+    def test_nested_scope_reuses_outer_store(self):
+        client, paginator = _client()
+
+        with describe_store_scope() as outer:
+            describe_pages(client, "describe_volumes")
+            with describe_store_scope() as inner:
+                assert inner is outer
+                describe_pages(client, "describe_volumes")
+            assert get_describe_store() is outer
+
+        assert paginator.paginate.call_count == 1
+        assert len(outer) == 0
+
+    def test_scope_logs_saved_pages(self):
+        client, _ = _client()
+
+        with patch("core.parallel.describe_store.logger") as logger, describe_store_scope():
+            describe_pages(client, "describe_volumes")
+            describe_pages(client, "describe_volumes")
+
+        assert "2" in logger.info.call_args.args[0]
@@ -9,6 +9,7 @@ import pytest
 
 from core.parallel.rate_limiter import (
     SERVICE_RATE_LIMITS,
+    AdaptiveRateLimiter,
     RateLimiterConfig,
     TokenBucketRateLimiter,
     get_rate_limiter,
@@ -286,6 +287,83 @@ class TestRateLimiterConfigValidation:
             RateLimiterConfig(requests_per_second=-1.0)
 
 
+class TestAdaptiveRateLimiter:
+    """AdaptiveRateLimiter (AIMD) 테스트"""
+
+    def test_defaults_from_config(self):
+        limiter = AdaptiveRateLimiter(RateLimiterConfig(requests_per_second=20, burst_size=40))
+
+        assert limiter.current_rate == 20
+        assert limiter.min_rate == 2
+        assert limiter.max_rate == 40
+
+    def test_success_increases_additively(self):
+        """성공 응답마다 additive_increase / rate 만큼 증가"""
+        limiter = AdaptiveRateLimiter(RateLimiterConfig(requests_per_second=10), additive_increase=1.0)
+
+        for _ in range(10):
+            limiter.on_success()
+
+        # 약 1초 분량(10회)의 성공 응답 -> 약 +1 req/s
+        assert 10.9 < limiter.current_rate < 11.0
+
+    def test_success_capped_at_max_rate(self):
+        limiter = AdaptiveRateLimiter(RateLimiterConfig(requests_per_second=10), max_rate=10.5, additive_increase=5.0)
+
+        for _ in range(10):
+            limiter.on_success()
+
+        assert limiter.current_rate == 10.5
+
+    def test_throttle_decreases_multiplicatively(self):
+        """쓰로틀링 시 감소 배율 적용 및 토큰 제거"""
+        limiter = AdaptiveRateLimiter(RateLimiterConfig(requests_per_second=20, burst_size=40), decrease_factor=0.5)
+
+        limiter.on_throttle()
+
+        assert limiter.current_rate == 10
+        assert limiter.available_tokens < 1
+        assert limiter.throttle_count == 1
+
+    def test_throttle_burst_decreases_once_within_cooldown(self):
+        """cooldown 내 연속 쓰로틀링은 한 번만 감소"""
+        limiter = AdaptiveRateLimiter(RateLimiterConfig(requests_per_second=20), decrease_cooldown=60)
+
+        for _ in range(5):
+            limiter.on_throttle()
+
+        assert limiter.current_rate == 10
+        assert limiter.throttle_count == 5
+
+    def test_throttle_floored_at_min_rate(self):
+        limiter = AdaptiveRateLimiter(RateLimiterConfig(requests_per_second=4), min_rate=1.5, decrease_cooldown=0)
+
+        for _ in range(5):
+            limiter.on_throttle()
+
+        assert limiter.current_rate == 1.5
+
+    def test_reduced_rate_slows_acquire(self):
+        """감소된 속도로 토큰이 생성됨"""
+        limiter = AdaptiveRateLimiter(
+            RateLimiterConfig(requests_per_second=100, burst_size=1),
+            min_rate=10,
+            decrease_factor=0.1,
+        )
+        limiter.on_throttle()
+
+        start = time.monotonic()
+        assert limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # 10 req/s -> 토큰 1개에 약 0.1초
+        assert elapsed >= 0.08
+
+    def test_invalid_decrease_factor(self):
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(decrease_factor=1.0)
+
+
 class TestResetRateLimiters:
     """reset_rate_limiters 테스트"""
 
@@ -0,0 +1,226 @@
+"""
+tests/core/parallel/test_parallel_request_limiter.py - core/parallel/request_limiter.py 테스트
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from core.parallel.client import get_client
+from core.parallel.executor import ParallelSessionExecutor
+from core.parallel.rate_limiter import SERVICE_RATE_LIMITS
+from core.parallel.request_limiter import (
+    get_current_account,
+    get_scoped_rate_limiter,
+    install_rate_limit_hooks,
+    rate_limit_scope,
+    reset_scoped_rate_limiters,
+)
+
+_OK_BODY = (
+    b'<DescribeRegionsResponse xmlns="http://ec2.amazonaws.com/doc/2016-11-15/"><regionInfo/></DescribeRegionsResponse>'
+)
+_THROTTLE_BODY = (
+    b"<Response><Errors><Error><Code>RequestLimitExceeded</Code>"
+    b"<Message>Request limit exceeded.</Message></Error></Errors></Response>"
+)
+
+
+class _RawBody:
+    """AWSResponse raw 스트림 대체"""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def stream(self):
+        yield self._body
+
+
+def _session(region="ap-northeast-2"):
+    return boto3.Session(aws_access_key_id="AKIATEST", aws_secret_access_key="secret", region_name=region)
+
+
+def _fake_http(client, responses):
+    """HTTP 전송 대신 준비된 (status, body) 응답을 순서대로 반환"""
+
+    def send(**kwargs):
+        status, body = responses.pop(0)
+        return AWSResponse("https://ec2.amazonaws.com", status, {}, _RawBody(body))
+
+    client.meta.events.register("before-send", send)
+
+
+def _ec2(session, region="ap-northeast-2"):
+    return session.client("ec2", region_name=region, config=Config(retries={"total_max_attempts": 1}))
+
+
+class TestScopedRateLimiter:
+    """get_scoped_rate_limiter 테스트"""
+
+    def test_singleton_per_scope(self):
+        a = get_scoped_rate_limiter("111", "ap-northeast-2", "ec2")
+
+        assert get_scoped_rate_limiter("111", "ap-northeast-2", "ec2") is a
+        assert get_scoped_rate_limiter("222", "ap-northeast-2", "ec2") is not a
+        assert get_scoped_rate_limiter("111", "us-east-1", "ec2") is not a
+        assert get_scoped_rate_limiter("111", "ap-northeast-2", "rds") is not a
+
+    def test_initial_rate_from_service_config(self):
+        assert get_scoped_rate_limiter("111", "us-east-1", "ec2").current_rate == (
+            SERVICE_RATE_LIMITS["ec2"].requests_per_second
+        )
+        assert get_scoped_rate_limiter("111", "us-east-1", "unknown-svc").current_rate == (
+            SERVICE_RATE_LIMITS["default"].requests_per_second
+        )
+
+    def test_reset(self):
+        a = get_scoped_rate_limiter("111", "ap-northeast-2", "ec2")
+        reset_scoped_rate_limiters()
+
+        assert get_scoped_rate_limiter("111", "ap-northeast-2", "ec2") is not a
+
+
+class TestRateLimitScope:
+    """rate_limit_scope 테스트"""
+
+    def test_scope_sets_and_restores(self):
+        assert get_current_account() is None
+        with rate_limit_scope("111"):
+            assert get_current_account() == "111"
+            with rate_limit_scope("222"):
+                assert get_current_account() == "222"
+            assert get_current_account() == "111"
+        assert get_current_account() is None
+
+    def test_scope_is_thread_local(self):
+        seen = []
+
+        with rate_limit_scope("111"):
+            t = threading.Thread(target=lambda: seen.append(get_current_account()))
+            t.start()
+            t.join()
+
+        assert seen == [None]
+
+
+class TestInstallRateLimitHooks:
+    """install_rate_limit_hooks 테스트"""
+
+    def test_each_call_consumes_token(self):
+        """API 호출마다 (계정, 리전, 서비스) limiter 토큰 소비"""
+        session = _session()
+        install_rate_limit_hooks(session.events, "111")
+        client = _ec2(session)
+        _fake_http(client, [(200, _OK_BODY)] * 3)
+        limiter = get_scoped_rate_limiter("111", "ap-northeast-2", "ec2")
+        before = limiter.available_tokens
+
+        for _ in range(3):
+            client.describe_regions()
+
+        assert limiter.available_tokens == pytest.approx(before - 3, abs=0.5)
+        # 다른 scope는 영향 없음
+        other = get_scoped_rate_limiter("222", "ap-northeast-2", "ec2")
+        assert other.available_tokens == SERVICE_RATE_LIMITS["ec2"].burst_size
+
+    def test_success_increases_rate(self):
+        session = _session()
+        install_rate_limit_hooks(session.events, "111")
+        client = _ec2(session)
+        _fake_http(client, [(200, _OK_BODY)])
+
+        client.describe_regions()
+
+        limiter = get_scoped_rate_limiter("111", "ap-northeast-2", "ec2")
+        assert limiter.current_rate > SERVICE_RATE_LIMITS["ec2"].requests_per_second
+
+    def test_throttle_response_decreases_rate(self):
+        session = _session()
+        install_rate_limit_hooks(session.events, "111")
+        client = _ec2(session)
+        _fake_http(client, [(503, _THROTTLE_BODY)])
+
+        with pytest.raises(ClientError):
+            client.describe_regions()
+
+        limiter = get_scoped_rate_limiter("111", "ap-northeast-2", "ec2")
+        assert limiter.current_rate == SERVICE_RATE_LIMITS["ec2"].requests_per_second / 2
+        assert limiter.throttle_count == 1
+
+    def test_install_is_idempotent(self):
+        """중복 등록해도 호출당 토큰 1개만 소비"""
+        session = _session()
+        install_rate_limit_hooks(session.events, "111")
+        client = _ec2(session)
+        install_rate_limit_hooks(client.meta.events, "111")
+        _fake_http(client, [(200, _OK_BODY)])
+        limiter = get_scoped_rate_limiter("111", "ap-northeast-2", "ec2")
+        before = limiter.available_tokens
+
+        client.describe_regions()
+
+        assert limiter.available_tokens == pytest.approx(before - 1, abs=0.5)
+
+    def test_non_botocore_emitter_ignored(self):
+        assert install_rate_limit_hooks(MagicMock(), "111") is False
+        assert install_rate_limit_hooks(None) is False
+
+
+class TestGetClientHooks:
+    """get_client 훅 등록 테스트"""
+
+    def test_get_client_uses_current_scope_account(self):
+        with rate_limit_scope("333"):
+            client = get_client(_session(), "ec2", region_name="us-east-1", pooled=False)
+        _fake_http(client, [(200, _OK_BODY)])
+
+        client.describe_regions()
+
+        assert get_scoped_rate_limiter("333", "us-east-1", "ec2").current_rate > 20
+
+    def test_get_client_rate_limited_false(self):
+        client = get_client(_session(), "ec2", region_name="us-east-1", pooled=False, rate_limited=False)
+        _fake_http(client, [(200, _OK_BODY)])
+
+        client.describe_regions()
+
+        assert get_scoped_rate_limiter("default", "us-east-1", "ec2").current_rate == 20
+
+
+class TestExecutorIntegration:
+    """ParallelSessionExecutor 연동 테스트"""
+
+    def test_executor_scopes_calls_by_task_account(self, mock_context):
+        """작업 내부 API 호출이 작업 계정의 limiter를 사용"""
+        from core.cli.flow.context import FallbackStrategy, RoleSelection
+
+        mock_context.role_selection = RoleSelection(
+            primary_role="AdminRole",
+            fallback_role=None,
+            fallback_strategy=FallbackStrategy.SKIP_ACCOUNT,
+            role_account_map={"AdminRole": ["123456789012"]},
+            skipped_accounts=[],
+        )
+        mock_context.regions = ["ap-northeast-2", "us-east-1"]
+        mock_context.provider = MagicMock()
+        mock_context.provider.get_session.side_effect = lambda account_id, role_name, region: _session(region)
+
+        def collect(session, account_id, account_name, region):
+            assert get_current_account() == account_id
+            client = _ec2(session, region)
+            _fake_http(client, [(200, _OK_BODY)])
+            return client.describe_regions()["Regions"]
+
+        result = ParallelSessionExecutor(mock_context).execute(collect, service="ec2")
+
+        assert result.success_count == 2
+        for region in mock_context.regions:
+            limiter = get_scoped_rate_limiter("123456789012", region, "ec2")
+            assert limiter.current_rate > SERVICE_RATE_LIMITS["ec2"].requests_per_second
+        assert get_scoped_rate_limiter("default", "ap-northeast-2", "ec2").current_rate == 20
+        assert get_current_account() is None
@@ -6,7 +6,15 @@ tests/core/region/test_data.py - 리전 데이터 테스트
 
 import pytest
 
-from core.region.data import ALL_REGIONS, COMMON_REGIONS, REGION_NAMES
+from core.region.data import (
+    ALL_REGIONS,
+    COMMON_REGIONS,
+    DEFAULT_ENABLED_REGIONS,
+    REGION_NAMES,
+    get_global_region,
+    get_partition,
+    requires_opt_in,
+)
 
 
 class TestAllRegions:
@@ -321,3 +329,37 @@ class TestRegionValidation:
     def test_critical_regions_present(self, region_code):
         """중요한 리전들이 반드시 포함되어 있어야 함"""
         assert region_code in ALL_REGIONS, f"Critical region {region_code} is missing"
+
+
+class TestPartitions:
+    """파티션/옵트인 판별 테스트"""
+
+    def test_default_enabled_regions_are_known(self):
+        """기본 활성 리전은 모두 ALL_REGIONS에 포함"""
+        assert set(ALL_REGIONS) >= DEFAULT_ENABLED_REGIONS
+
+    @pytest.mark.parametrize(
+        "region, partition, global_region",
+        [
+            ("ap-northeast-2", "aws", "us-east-1"),
+            ("me-south-1", "aws", "us-east-1"),
+            ("us-gov-east-1", "aws-us-gov", "us-gov-west-1"),
+            ("cn-north-1", "aws-cn", "cn-northwest-1"),
+        ],
+    )
+    def test_partition_and_global_region(self, region, partition, global_region):
+        assert get_partition(region) == partition
+        assert get_global_region(region) == global_region
+
+    @pytest.mark.parametrize(
+        "region, expected",
+        [
+            ("ap-northeast-2", False),
+            ("us-east-1", False),
+            ("me-south-1", True),
+            ("ap-east-1", True),
+            ("cn-north-1", False),
+        ],
+    )
+    def test_requires_opt_in(self, region, expected):
+        assert requires_opt_in(region) is expected
@@ -5,12 +5,16 @@ tests/core/region/test_region_availability.py - 리전 가용성 테스트
 import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from core.region.availability import (
     DEFAULT_CACHE_TTL,
     RegionAvailabilityChecker,
     RegionInfo,
     filter_available_regions,
+    filter_service_regions,
     get_available_regions,
+    get_enabled_regions,
     get_region_checker,
     reset_region_checkers,
     validate_regions,
@@ -723,3 +727,90 @@ class TestDefaultCacheTTL:
         checker = RegionAvailabilityChecker(session=session)
 
         assert checker.cache_ttl == DEFAULT_CACHE_TTL
+
+
+class TestGetEnabledRegions:
+    """계정별 활성 리전 파일 캐시 테스트"""
+
+    @staticmethod
+    def _session(regions):
+        session = MagicMock()
+        session.client.return_value.describe_regions.return_value = {"Regions": regions}
+        return session
+
+    def test_fetches_once_then_reads_file(self, tmp_path):
+        """첫 조회 결과를 파일에 저장하고 이후 API를 호출하지 않음"""
+        session = self._session(
+            [
+                {"RegionName": "ap-northeast-2", "OptInStatus": "opt-in-not-required"},
+                {"RegionName": "me-south-1", "OptInStatus": "not-opted-in"},
+                {"RegionName": "ap-east-1", "OptInStatus": "opted-in"},
+            ]
+        )
+
+        with patch("core.tools.cache.ttl.get_cache_path", side_effect=lambda c, f: str(tmp_path / c / f)):
+            first = get_enabled_regions(session, cache_key="111111111111")
+            second = get_enabled_regions(MagicMock(), cache_key="111111111111")
+
+        assert first == second == frozenset({"ap-northeast-2", "ap-east-1"})
+        session.client.assert_called_once_with("ec2", region_name="us-east-1")
+        assert (tmp_path / "region" / "enabled_regions_111111111111.json").exists()
+
+    def test_failure_returns_none_and_is_not_cached(self, tmp_path):
+        """조회 실패는 None (필터링 안 함), 캐시 파일을 만들지 않음"""
+        session = MagicMock()
+        session.client.return_value.describe_regions.side_effect = Exception("AccessDenied")
+
+        with patch("core.tools.cache.ttl.get_cache_path", side_effect=lambda c, f: str(tmp_path / c / f)):
+            assert get_enabled_regions(session, cache_key="profile/a") is None
+            assert get_enabled_regions(self._session([]), cache_key="profile/a") is None
+
+        assert not (tmp_path / "region" / "enabled_regions_profile_a.json").exists()
+
+
+@pytest.fixture
+def endpoint_data():
+    """botocore 엔드포인트 데이터 대체 (kendra/monitoring은 us-east-1만 제공)"""
+    from core.region.availability import _service_regions
+
+    data = {
+        "aws": {
+            "regions": {"ap-northeast-2": {}, "us-east-1": {}, "me-south-1": {}},
+            "services": {
+                "kendra": {"endpoints": {"us-east-1": {}}},
+                "monitoring": {"endpoints": {"us-east-1": {}}},
+                "iam": {"isRegionalized": False, "partitionEndpoint": "aws-global", "endpoints": {"aws-global": {}}},
+            },
+        }
+    }
+    _service_regions.cache_clear()
+    with patch("core.region.availability._load_endpoint_partitions", return_value=data):
+        yield
+    _service_regions.cache_clear()
+
+
+class TestFilterServiceRegions:
+    """botocore 엔드포인트 데이터 기반 서비스 리전 필터"""
+
+    def test_regional_service_limited_regions(self, endpoint_data):
+        """미제공 리전은 제외, botocore보다 새로운 리전은 유지"""
+        assert filter_service_regions("kendra", ["ap-northeast-2", "us-east-1", "xx-new-1"]) == [
+            "us-east-1",
+            "xx-new-1",
+        ]
+
+    def test_unknown_or_global_services_not_filtered(self, endpoint_data):
+        """알 수 없는 서비스, 글로벌 엔드포인트 서비스는 그대로"""
+        regions = ["ap-northeast-2", "me-south-1"]
+
+        assert filter_service_regions("default", regions) == regions
+        assert filter_service_regions("iam", regions) == regions
+
+    def test_service_name_alias(self, endpoint_data):
+        """rate limit 서비스명(cloudwatch)을 엔드포인트 접두사(monitoring)로 확인"""
+        assert filter_service_regions("cloudwatch", ["ap-northeast-2", "us-east-1"]) == ["us-east-1"]
+
+    def test_installed_botocore_data(self):
+        """설치된 botocore 데이터: 주요 서비스는 기본 리전 제공, 글로벌 서비스는 필터 없음"""
+        assert filter_service_regions("ec2", ["ap-northeast-2", "us-east-1"]) == ["ap-northeast-2", "us-east-1"]
+        assert filter_service_regions("health", ["ap-northeast-2"]) == ["ap-northeast-2"]
@@ -0,0 +1,160 @@
+"""
+tests/core/tools/test_manifest.py - 도구 매니페스트 테스트
+
+import 없이 CATEGORY/TOOLS를 읽는 매니페스트 생성, 서명 기반 재생성을 테스트합니다.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from core.tools import manifest as manifest_module
+from core.tools.manifest import build_manifest, iter_packages, load_manifest, read_package_metadata
+
+STATIC_INIT = """
+CATEGORY = {"name": "alpha", "description": "알파"}
+TOOLS = [{"name": "도구", "description": "설명", "permission": "read", "module": "tool"}]
+"""
+
+
+def _write(path, content: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """tmp_path/plugins 아래 도구 패키지 트리"""
+    root = tmp_path / "plugins"
+    _write(root / "__init__.py")
+    _write(root / "alpha" / "__init__.py", STATIC_INIT)
+    _write(root / "alpha" / "sub" / "__init__.py", STATIC_INIT.replace("alpha", "alpha_sub"))
+    _write(root / "beta" / "__init__.py", "from .meta import CATEGORY, TOOLS\n")
+    _write(root / "gamma" / "__init__.py", "TOOLS = []\n")
+    _write(root / "_private" / "__init__.py", STATIC_INIT)
+    _write(root / "skipme" / "__init__.py", STATIC_INIT)
+    return [("plugins", root)]
+
+
+class TestReadPackageMetadata:
+    """AST 기반 메타데이터 읽기"""
+
+    def test_static_literals(self, tmp_path):
+        init = tmp_path / "__init__.py"
+        _write(init, '"""doc"""\nimport os\n' + STATIC_INIT)
+
+        meta = read_package_metadata(init)
+
+        assert meta["kind"] == "static"
+        assert meta["category"]["name"] == "alpha"
+        assert meta["tools"][0]["module"] == "tool"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "from .meta import CATEGORY, TOOLS\n",
+            'CATEGORY = {"name": NAME}\nTOOLS = []\n',
+            "from .meta import *\n",
+            "CATEGORY = {\n",
+        ],
+    )
+    def test_non_literal_is_dynamic(self, tmp_path, content):
+        init = tmp_path / "__init__.py"
+        _write(init, content)
+
+        assert read_package_metadata(init) == {"kind": "dynamic"}
+
+    @pytest.mark.parametrize("content", ["", "TOOLS = []\n", "import os\n"])
+    def test_no_metadata(self, tmp_path, content):
+        init = tmp_path / "__init__.py"
+        _write(init, content)
+
+        assert read_package_metadata(init) is None
+
+    def test_missing_init(self, tmp_path):
+        assert read_package_metadata(tmp_path / "__init__.py") is None
+
+
+class TestBuildManifest:
+    """스캔 순서 및 제외 규칙"""
+
+    def test_packages_in_discovery_order(self, tree):
+        assert [m for m, _, _ in iter_packages(tree, {"skipme"})] == [
+            "plugins",
+            "plugins.alpha",
+            "plugins.alpha.sub",
+            "plugins.beta",
+            "plugins.gamma",
+        ]
+
+    def test_entries(self, tree):
+        manifest = build_manifest(tree, {"skipme"})
+
+        assert [(e["module_path"], e["kind"]) for e in manifest["packages"]] == [
+            ("plugins.alpha", "static"),
+            ("plugins.alpha.sub", "static"),
+            ("plugins.beta", "dynamic"),
+        ]
+        assert {e["source"] for e in manifest["packages"]} == {"plugins"}
+
+
+class TestLoadManifest:
+    """서명 기반 재사용/재생성"""
+
+    def test_reuses_manifest_until_source_changes(self, tree, tmp_path):
+        path = tmp_path / "manifest.json"
+        first = load_manifest(tree, set(), path)
+
+        with patch.object(manifest_module, "build_manifest", wraps=build_manifest) as build:
+            assert load_manifest(tree, set(), path) == first
+            build.assert_not_called()
+
+            init = tree[0][1] / "alpha" / "__init__.py"
+            _write(init, STATIC_INIT.replace("알파", "알파 v2"))
+            stat = init.stat()
+            os.utime(init, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            updated = load_manifest(tree, set(), path)
+            build.assert_called_once()
+
+        assert updated[0]["category"]["description"] == "알파 v2"
+
+    def test_new_package_triggers_rebuild(self, tree, tmp_path):
+        path = tmp_path / "manifest.json"
+        load_manifest(tree, set(), path)
+        _write(tree[0][1] / "delta" / "__init__.py", STATIC_INIT.replace("alpha", "delta"))
+
+        names = [e["module_path"] for e in load_manifest(tree, set(), path)]
+
+        assert "plugins.delta" in names
+
+    def test_corrupt_or_old_version_is_rebuilt(self, tree, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert len(load_manifest(tree, set(), path)) == 4
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["version"] = 0
+        data["packages"] = []
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert len(load_manifest(tree, set(), path)) == 4
+
+
+class TestDiscoveryUsesManifest:
+    """discovery는 도구 패키지를 import하지 않음"""
+
+    def test_static_categories_are_not_imported(self):
+        from core.tools.discovery import discover_categories
+
+        loaded_before = {name for name in sys.modules if name.startswith("functions.analyzers.")}
+        with patch("core.tools.discovery.importlib.import_module") as mock_import:
+            categories = discover_categories(include_aws_services=True, use_cache=False)
+
+        mock_import.assert_not_called()
+        assert any(cat["name"] == "ec2" for cat in categories)
+        loaded_after = {name for name in sys.modules if name.startswith("functions.analyzers.")}
+        assert loaded_after == loaded_before
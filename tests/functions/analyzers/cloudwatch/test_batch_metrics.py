@@ -13,12 +13,18 @@ from core.shared.aws.metrics.batch_metrics import (
     MetricQuery,
     _chunks,
     batch_get_metrics,
+    build_alarm_metric_queries,
+    build_dynamodb_metric_queries,
+    build_ebs_metric_queries,
     build_ec2_metric_queries,
     build_elasticache_metric_queries,
+    build_lambda_concurrency_metric_queries,
     build_lambda_metric_queries,
     build_nat_metric_queries,
     build_rds_metric_queries,
+    build_s3_storage_metric_queries,
     build_sagemaker_endpoint_metric_queries,
+    build_vpc_endpoint_metric_queries,
     sanitize_metric_id,
 )
 
@@ -451,6 +457,106 @@ class TestBuildSageMakerEndpointMetricQueries:
             assert "EndpointName" in q.dimensions
 
 
+class TestBuildLambdaConcurrencyMetricQueries:
+    """build_lambda_concurrency_metric_queries 함수 테스트"""
+
+    def test_max_and_avg(self):
+        queries = build_lambda_concurrency_metric_queries(["my-func"])
+
+        assert [q.id for q in queries] == ["m0_concurrentexecutions_max", "m0_concurrentexecutions_avg"]
+        assert {q.stat for q in queries} == {"Maximum", "Average"}
+
+    def test_colliding_names_get_distinct_ids(self):
+        queries = build_lambda_concurrency_metric_queries(["my-func", "my.func"])
+
+        assert len({q.id for q in queries}) == 4
+        assert [q.dimensions["FunctionName"] for q in queries[2:]] == ["my.func", "my.func"]
+
+
+class TestBuildEbsMetricQueries:
+    """build_ebs_metric_queries 함수 테스트"""
+
+    def test_volume(self):
+        queries = build_ebs_metric_queries(["vol-123"])
+
+        # VolumeReadOps, VolumeWriteOps = 2개
+        assert [q.id for q in queries] == ["vol_123_volumereadops_sum", "vol_123_volumewriteops_sum"]
+        for q in queries:
+            assert q.namespace == "AWS/EBS"
+            assert q.dimensions == {"VolumeId": "vol-123"}
+
+
+class TestBuildS3StorageMetricQueries:
+    """build_s3_storage_metric_queries 함수 테스트"""
+
+    def test_bucket(self):
+        queries = build_s3_storage_metric_queries(["my.bucket"])
+
+        assert [q.id for q in queries] == ["m0_bucketsizebytes_avg", "m0_numberofobjects_avg"]
+        for q in queries:
+            assert q.namespace == "AWS/S3"
+            assert q.dimensions["BucketName"] == "my.bucket"
+            assert "StorageType" in q.dimensions
+
+
+class TestBuildDynamoDBMetricQueries:
+    """build_dynamodb_metric_queries 함수 테스트"""
+
+    def test_table(self):
+        queries = build_dynamodb_metric_queries(["orders"])
+        ids = {q.id for q in queries}
+
+        assert "m0_consumedreadcapacityunits_avg" in ids
+        assert "m0_consumedwritecapacityunits_max" in ids
+        assert "m0_readthrottledrequests_sum" in ids
+        for q in queries:
+            assert q.namespace == "AWS/DynamoDB"
+            assert q.dimensions == {"TableName": "orders"}
+
+    def test_colliding_and_uppercase_names(self):
+        names = ["orders.v2", "orders-v2", "Orders"]
+        queries = build_dynamodb_metric_queries(names)
+
+        # 테이블당 6개, 모두 서로 다르고 소문자로 시작
+        assert len({q.id for q in queries}) == len(queries) == 18
+        assert all(q.id[0].islower() for q in queries)
+        assert [q.dimensions["TableName"] for q in queries[::6]] == names
+
+
+class TestBuildAlarmMetricQueries:
+    """build_alarm_metric_queries 함수 테스트"""
+
+    def test_alarm_dimensions(self):
+        alarms = [
+            {
+                "Namespace": "AWS/EC2",
+                "MetricName": "CPUUtilization",
+                "Dimensions": [{"Name": "InstanceId", "Value": "i-1"}],
+            },
+            {"Namespace": "Custom", "MetricName": "Queue"},
+        ]
+
+        queries = build_alarm_metric_queries(alarms)
+
+        assert [q.id for q in queries] == ["alarm0", "alarm1"]
+        assert queries[0].dimensions == {"InstanceId": "i-1"}
+        assert queries[1].dimensions == {}
+        assert all(q.stat == "SampleCount" for q in queries)
+
+
+class TestBuildVpcEndpointMetricQueries:
+    """build_vpc_endpoint_metric_queries 함수 테스트"""
+
+    def test_endpoint(self):
+        queries = build_vpc_endpoint_metric_queries([("vpce-1", "vpc-1", "com.amazonaws.us-east-1.s3")])
+
+        assert len(queries) == 1
+        q = queries[0]
+        assert q.id == "vpce_1_bytesprocessed_sum"
+        assert q.namespace == "AWS/PrivateLinkEndpoints"
+        assert q.dimensions["VPC Endpoint Id"] == "vpce-1"
+
+
 class TestIntegration:
     """통합 테스트"""
 
@@ -4,6 +4,8 @@ tests/plugins/cost/pricing/conftest.py - Pricing 테스트 공통 fixtures
 
 import pytest
 
+from core.shared.aws.pricing.price_db import PriceDatabase
+
 
 @pytest.fixture
 def sample_ec2_prices():
@@ -61,3 +63,11 @@ def sample_dynamodb_prices():
         "write_per_million": 1.25,
         "storage_per_gb": 0.25,
     }
+
+
+@pytest.fixture
+def isolated_price_db(tmp_path, monkeypatch):
+    """기본 경로 로컬 가격 DB를 tmp 경로의 빈 DB로 교체"""
+    db = PriceDatabase(tmp_path / "price_list.sqlite3")
+    monkeypatch.setattr("core.shared.aws.pricing.price_db._get_price_db_path", lambda: db.path)
+    return db
@@ -107,3 +107,60 @@ class TestPriceCache:
             cache.set("ec2", "us-west-2", {})
             result = cache.get("ec2", "us-west-2")
             assert result == {}
+
+    def test_repeated_get_reads_file_once(self, cache, temp_cache_dir):
+        """변경 없는 파일은 메모리 계층에서 반환"""
+        cache.set("ec2", "eu-west-1", {"t3.micro": 0.0104})
+
+        with patch("core.shared.aws.pricing.cache.json.load") as mock_load:
+            for _ in range(100):
+                assert cache.get("ec2", "eu-west-1") == {"t3.micro": 0.0104}
+
+        mock_load.assert_not_called()
+
+    def test_returned_dict_is_a_copy(self, cache, temp_cache_dir):
+        """반환값 수정이 메모리 계층에 영향 없음"""
+        cache.set("ec2", "eu-west-2", {"t3.micro": 0.0104})
+
+        cache.get("ec2", "eu-west-2")["t3.micro"] = 99.0
+
+        assert cache.get("ec2", "eu-west-2") == {"t3.micro": 0.0104}
+
+    def test_file_changed_by_other_process_is_reread(self, cache, temp_cache_dir):
+        """파일 mtime/size가 바뀌면 다시 읽음"""
+        cache.set("ec2", "eu-west-3", {"t3.micro": 0.0104})
+        assert cache.get("ec2", "eu-west-3") == {"t3.micro": 0.0104}
+
+        cache_path = temp_cache_dir / "ec2_eu-west-3.json"
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        data["prices"] = {"t3.micro": 0.0104, "t3.small": 0.0208}
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert cache.get("ec2", "eu-west-3") == {"t3.micro": 0.0104, "t3.small": 0.0208}
+
+    def test_deleted_file_not_served_from_memory(self, cache, temp_cache_dir):
+        """다른 경로로 삭제된 파일은 메모리 계층에서도 무효"""
+        cache.set("ec2", "eu-north-1", {"t3.micro": 0.0104})
+        (temp_cache_dir / "ec2_eu-north-1.json").unlink()
+
+        assert cache.get("ec2", "eu-north-1") is None
+
+
+class TestMemoryLayer:
+    """_MemoryLayer LRU 테스트"""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        from core.shared.aws.pricing.cache import _MemoryLayer
+
+        layer = _MemoryLayer(max_entries=2)
+        now = datetime.now()
+        a, b, c = tmp_path / "a.json", tmp_path / "b.json", tmp_path / "c.json"
+        layer.put(a, (1, 1), now, {"a": 1.0})
+        layer.put(b, (1, 1), now, {"b": 1.0})
+        assert layer.get(a, (1, 1)) is not None
+
+        layer.put(c, (1, 1), now, {"c": 1.0})
+
+        assert layer.get(b, (1, 1)) is None
+        assert layer.get(a, (1, 1)) is not None
+        assert layer.get(a, (2, 1)) is None
@@ -0,0 +1,62 @@
+"""
+tests/functions/analyzers/cost/pricing/test_fetcher.py - PricingFetcher 페이지네이션 테스트
+"""
+
+import json
+from unittest.mock import MagicMock
+
+from core.shared.aws.pricing.fetcher import PRICE_LIST_PAGE_SIZE, PricingFetcher
+
+
+def _ec2_item(instance_type: str, price: str) -> str:
+    return json.dumps(
+        {
+            "product": {"attributes": {"instanceType": instance_type}},
+            "terms": {"OnDemand": {"t": {"priceDimensions": {"d": {"pricePerUnit": {"USD": price}}}}}},
+        }
+    )
+
+
+def _fetcher(pages: list[dict]) -> tuple[PricingFetcher, MagicMock]:
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = iter(pages)
+    fetcher = PricingFetcher(session=MagicMock())
+    fetcher._pricing_client = client
+    return fetcher, client
+
+
+class TestPricingFetcherPagination:
+    """get_products 전체 페이지 순회"""
+
+    def test_ec2_prices_read_every_page(self):
+        pages = [
+            {"PriceList": [_ec2_item(f"m5.{i}xlarge", "0.1") for i in range(PRICE_LIST_PAGE_SIZE)]},
+            {"PriceList": [_ec2_item("t3.micro", "0.0104"), _ec2_item("t3.nano", "0")]},
+        ]
+        fetcher, client = _fetcher(pages)
+
+        prices = fetcher.get_ec2_prices("ap-northeast-2")
+
+        assert len(prices) == PRICE_LIST_PAGE_SIZE + 1
+        assert prices["t3.micro"] == 0.0104
+        client.get_paginator.assert_called_once_with("get_products")
+        kwargs = client.get_paginator.return_value.paginate.call_args.kwargs
+        assert kwargs["ServiceCode"] == "AmazonEC2"
+        assert kwargs["PaginationConfig"] == {"PageSize": PRICE_LIST_PAGE_SIZE}
+
+    def test_dict_price_items_are_accepted(self):
+        fetcher, _ = _fetcher([{"PriceList": [json.loads(_ec2_item("ml.m5.large", "0.115"))]}])
+
+        assert fetcher.get_sagemaker_prices("ap-northeast-2") == {"ml.m5.large": 0.115}
+
+    def test_error_on_later_page_returns_empty(self):
+        from botocore.exceptions import ClientError
+
+        def pages():
+            yield {"PriceList": [_ec2_item("t3.micro", "0.0104")]}
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "GetProducts")
+
+        fetcher, client = _fetcher([])
+        client.get_paginator.return_value.paginate.return_value = pages()
+
+        assert fetcher.get_ec2_prices("ap-northeast-2") == {}
@@ -0,0 +1,315 @@
+"""
+tests/functions/analyzers/cost/pricing/test_price_db.py - 로컬 가격 DB 테스트
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.shared.aws.pricing.fetcher import PricingFetcher
+from core.shared.aws.pricing.price_db import PriceDatabase, sync_price_db, sync_scope
+
+EC2_LINUX = {"operatingSystem": "Linux", "tenancy": "Shared", "preInstalledSw": "NA", "capacitystatus": "Used"}
+
+
+def _terms(sku: str, price: str, description: str = "") -> dict:
+    return {
+        f"{sku}.JRTCKXETXF": {
+            "priceDimensions": {
+                f"{sku}.JRTCKXETXF.6YS6EN2CT7": {"description": description, "pricePerUnit": {"USD": price}}
+            }
+        }
+    }
+
+
+def _ec2_offer() -> dict:
+    products = {
+        "SKU1": {
+            "productFamily": "Compute Instance",
+            "attributes": {"regionCode": "ap-northeast-2", "instanceType": "t3.micro", **EC2_LINUX},
+        },
+        "SKU2": {
+            "productFamily": "Compute Instance",
+            "attributes": {"regionCode": "us-east-1", "instanceType": "t3.micro", **EC2_LINUX},
+        },
+        "SKU3": {
+            "productFamily": "Compute Instance",
+            "attributes": {
+                "regionCode": "ap-northeast-2",
+                "instanceType": "t3.micro",
+                **EC2_LINUX,
+                "operatingSystem": "Windows",
+            },
+        },
+        "SKU4": {"productFamily": "Storage", "attributes": {"regionCode": "ap-northeast-2", "volumeApiName": "gp3"}},
+        "SKU5": {"productFamily": "Data Transfer", "attributes": {"regionCode": "ap-northeast-2"}},
+        "SKU6": {
+            "productFamily": "Compute Instance",
+            "attributes": {"regionCode": "ap-northeast-2", "instanceType": "m5.large", **EC2_LINUX},
+        },
+    }
+    on_demand = {
+        "SKU1": _terms("SKU1", "0.0130"),
+        "SKU2": _terms("SKU2", "0.0104"),
+        "SKU3": _terms("SKU3", "0.0222"),
+        "SKU4": _terms("SKU4", "0.0912"),
+        "SKU5": _terms("SKU5", "0.09"),
+    }
+    # SKU6은 Reserved 전용 → 적재 제외
+    return {
+        "offerCode": "AmazonEC2",
+        "version": "20260101000000",
+        "publicationDate": "2026-01-01T00:00:00Z",
+        "products": products,
+        "terms": {"OnDemand": on_demand, "Reserved": {"SKU6": {}}},
+    }
+
+
+def _route53_offer() -> dict:
+    return {
+        "offerCode": "AmazonRoute53",
+        "version": "20260101000000",
+        "publicationDate": "2026-01-01T00:00:00Z",
+        "products": {
+            "R1": {"productFamily": "DNS Zone", "attributes": {"regionCode": "", "group": "ZoneMonthly"}},
+            "R2": {"productFamily": "DNS Query", "attributes": {"regionCode": "us-east-1", "group": "Queries"}},
+        },
+        "terms": {
+            "OnDemand": {
+                "R1": _terms("R1", "0.50", "Hosted zone first 25"),
+                "R2": _terms("R2", "0.40", "DNS queries per million"),
+            }
+        },
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    return PriceDatabase(tmp_path / "price_list.sqlite3")
+
+
+def _filters(region: str | None = None, **attributes: str) -> list[dict]:
+    filters = [{"Type": "TERM_MATCH", "Field": "regionCode", "Value": region}] if region else []
+    return filters + [{"Type": "TERM_MATCH", "Field": k, "Value": v} for k, v in attributes.items()]
+
+
+class TestSyncScope:
+    """PRICE_QUERIES 기반 동기화 범위"""
+
+    def test_groups_conditions_by_offer(self):
+        scope = sync_scope(["ec2", "ebs", "route53"])
+
+        assert set(scope) == {"AmazonEC2", "AmazonRoute53"}
+        assert {"productFamily": "storage"} in scope["AmazonEC2"]
+        assert scope["AmazonRoute53"] == [{}]
+
+    def test_unknown_service(self):
+        with pytest.raises(ValueError):
+            sync_scope(["ec2", "nope"])
+
+
+class TestIngest:
+    """offer 파일 적재"""
+
+    def test_only_scoped_on_demand_skus_are_stored(self, db):
+        results = db.ingest_offer(_ec2_offer(), sync_scope(["ec2", "ebs"]))
+
+        assert [(r.region, r.sku_count) for r in results] == [("ap-northeast-2", 2), ("us-east-1", 1)]
+        offers = db.offers()
+        assert [(o["offer_code"], o["region"], o["sku_count"]) for o in offers] == [
+            ("AmazonEC2", "ap-northeast-2", 2),
+            ("AmazonEC2", "us-east-1", 1),
+        ]
+        assert offers[0]["publication_date"] == "2026-01-01T00:00:00Z"
+
+    def test_region_filter_and_resync_replaces(self, db):
+        db.ingest_offer(_ec2_offer(), sync_scope(["ec2"]), regions=["ap-northeast-2"])
+        offer = _ec2_offer()
+        offer["terms"]["OnDemand"]["SKU1"] = _terms("SKU1", "0.0150")
+        db.ingest_offer(offer, sync_scope(["ec2"]), regions=["ap-northeast-2"])
+
+        items = db.query("AmazonEC2", _filters("ap-northeast-2", **EC2_LINUX))
+
+        assert [o["region"] for o in db.offers()] == ["ap-northeast-2"]
+        assert len(items) == 1
+        dims = next(iter(items[0]["terms"]["OnDemand"].values()))["priceDimensions"]
+        assert next(iter(dims.values()))["pricePerUnit"]["USD"] == "0.0150"
+
+    def test_global_offer_merged_into_single_scope(self, db):
+        results = db.ingest_offer(_route53_offer(), sync_scope(["route53"]), regions=["ap-northeast-2"])
+
+        assert [(r.region, r.sku_count) for r in results] == [("", 2)]
+        assert len(db.query("AmazonRoute53", [])) == 2
+
+    def test_out_of_scope_offer_is_skipped(self, db):
+        assert db.ingest_offer(_route53_offer(), sync_scope(["ec2"])) == []
+        assert not db.exists()
+
+    def test_ingest_file_ignores_non_offer_json(self, db, tmp_path):
+        path = tmp_path / "region_index.json"
+        path.write_text(json.dumps({"regions": {}}))
+
+        assert db.ingest_file(path) == []
+
+
+def _write_offer(tmp_path, offer: dict, indent: int | None = None):
+    path = tmp_path / "index.json"
+    path.write_text(json.dumps(offer, indent=indent))
+    return path
+
+
+class TestIngestFile:
+    """offer 파일 스트리밍 적재"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+    def test_stream_matches_in_memory_ingest(self, db, tmp_path, chunk_size):
+        offer = _ec2_offer()
+        offer["formatVersion"] = "v1.0"
+        offer["terms"]["Reserved"] = {"SKU6": {"SKU6.4NA7Y494T4": {"termAttributes": {"LeaseContractLength": "1yr"}}}}
+        path = _write_offer(tmp_path, offer, indent=2)
+
+        results = db.ingest_file(path, sync_scope(["ec2", "ebs"]), chunk_size=chunk_size)
+
+        assert [(r.region, r.sku_count) for r in results] == [("ap-northeast-2", 2), ("us-east-1", 1)]
+        items = db.query("AmazonEC2", _filters("ap-northeast-2", instanceType="t3.micro", **EC2_LINUX))
+        assert [item["product"]["sku"] for item in items] == ["SKU1"]
+        assert items[0]["product"]["attributes"] == offer["products"]["SKU1"]["attributes"]
+        assert items[0]["terms"] == {"OnDemand": _terms("SKU1", "0.0130")}
+
+    def test_keys_after_products_are_buffered(self, db, tmp_path):
+        offer = _route53_offer()
+        reordered = {"terms": offer["terms"], "products": offer["products"], "offerCode": offer["offerCode"]}
+        path = _write_offer(tmp_path, reordered)
+
+        results = db.ingest_file(path, sync_scope(["route53"]))
+
+        assert [(r.region, r.sku_count) for r in results] == [("", 2)]
+
+    def test_batches_replace_region_once(self, db, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.shared.aws.pricing.price_db.INGEST_BATCH_SIZE", 1)
+        path = _write_offer(tmp_path, _ec2_offer())
+        db.ingest_file(path, sync_scope(["ec2", "ebs"]))
+
+        results = db.ingest_file(path, sync_scope(["ec2", "ebs"]))
+
+        assert [(r.region, r.sku_count) for r in results] == [("ap-northeast-2", 2), ("us-east-1", 1)]
+        assert len(db.query("AmazonEC2", _filters("ap-northeast-2"))) == 2
+
+    def test_truncated_file_rolls_back(self, db, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.shared.aws.pricing.price_db.INGEST_BATCH_SIZE", 1)
+        db.ingest_offer(_ec2_offer(), sync_scope(["ec2"]))
+        offer = _ec2_offer()
+        offer["terms"]["OnDemand"]["SKU1"] = _terms("SKU1", "0.0150")
+        text = json.dumps(offer)
+        path = tmp_path / "index.json"
+        path.write_text(text[: text.index('"SKU3": {"SKU3.')])
+
+        assert db.ingest_file(path, sync_scope(["ec2"]), chunk_size=16) == []
+        items = db.query("AmazonEC2", _filters("ap-northeast-2", **EC2_LINUX))
+        dims = next(iter(items[0]["terms"]["OnDemand"].values()))["priceDimensions"]
+        assert next(iter(dims.values()))["pricePerUnit"]["USD"] == "0.0130"
+
+    def test_out_of_scope_file_stops_early(self, db, tmp_path):
+        path = _write_offer(tmp_path, _route53_offer())
+
+        assert db.ingest_file(path, sync_scope(["ec2"])) == []
+        assert not db.exists()
+
+
+class TestQuery:
+    """get_products 조건 조회"""
+
+    def test_attribute_match_is_case_insensitive(self, db):
+        db.ingest_offer(_ec2_offer(), sync_scope(["ec2", "ebs"]))
+
+        items = db.query("AmazonEC2", _filters("ap-northeast-2", productFamily="STORAGE"))
+
+        assert [item["product"]["sku"] for item in items] == ["SKU4"]
+        assert items[0]["product"]["attributes"]["volumeApiName"] == "gp3"
+
+    def test_unsynced_region_or_service_returns_none(self, db):
+        assert db.query("AmazonEC2", _filters("ap-northeast-2")) is None
+        db.ingest_offer(_ec2_offer(), sync_scope(["ec2"]), regions=["us-east-1"])
+
+        assert db.query("AmazonEC2", _filters("ap-northeast-2")) is None
+        assert db.query("AmazonRDS", _filters("us-east-1")) is None
+        assert db.query("AmazonEC2", _filters("us-east-1", instanceType="x9.huge")) == []
+
+    def test_non_term_match_filter_falls_back(self, db):
+        db.ingest_offer(_ec2_offer(), sync_scope(["ec2"]))
+
+        assert db.query("AmazonEC2", [{"Type": "CONTAINS", "Field": "instanceType", "Value": "t3"}]) is None
+
+
+class TestFetcherUsesPriceDB:
+    """PricingFetcher는 동기화된 범위를 DB에서 조회"""
+
+    def test_ec2_and_ebs_from_db_without_api(self, db):
+        db.ingest_offer(_ec2_offer(), sync_scope(["ec2", "ebs"]))
+        fetcher = PricingFetcher(session=MagicMock(), price_db=db)
+        fetcher._pricing_client = MagicMock()
+
+        assert fetcher.get_ec2_prices("ap-northeast-2") == {"t3.micro": 0.013}
+        assert fetcher.get_ebs_prices("ap-northeast-2") == {"gp3": 0.0912}
+        fetcher._pricing_client.get_paginator.assert_not_called()
+
+    def test_route53_from_db(self, db):
+        db.ingest_offer(_route53_offer(), sync_scope(["route53"]))
+        fetcher = PricingFetcher(session=MagicMock(), price_db=db)
+        fetcher._pricing_client = MagicMock()
+
+        prices = fetcher.get_route53_prices()
+
+        assert prices["hosted_zone_monthly"] == 0.5
+        assert prices["query_per_million"] == 0.4
+
+    def test_unsynced_region_uses_api(self, db):
+        db.ingest_offer(_ec2_offer(), sync_scope(["ec2"]), regions=["us-east-1"])
+        fetcher = PricingFetcher(session=MagicMock(), price_db=db)
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.return_value = iter([{"PriceList": []}])
+        fetcher._pricing_client = client
+
+        assert fetcher.get_ec2_prices("ap-northeast-2") == {}
+        client.get_paginator.assert_called_once_with("get_products")
+
+
+class TestSyncPriceDB:
+    """sync_price_db 로컬/다운로드 적재"""
+
+    def test_sync_from_source_dir_clears_file_cache(self, db, tmp_path):
+        source = tmp_path / "offers"
+        (source / "AmazonEC2").mkdir(parents=True)
+        (source / "AmazonEC2" / "index.json").write_text(json.dumps(_ec2_offer()))
+        (source / "route53.json").write_text(json.dumps(_route53_offer()))
+
+        with patch("core.shared.aws.pricing.cache.clear_cache") as clear_cache:
+            results = sync_price_db(source=source, services=["ec2", "route53"], db=db)
+
+        assert sorted((r.offer_code, r.region) for r in results) == [
+            ("AmazonEC2", "ap-northeast-2"),
+            ("AmazonEC2", "us-east-1"),
+            ("AmazonRoute53", ""),
+        ]
+        assert sorted(c.kwargs["service"] for c in clear_cache.call_args_list) == ["ec2", "route53"]
+
+    def test_download_requires_regions(self, db):
+        with pytest.raises(ValueError):
+            sync_price_db(db=db)
+
+    def test_download_per_region(self, db, tmp_path):
+        def fake_download(offer_code, region, dest_dir):
+            path = tmp_path / f"{offer_code}_{region}.json"
+            path.write_text(json.dumps(_ec2_offer()))
+            return path
+
+        with (
+            patch("core.shared.aws.pricing.price_db.download_offer_file", side_effect=fake_download) as download,
+            patch("core.shared.aws.pricing.cache.clear_cache"),
+        ):
+            results = sync_price_db(regions=["us-east-1"], services=["ec2"], db=db)
+
+        download.assert_called_once()
+        assert download.call_args.args[:2] == ("AmazonEC2", "us-east-1")
+        assert [(r.region, r.sku_count) for r in results] == [("us-east-1", 1)]
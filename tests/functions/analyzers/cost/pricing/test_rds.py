@@ -4,6 +4,8 @@ tests/analyzers/cost/pricing/test_rds.py - RDS 가격 조회 테스트
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 class TestGetRdsPrices:
     """get_rds_prices 함수 테스트"""
@@ -166,31 +168,33 @@ class TestGetRdsMonthlyCost:
         assert large_storage > small_storage
 
 
+def _pricing_client(pages: list[dict]) -> MagicMock:
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = iter(pages)
+    return client
+
+
+@pytest.mark.usefixtures("isolated_price_db")
 class TestGetRdsPricesFromApi:
-    """get_rds_prices_from_api 함수 테스트"""
+    """get_rds_prices_from_api 함수 테스트 (로컬 가격 DB 미동기화 → API)"""
 
-    @patch("core.shared.aws.pricing.rds.get_client")
+    @patch("core.shared.aws.pricing.fetcher.get_client")
     def test_successful_api_call(self, mock_get_client):
         """API 호출 성공"""
         from core.shared.aws.pricing.rds import get_rds_prices_from_api
 
-        mock_pricing = MagicMock()
-        mock_get_client.return_value = mock_pricing
-        mock_pricing.get_products.return_value = {
-            "PriceList": [
-                {
-                    "product": {"attributes": {"instanceType": "db.t3.micro"}},
-                    "terms": {"OnDemand": {"term1": {"priceDimensions": {"dim1": {"pricePerUnit": {"USD": "0.020"}}}}}},
-                }
-            ]
+        item = {
+            "product": {"attributes": {"instanceType": "db.t3.micro"}},
+            "terms": {"OnDemand": {"term1": {"priceDimensions": {"dim1": {"pricePerUnit": {"USD": "0.020"}}}}}},
         }
+        mock_get_client.return_value = _pricing_client([{"PriceList": []}, {"PriceList": [item]}])
 
         mock_session = MagicMock()
         result = get_rds_prices_from_api(mock_session, "ap-northeast-2", "mysql")
 
-        assert isinstance(result, dict)
+        assert result == {"db.t3.micro": 0.02}
 
-    @patch("core.shared.aws.pricing.rds.get_client")
+    @patch("core.shared.aws.pricing.fetcher.get_client")
     def test_handles_api_error(self, mock_get_client):
         """API 오류 처리"""
         from botocore.exceptions import ClientError
@@ -199,7 +203,7 @@ class TestGetRdsPricesFromApi:
 
         mock_pricing = MagicMock()
         mock_get_client.return_value = mock_pricing
-        mock_pricing.get_products.side_effect = ClientError(
+        mock_pricing.get_paginator.return_value.paginate.side_effect = ClientError(
             {"Error": {"Code": "AccessDenied", "Message": "Access Denied"}},
             "GetProducts",
         )
@@ -209,20 +213,19 @@ class TestGetRdsPricesFromApi:
 
         assert result == {}
 
-    @patch("core.shared.aws.pricing.rds.get_client")
+    @patch("core.shared.aws.pricing.fetcher.get_client")
     def test_engine_filter_postgresql(self, mock_get_client):
         """PostgreSQL 엔진 필터"""
         from core.shared.aws.pricing.rds import get_rds_prices_from_api
 
-        mock_pricing = MagicMock()
+        mock_pricing = _pricing_client([{"PriceList": []}])
         mock_get_client.return_value = mock_pricing
-        mock_pricing.get_products.return_value = {"PriceList": []}
 
         mock_session = MagicMock()
         get_rds_prices_from_api(mock_session, "ap-northeast-2", "postgres")
 
         # Verify the filter includes PostgreSQL
-        call_args = mock_pricing.get_products.call_args
+        call_args = mock_pricing.get_paginator.return_value.paginate.call_args
         filters = call_args.kwargs["Filters"]
         engine_filter = next(f for f in filters if f["Field"] == "databaseEngine")
         assert engine_filter["Value"] == "PostgreSQL"
@@ -0,0 +1,134 @@
+"""
+tests/functions/analyzers/cost/pricing/test_service_prices.py - 서비스별 가격 모듈의 로컬 가격 DB/API 조회 테스트
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.shared.aws.pricing.efs import get_efs_prices_from_api
+from core.shared.aws.pricing.elasticache import get_elasticache_prices_from_api
+from core.shared.aws.pricing.fetcher import PRICE_QUERIES
+from core.shared.aws.pricing.fsx import get_fsx_prices_from_api
+from core.shared.aws.pricing.kinesis import get_kinesis_prices_from_api
+from core.shared.aws.pricing.opensearch import get_opensearch_prices_from_api
+from core.shared.aws.pricing.price_db import sync_scope
+from core.shared.aws.pricing.rds import get_rds_prices_from_api
+from core.shared.aws.pricing.redshift import get_redshift_prices_from_api
+from core.shared.aws.pricing.transfer import get_transfer_prices_from_api
+
+REGION = "ap-northeast-2"
+
+# (PRICE_QUERIES 키, 조회 함수, SKU productFamily, SKU 속성, 기대 가격 항목)
+CASES = [
+    (
+        "rds",
+        lambda session: get_rds_prices_from_api(session, REGION, "postgres"),
+        "Database Instance",
+        {"instanceType": "db.r6g.large", "databaseEngine": "PostgreSQL", "deploymentOption": "Single-AZ"},
+        ("db.r6g.large", 0.26),
+    ),
+    (
+        "elasticache",
+        lambda session: get_elasticache_prices_from_api(session, REGION),
+        "Cache Instance",
+        {"instanceType": "cache.t3.micro"},
+        ("cache.t3.micro", 0.026),
+    ),
+    (
+        "efs",
+        lambda session: get_efs_prices_from_api(session, REGION),
+        "Storage",
+        {"storageClass": "General Purpose", "usagetype": "APN2-TimedStorage-ByteHrs-Standard"},
+        ("standard", 0.33),
+    ),
+    (
+        "fsx",
+        lambda session: get_fsx_prices_from_api(session, REGION, "LUSTRE"),
+        "Storage",
+        {"fileSystemType": "Lustre", "storageType": "SSD"},
+        ("ssd", 0.17),
+    ),
+    (
+        "kinesis",
+        lambda session: get_kinesis_prices_from_api(session, REGION),
+        "Kinesis Streams",
+        {"usagetype": "APN2-Storage-ShardHour"},
+        ("shard_hour", 0.0174),
+    ),
+    (
+        "opensearch",
+        lambda session: get_opensearch_prices_from_api(session, REGION),
+        "Amazon OpenSearch Service Instance",
+        {"instanceType": "r6g.large.search"},
+        ("r6g.large.search", 0.181),
+    ),
+    (
+        "redshift",
+        lambda session: get_redshift_prices_from_api(session, REGION),
+        "Compute Instance",
+        {"instanceType": "ra3.xlplus"},
+        ("ra3.xlplus", 1.278),
+    ),
+    (
+        "transfer",
+        lambda session: get_transfer_prices_from_api(session, REGION),
+        "AWS Transfer Family",
+        {"usagetype": "APN2-ProtocolHours-Server"},
+        ("hourly", 0.3),
+    ),
+]
+
+
+def _item(family: str, attributes: dict[str, str], price: float) -> dict:
+    return {
+        "product": {"sku": "SKU1", "productFamily": family, "attributes": {"regionCode": REGION, **attributes}},
+        "terms": {
+            "OnDemand": {
+                "SKU1.JRTCKXETXF": {
+                    "priceDimensions": {
+                        "SKU1.JRTCKXETXF.6YS6EN2CT7": {"unit": "Hrs", "pricePerUnit": {"USD": str(price)}}
+                    }
+                }
+            }
+        },
+    }
+
+
+def _offer(offer_code: str, item: dict) -> dict:
+    return {
+        "offerCode": offer_code,
+        "version": "20260101000000",
+        "publicationDate": "2026-01-01T00:00:00Z",
+        "products": {"SKU1": item["product"]},
+        "terms": {"OnDemand": {"SKU1": item["terms"]["OnDemand"]}},
+    }
+
+
+@pytest.mark.parametrize(("name", "lookup", "family", "attributes", "expected"), CASES, ids=[c[0] for c in CASES])
+class TestServicePricesUsePriceDB:
+    """rds/elasticache/efs/fsx/kinesis/opensearch/redshift/transfer 가격은 PRICE_QUERIES 조건으로 조회"""
+
+    def test_synced_region_reads_db_without_api(self, isolated_price_db, name, lookup, family, attributes, expected):
+        offer_code = PRICE_QUERIES[name][0]
+        isolated_price_db.ingest_offer(_offer(offer_code, _item(family, attributes, expected[1])), sync_scope([name]))
+
+        with patch("core.shared.aws.pricing.fetcher.get_client") as mock_get_client:
+            prices = lookup(MagicMock())
+
+        assert prices[expected[0]] == expected[1]
+        mock_get_client.assert_not_called()
+
+    def test_unsynced_region_reads_every_api_page(self, isolated_price_db, name, lookup, family, attributes, expected):
+        client = MagicMock()
+        pages = [{"PriceList": []}, {"PriceList": [json.dumps(_item(family, attributes, expected[1]))]}]
+        client.get_paginator.return_value.paginate.return_value = iter(pages)
+
+        with patch("core.shared.aws.pricing.fetcher.get_client", return_value=client):
+            prices = lookup(MagicMock())
+
+        assert prices[expected[0]] == expected[1]
+        kwargs = client.get_paginator.return_value.paginate.call_args.kwargs
+        assert kwargs["ServiceCode"] == PRICE_QUERIES[name][0]
+        assert {"Type": "TERM_MATCH", "Field": "regionCode", "Value": REGION} in kwargs["Filters"]
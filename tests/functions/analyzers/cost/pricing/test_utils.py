@@ -143,3 +143,78 @@ class TestGetPricesFunction:
         from core.shared.aws.pricing.utils import pricing_service
 
         assert pricing_service is not None
+
+
+class TestPrefetch:
+    """PricingService.prefetch 테스트"""
+
+    def _service(self, get_prices):
+        from core.shared.aws.pricing.utils import PricingService
+
+        # 싱글톤(pricing_service)을 건드리지 않도록 별도 인스턴스 사용
+        service = object.__new__(PricingService)
+        service._initialized = True
+        service.get_prices = get_prices
+        return service
+
+    def test_prefetch_fetches_each_pair_once_in_background(self):
+        import threading
+
+        calls: list[tuple[str, str]] = []
+        threads: set[int] = set()
+        barrier = threading.Barrier(5, timeout=5)
+
+        def get_prices(service, region):
+            calls.append((service, region))
+            threads.add(threading.get_ident())
+            barrier.wait()
+            return {}
+
+        service = self._service(get_prices)
+
+        with service.prefetch(["ec2", "ebs", "ec2"], ["us-east-1", "eu-west-1", "us-east-1"]):
+            # 블록 본문과 4건의 조회가 동시에 진행됨 (barrier: 워커 4 + 본문 1)
+            barrier.wait()
+
+        assert sorted(calls) == [
+            ("ebs", "eu-west-1"),
+            ("ebs", "us-east-1"),
+            ("ec2", "eu-west-1"),
+            ("ec2", "us-east-1"),
+        ]
+        assert len(threads) == 4
+        assert threading.get_ident() not in threads
+
+    def test_prefetch_cancels_pending_on_exit(self):
+        import threading
+
+        release = threading.Event()
+        calls: list[str] = []
+
+        def get_prices(service, region):
+            calls.append(region)
+            release.wait(5)
+            return {}
+
+        service = self._service(get_prices)
+
+        with service.prefetch(["ec2"], ["r1", "r2", "r3"], max_workers=1):
+            pass
+        release.set()
+
+        assert calls in ([], ["r1"])
+
+    def test_prefetch_failure_is_ignored(self):
+        service = self._service(MagicMock(side_effect=RuntimeError("boom")))
+
+        with service.prefetch(["ec2"], ["us-east-1"]):
+            pass
+
+    def test_prefetch_without_regions_is_noop(self):
+        get_prices = MagicMock()
+        service = self._service(get_prices)
+
+        with service.prefetch(["ec2"], []):
+            pass
+
+        get_prices.assert_not_called()
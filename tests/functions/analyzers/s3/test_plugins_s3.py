@@ -2,13 +2,18 @@
 tests/test_plugins_s3.py - S3 플러그인 테스트
 """
 
+import logging
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
 
 from functions.analyzers.s3.empty_bucket import (
     BucketInfo,
     BucketStatus,
     S3AnalysisResult,
     analyze_buckets,
+    get_bucket_sizes_from_cloudwatch,
 )
 
 
@@ -241,3 +246,48 @@ class TestS3AnalysisResult:
         assert result.small_buckets == 0
         assert result.total_size_gb == 0.0
         assert result.findings == []
+
+
+class TestGetBucketSizesFromCloudWatch:
+    """get_bucket_sizes_from_cloudwatch 테스트"""
+
+    @staticmethod
+    def _client(values_by_bucket: dict[str, tuple[float, float]]) -> MagicMock:
+        def get_metric_data(MetricDataQueries, **kwargs):
+            results = []
+            for q in MetricDataQueries:
+                stat = q["MetricStat"]["Metric"]
+                dims = {d["Name"]: d["Value"] for d in stat["Dimensions"]}
+                size, count = values_by_bucket[dims["BucketName"]]
+                value = size if stat["MetricName"] == "BucketSizeBytes" else count
+                results.append(
+                    {
+                        "Id": q["Id"],
+                        "Timestamps": [datetime.now(timezone.utc)],
+                        "Values": [value],
+                        "StatusCode": "Complete",
+                    }
+                )
+            return {"MetricDataResults": results}
+
+        client = MagicMock()
+        client.get_metric_data.side_effect = get_metric_data
+        return client
+
+    def test_colliding_names_keep_their_own_values(self):
+        client = self._client({"logs.v2": (100.0, 1.0), "logs-v2": (200.0, 2.0)})
+
+        sizes = get_bucket_sizes_from_cloudwatch(client, ["logs.v2", "logs-v2"])
+
+        assert sizes == {"logs.v2": (100, 1), "logs-v2": (200, 2)}
+
+    def test_api_error_is_logged(self, caplog):
+        client = MagicMock()
+        client.get_metric_data.side_effect = ClientError(
+            {"Error": {"Code": "ValidationError", "Message": "bad id"}}, "GetMetricData"
+        )
+
+        with caplog.at_level(logging.WARNING):
+            assert get_bucket_sizes_from_cloudwatch(client, ["logs"]) == {}
+
+        assert "ValidationError" in caplog.text
@@ -0,0 +1,272 @@
+"""
+tests/functions/reports/ip_search/test_private_ip_cache.py - ENI 캐시 테스트
+
+ENI ID 기준 정규화 저장, 증분 인덱스 갱신, 스냅샷 + 델타 저장/로드를 테스트합니다.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import msgpack
+import pytest
+
+from functions.reports.ip_search.private_ip import cache as cache_module
+from functions.reports.ip_search.private_ip.cache import ENICache, MultiCacheSearch, list_available_caches
+from functions.reports.ip_search.private_ip.snapshot import ENISnapshot, read_snapshot_meta
+
+
+def _eni(
+    eni_id: str,
+    private_ips: list[str],
+    public_ip: str = "",
+    ipv6: list[str] | None = None,
+    vpc_id: str = "vpc-1",
+    region: str = "ap-northeast-2",
+    description: str = "",
+    name: str = "",
+) -> dict:
+    addresses = []
+    for i, ip in enumerate(private_ips):
+        entry: dict = {"PrivateIpAddress": ip, "Primary": i == 0}
+        if i == 0 and public_ip:
+            entry["Association"] = {"PublicIp": public_ip}
+        addresses.append(entry)
+    return {
+        "NetworkInterfaceId": eni_id,
+        "Region": region,
+        "VpcId": vpc_id,
+        "Description": description,
+        "TagSet": [{"Key": "Name", "Value": name}] if name else [],
+        "PrivateIpAddresses": addresses,
+        "Ipv6Addresses": [{"Ipv6Address": ip} for ip in ipv6 or []],
+    }
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "_get_cache_dir", lambda: str(tmp_path))
+    return tmp_path
+
+
+def _deltas(path: str) -> list[dict]:
+    """스냅샷 뒤의 델타 레코드"""
+    meta = read_snapshot_meta(path)
+    assert meta is not None
+    with open(path, "rb") as f:
+        f.seek(meta["snapshot_end"])
+        return list(msgpack.Unpacker(f, raw=False))
+
+
+class TestNormalizedStorage:
+    """ENI는 한 번만 저장되고 IP는 ENI ID로 참조"""
+
+    def test_eni_stored_once_for_all_ips(self, cache_dir):
+        cache = ENICache("dev", "111")
+        eni = _eni("eni-a", ["10.0.0.1", "10.0.0.2"], public_ip="3.3.3.3", ipv6=["2600::1"])
+
+        cache.update([eni])
+
+        assert cache.count() == 4
+        assert cache.get_by_ip("10.0.0.2") == [eni]
+        assert cache.get_by_ip("3.3.3.3")[0] is cache.get_by_ip("2600::1")[0]
+        assert len(cache._enis) == 1
+
+    def test_shared_ip_posts_both_enis(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1"], vpc_id="vpc-1"), _eni("eni-b", ["10.0.0.1"], vpc_id="vpc-2")])
+
+        assert [e["NetworkInterfaceId"] for e in cache.get_by_ip("10.0.0.1")] == ["eni-a", "eni-b"]
+        assert cache.count() == 1
+
+    def test_cidr_with_mixed_ip_versions(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update(
+            [
+                _eni("eni-a", ["10.0.1.5"], ipv6=["2600:1f18::5"]),
+                _eni("eni-b", ["10.0.2.5"]),
+                _eni("eni-c", ["10.1.0.1"]),
+            ]
+        )
+
+        assert sorted(ip for ip, _ in cache.get_by_cidr("10.0.0.0/16")) == ["10.0.1.5", "10.0.2.5"]
+        assert [ip for ip, _ in cache.get_by_cidr("2600:1f18::/32")] == ["2600:1f18::5"]
+        assert cache.get_by_cidr("invalid") == []
+
+
+class TestIncrementalUpdate:
+    """update()는 변경된 ENI만 인덱스에 반영"""
+
+    def test_changed_eni_replaces_previous_record(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1", "10.0.0.2"], vpc_id="vpc-1")])
+
+        cache.update([_eni("eni-a", ["10.0.0.3"], vpc_id="vpc-2")])
+
+        assert cache.get_by_ip("10.0.0.1") == []
+        assert [ip for ip, _ in cache.get_by_cidr("10.0.0.0/24")] == ["10.0.0.3"]
+        assert cache.search_by_vpc("vpc-1") == []
+        assert [ip for ip, _ in cache.search_by_vpc("vpc-2")] == ["10.0.0.3"]
+        assert cache.count() == 1
+
+    def test_sorted_ips_match_postings_after_bulk_and_small_updates(self, cache_dir):
+        cache = ENICache("dev", "111")
+        bulk = [_eni(f"eni-{i}", [f"10.0.{i // 256}.{i % 256}"]) for i in range(600)]
+        cache.update(bulk)
+        cache.update([_eni("eni-5", ["10.9.9.9"]), _eni("eni-new", ["10.0.0.5"])])
+
+        assert [key[1] for key in cache.sorted_ips] == sorted(
+            cache._ip_postings, key=lambda ip: tuple(int(p) for p in ip.split("."))
+        )
+        assert len(cache.get_by_cidr("10.0.0.5/32")) == 1
+
+    def test_unchanged_eni_is_not_marked_dirty(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1"])])
+        cache.save()
+
+        cache.update([_eni("eni-a", ["10.0.0.1"])])
+
+        assert cache._dirty == set()
+        assert cache._touched == {"eni-a"}
+
+
+class TestDeltaPersistence:
+    """save()는 변경분만 델타 레코드로 추가"""
+
+    def test_save_appends_delta_and_reload_applies_it(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1"]), _eni("eni-b", ["10.0.0.2"])])
+        cache.save()
+
+        cache.update([_eni("eni-b", ["10.0.0.3"], description="changed")])
+        cache.save()
+
+        deltas = _deltas(cache.cache_file)
+        assert len(deltas) == 1
+        assert list(deltas[0]["enis"]) == ["eni-b"]
+
+        reloaded = ENICache("dev", "111")
+        assert reloaded._snapshot is not None
+        assert reloaded.get_by_ip("10.0.0.2") == []
+        assert reloaded.get_by_ip("10.0.0.3")[0]["Description"] == "changed"
+        assert reloaded.count() == 2
+
+    def test_full_refresh_delta_records_single_timestamp(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1"]), _eni("eni-b", ["10.0.0.2"])])
+        cache.save()
+
+        cache.update([_eni("eni-a", ["10.0.0.1"]), _eni("eni-b", ["10.0.0.2"])])
+        cache.save()
+
+        delta = _deltas(cache.cache_file)[0]
+        assert delta["enis"] == {}
+        assert "updated_all" in delta
+
+    def test_compaction_after_max_delta_records(self, cache_dir, monkeypatch):
+        monkeypatch.setattr(cache_module, "_MAX_DELTA_RECORDS", 2)
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1"])])
+        cache.save()
+        for i in range(3):
+            cache.update([_eni("eni-a", ["10.0.0.1"], description=str(i))])
+            cache.save()
+
+        assert _deltas(cache.cache_file) == []
+        snapshot = ENISnapshot.open(cache.cache_file)
+        assert snapshot is not None
+        assert snapshot.decode(0)["Description"] == "2"
+        snapshot.close()
+
+    def test_truncated_delta_is_ignored_and_rewritten(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1"])])
+        cache.save()
+        with open(cache.cache_file, "ab") as f:
+            f.write(msgpack.packb({"v": 2, "enis": {"eni-b": _eni("eni-b", ["10.0.0.2"])}})[:-5])
+
+        reloaded = ENICache("dev", "111")
+        assert reloaded.count() == 1
+        reloaded.save()
+
+        assert _deltas(reloaded.cache_file) == []
+
+    def test_expired_enis_dropped_on_load(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1"]), _eni("eni-b", ["10.0.0.2"])])
+        cache._eni_updated["eni-a"] = time.time() - 2 * 86400
+        cache.save()
+
+        reloaded = ENICache("dev", "111")
+
+        assert reloaded.get_by_ip("10.0.0.1") == []
+        assert reloaded.count() == 1
+        assert reloaded._needs_rewrite
+
+    def test_legacy_per_ip_format_is_converted(self, cache_dir):
+        eni = _eni("eni-a", ["10.0.0.1"], public_ip="3.3.3.3")
+        legacy = {
+            "10.0.0.1": {"interfaces": [eni], "last_accessed": time.time()},
+            "3.3.3.3": {"interfaces": [eni], "last_accessed": time.time()},
+        }
+        path = os.path.join(str(cache_dir), "dev_111_eni.msgpack")
+        with open(path, "wb") as f:
+            msgpack.dump(legacy, f)
+
+        cache = ENICache("dev", "111")
+        assert cache.count() == 2
+        assert len(cache._enis) == 1
+        cache.save()
+
+        assert read_snapshot_meta(path) is not None
+        assert ENICache("dev", "111").get_by_ip("3.3.3.3")[0]["NetworkInterfaceId"] == "eni-a"
+
+    def test_msgpack_stream_format_is_converted(self, cache_dir):
+        path = os.path.join(str(cache_dir), "dev_111_eni.msgpack")
+        base = {"v": 2, "enis": {"eni-a": _eni("eni-a", ["10.0.0.1"])}, "updated": {"eni-a": time.time()}}
+        delta = {"v": 2, "enis": {"eni-b": _eni("eni-b", ["10.0.0.2"])}, "updated_all": time.time()}
+        with open(path, "wb") as f:
+            f.write(msgpack.packb(base) + msgpack.packb(delta))
+
+        cache = ENICache("dev", "111")
+
+        assert cache.count() == 2
+        assert cache._needs_rewrite
+
+
+class TestSearchAndDiscovery:
+    """텍스트 검색 및 캐시 목록"""
+
+    def test_search_text_across_caches(self, cache_dir):
+        dev = ENICache("dev", "111")
+        dev.update([_eni("eni-a", ["10.0.0.1", "10.0.0.2"], description="ELB app/my-lb/abc")])
+        prod = ENICache("prod", "222")
+        prod.update([_eni("eni-b", ["10.1.0.1"], name="My-LB-node"), _eni("eni-c", ["10.1.0.2"])])
+
+        results = MultiCacheSearch([dev, prod]).search_text("my-lb")
+
+        assert sorted((r.profile_name, r.ip_address) for r in results) == [
+            ("dev", "10.0.0.1"),
+            ("dev", "10.0.0.2"),
+            ("prod", "10.1.0.1"),
+        ]
+
+    def test_list_available_caches_counts_ips_and_regions(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update(
+            [
+                _eni("eni-a", ["10.0.0.1"], public_ip="3.3.3.3", region="us-east-1"),
+                _eni("eni-b", ["10.0.0.2"], region="ap-northeast-2"),
+            ]
+        )
+        cache.save()
+        cache.update([_eni("eni-c", ["10.0.0.3"], region="ap-northeast-2")])
+        cache.save()
+
+        infos = list_available_caches()
+
+        assert len(infos) == 1
+        assert infos[0].eni_count == 4
+        assert infos[0].regions == ["ap-northeast-2", "us-east-1"]
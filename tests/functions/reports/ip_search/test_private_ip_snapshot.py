@@ -0,0 +1,162 @@
+"""
+tests/functions/reports/ip_search/test_private_ip_snapshot.py - mmap ENI 스냅샷 테스트
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import os
+
+import pytest
+
+from functions.reports.ip_search.private_ip import cache as cache_module
+from functions.reports.ip_search.private_ip.cache import ENICache
+from functions.reports.ip_search.private_ip.snapshot import (
+    ENISnapshot,
+    ip_key,
+    key_to_ip,
+    network_key_range,
+    read_snapshot_meta,
+    write_snapshot,
+)
+
+
+def _eni(eni_id: str, ips: list[str], ipv6: list[str] | None = None, vpc_id: str = "vpc-1") -> dict:
+    return {
+        "NetworkInterfaceId": eni_id,
+        "Region": "ap-northeast-2",
+        "VpcId": vpc_id,
+        "Description": f"desc {eni_id}",
+        "PrivateIpAddresses": [{"PrivateIpAddress": ip, "Primary": i == 0} for i, ip in enumerate(ips)],
+        "Ipv6Addresses": [{"Ipv6Address": ip} for ip in ipv6 or []],
+    }
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    enis = {
+        "eni-a": _eni("eni-a", ["10.0.0.1", "10.0.0.2"], ipv6=["2600:1f18::1"]),
+        "eni-b": _eni("eni-b", ["10.0.0.2"], vpc_id="vpc-2"),
+        "eni-c": _eni("eni-c", ["10.1.0.1"]),
+    }
+    path = str(tmp_path / "snap.msgpack")
+    write_snapshot(path, enis, {"eni-a": 1.0, "eni-b": 2.0, "eni-c": 3.0})
+    snap = ENISnapshot.open(path)
+    assert snap is not None
+    yield snap
+    snap.close()
+
+
+class TestIPKey:
+    """고정폭 IP 키"""
+
+    @pytest.mark.parametrize("ip", ["10.0.0.1", "255.255.255.255", "2600:1f18::1", "::1"])
+    def test_round_trip(self, ip):
+        key = ip_key(ip)
+        assert key is not None and len(key) == 17
+        assert key_to_ip(key) == ip
+
+    def test_ipv4_sorts_before_ipv6_and_numerically(self):
+        ips = ["2600::1", "10.0.0.10", "10.0.0.9", "9.255.255.255"]
+
+        assert [ip for ip in sorted(ips, key=ip_key)] == ["9.255.255.255", "10.0.0.9", "10.0.0.10", "2600::1"]
+
+    def test_invalid_ip(self):
+        assert ip_key("not-an-ip") is None
+
+    def test_network_range_bounds(self):
+        low, high = network_key_range(ipaddress.ip_network("10.0.0.0/24"))
+
+        assert key_to_ip(low) == "10.0.0.0"
+        assert key_to_ip(high) == "10.0.0.255"
+
+
+class TestENISnapshot:
+    """스냅샷 조회는 필요한 ENI만 디코딩"""
+
+    def test_meta(self, snapshot):
+        assert snapshot.eni_count == 3
+        assert snapshot.ip_count == 4
+        assert snapshot.regions == ["ap-northeast-2"]
+        assert snapshot.ids == ["eni-a", "eni-b", "eni-c"]
+        assert snapshot.updated_at(2) == 3.0
+
+    def test_lookup_does_not_decode_records(self, snapshot):
+        assert sorted(snapshot.lookup(ip_key("10.0.0.2"))) == [0, 1]
+        assert snapshot.lookup(ip_key("10.9.9.9")) == []
+        assert snapshot._decoded == {}
+
+    def test_scan_returns_keys_in_order(self, snapshot):
+        low, high = network_key_range(ipaddress.ip_network("10.0.0.0/16"))
+
+        hits = snapshot.scan(low, high)
+
+        assert [(key_to_ip(key), ordinal) for key, ordinal in hits] == [
+            ("10.0.0.1", 0),
+            ("10.0.0.2", 0),
+            ("10.0.0.2", 1),
+        ]
+
+    def test_records_and_vpc_and_text(self, snapshot):
+        assert snapshot.eni(1)["NetworkInterfaceId"] == "eni-b"
+        assert snapshot.eni(1) is snapshot.eni(1)
+        assert snapshot.vpc_ordinals("vpc-2") == [1]
+        assert snapshot.ordinal_of("eni-c") == 2
+        assert snapshot.text_index.search("desc eni-c") == {2}
+
+    def test_empty_snapshot(self, tmp_path):
+        path = str(tmp_path / "empty.msgpack")
+        write_snapshot(path, {}, {})
+        snap = ENISnapshot.open(path)
+        assert snap is not None
+
+        assert snap.eni_count == 0
+        assert snap.lookup(ip_key("10.0.0.1")) == []
+        snap.close()
+
+    def test_non_snapshot_file(self, tmp_path):
+        path = tmp_path / "other.msgpack"
+        path.write_bytes(b"\x81\xa1v\x02")
+
+        assert read_snapshot_meta(str(path)) is None
+        assert ENISnapshot.open(str(path)) is None
+
+
+class TestENICacheOverlay:
+    """스냅샷 + 메모리 오버레이 병합"""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cache_module, "_get_cache_dir", lambda: str(tmp_path))
+        return tmp_path
+
+    def test_cidr_merges_snapshot_and_overlay_in_ip_order(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1"]), _eni("eni-b", ["10.0.0.5"]), _eni("eni-c", ["10.0.0.9"])])
+        cache.save()
+
+        reloaded = ENICache("dev", "111")
+        reloaded.update([_eni("eni-b", ["10.0.0.7"]), _eni("eni-d", ["10.0.0.3"], ipv6=["2600::3"])])
+
+        results = reloaded.get_by_cidr("10.0.0.0/24")
+
+        assert [(ip, eni["NetworkInterfaceId"]) for ip, eni in results] == [
+            ("10.0.0.1", "eni-a"),
+            ("10.0.0.3", "eni-d"),
+            ("10.0.0.7", "eni-b"),
+            ("10.0.0.9", "eni-c"),
+        ]
+        assert reloaded.count() == 5
+
+    def test_rewrite_replaces_open_snapshot(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", ["10.0.0.1"])])
+        cache.save()
+        cache._needs_rewrite = True
+        cache.update([_eni("eni-b", ["10.0.0.2"])])
+        cache.save()
+
+        assert cache._snapshot is not None and cache._snapshot.eni_count == 2
+        assert os.path.getsize(cache.cache_file) == read_snapshot_meta(cache.cache_file)["snapshot_end"]
+        assert [e["NetworkInterfaceId"] for e in cache.get_by_ip("10.0.0.2")] == ["eni-b"]
+        cache.close()
@@ -0,0 +1,164 @@
+"""
+tests/functions/reports/ip_search/test_private_ip_text_index.py - ENI 텍스트 역색인 테스트
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from functions.reports.ip_search.private_ip import cache as cache_module
+from functions.reports.ip_search.private_ip.cache import ENICache
+from functions.reports.ip_search.private_ip.text_index import ENITextIndex, eni_text_values
+
+
+def _eni(eni_id: str, ip: str, **fields) -> dict:
+    eni = {
+        "NetworkInterfaceId": eni_id,
+        "SubnetId": fields.get("subnet", "subnet-0aa"),
+        "Region": "ap-northeast-2",
+        "VpcId": "vpc-1",
+        "Description": fields.get("description", ""),
+        "RequesterId": fields.get("requester", ""),
+        "TagSet": [{"Key": "Name", "Value": fields["name"]}] if "name" in fields else [],
+        "Groups": [{"GroupName": g} for g in fields.get("groups", [])],
+        "PrivateIpAddresses": [{"PrivateIpAddress": ip, "Primary": True}],
+    }
+    if "instance" in fields:
+        eni["Attachment"] = {"InstanceId": fields["instance"]}
+    return eni
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "_get_cache_dir", lambda: str(tmp_path))
+    return tmp_path
+
+
+class TestENITextIndex:
+    """ENITextIndex 검색 테스트"""
+
+    ENIS = [
+        _eni("eni-a", "10.0.0.1", description="ELB app/Orders-ALB/abc", groups=["web-sg"], instance="i-0123"),
+        _eni("eni-b", "10.0.0.2", name="Batch-Worker", requester="amazon-elb", groups=["web-sg", "batch-sg"]),
+        _eni("eni-c", "10.0.0.3", description="AWS Lambda VPC ENI-orders-fn", subnet="subnet-0bb"),
+    ]
+
+    def _index(self) -> ENITextIndex:
+        index = ENITextIndex()
+        for eni in self.ENIS:
+            index.add(eni["NetworkInterfaceId"], eni)
+        return index
+
+    def test_indexed_fields(self):
+        values = eni_text_values(self.ENIS[0])
+
+        assert sorted(values) == ["elb app/orders-alb/abc", "eni-a", "i-0123", "subnet-0aa", "web-sg"]
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("orders", {"eni-a", "eni-c"}),
+            ("ORDERS-alb", {"eni-a"}),
+            ("worker", {"eni-b"}),
+            ("amazon-elb", {"eni-b"}),
+            ("i-0123", {"eni-a"}),
+            ("web-sg", {"eni-a", "eni-b"}),
+            ("subnet-0bb", {"eni-c"}),
+            ("eni-b", {"eni-b"}),
+            ("nothing", set()),
+        ],
+    )
+    def test_substring_search(self, query, expected):
+        assert self._index().search(query) == expected
+
+    def test_short_query_matches_term_prefix(self):
+        index = self._index()
+
+        assert index.search("ba") == {"eni-b"}
+        assert index.search("i") == {"eni-a"}
+        assert index.search("zz") == set()
+
+    def test_remove(self):
+        index = self._index()
+        index.remove("eni-a", self.ENIS[0])
+
+        assert index.search("orders") == {"eni-c"}
+        assert index.search("web-sg") == {"eni-b"}
+        assert index.search("i-") == set()
+
+    def test_record_round_trip_with_ordinal_owners(self):
+        index = ENITextIndex()
+        for ordinal, eni in enumerate(self.ENIS):
+            index.add(ordinal, eni)
+        record = index.to_record()
+        restored = ENITextIndex.from_record(record)
+        assert restored is not None
+
+        assert len(restored) == len(record["values"])
+        assert restored.search("orders") == {0, 2}
+        assert restored.search("web-sg") == {0, 1}
+        assert restored.search("ba") == {1}
+        assert ENITextIndex.from_record({**record, "version": 0}) is None
+        assert ENITextIndex.from_record(None) is None
+
+    def test_agrees_with_linear_scan(self):
+        rng = random.Random(3)
+        words = ["api", "orders", "batch", "elb", "lambda", "worker", "prod", "dev", "node"]
+        enis = [
+            _eni(
+                f"eni-{i:04d}",
+                f"10.0.{i // 256}.{i % 256}",
+                description=" ".join(rng.sample(words, 2)),
+                name=f"{rng.choice(words)}-{i}",
+                groups=[f"{rng.choice(words)}-sg"],
+            )
+            for i in range(300)
+        ]
+        index = ENITextIndex()
+        for eni in enis:
+            index.add(eni["NetworkInterfaceId"], eni)
+
+        for query in ["orders", "er-1", "i bat", "prod-sg", "ker-29", "lambda node"]:
+            expected = {
+                eni["NetworkInterfaceId"] for eni in enis if any(query in value for value in eni_text_values(eni))
+            }
+            assert index.search(query) == expected, query
+
+
+class TestENICacheTextIndex:
+    """ENICache 텍스트 색인 연동 테스트"""
+
+    def test_persisted_index_decoded_on_first_search(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", "10.0.0.1", description="orders api")])
+        cache.save()
+
+        reloaded = ENICache("dev", "111")
+        assert reloaded._snapshot is not None
+        assert reloaded._snapshot._text_index is None
+
+        assert [ip for ip, _ in reloaded.search_text("orders")] == ["10.0.0.1"]
+        grams = reloaded._snapshot.text_index._grams
+        assert grams and any(isinstance(postings, bytes) for postings in grams.values())
+        assert len(reloaded._text_index) == 0
+
+    def test_delta_enis_indexed_after_reload(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-a", "10.0.0.1", description="orders api")])
+        cache.save()
+        cache.update([_eni("eni-a", "10.0.0.1", description="payments api"), _eni("eni-b", "10.0.0.2", name="Orders")])
+        cache.save()
+
+        reloaded = ENICache("dev", "111")
+
+        assert [ip for ip, _ in reloaded.search_text("orders")] == ["10.0.0.2"]
+        assert [ip for ip, _ in reloaded.search_text("payments")] == ["10.0.0.1"]
+
+    def test_eni_and_subnet_id_queries(self, cache_dir):
+        cache = ENICache("dev", "111")
+        cache.update([_eni("eni-0abc", "10.0.0.1", subnet="subnet-0123")])
+
+        assert len(cache.search_text("eni-0abc")) == 1
+        assert len(cache.search_text("subnet-0123")) == 1
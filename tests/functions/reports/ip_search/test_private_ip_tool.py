@@ -0,0 +1,82 @@
+"""
+tests/functions/reports/ip_search/test_private_ip_tool.py - Private IP 검색 도구 테스트
+
+선택한 ENI 캐시의 로드/종료(스냅샷 파일 핸들, mmap 해제)를 테스트합니다.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from functions.reports.ip_search.private_ip import tool
+from functions.reports.ip_search.private_ip.cache import CacheInfo
+
+
+class _FakeCache:
+    """count()와 close()만 흉내 내는 ENICache 대역"""
+
+    instances: list[_FakeCache] = []
+
+    def __init__(self, profile_name: str, account_id: str):
+        self.profile_name = profile_name
+        self.eni_count = int(account_id)
+        self.closed = False
+        _FakeCache.instances.append(self)
+
+    def count(self) -> int:
+        return self.eni_count
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _info(profile_name: str, eni_count: int) -> CacheInfo:
+    return CacheInfo(
+        filepath=f"/tmp/{profile_name}.cache",
+        profile_name=profile_name,
+        account_id=str(eni_count),
+        eni_count=eni_count,
+        created_at=datetime.now(),
+        is_valid=True,
+    )
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    _FakeCache.instances = []
+    monkeypatch.setattr(tool, "ENICache", _FakeCache)
+    return _FakeCache
+
+
+class TestCacheLifecycle:
+    """캐시 로드/종료 테스트"""
+
+    def test_empty_cache_closed_immediately(self, fake_cache):
+        loaded = tool._load_selected_caches([_info("dev", 3), _info("empty", 0)])
+
+        dev, empty = fake_cache.instances
+        assert loaded == [dev]
+        assert empty.closed
+        assert not dev.closed
+
+    def test_caches_closed_after_search_loop(self, fake_cache, monkeypatch):
+        searched: list[list[_FakeCache]] = []
+        monkeypatch.setattr(tool, "_run_search_loop", lambda ctx, caches, session_name: searched.append(caches))
+
+        tool._search_selected_caches(None, [_info("dev", 3), _info("prod", 5)], "session")
+
+        assert len(searched[0]) == 2
+        assert all(c.closed for c in fake_cache.instances)
+
+    def test_caches_closed_when_search_loop_interrupted(self, fake_cache, monkeypatch):
+        def interrupted(ctx, caches, session_name):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(tool, "_run_search_loop", interrupted)
+
+        with pytest.raises(KeyboardInterrupt):
+            tool._search_selected_caches(None, [_info("dev", 3)], "session")
+
+        assert all(c.closed for c in fake_cache.instances)
@@ -5,6 +5,7 @@ Tests for the DuckDB-based ALB log analyzer.
 Note: These tests focus on structure and logic; actual DuckDB operations are mocked.
 """
 
+import gzip
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -264,3 +265,200 @@ class TestALBLogAnalyzerCleanup:
 
         # Should not raise exception
         analyzer.clean_up([])
+
+
+# ALB access log line (all 30 fields, including conn_trace_id)
+ALB_LINE = (
+    "h2 2024-01-01T00:00:01.500000Z app/my-alb/50dc6c495c0c9188 10.0.0.1:40000 172.31.0.5:80 "
+    '0.001 0.020 -1 200 502 120 3400 "GET https://example.com:443/path?q=1 HTTP/2.0" '
+    '"Mozilla/5.0 (X11; Linux)" ECDHE-RSA-AES128-GCM-SHA256 TLSv1.2 '
+    "arn:aws:elasticloadbalancing:us-east-1:123456789012:targetgroup/my-tg/73e2d6bc24d8a067 "
+    '"Root=1-58337262-36d228ad5d99923122bbe354" "example.com" "arn:aws:acm:us-east-1:123456789012:certificate/abc" '
+    '1 2024-01-01T00:00:01.400000Z "waf,forward" "-" "-" "172.31.0.5:80" "502" "Ambiguous" "UndefinedContentLengthSemantics" '
+    "TID_1234"
+)
+
+
+class TestALBLogParsing:
+    """Test single-pass ALB log tokenization against a real DuckDB connection"""
+
+    @pytest.fixture
+    def analyzer(self):
+        duckdb = pytest.importorskip("duckdb")
+
+        with patch("functions.reports.log_analyzer.alb_log_analyzer.duckdb"):
+            from functions.reports.log_analyzer.alb_log_analyzer import ALBLogAnalyzer
+
+            analyzer = ALBLogAnalyzer(
+                s3_client=MagicMock(),
+                bucket_name="test-bucket",
+                prefix="logs/alb",
+                start_datetime=datetime(2024, 1, 1, 0, 0, 0),
+                timezone="UTC",
+            )
+        analyzer.conn = duckdb.connect()
+        yield analyzer
+        analyzer.conn.close()
+
+    def _load(self, analyzer, tmp_path, lines):
+        (tmp_path / "alb.log").write_text("\n".join(lines) + "\n")
+        assert analyzer._load_logs_to_duckdb(str(tmp_path)) == "alb_logs"
+        result = analyzer.conn.execute("SELECT * FROM alb_logs")
+        columns = [d[0] for d in result.description]
+        return [dict(zip(columns, row, strict=True)) for row in result.fetchall()]
+
+    def test_parses_all_fields(self, analyzer, tmp_path):
+        (row,) = self._load(analyzer, tmp_path, [ALB_LINE])
+
+        assert row["timestamp"] == datetime(2024, 1, 1, 0, 0, 1, 500000)
+        assert row["client_ip"] == "10.0.0.1"
+        assert (row["target_ip"], row["target_port"], row["target"]) == ("172.31.0.5", "80", "172.31.0.5:80")
+        assert row["elb_name"] == "my-alb"
+        assert (row["elb_status_code"], row["target_status_code"]) == ("200", "502")
+        assert row["request_processing_time"] == 0.001
+        assert row["response_processing_time"] is None
+        assert row["response_time"] == pytest.approx(0.021)
+        assert (row["http_method"], row["url"]) == ("GET", "https://example.com:443/path?q=1")
+        assert row["user_agent"] == "Mozilla/5.0 (X11; Linux)"
+        assert row["target_group_name"] == "my-tg"
+        assert (row["received_bytes"], row["sent_bytes"]) == (120, 3400)
+        assert row["http_version"] == "HTTP/2"
+        assert (row["ssl_protocol"], row["ssl_cipher"]) == ("TLSv1.2", "ECDHE-RSA-AES128-GCM-SHA256")
+        assert row["actions_executed"] == "waf,forward"
+        assert row["classification"] == "Ambiguous"
+        assert row["classification_reason"] == "UndefinedContentLengthSemantics"
+
+    def test_raw_line_dropped_by_default(self, analyzer, tmp_path):
+        (row,) = self._load(analyzer, tmp_path, [ALB_LINE])
+        assert "raw_line" not in row
+
+    def test_raw_line_kept_when_requested(self, analyzer, tmp_path):
+        analyzer.keep_raw_line = True
+        (row,) = self._load(analyzer, tmp_path, [ALB_LINE])
+        assert row["raw_line"] == ALB_LINE
+
+    def test_older_format_without_trailing_fields(self, analyzer, tmp_path):
+        """Lines without actions/classification fields use defaults"""
+        old_line = ALB_LINE.split(' "waf,forward"')[0]
+
+        (row,) = self._load(analyzer, tmp_path, [old_line])
+
+        assert row["actions_executed"] == "-"
+        assert row["classification"] == "Unknown"
+        assert row["error_reason"] == ""
+
+    def test_escaped_quote_in_user_agent(self, analyzer, tmp_path):
+        line = ALB_LINE.replace('"Mozilla/5.0 (X11; Linux)"', r'"agent \"quoted\""')
+
+        (row,) = self._load(analyzer, tmp_path, [line])
+
+        assert row["user_agent"] == 'agent "quoted"'
+        assert row["ssl_protocol"] == "TLSv1.2"
+        assert row["classification"] == "Ambiguous"
+
+    def test_plain_http_and_malformed_lines(self, analyzer, tmp_path):
+        http_line = ALB_LINE.replace("h2 ", "http ", 1).replace("ECDHE-RSA-AES128-GCM-SHA256 TLSv1.2", "- -")
+        garbage = "this line is long enough to pass the length filter but is not an ALB log"
+
+        rows = self._load(analyzer, tmp_path, [http_line, garbage])
+
+        assert len(rows) == 1
+        assert (rows[0]["ssl_protocol"], rows[0]["ssl_cipher"]) == ("None", "None")
+
+    def test_reads_gzip_directly(self, analyzer, tmp_path):
+        """.gz files are loaded without a decompress-to-disk step"""
+        with gzip.open(tmp_path / "alb.log.gz", "wt") as f:
+            f.write(ALB_LINE + "\n")
+
+        assert analyzer._load_logs_to_duckdb(str(tmp_path)) == "alb_logs"
+        assert analyzer.conn.execute("SELECT client_ip FROM alb_logs").fetchall() == [("10.0.0.1",)]
+
+
+class TestDownloadAndLoadLogs:
+    """Test pipelined download -> DuckDB ingest"""
+
+    @pytest.fixture
+    def analyzer(self, tmp_path):
+        duckdb = pytest.importorskip("duckdb")
+
+        with patch("functions.reports.log_analyzer.alb_log_analyzer.duckdb"):
+            from functions.reports.log_analyzer.alb_log_analyzer import ALBLogAnalyzer
+
+            analyzer = ALBLogAnalyzer(
+                s3_client=MagicMock(),
+                bucket_name="test-bucket",
+                prefix="logs/alb",
+                start_datetime=datetime(2024, 1, 1, 0, 0, 0),
+                timezone="UTC",
+            )
+        analyzer.conn = duckdb.connect()
+        analyzer.downloader = MagicMock()
+        yield analyzer
+        analyzer.conn.close()
+
+    def _gz(self, path, lines):
+        with gzip.open(path, "wt") as f:
+            f.write("\n".join(lines) + "\n")
+        return str(path)
+
+    def test_batches_appended_and_gz_removed(self, analyzer, tmp_path):
+        batches = [
+            [self._gz(tmp_path / "a.log.gz", [ALB_LINE, ALB_LINE])],
+            [self._gz(tmp_path / "b.log.gz", [ALB_LINE]), self._gz(tmp_path / "c.log.gz", [ALB_LINE])],
+        ]
+        analyzer.downloader.iter_download_batches.return_value = iter(batches)
+
+        assert analyzer.download_and_load_logs() == 3
+        assert analyzer.conn.execute("SELECT COUNT(*) FROM alb_logs").fetchone() == (4,)
+        assert analyzer.loaded_log_files_count == 3
+        assert not list(tmp_path.glob("*.gz"))
+
+    def test_no_files(self, analyzer):
+        analyzer.downloader.iter_download_batches.return_value = iter([])
+
+        assert analyzer.download_and_load_logs() == 0
+        assert analyzer.analyze_logs()["log_lines_count"] == 0
+
+    def test_log_store_skips_ingested_files(self, analyzer, tmp_path):
+        from functions.reports.log_analyzer.alb_log_store import ALBLogStore
+
+        analyzer.log_store = ALBLogStore(tmp_path / "store")
+        analyzer.downloader.excluded_count = 0
+        analyzer.downloader.iter_download_batches.return_value = iter([[self._gz(tmp_path / "a.log.gz", [ALB_LINE])]])
+
+        assert analyzer.download_and_load_logs() == 1
+        assert analyzer.conn.execute("SELECT COUNT(*) FROM alb_logs").fetchone() == (1,)
+
+        # 두 번째 실행: 저장소에 있는 파일은 제외하고 Parquet에서 분석
+        analyzer.downloader.iter_download_batches.return_value = iter([])
+        analyzer.downloader.excluded_count = 1
+
+        assert analyzer.download_and_load_logs() == 1
+        analyzer.downloader.iter_download_batches.assert_called_with(exclude={"a.log.gz"})
+        assert analyzer.conn.execute("SELECT COUNT(*), MIN(client_ip) FROM alb_logs").fetchone() == (1, "10.0.0.1")
+
+    def test_log_store_without_data_skips_count(self, analyzer, tmp_path):
+        """Files counted from the store but no Parquet data: no alb_logs view, no COUNT query"""
+        from functions.reports.log_analyzer.alb_log_store import ALBLogStore
+
+        analyzer.log_store = ALBLogStore(tmp_path / "store")
+        analyzer.downloader.excluded_count = 1
+        analyzer.downloader.iter_download_batches.return_value = iter([])
+
+        assert analyzer.download_and_load_logs() == 1
+        assert analyzer.analyze_logs()["log_lines_count"] == 0
+
+    def test_log_store_keeps_rows_without_timestamp(self, analyzer, tmp_path):
+        from functions.reports.log_analyzer.alb_log_store import ALBLogStore
+
+        analyzer.end_datetime = datetime(2024, 1, 1, 1, 0, 0)
+        analyzer.log_store = ALBLogStore(tmp_path / "store")
+        analyzer.downloader.excluded_count = 0
+        bad_line = ALB_LINE.replace("2024-01-01T00:00:01.500000Z", "not-a-time", 1)
+        name = "123_elasticloadbalancing_us-east-1_app.my-alb.abc_20240101T0005Z_10.0.0.1_xyz.log.gz"
+        analyzer.downloader.iter_download_batches.return_value = iter(
+            [[self._gz(tmp_path / name, [ALB_LINE, bad_line])]]
+        )
+
+        assert analyzer.download_and_load_logs() == 1
+        assert analyzer.conn.execute("SELECT COUNT(*), COUNT(timestamp) FROM alb_logs").fetchone() == (2, 1)
@@ -0,0 +1,72 @@
+"""
+tests/reports/log_analyzer/test_alb_log_downloader.py - ALB log downloader tests
+
+Tests batch-wise download streaming (iter_download_batches) with S3 access mocked.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+import pytz
+from rich.console import Console
+
+from functions.reports.log_analyzer.alb_log_downloader import ALBLogDownloader, LogDownloadError, S3LogFile
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    """ALBLogDownloader with S3 listing/download replaced by stubs"""
+    d = ALBLogDownloader.__new__(ALBLogDownloader)
+    d.max_workers = 2
+    d.batch_size = 50
+    d.temp_dir = str(tmp_path / "gz")
+    d.decompressed_dir = str(tmp_path / "log")
+    d.console = Console(quiet=True)
+    d.timezone = pytz.UTC
+    d.start_datetime = datetime(2024, 1, 1, tzinfo=pytz.UTC)
+    d.end_datetime = datetime(2024, 1, 2, tzinfo=pytz.UTC)
+    d.available_range_local = None
+
+    files = [
+        S3LogFile(key=f"logs/file{i}.log.gz", last_modified=d.start_datetime, size=1024, timestamp=None)
+        for i in range(12)
+    ]
+    d._verify_s3_access = MagicMock(return_value=True)
+    d._smart_date_range_optimization = MagicMock(return_value=["logs/"])
+    d._get_log_files_from_s3 = MagicMock(return_value=files)
+    d._binary_search_time_filter = MagicMock(side_effect=lambda f: f)
+    d._download_single_file = MagicMock(side_effect=lambda key, progress, task_id: f"/tmp/{key}")
+    return d
+
+
+class TestIterDownloadBatches:
+    """Test iter_download_batches streaming"""
+
+    def test_yields_fixed_size_batches(self, downloader):
+        # 20개 미만 파일은 배치 크기 5
+        batches = list(downloader.iter_download_batches())
+
+        assert [len(b) for b in batches] == [5, 5, 2]
+        assert sorted(p for b in batches for p in b) == sorted(f"/tmp/logs/file{i}.log.gz" for i in range(12))
+
+    def test_download_logs_flattens_batches(self, downloader):
+        assert len(downloader.download_logs()) == 12
+
+    def test_no_files_in_range(self, downloader):
+        downloader._get_log_files_from_s3.return_value = []
+
+        assert list(downloader.iter_download_batches()) == []
+
+    def test_all_downloads_failed(self, downloader):
+        downloader._download_single_file.side_effect = lambda key, progress, task_id: None
+
+        with pytest.raises(LogDownloadError):
+            list(downloader.iter_download_batches())
+
+    def test_consumer_can_stop_early(self, downloader):
+        gen = downloader.iter_download_batches()
+        first = next(gen)
+        gen.close()
+
+        assert len(first) == 5
@@ -0,0 +1,133 @@
+"""
+tests/reports/log_analyzer/test_alb_log_store.py - ALB log Parquet store tests
+
+Tests partitioned Parquet ingest, the manifest of ingested files and the analysis view.
+"""
+
+import gzip
+from datetime import datetime
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from functions.reports.log_analyzer.alb_log_store import ALBLogStore  # noqa: E402
+
+ALB_LINE = (
+    "https 2024-01-01T{hour}:10:00.000000Z app/{elb}/50dc6c495c0c9188 10.0.0.1:40000 172.31.0.5:80 "
+    '0.001 0.020 0.000 200 200 120 3400 "GET https://example.com:443/ HTTP/1.1" "curl/8.0" '
+    "ECDHE-RSA-AES128-GCM-SHA256 TLSv1.2 arn:aws:elasticloadbalancing:us-east-1:123456789012:targetgroup/tg/73e2 "
+    '"Root=1-abc" "example.com" "-" 1 2024-01-01T00:00:00.000000Z "forward" "-" "-" "172.31.0.5:80" "200" "-" "-"'
+)
+
+# 분석기 파싱 쿼리 대신 사용하는 최소 쿼리 (저장소는 timestamp/elb_name 컬럼만 요구)
+PARSE_QUERY = """
+    SELECT try_strptime(split_part(line, ' ', 2), '%Y-%m-%dT%H:%M:%S.%fZ') AS timestamp,
+           split_part(split_part(line, ' ', 3), '/', 2) AS elb_name,
+           split_part(split_part(line, ' ', 4), ':', 1) AS client_ip
+    FROM read_csv([{files}], delim='\\t', quote='', escape='', header=false, columns={{'line': 'VARCHAR'}})
+"""
+
+
+@pytest.fixture
+def conn():
+    c = duckdb.connect()
+    yield c
+    c.close()
+
+
+def _log_file(path, lines):
+    with gzip.open(path, "wt") as f:
+        f.write("\n".join(lines) + "\n")
+    return str(path)
+
+
+def _ingest(store, conn, paths):
+    files = ", ".join(f"'{p}'" for p in paths)
+    store.ingest(conn, PARSE_QUERY.format(files=files), [p.rsplit("/", 1)[-1] for p in paths])
+
+
+class TestALBLogStore:
+    """ALBLogStore tests"""
+
+    def test_partitions_by_elb_and_hour(self, tmp_path, conn):
+        store = ALBLogStore(tmp_path / "store")
+        path = _log_file(
+            tmp_path / "a.log.gz",
+            [ALB_LINE.format(hour="00", elb="alb-a"), ALB_LINE.format(hour="01", elb="alb-a")]
+            + [ALB_LINE.format(hour="01", elb="alb-b")],
+        )
+
+        _ingest(store, conn, [path])
+
+        partitions = sorted(p.parent.relative_to(store.root).as_posix() for p in store.root.glob("elb=*/hour=*/*"))
+        assert partitions == [
+            "elb=alb-a/hour=2024-01-01T00",
+            "elb=alb-a/hour=2024-01-01T01",
+            "elb=alb-b/hour=2024-01-01T01",
+        ]
+        assert store.ingested_files(conn) == {"a.log.gz"}
+
+    def test_view_prunes_hours_and_converts_timezone(self, tmp_path, conn):
+        store = ALBLogStore(tmp_path / "store")
+        lines = [ALB_LINE.format(hour=h, elb="alb-a") for h in ("00", "01", "05")]
+        _ingest(store, conn, [_log_file(tmp_path / "a.log.gz", lines)])
+
+        store.create_view(conn, "alb_logs", "Asia/Seoul", datetime(2024, 1, 1, 0), datetime(2024, 1, 1, 1, 30))
+
+        rows = conn.execute("SELECT timestamp FROM alb_logs ORDER BY timestamp").fetchall()
+        assert rows == [(datetime(2024, 1, 1, 9, 10),), (datetime(2024, 1, 1, 10, 10),)]
+        columns = [d[0] for d in conn.execute("SELECT * FROM alb_logs LIMIT 0").description]
+        assert "elb" not in columns and "hour" not in columns
+
+    def test_appends_batches(self, tmp_path, conn):
+        store = ALBLogStore(tmp_path / "store")
+        _ingest(store, conn, [_log_file(tmp_path / "a.log.gz", [ALB_LINE.format(hour="00", elb="x")])])
+        _ingest(store, conn, [_log_file(tmp_path / "b.log.gz", [ALB_LINE.format(hour="00", elb="x")])])
+
+        store.create_view(conn, "alb_logs", "UTC", datetime(2024, 1, 1), datetime(2024, 1, 2))
+
+        assert conn.execute("SELECT COUNT(*) FROM alb_logs").fetchone() == (2,)
+        assert store.ingested_files(conn) == {"a.log.gz", "b.log.gz"}
+
+    def test_orphan_parts_pruned_on_open(self, tmp_path, conn):
+        """Data files of a batch whose manifest was never written are removed"""
+        store = ALBLogStore(tmp_path / "store")
+        _ingest(store, conn, [_log_file(tmp_path / "a.log.gz", [ALB_LINE.format(hour="00", elb="x")])])
+        for manifest in store.manifest_dir.glob("*.parquet"):
+            manifest.unlink()
+
+        reopened = ALBLogStore(tmp_path / "store")
+
+        assert not reopened.has_data()
+        assert reopened.ingested_files(conn) == set()
+
+    def test_unparsed_timestamp_kept_in_file_hour(self, tmp_path, conn):
+        """Rows without a timestamp are kept, partitioned by the hour in the S3 object name"""
+        store = ALBLogStore(tmp_path / "store")
+        bad_line = ALB_LINE.format(hour="00", elb="x").replace("2024-01-01T00:10:00.000000Z", "-", 1)
+        path = _log_file(
+            tmp_path / "123_elasticloadbalancing_us-east-1_app.x.abc_20240101T0105Z_10.0.0.1_xyz.log.gz",
+            [ALB_LINE.format(hour="01", elb="x"), bad_line],
+        )
+        query = PARSE_QUERY.format(files=f"'{path}'").replace("columns=", "filename=true, columns=")
+        query = query.replace("SELECT ", "SELECT filename AS source_file, ", 1)
+
+        store.ingest(conn, query, [path.rsplit("/", 1)[-1]], source_file_column="source_file")
+        store.create_view(conn, "alb_logs", "UTC", datetime(2024, 1, 1, 1), datetime(2024, 1, 1, 1, 59))
+
+        assert conn.execute("SELECT COUNT(*), COUNT(timestamp) FROM alb_logs").fetchone() == (2, 1)
+        columns = [d[0] for d in conn.execute("SELECT * FROM alb_logs LIMIT 0").description]
+        assert "source_file" not in columns
+
+    def test_unparsed_timestamp_without_file_hour_is_unknown(self, tmp_path, conn):
+        store = ALBLogStore(tmp_path / "store")
+        bad_line = ALB_LINE.format(hour="00", elb="x").replace("2024-01-01T00:10:00.000000Z", "-", 1)
+        _ingest(store, conn, [_log_file(tmp_path / "a.log.gz", [bad_line])])
+
+        assert [p.name for p in (store.root / "elb=x").iterdir()] == ["hour=unknown"]
+
+    def test_default_root_scoped_by_bucket_and_prefix(self, tmp_path):
+        root = ALBLogStore.default_root("my-bucket", "/AWSLogs/123/elasticloadbalancing/", base_dir=str(tmp_path))
+
+        assert root == tmp_path / "my-bucket_AWSLogs_123_elasticloadbalancing"
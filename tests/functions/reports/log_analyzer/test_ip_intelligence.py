@@ -0,0 +1,177 @@
+"""
+tests/functions/reports/log_analyzer/test_ip_intelligence.py - IP 국가 매핑 테스트
+
+구간 테이블 기반 Longest-Prefix 조회와 일괄 조회 성능을 테스트합니다.
+
+벤치마크 실행 (numpy 필요):
+    pytest tests/functions/reports/log_analyzer/test_ip_intelligence.py -m slow
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import random
+import time
+
+import pytest
+
+from functions.reports.log_analyzer import ip_intelligence
+from functions.reports.log_analyzer.ip_intelligence import IPIntelligence, IPRangeTable
+
+
+def _intel(ipv4_blocks: dict[str, list[str]], ipv6_blocks: dict[str, list[str]] | None = None) -> IPIntelligence:
+    """IPDeny 다운로드 없이 블록 데이터로 초기화한 IPIntelligence"""
+    intel = IPIntelligence()
+    intel._ipdeny.download = lambda: {"ipv4_blocks": ipv4_blocks, "ipv6_blocks": ipv6_blocks or {}}
+    assert intel.initialize()
+    return intel
+
+
+def _brute_force(ip: str, blocks: dict[str, list[str]]) -> str | None:
+    """모든 블록을 검사하는 Longest-Prefix-Win 기준 구현"""
+    addr = ipaddress.ip_address(ip)
+    best, best_prefix = None, -1
+    for country, cidrs in blocks.items():
+        for cidr in cidrs:
+            network = ipaddress.ip_network(cidr, strict=False)
+            if addr in network and network.prefixlen > best_prefix:
+                best, best_prefix = country, network.prefixlen
+    return best
+
+
+class TestIPRangeTable:
+    """IPRangeTable 구축/조회 테스트"""
+
+    def test_nested_ranges_split(self):
+        table = IPRangeTable.from_ranges([(0, 99, "A"), (10, 19, "B"), (12, 13, "C"), (50, 59, "D")])
+
+        assert [table.lookup(v) for v in (0, 9, 10, 12, 13, 14, 19, 20, 55, 60, 99)] == [
+            "A",
+            "A",
+            "B",
+            "C",
+            "C",
+            "B",
+            "B",
+            "A",
+            "D",
+            "A",
+            "A",
+        ]
+        assert table.lookup(100) is None
+
+    def test_adjacent_same_code_merged(self):
+        table = IPRangeTable.from_ranges([(0, 9, "A"), (10, 19, "A"), (30, 39, "A")])
+
+        assert len(table) == 2
+        assert table.lookup(25) is None
+
+    def test_duplicate_block_keeps_first(self):
+        table = IPRangeTable.from_ranges([(0, 9, "A"), (0, 9, "B")])
+
+        assert table.lookup(5) == "A"
+
+    def test_empty(self):
+        assert IPRangeTable.from_ranges([]).lookup(1) is None
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_lookup_many_matches_lookup(self, monkeypatch, vectorized):
+        if vectorized:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(ip_intelligence, "np", None)
+        table = IPRangeTable.from_ranges([(0, 99, "A"), (10, 19, "B"), (12, 13, "C"), (150, 159, "D")])
+        values = [0, 12, 14, 20, 99, 100, 149, 150, 159, 160, 1 << 32]
+
+        assert table.lookup_many(values, "ZZ") == [table.lookup(v) or "ZZ" for v in values]
+
+    def test_lookup_many_empty_table(self):
+        assert IPRangeTable.from_ranges([]).lookup_many([1, 2], "ZZ") == ["ZZ", "ZZ"]
+
+
+class TestCountryLookup:
+    """IPIntelligence 국가 매핑 테스트"""
+
+    BLOCKS = {
+        "US": ["3.0.0.0/8", "52.0.0.0/11"],
+        "KR": ["3.34.0.0/15", "1.208.0.0/12"],
+        "JP": ["3.34.10.0/24"],
+    }
+
+    def test_longest_prefix_wins(self):
+        intel = _intel(self.BLOCKS)
+
+        assert intel.get_country_code("3.1.1.1") == "US"
+        assert intel.get_country_code("3.34.1.1") == "KR"
+        assert intel.get_country_code("3.34.10.5") == "JP"
+        assert intel.get_country_code("9.9.9.9") is None
+        assert intel.get_country_code("10.0.0.1") == "PRIVATE"
+        assert intel.get_country_code("not-an-ip") is None
+
+    def test_batch_matches_single_lookup(self):
+        intel = _intel(self.BLOCKS, {"DE": ["2a00::/12"], "FR": ["2a01:e000::/19"]})
+        ips = ["3.1.1.1", "3.34.10.5", "1.209.0.1", "9.9.9.9", "10.0.0.1", "127.0.0.1", "2a00::1", "2a01:e000::1", "x"]
+
+        result = intel.get_country_codes_batch(ips)
+
+        assert result == {
+            "3.1.1.1": "US",
+            "3.34.10.5": "JP",
+            "1.209.0.1": "KR",
+            "9.9.9.9": "ZZ",
+            "10.0.0.1": "ZZ",
+            "127.0.0.1": "ZZ",
+            "2a00::1": "DE",
+            "2a01:e000::1": "FR",
+            "x": "ZZ",
+        }
+        assert intel.get_country_statistics(ips, result) == {"US": 1, "JP": 1, "KR": 1, "ZZ": 4, "DE": 1, "FR": 1}
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_batch_agrees_with_brute_force(self, monkeypatch, vectorized):
+        if vectorized:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(ip_intelligence, "np", None)
+        rng = random.Random(7)
+        blocks: dict[str, list[str]] = {}
+        for i in range(300):
+            prefix = rng.randint(8, 24)
+            addr = ipaddress.IPv4Address(rng.randint(1 << 24, (223 << 24) - 1))
+            network = ipaddress.IPv4Network(f"{addr}/{prefix}", strict=False)
+            blocks.setdefault(f"C{i % 40}", []).append(str(network))
+        ips = [str(ipaddress.IPv4Address(rng.randint(1 << 24, (223 << 24) - 1))) for _ in range(500)]
+        ips += [cidr.split("/")[0] for cidrs in blocks.values() for cidr in cidrs]
+        intel = _intel(blocks)
+
+        result = intel.get_country_codes_batch(ips)
+
+        for ip in ips:
+            assert result[ip] == (_brute_force(ip, blocks) or "ZZ"), ip
+
+
+class TestBatchLookupBenchmark:
+    """일괄 국가 조회 성능"""
+
+    @pytest.mark.slow
+    def test_million_ips_about_one_second(self):
+        pytest.importorskip("numpy")
+        rng = random.Random(42)
+        # IPDeny 규모 (~20만 IPv4 /24 블록)
+        blocks: dict[str, list[str]] = {}
+        for i in range(200_000):
+            cidr = f"{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.0/24"
+            blocks.setdefault(f"C{i % 250}", []).append(cidr)
+        intel = _intel(blocks)
+        ips = [
+            f"{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}"
+            for _ in range(1_000_000)
+        ]
+
+        start = time.perf_counter()
+        result = intel.get_country_codes_batch(ips)
+        elapsed = time.perf_counter() - start
+
+        assert len(result) == len(set(ips))
+        # 단일 코어 기준 약 0.8초, CI 편차 여유분 포함
+        assert elapsed < 1.5, f"100만 IP 국가 조회 {elapsed:.2f}초"
@@ -6,6 +6,8 @@ InventoryCollector 클래스의 초기화, 리소스 수집, 캐싱, 에러 처
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from core.shared.aws.inventory.collector import InventoryCollector
 from core.shared.aws.inventory.types import (
     VPC,
@@ -602,6 +604,76 @@ class TestParallelCollectIntegration:
         assert mock_parallel.call_args[0][0] == mock_context
 
 
+class TestCollectMany:
+    """collect_many (공유 작업 큐) 테스트"""
+
+    @patch("core.shared.aws.inventory.collector.parallel_collect_many")
+    def test_builds_jobs_with_service(self, mock_many, mock_context):
+        """메서드명별 CollectJob이 올바른 서비스로 생성됨"""
+        mock_many.return_value = {}
+
+        collector = InventoryCollector(mock_context)
+        collector.collect_many(["collect_vpcs", "collect_rds_instances", "collect_iam_users"])
+
+        jobs = mock_many.call_args[0][1]
+        assert [(j.name, j.service) for j in jobs] == [
+            ("collect_vpcs", "ec2"),
+            ("collect_rds_instances", "rds"),
+            ("collect_iam_users", "iam"),
+        ]
+
+    @patch("core.shared.aws.inventory.collector.parallel_collect_many")
+    def test_global_collectors_use_account_scope(self, mock_many, mock_context):
+        """글로벌 리소스는 계정당 1개 태스크(scope="account")로 수집"""
+        mock_many.return_value = {}
+
+        collector = InventoryCollector(mock_context)
+        collector.collect_many(["collect_vpcs", "collect_s3_buckets", "collect_route53_hosted_zones"])
+
+        jobs = mock_many.call_args[0][1]
+        assert [(j.name, j.scope) for j in jobs] == [
+            ("collect_vpcs", "region"),
+            ("collect_s3_buckets", "account"),
+            ("collect_route53_hosted_zones", "account"),
+        ]
+
+    @patch("core.shared.aws.inventory.collector.parallel_collect_many")
+    def test_streams_flat_data_to_callback(self, mock_many, mock_context):
+        """작업 완료 시 평탄화된 데이터가 콜백으로 전달됨"""
+
+        def fake_many(ctx, jobs, max_workers=20, on_job_complete=None):
+            for job in jobs:
+                result = Mock()
+                result.get_flat_data.return_value = [job.name]
+                on_job_complete(job.name, result)
+            return {}
+
+        mock_many.side_effect = fake_many
+        received = []
+
+        collector = InventoryCollector(mock_context)
+        returned = collector.collect_many(
+            ["collect_ec2", "collect_subnets"], on_complete=lambda name, data: received.append((name, data))
+        )
+
+        assert returned == {}
+        assert received == [("collect_ec2", ["collect_ec2"]), ("collect_subnets", ["collect_subnets"])]
+
+    def test_unknown_method_rejected(self, mock_context):
+        """지원하지 않는 메서드명은 ValueError"""
+        collector = InventoryCollector(mock_context)
+
+        with pytest.raises(ValueError):
+            collector.collect_many(["collect_unknown"])
+
+    def test_registry_covers_all_collect_methods(self):
+        """RESOURCE_COLLECTORS가 모든 collect_* 메서드를 포함"""
+        from core.shared.aws.inventory.collector import RESOURCE_COLLECTORS
+
+        methods = {name for name in dir(InventoryCollector) if name.startswith("collect_") and name != "collect_many"}
+        assert methods == set(RESOURCE_COLLECTORS)
+
+
 class TestCollectorCompleteness:
     """모든 수집 메서드 테스트"""
 
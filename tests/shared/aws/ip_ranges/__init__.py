@@ -0,0 +1 @@
+"""Tests for shared.aws.ip_ranges module."""
@@ -0,0 +1,266 @@
+"""
+tests/shared/aws/ip_ranges/test_index.py - IP 대역 인덱스 테스트
+
+정렬 구간 인덱스 조회, 바이너리 저장/로드, 프로바이더 캐시 기반 재사용을 테스트합니다.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import json
+import os
+import random
+from unittest.mock import patch
+
+import pytest
+
+from core.shared.aws.ip_ranges import providers
+from core.shared.aws.ip_ranges.index import IPRangeIndex, MultiProviderIndex, reset_global_index
+
+AWS_DATA = {
+    "prefixes": [
+        {"ip_prefix": "52.94.0.0/16", "region": "us-east-1", "service": "AMAZON", "network_border_group": "us-east-1"},
+        {"ip_prefix": "52.94.76.0/22", "region": "us-west-2", "service": "AMAZON", "network_border_group": "us-west-2"},
+        {"ip_prefix": "52.94.76.0/22", "region": "us-west-2", "service": "EC2", "network_border_group": "us-west-2"},
+        {
+            "ip_prefix": "3.5.140.0/22",
+            "region": "ap-northeast-2",
+            "service": "S3",
+            "network_border_group": "ap-northeast-2",
+        },
+    ],
+    "ipv6_prefixes": [
+        {"ipv6_prefix": "2600:1f00::/24", "region": "GLOBAL", "service": "AMAZON", "network_border_group": "GLOBAL"},
+        {"ipv6_prefix": "2600:1f18::/33", "region": "us-east-1", "service": "EC2", "network_border_group": "us-east-1"},
+    ],
+}
+GCP_DATA = {"prefixes": [{"ipv4Prefix": "34.64.0.0/10", "service": "Google Cloud", "scope": "asia-northeast3"}]}
+
+
+def _multi_index() -> MultiProviderIndex:
+    index = MultiProviderIndex()
+    index.load_provider("aws", AWS_DATA)
+    index.load_provider("gcp", GCP_DATA)
+    index.build()
+    return index
+
+
+def _matches(index: MultiProviderIndex | IPRangeIndex, ip: str) -> list[tuple[str, str]]:
+    return [(m.prefix, m.service) for m in index.search(ip)]
+
+
+class TestSortedIntervalSearch:
+    """정렬 구간 백엔드 조회 테스트"""
+
+    def test_returns_all_containing_prefixes_outermost_first(self):
+        index = _multi_index()
+
+        assert _matches(index, "52.94.76.1") == [
+            ("52.94.0.0/16", "AMAZON"),
+            ("52.94.76.0/22", "AMAZON"),
+            ("52.94.76.0/22", "EC2"),
+        ]
+        assert _matches(index, "52.94.1.1") == [("52.94.0.0/16", "AMAZON")]
+        assert _matches(index, "2600:1f18::1") == [("2600:1f00::/24", "AMAZON"), ("2600:1f18::/33", "EC2")]
+        assert index.search("8.8.8.8") == []
+        assert index.search("invalid") == []
+
+    def test_sibling_after_nested_prefix(self):
+        """바로 앞 구간이 포함하지 않아도 parent 체인에서 상위 구간을 찾음"""
+        index = IPRangeIndex(use_radix=False)
+        index.add_prefix("10.0.0.0/8", "P")
+        index.add_prefix("10.1.0.0/16", "P")
+        index.add_prefix("10.1.2.0/24", "P")
+        index.add_prefix("10.3.0.0/16", "P")
+
+        assert [m.prefix for m in index.search("10.2.0.1")] == ["10.0.0.0/8"]
+        assert [m.prefix for m in index.search("10.1.9.9")] == ["10.0.0.0/8", "10.1.0.0/16"]
+
+    def test_agrees_with_linear_scan(self):
+        rng = random.Random(3)
+        prefixes = []
+        for _ in range(400):
+            addr = ipaddress.IPv4Address(rng.randint(0, 2**32 - 1))
+            prefixes.append(str(ipaddress.IPv4Network(f"{addr}/{rng.randint(8, 28)}", strict=False)))
+        index = IPRangeIndex(use_radix=False)
+        for prefix in prefixes:
+            index.add_prefix(prefix, "P")
+        index.build()
+        networks = [ipaddress.ip_network(p) for p in prefixes]
+
+        for _ in range(300):
+            ip = ipaddress.IPv4Address(rng.randint(0, 2**32 - 1))
+            expected = sorted(str(n) for n in networks if ip in n)
+            assert sorted(m.prefix for m in index.search(str(ip))) == expected
+
+    def test_extra_is_copied_per_result(self):
+        index = _multi_index()
+
+        first = index.search("3.5.140.1")[0]
+        first.extra["network_border_group"] = "changed"
+
+        assert index.search("3.5.140.1")[0].extra == {"network_border_group": "ap-northeast-2"}
+
+
+class TestIndexPersistence:
+    """바이너리 저장/로드 테스트"""
+
+    def test_roundtrip(self, tmp_path):
+        path = str(tmp_path / "index.bin")
+        index = _multi_index()
+
+        index.save(path, signature=[["aws", 1, 2]])
+        loaded = MultiProviderIndex.load(path, signature=[["aws", 1, 2]])
+
+        assert loaded is not None
+        assert loaded.prefix_count == index.prefix_count
+        assert loaded.loaded_providers == {"aws", "gcp"}
+        for ip in ("52.94.76.1", "3.5.140.9", "34.64.1.1", "2600:1f18::1", "1.1.1.1"):
+            assert loaded.search(ip) == index.search(ip)
+
+    def test_signature_mismatch(self, tmp_path):
+        path = str(tmp_path / "index.bin")
+        _multi_index().save(path, signature=[["aws", 1, 2]])
+
+        assert MultiProviderIndex.load(path, signature=[["aws", 1, 3]]) is None
+
+    def test_corrupt_or_missing(self, tmp_path):
+        path = tmp_path / "index.bin"
+        assert MultiProviderIndex.load(str(path)) is None
+
+        _multi_index().save(str(path))
+        path.write_bytes(path.read_bytes()[:-10])
+        assert MultiProviderIndex.load(str(path)) is None
+
+
+class TestProviderIndexCache:
+    """get_provider_index 캐시 동작 테스트"""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        for name, data in (("aws", AWS_DATA), ("gcp", GCP_DATA)):
+            (tmp_path / f"{name}.json").write_text(json.dumps(data), encoding="utf-8")
+        reset_global_index()
+        with patch.object(providers, "_get_cache_dir", return_value=str(tmp_path)):
+            yield tmp_path
+        reset_global_index()
+
+    def test_built_once_and_reused(self, cache_dir):
+        with patch.object(providers, "load_ip_ranges_parallel", wraps=providers.load_ip_ranges_parallel) as load:
+            first = providers.get_provider_index(["aws"])
+            second = providers.get_provider_index(["aws"])
+
+        assert first is second
+        assert load.call_count == 1
+        assert (cache_dir / "index.bin").exists()
+
+    def test_loads_persisted_index_in_new_session(self, cache_dir):
+        providers.get_provider_index(["aws"])
+        reset_global_index()
+
+        with patch.object(providers, "load_ip_ranges_parallel") as load:
+            index = providers.get_provider_index(["aws"])
+
+        load.assert_not_called()
+        assert [m.prefix for m in index.search("34.64.1.1")] == ["34.64.0.0/10"]
+
+    def test_rebuilt_when_provider_json_changes(self, cache_dir):
+        providers.get_provider_index(["aws"])
+        data = json.loads(json.dumps(AWS_DATA))
+        data["prefixes"].append({"ip_prefix": "16.0.0.0/8", "region": "us-east-1", "service": "AMAZON"})
+        (cache_dir / "aws.json").write_text(json.dumps(data), encoding="utf-8")
+        stat = os.stat(cache_dir / "aws.json")
+        os.utime(cache_dir / "aws.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        index = providers.get_provider_index(["aws"])
+
+        assert [m.prefix for m in index.search("16.1.1.1")] == ["16.0.0.0/8"]
+
+    def test_search_public_cidr(self, cache_dir):
+        results = providers.search_public_cidr(["52.94.76.0/24", "10.0.0.0/8"], region_filter="west")
+
+        assert [(r.ip_address, r.service, r.ip_prefix) for r in results] == [
+            ("52.94.76.0/24", "AMAZON", "52.94.76.0/22"),
+            ("52.94.76.0/24", "EC2", "52.94.76.0/22"),
+            ("10.0.0.0/8", "", ""),
+        ]
+
+    def test_search_by_filter(self, cache_dir):
+        results = providers.search_by_filter("aws", region="us-east")
+
+        assert [(r.ip_prefix, r.service) for r in results] == [
+            ("52.94.0.0/16", "AMAZON"),
+            ("2600:1f18::/33", "EC2"),
+        ]
+        assert providers.search_by_filter("unknown") == []
+
+    def test_search_public_ip_optimized_filters(self, cache_dir):
+        results = providers.search_public_ip_optimized(
+            ["52.94.76.1", "34.64.1.1"], providers=["aws"], service_filter="ec2"
+        )
+
+        assert [(r.ip_address, r.provider, r.service, r.ip_prefix) for r in results] == [
+            ("52.94.76.1", "AWS", "EC2", "52.94.76.0/22"),
+            ("34.64.1.1", "Unknown", "", ""),
+        ]
+
+
+class TestOverlapSearch:
+    """CIDR 겹침 조회 테스트"""
+
+    def test_overlaps_include_parents_and_children(self):
+        index = _multi_index()
+
+        assert [(m.prefix, m.service) for m in index.search_overlaps("52.94.76.0/24")] == [
+            ("52.94.0.0/16", "AMAZON"),
+            ("52.94.76.0/22", "AMAZON"),
+            ("52.94.76.0/22", "EC2"),
+        ]
+        assert [m.prefix for m in index.search_overlaps("52.0.0.0/8")] == [
+            "52.94.0.0/16",
+            "52.94.76.0/22",
+            "52.94.76.0/22",
+        ]
+        assert [m.prefix for m in index.search_overlaps("2600::/16")] == ["2600:1f00::/24", "2600:1f18::/33"]
+        assert index.search_overlaps("8.0.0.0/8") == []
+        assert index.search_overlaps("bad") == []
+
+    def test_agrees_with_linear_overlaps(self):
+        rng = random.Random(11)
+        prefixes = []
+        for _ in range(400):
+            addr = ipaddress.IPv4Address(rng.randint(0, 2**32 - 1))
+            prefixes.append(str(ipaddress.IPv4Network(f"{addr}/{rng.randint(8, 28)}", strict=False)))
+        index = IPRangeIndex(use_radix=False)
+        for prefix in prefixes:
+            index.add_prefix(prefix, "P")
+        networks = [ipaddress.ip_network(p) for p in prefixes]
+
+        for _ in range(200):
+            addr = ipaddress.IPv4Address(rng.randint(0, 2**32 - 1))
+            query = ipaddress.IPv4Network(f"{addr}/{rng.randint(4, 30)}", strict=False)
+            expected = sorted(str(n) for n in networks if n.overlaps(query))
+            assert sorted(m.prefix for m in index.search_overlaps(str(query))) == expected
+
+
+class TestInvertedFilters:
+    """역색인 필터 테스트"""
+
+    def test_filter_meta_ids(self):
+        index = _multi_index()
+
+        assert index.filter_meta_ids() is None
+        ec2 = index.filter_meta_ids({"aws"}, service="ec2")
+        assert [m.prefix for m in index.entries_for_meta_ids(ec2)] == ["52.94.76.0/22", "2600:1f18::/33"]
+        west = index.filter_meta_ids(region="US-WEST")
+        assert [m.service for m in index.search("52.94.76.1", west)] == ["AMAZON", "EC2"]
+        assert index.entries_for_meta_ids(index.filter_meta_ids({"gcp"}, region="us-")) == []
+
+    def test_filters_rebuilt_after_add(self):
+        index = IPRangeIndex(use_radix=False)
+        index.add_prefix("10.0.0.0/8", "P", service="A")
+        assert len(index.entries_for_meta_ids(index.filter_meta_ids(service="b"))) == 0
+
+        index.add_prefix("11.0.0.0/8", "P", service="B")
+
+        assert [m.prefix for m in index.entries_for_meta_ids(index.filter_meta_ids(service="b"))] == ["11.0.0.0/8"]
@@ -6,10 +6,16 @@ batch_get_metrics 함수의 캐싱 동작을 테스트합니다.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
-from core.shared.aws.metrics import MetricQuery, MetricSessionCache, batch_get_metrics
+from core.shared.aws.metrics import (
+    FileBackedMetricCache,
+    MetricQuery,
+    MetricSessionCache,
+    SharedMetricCache,
+    batch_get_metrics,
+)
 
 
 class TestBatchGetMetricsWithCache:
@@ -50,8 +56,8 @@ class TestBatchGetMetricsWithCache:
             [
                 {
                     "MetricDataResults": [
-                        {"Id": "q1", "Values": [50.0]},
-                        {"Id": "q2", "Values": [1000.0]},
+                        {"Id": "q1", "Timestamps": [self.start_time], "Values": [50.0]},
+                        {"Id": "q2", "Timestamps": [self.start_time], "Values": [1000.0]},
                     ]
                 }
             ]
@@ -74,8 +80,8 @@ class TestBatchGetMetricsWithCache:
             [
                 {
                     "MetricDataResults": [
-                        {"Id": "q1", "Values": [50.0]},
-                        {"Id": "q2", "Values": [1000.0]},
+                        {"Id": "q1", "Timestamps": [self.start_time], "Values": [50.0]},
+                        {"Id": "q2", "Timestamps": [self.start_time], "Values": [1000.0]},
                     ]
                 }
             ]
@@ -110,8 +116,8 @@ class TestBatchGetMetricsWithCache:
         query1 = [self.queries[0]]
         mock_client = self._create_mock_client(
             [
-                {"MetricDataResults": [{"Id": "q1", "Values": [50.0]}]},
-                {"MetricDataResults": [{"Id": "q2", "Values": [1000.0]}]},
+                {"MetricDataResults": [{"Id": "q1", "Timestamps": [self.start_time], "Values": [50.0]}]},
+                {"MetricDataResults": [{"Id": "q2", "Timestamps": [self.start_time], "Values": [1000.0]}]},
             ]
         )
 
@@ -143,8 +149,12 @@ class TestBatchGetMetricsWithCache:
         """다른 시간 범위는 캐시 미스"""
         mock_client = self._create_mock_client(
             [
-                {"MetricDataResults": [{"Id": "q1", "Values": [50.0]}]},
-                {"MetricDataResults": [{"Id": "q1", "Values": [75.0]}]},
+                {"MetricDataResults": [{"Id": "q1", "Timestamps": [self.start_time], "Values": [50.0]}]},
+                {
+                    "MetricDataResults": [
+                        {"Id": "q1", "Timestamps": [self.start_time + timedelta(days=1)], "Values": [75.0]}
+                    ]
+                },
             ]
         )
 
@@ -191,8 +201,8 @@ class TestBatchGetMetricsWithCache:
 
         mock_client = self._create_mock_client(
             [
-                {"MetricDataResults": [{"Id": "q1_avg", "Values": [50.0]}]},
-                {"MetricDataResults": [{"Id": "q1_max", "Values": [100.0]}]},
+                {"MetricDataResults": [{"Id": "q1_avg", "Timestamps": [self.start_time], "Values": [50.0]}]},
+                {"MetricDataResults": [{"Id": "q1_max", "Timestamps": [self.start_time], "Values": [100.0]}]},
             ]
         )
 
@@ -235,7 +245,7 @@ class TestBatchGetMetricsWithCache:
         """0 값도 캐시됨"""
         mock_client = self._create_mock_client(
             [
-                {"MetricDataResults": [{"Id": "q1", "Values": [0.0]}]},
+                {"MetricDataResults": [{"Id": "q1", "Timestamps": [self.start_time], "Values": [0.0]}]},
             ]
         )
 
@@ -279,8 +289,8 @@ class TestBatchGetMetricsWithCache:
 
         mock_client = self._create_mock_client(
             [
-                {"MetricDataResults": [{"Id": "q_inst1", "Values": [50.0]}]},
-                {"MetricDataResults": [{"Id": "q_inst2", "Values": [75.0]}]},
+                {"MetricDataResults": [{"Id": "q_inst1", "Timestamps": [self.start_time], "Values": [50.0]}]},
+                {"MetricDataResults": [{"Id": "q_inst2", "Timestamps": [self.start_time], "Values": [75.0]}]},
             ]
         )
 
@@ -324,7 +334,9 @@ class TestBatchGetMetricsCacheEdgeCases:
         )
 
         mock_client = MagicMock()
-        mock_client.get_metric_data.return_value = {"MetricDataResults": [{"Id": "q1", "Values": [50.0]}]}
+        mock_client.get_metric_data.return_value = {
+            "MetricDataResults": [{"Id": "q1", "Timestamps": [self.start_time], "Values": [50.0]}]
+        }
 
         # MetricSessionCache 인스턴스 생성하지만 context manager 외부
         cache = MetricSessionCache()
@@ -359,7 +371,9 @@ class TestBatchGetMetricsCacheEdgeCases:
         )
 
         mock_client = MagicMock()
-        mock_client.get_metric_data.return_value = {"MetricDataResults": [{"Id": "q1", "Values": [50.0]}]}
+        mock_client.get_metric_data.return_value = {
+            "MetricDataResults": [{"Id": "q1", "Timestamps": [self.start_time], "Values": [50.0]}]
+        }
 
         with MetricSessionCache() as cache:
             result1 = batch_get_metrics(
@@ -383,3 +397,172 @@ class TestBatchGetMetricsCacheEdgeCases:
             assert result2 == {"q2": 50.0}
             # API 호출 1회만
             assert mock_client.get_metric_data.call_count == 1
+
+
+class TestBatchGetMetricsDayBuckets:
+    """일 단위(period=86400) 날짜 버킷 캐시 테스트"""
+
+    BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def _day(self, n: int) -> datetime:
+        return self.BASE + timedelta(days=n)
+
+    def _query(self, qid: str = "q1") -> MetricQuery:
+        return MetricQuery(
+            id=qid,
+            namespace="AWS/EC2",
+            metric_name="NetworkIn",
+            dimensions={"InstanceId": "i-123"},
+            stat="Sum",
+        )
+
+    def _daily_client(self, values: list[float]) -> MagicMock:
+        """요청 구간 안의 일별 datapoint를 반환하는 CloudWatch client 모킹 (values[n] = n일차 값)"""
+        client = MagicMock()
+
+        def get_metric_data(**kwargs):
+            start, end = kwargs["StartTime"], kwargs["EndTime"]
+            days = [i for i in range(len(values)) if start <= self._day(i) < end]
+            return {
+                "MetricDataResults": [
+                    {
+                        "Id": mdq["Id"],
+                        "Timestamps": [self._day(i) for i in days],
+                        "Values": [values[i] for i in days],
+                    }
+                    for mdq in kwargs["MetricDataQueries"]
+                ]
+            }
+
+        client.get_metric_data.side_effect = get_metric_data
+        return client
+
+    def test_next_day_fetches_only_new_day(self):
+        """다음 날 30일 조회는 새로 추가된 하루만 API 조회"""
+        client = self._daily_client([float(i) for i in range(31)])
+
+        with SharedMetricCache(register_global=False) as cache:
+            first = batch_get_metrics(client, [self._query()], self._day(0), self._day(30), cache=cache)
+            second = batch_get_metrics(client, [self._query()], self._day(1), self._day(31), cache=cache)
+
+        assert first == {"q1": float(sum(range(30)))}
+        assert second == {"q1": float(sum(range(1, 31)))}
+        assert client.get_metric_data.call_count == 2
+        last_call = client.get_metric_data.call_args.kwargs
+        assert last_call["StartTime"] == self._day(30)
+        assert last_call["EndTime"] == self._day(31)
+
+    def test_sub_window_served_from_cache(self):
+        client = self._daily_client([1.0] * 30)
+
+        with SharedMetricCache(register_global=False) as cache:
+            batch_get_metrics(client, [self._query()], self._day(0), self._day(30), cache=cache)
+            result = batch_get_metrics(client, [self._query()], self._day(16), self._day(30), cache=cache)
+
+        assert result == {"q1": 14.0}
+        assert client.get_metric_data.call_count == 1
+
+    def test_queries_grouped_by_missing_range(self):
+        """누락 구간이 같은 쿼리는 한 번의 API 호출로 조회"""
+        client = self._daily_client([1.0] * 10)
+        q2 = MetricQuery(id="q2", namespace="AWS/EC2", metric_name="NetworkOut", dimensions={"InstanceId": "i-123"})
+
+        with SharedMetricCache(register_global=False) as cache:
+            batch_get_metrics(client, [self._query()], self._day(0), self._day(5), cache=cache)
+            result = batch_get_metrics(client, [self._query(), q2], self._day(0), self._day(10), cache=cache)
+
+        assert result == {"q1": 10.0, "q2": 10.0}
+        # 1회차 + (q1: 5~10일) + (q2: 0~10일)
+        assert client.get_metric_data.call_count == 3
+
+    def _hourly_client(self, hours: int, stat_values=lambda hour: float(hour % 7)) -> MagicMock:
+        """시간별 datapoint를 StartTime 기준 Period 구간으로 집계하는 CloudWatch client 모킹"""
+        client = MagicMock()
+
+        def get_metric_data(**kwargs):
+            start, end = kwargs["StartTime"], kwargs["EndTime"]
+            start = start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+            end = end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+            results = []
+            for mdq in kwargs["MetricDataQueries"]:
+                stat = mdq["MetricStat"]["Stat"]
+                period = timedelta(seconds=mdq["MetricStat"]["Period"])
+                timestamps, values = [], []
+                bucket = start
+                while bucket < end:
+                    bucket_end = min(bucket + period, end)
+                    points = [
+                        stat_values(h) for h in range(hours) if bucket <= self.BASE + timedelta(hours=h) < bucket_end
+                    ]
+                    if points:
+                        timestamps.append(bucket)
+                        values.append(sum(points) if stat == "Sum" else sum(points) / len(points))
+                    bucket = bucket_end
+                results.append({"Id": mdq["Id"], "Timestamps": timestamps, "Values": values})
+            return {"MetricDataResults": results}
+
+        client.get_metric_data.side_effect = get_metric_data
+        return client
+
+    def test_unaligned_window_matches_uncached(self):
+        """자정이 아닌 구간은 부분 날짜를 캐시 없이 합산하여 캐시 미사용 결과와 같음"""
+        window = (self._day(0) + timedelta(hours=14), self._day(7) + timedelta(hours=14))
+        uncached = batch_get_metrics(self._hourly_client(24 * 8), [self._query()], *window, cache=None)
+
+        client = self._hourly_client(24 * 8)
+        with SharedMetricCache(register_global=False) as cache:
+            first = batch_get_metrics(client, [self._query()], *window, cache=cache)
+            second = batch_get_metrics(client, [self._query()], *window, cache=cache)
+
+        assert first == second == uncached
+        # 완전한 날짜 1회 + 앞/뒤 부분 날짜 각 1회, 두 번째는 부분 날짜만
+        assert client.get_metric_data.call_count == 5
+
+    def test_window_without_full_day_matches_uncached(self):
+        """20:00→02:00 구간은 날짜 버킷을 쓰지 않음 (전날 전체가 아닌 해당 6시간)"""
+        window = (self._day(1) + timedelta(hours=20), self._day(2) + timedelta(hours=2))
+        uncached = batch_get_metrics(self._hourly_client(24 * 3), [self._query()], *window, cache=None)
+
+        with SharedMetricCache(register_global=False) as cache:
+            cached = batch_get_metrics(self._hourly_client(24 * 3), [self._query()], *window, cache=cache)
+
+        assert cached == uncached
+        assert cached["q1"] == sum(float(h % 7) for h in range(44, 50))
+
+    def test_non_additive_stat_on_unaligned_window_matches_uncached(self):
+        """Average 등은 부분 날짜로 나누면 값이 달라지므로 구간 전체로 조회"""
+        query = MetricQuery(id="q1", namespace="AWS/EC2", metric_name="CPUUtilization", dimensions={}, stat="Average")
+        window = (self._day(0) + timedelta(hours=6), self._day(3) + timedelta(hours=6))
+        uncached = batch_get_metrics(self._hourly_client(24 * 4), [query], *window, cache=None)
+
+        with SharedMetricCache(register_global=False) as cache:
+            cached = batch_get_metrics(self._hourly_client(24 * 4), [query, self._query("q2")], *window, cache=cache)
+
+        assert cached["q1"] == uncached["q1"]
+
+    def test_unsettled_day_not_cached(self, monkeypatch):
+        """끝난 지 얼마 안 된 날짜는 지연 수집 datapoint 대비 캐시하지 않음"""
+        now = self._day(2) + timedelta(minutes=30)
+        monkeypatch.setattr("core.shared.aws.metrics.batch_metrics.time.time", now.timestamp)
+        client = self._daily_client([1.0, 1.0])
+
+        with SharedMetricCache(register_global=False) as cache:
+            batch_get_metrics(client, [self._query()], self._day(0), self._day(2), cache=cache)
+            result = batch_get_metrics(client, [self._query()], self._day(0), self._day(2), cache=cache)
+            assert cache.size() == 1
+
+        assert result == {"q1": 2.0}
+        assert client.get_metric_data.call_count == 2
+        assert client.get_metric_data.call_args.kwargs["StartTime"] == self._day(1)
+
+    def test_day_buckets_persist_in_file_cache(self, tmp_path):
+        client = self._daily_client([2.0] * 31)
+
+        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=False, register_global=False) as cache:
+            batch_get_metrics(client, [self._query()], self._day(0), self._day(30), cache=cache)
+
+        with FileBackedMetricCache(cache_dir=tmp_path, register_global=False) as cache:
+            result = batch_get_metrics(client, [self._query()], self._day(1), self._day(31), cache=cache)
+
+        assert result == {"q1": 60.0}
+        assert client.get_metric_data.call_count == 2
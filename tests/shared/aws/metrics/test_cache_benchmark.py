@@ -16,7 +16,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from core.shared.aws.metrics import MetricQuery, MetricSessionCache, batch_get_metrics
+from core.shared.aws.metrics import FileBackedMetricCache, MetricQuery, MetricSessionCache, batch_get_metrics
 
 
 class TestCacheBenchmark:
@@ -305,6 +305,77 @@ class TestCacheMemoryUsage:
             assert cache.get("test_key") is None
 
 
+class TestFileCacheBackendBenchmark:
+    """FileBackedMetricCache 저장소 비교 (SQLite 단일 파일 vs 항목당 JSON 파일)
+
+    대량 키(10k/100k/1M)는 slow 마커로 기본 실행에서 제외:
+        pytest tests/shared/aws/metrics/test_cache_benchmark.py -m slow -s -k backend
+    """
+
+    LOOKUPS = 1000
+    WRITE_BATCH = 500
+
+    def _measure(self, tmp_path, backend: str, num_keys: int) -> dict[str, float]:
+        """저장소별 쓰기/재시작/조회 시간 측정"""
+        cache_dir = tmp_path / backend
+        keys = [f"AWS/EC2|CPUUtilization|InstanceId=i-{i:012d}|Average|86400" for i in range(num_keys)]
+        step = max(1, num_keys // self.LOOKUPS)
+        lookup_keys = keys[::step][: self.LOOKUPS]
+
+        # 1. 쓰기 (batch_get_metrics와 같은 배치 단위)
+        start = time.perf_counter()
+        with FileBackedMetricCache(
+            cache_dir=cache_dir, cleanup_on_exit=False, register_global=False, backend=backend
+        ) as cache:
+            for i in range(0, num_keys, self.WRITE_BATCH):
+                cache.set_many({k: float(n) for n, k in enumerate(keys[i : i + self.WRITE_BATCH], start=i)})
+        write_s = time.perf_counter() - start
+
+        # 2. 다음 실행: 시작(만료 정리 포함) + 메모리 미스 상태의 일괄 조회
+        start = time.perf_counter()
+        cache = FileBackedMetricCache(cache_dir=cache_dir, cleanup_on_exit=True, register_global=False, backend=backend)
+        cache.__enter__()
+        open_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = cache.get_many(lookup_keys)
+        lookup_s = time.perf_counter() - start
+
+        files = sum(1 for _ in cache_dir.iterdir())
+        cache.__exit__()
+
+        assert len(found) == len(lookup_keys)
+        return {"write": write_s, "open": open_s, "lookup": lookup_s, "files": files}
+
+    def _run(self, tmp_path, num_keys: int) -> None:
+        results = {backend: self._measure(tmp_path, backend, num_keys) for backend in ("files", "sqlite")}
+
+        print(f"\n{'=' * 72}")
+        print(f"FileBackedMetricCache 저장소 비교 (키 {num_keys:,}개, 조회 {self.LOOKUPS}개)")
+        print(f"{'=' * 72}")
+        print(f"{'저장소':<10} {'쓰기':>12} {'시작(정리)':>14} {'일괄 조회':>12} {'파일 수':>12}")
+        print(f"{'-' * 72}")
+        for backend, r in results.items():
+            print(
+                f"{backend:<10} {r['write']:>11.2f}s {r['open'] * 1000:>12.1f}ms "
+                f"{r['lookup'] * 1000:>10.1f}ms {int(r['files']):>12,}"
+            )
+        print(f"{'=' * 72}")
+
+        assert results["sqlite"]["files"] <= 3  # DB + WAL/SHM
+        assert results["sqlite"]["open"] < results["files"]["open"]
+
+    def test_backend_benchmark_small(self, tmp_path):
+        """저장소 비교 (소규모, 기본 실행)"""
+        self._run(tmp_path, 2000)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("num_keys", [10_000, 100_000, 1_000_000])
+    def test_backend_benchmark(self, tmp_path, num_keys):
+        """저장소 비교 (10k/100k/1M 키)"""
+        self._run(tmp_path, num_keys)
+
+
 if __name__ == "__main__":
     # 직접 실행 시 벤치마크만 실행
     pytest.main([__file__, "-v", "-s", "-k", "benchmark"])
@@ -0,0 +1,50 @@
+"""
+tests/shared/aws/metrics/test_no_get_metric_statistics.py - get_metric_statistics 사용 금지 검사
+
+리소스/메트릭당 1회 호출하는 get_metric_statistics 대신 core/shared/aws/metrics의
+GetMetricData 배치 경로(batch_get_metrics, batch_get_metric_series)를 사용하도록 강제합니다.
+"""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+SCANNED_DIRS = ("core", "functions", "scripts")
+ALLOWED_DIR = PROJECT_ROOT / "core" / "shared" / "aws" / "metrics"
+
+
+def _get_metric_statistics_calls(path: Path) -> list[int]:
+    """파일 내 ``*.get_metric_statistics`` 참조 라인 번호 (주석/문자열 제외)"""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    return [
+        node.lineno
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Attribute) and node.attr == "get_metric_statistics"
+    ]
+
+
+def test_get_metric_statistics_only_in_metrics_package():
+    violations = []
+    for dirname in SCANNED_DIRS:
+        for path in sorted((PROJECT_ROOT / dirname).rglob("*.py")):
+            if path.is_relative_to(ALLOWED_DIR):
+                continue
+            violations.extend(f"{path.relative_to(PROJECT_ROOT)}:{line}" for line in _get_metric_statistics_calls(path))
+
+    assert not violations, (
+        "get_metric_statistics 대신 core.shared.aws.metrics의 batch_get_metrics/batch_get_metric_series를 "
+        "사용하세요:\n" + "\n".join(violations)
+    )
+
+
+def test_detects_attribute_access(tmp_path):
+    sample = tmp_path / "sample.py"
+    sample.write_text(
+        "# cloudwatch.get_metric_statistics in a comment is fine\n"
+        "resp = cloudwatch.get_metric_statistics(Namespace='AWS/EC2')\n",
+        encoding="utf-8",
+    )
+
+    assert _get_metric_statistics_calls(sample) == [2]
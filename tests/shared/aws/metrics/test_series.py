@@ -0,0 +1,266 @@
+"""
+tests/shared/aws/metrics/test_series.py - 메트릭 시계열 테스트
+
+MetricSeries 리듀서와 batch_get_metric_series의 조회/캐시 동작을 테스트합니다.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.shared.aws.metrics import (
+    FileBackedMetricCache,
+    MetricQuery,
+    MetricSeries,
+    MetricSeriesSet,
+    SharedMetricCache,
+    batch_get_metric_series,
+)
+from core.shared.aws.metrics.series import decode_points, encode_points
+
+NAN = float("nan")
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _day(n: int) -> datetime:
+    return BASE + timedelta(days=n)
+
+
+def _series(values: list[float]) -> MetricSeries:
+    timestamps = array("d", [_day(i).timestamp() for i in range(len(values))])
+    return MetricSeries(timestamps, array("d", values))
+
+
+def _query(qid: str, instance_id: str = "i-123") -> MetricQuery:
+    return MetricQuery(
+        id=qid,
+        namespace="AWS/EC2",
+        metric_name="NetworkIn",
+        dimensions={"InstanceId": instance_id},
+        stat="Sum",
+    )
+
+
+def _daily_client(values_by_id: dict[str, list[float]]) -> MagicMock:
+    """요청 구간 안의 일별 datapoint를 반환하는 CloudWatch client 모킹 (values[n] = n일차 값)"""
+    client = MagicMock()
+
+    def get_metric_data(**kwargs):
+        start, end = kwargs["StartTime"], kwargs["EndTime"]
+        results = []
+        for mdq in kwargs["MetricDataQueries"]:
+            values = values_by_id.get(mdq["Id"], [])
+            days = [i for i in range(len(values)) if start <= _day(i) < end]
+            # CloudWatch 기본 정렬 (최신순)
+            days.reverse()
+            results.append(
+                {
+                    "Id": mdq["Id"],
+                    "Timestamps": [_day(i) for i in days],
+                    "Values": [values[i] for i in days],
+                }
+            )
+        return {"MetricDataResults": results}
+
+    client.get_metric_data.side_effect = get_metric_data
+    return client
+
+
+class TestMetricSeriesReducers:
+    """MetricSeries 리듀서 테스트"""
+
+    def test_sum_ignores_missing(self):
+        assert _series([1.0, NAN, 2.5, 0.0]).sum() == 3.5
+
+    def test_max(self):
+        assert _series([1.0, NAN, 7.0, 3.0]).max() == 7.0
+
+    def test_mean_count_last(self):
+        s = _series([1.0, NAN, 5.0, NAN])
+        assert s.mean() == 3.0
+        assert s.count() == 2
+        assert s.last() == 5.0
+
+    def test_empty_reducers(self):
+        s = _series([NAN, NAN])
+        assert s.sum() == 0.0
+        assert s.max() == 0.0
+        assert s.mean() == 0.0
+        assert s.count() == 0
+        assert s.last() == 0.0
+        assert s.p95() == 0.0
+        assert s.days_active() == 0
+        assert s.last_nonzero() is None
+
+    def test_p95_nearest_rank(self):
+        s = _series([float(i) for i in range(1, 101)])
+        assert s.p95() == 95.0
+        assert s.percentile(100) == 100.0
+        assert s.percentile(0) == 1.0
+
+    def test_percentile_out_of_range(self):
+        with pytest.raises(ValueError):
+            _series([1.0]).percentile(101)
+
+    def test_days_active(self):
+        assert _series([0.0, 5.0, NAN, 1.0, 0.0]).days_active() == 2
+        assert _series([0.5, 5.0, 1.0]).days_active(threshold=1.0) == 1
+
+    def test_days_active_groups_sub_daily_points(self):
+        """1일 미만 주기는 날짜 단위로 집계"""
+        timestamps = array("d", [(BASE + timedelta(hours=h)).timestamp() for h in (0, 6, 12, 30)])
+        s = MetricSeries(timestamps, array("d", [1.0, 1.0, 1.0, 1.0]))
+        assert s.days_active() == 2
+
+    def test_last_nonzero(self):
+        assert _series([1.0, 2.0, 0.0, NAN]).last_nonzero() == _day(1)
+
+    def test_iter_skips_missing(self):
+        assert list(_series([1.0, NAN, 3.0])) == [(_day(0), 1.0), (_day(2), 3.0)]
+
+
+class TestMetricSeriesSet:
+    """MetricSeriesSet 테스트"""
+
+    def test_from_points_shares_timestamp_vector(self):
+        t = [_day(i).timestamp() for i in range(3)]
+        result = MetricSeriesSet.from_points(
+            {
+                "a": (array("d", [t[0], t[2]]), array("d", [1.0, 3.0])),
+                "b": (array("d", [t[1]]), array("d", [2.0])),
+            }
+        )
+
+        assert list(result.timestamps) == t
+        assert result["a"].timestamps is result["b"].timestamps
+        assert math.isnan(result["a"].values[1])
+        assert result["b"].sum() == 2.0
+
+    def test_window(self):
+        t = array("d", [_day(i).timestamp() for i in range(5)])
+        result = MetricSeriesSet.from_points({"a": (t, array("d", [1.0, 2.0, 3.0, 4.0, 5.0]))})
+
+        recent = result.window(_day(3), _day(5))
+
+        assert recent["a"].sum() == 9.0
+        assert len(recent.timestamps) == 2
+
+    def test_reduce(self):
+        t = array("d", [_day(i).timestamp() for i in range(2)])
+        result = MetricSeriesSet.from_points({"a": (t, array("d", [1.0, 4.0]))})
+
+        assert result.reduce("sum") == {"a": 5.0}
+        assert result.reduce("max") == {"a": 4.0}
+        with pytest.raises(ValueError):
+            result.reduce("median")
+
+
+class TestEncodePoints:
+    """캐시 직렬화 테스트"""
+
+    def test_roundtrip(self):
+        ts = array("d", [1.0, 2.0])
+        values = array("d", [3.5, 4.5])
+
+        start, end, ts2, values2 = decode_points(encode_points(0.0, 10.0, ts, values))
+
+        assert (start, end) == (0.0, 10.0)
+        assert ts2 == ts
+        assert values2 == values
+
+    def test_corrupt(self):
+        with pytest.raises(ValueError):
+            decode_points(b"broken")
+
+
+class TestBatchGetMetricSeries:
+    """batch_get_metric_series 테스트"""
+
+    def test_returns_sorted_series(self):
+        client = _daily_client({"q1": [1.0, 2.0, 3.0], "q2": [0.0, 0.0, 5.0]})
+
+        result = batch_get_metric_series(client, [_query("q1"), _query("q2", "i-456")], _day(0), _day(3), cache=None)
+
+        assert list(result.timestamps) == [_day(i).timestamp() for i in range(3)]
+        assert list(result["q1"].values) == [1.0, 2.0, 3.0]
+        assert result["q2"].last_nonzero() == _day(2)
+        assert result["q2"].days_active() == 1
+
+    def test_query_without_datapoints(self):
+        client = _daily_client({"q1": [1.0]})
+
+        result = batch_get_metric_series(client, [_query("q1"), _query("q2", "i-456")], _day(0), _day(1), cache=None)
+
+        assert result["q2"].sum() == 0.0
+        assert math.isnan(result["q2"].values[0])
+
+    def test_pagination_merges_pages(self):
+        client = MagicMock()
+        client.get_metric_data.side_effect = [
+            {"MetricDataResults": [{"Id": "q1", "Timestamps": [_day(1)], "Values": [2.0]}], "NextToken": "t"},
+            {"MetricDataResults": [{"Id": "q1", "Timestamps": [_day(0)], "Values": [1.0]}]},
+        ]
+
+        result = batch_get_metric_series(client, [_query("q1")], _day(0), _day(2), cache=None)
+
+        assert list(result["q1"].values) == [1.0, 2.0]
+
+    def test_shorter_window_served_from_cached_longer_fetch(self):
+        """30일 조회 결과 캐시로 14일 요청 응답"""
+        client = _daily_client({"q1": [float(i) for i in range(30)]})
+
+        with SharedMetricCache(register_global=False) as cache:
+            full = batch_get_metric_series(client, [_query("q1")], _day(0), _day(30), cache=cache)
+            recent = batch_get_metric_series(client, [_query("q1")], _day(16), _day(30), cache=cache)
+
+        assert client.get_metric_data.call_count == 1
+        assert full["q1"].sum() == sum(range(30))
+        assert recent["q1"].sum() == sum(range(16, 30))
+        assert len(recent.timestamps) == 14
+
+    def test_window_outside_cached_range_fetches(self):
+        client = _daily_client({"q1": [1.0] * 40})
+
+        with SharedMetricCache(register_global=False) as cache:
+            batch_get_metric_series(client, [_query("q1")], _day(0), _day(30), cache=cache)
+            batch_get_metric_series(client, [_query("q1")], _day(5), _day(35), cache=cache)
+
+        assert client.get_metric_data.call_count == 2
+
+    def test_series_cache_persists_in_file_cache(self, tmp_path):
+        """파일 캐시(SQLite)에 시계열 저장 후 다음 실행에서 재사용"""
+        client = _daily_client({"q1": [float(i) for i in range(30)]})
+
+        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=False, register_global=False) as cache:
+            batch_get_metric_series(client, [_query("q1")], _day(0), _day(30), cache=cache)
+
+        with FileBackedMetricCache(cache_dir=tmp_path, register_global=False) as cache:
+            result = batch_get_metric_series(client, [_query("q1")], _day(23), _day(30), cache=cache)
+
+        assert client.get_metric_data.call_count == 1
+        assert result["q1"].sum() == sum(range(23, 30))
+
+    def test_series_cache_in_directory_backend(self, tmp_path):
+        client = _daily_client({"q1": [1.0, 2.0]})
+
+        with FileBackedMetricCache(
+            cache_dir=tmp_path, cleanup_on_exit=False, register_global=False, backend="files"
+        ) as cache:
+            batch_get_metric_series(client, [_query("q1")], _day(0), _day(2), cache=cache)
+
+        with FileBackedMetricCache(cache_dir=tmp_path, register_global=False, backend="files") as cache:
+            result = batch_get_metric_series(client, [_query("q1")], _day(0), _day(2), cache=cache)
+
+        assert client.get_metric_data.call_count == 1
+        assert list(result["q1"].values) == [1.0, 2.0]
+
+    def test_empty_queries(self):
+        client = MagicMock()
+
+        assert len(batch_get_metric_series(client, [], _day(0), _day(1))) == 0
+        client.get_metric_data.assert_not_called()
@@ -7,7 +7,11 @@ MetricSessionCache 클래스의 동작을 테스트합니다.
 from __future__ import annotations
 
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
 
 from core.shared.aws.metrics.session_cache import (
     CacheStats,
@@ -17,6 +21,7 @@ from core.shared.aws.metrics.session_cache import (
     get_active_cache,
     get_global_cache,
     is_cache_active,
+    persistent_metric_cache,
     set_global_cache,
 )
 
@@ -528,8 +533,10 @@ class TestFileBackedMetricCache:
             assert cache.get("key1") == 100.0
 
     def test_cleanup_on_exit(self, tmp_path):
-        """종료 시 파일 삭제 (기본 동작)"""
-        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=True, register_global=False) as cache:
+        """종료 시 파일 삭제 (기본 동작, files 백엔드)"""
+        with FileBackedMetricCache(
+            cache_dir=tmp_path, cleanup_on_exit=True, register_global=False, backend="files"
+        ) as cache:
             cache.set("key1", 100.0)
             cache.set("key2", 200.0)
 
@@ -542,8 +549,10 @@ class TestFileBackedMetricCache:
         assert len(files_after) == 0
 
     def test_persist_on_exit(self, tmp_path):
-        """종료 시 파일 유지 옵션"""
-        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=False, register_global=False) as cache:
+        """종료 시 파일 유지 옵션 (files 백엔드)"""
+        with FileBackedMetricCache(
+            cache_dir=tmp_path, cleanup_on_exit=False, register_global=False, backend="files"
+        ) as cache:
             cache.set("key1", 100.0)
 
         # 종료 후에도 파일 유지
@@ -587,3 +596,110 @@ class TestFileBackedMetricCache:
             assert get_global_cache() is cache
 
         assert get_global_cache() is None
+
+    def test_invalid_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            FileBackedMetricCache(cache_dir=tmp_path, backend="redis")
+
+
+class TestPersistentMetricCache:
+    """persistent_metric_cache 테스트"""
+
+    def test_registers_global_and_persists(self, tmp_path):
+        with persistent_metric_cache(tmp_path) as cache:
+            assert isinstance(cache, FileBackedMetricCache)
+            assert get_global_cache() is cache
+            cache.set("key", 1.5)
+
+        assert get_global_cache() is None
+        with persistent_metric_cache(tmp_path) as cache:
+            assert cache.get("key") == 1.5
+
+    def test_nested_reuses_existing_global(self, tmp_path):
+        with SharedMetricCache() as outer, persistent_metric_cache(tmp_path) as inner:
+            assert inner is outer
+
+        assert not list(tmp_path.iterdir())
+
+    def test_unavailable_directory_runs_without_cache(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        with persistent_metric_cache(blocker / "metrics") as cache:
+            assert cache is None
+            assert get_global_cache() is None
+
+
+class TestFileBackedMetricCacheSQLite:
+    """FileBackedMetricCache SQLite 백엔드 테스트"""
+
+    def test_single_file(self, tmp_path):
+        """모든 항목이 단일 DB 파일에 저장됨"""
+        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=False, register_global=False) as cache:
+            assert cache.backend == "sqlite"
+            cache.set_many({f"key_{i}": float(i) for i in range(100)})
+            assert cache.file_size() == 100
+
+        assert list(tmp_path.glob("*.json")) == []
+        assert (tmp_path / "metrics.sqlite3").exists()
+
+    def test_cleanup_on_exit(self, tmp_path):
+        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=True, register_global=False) as cache:
+            cache.set_many({"key1": 1.0, "key2": 2.0})
+
+        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=True, register_global=False) as cache:
+            assert cache.file_size() == 0
+            assert cache.get("key1") is None
+
+    def test_get_many_from_file(self, tmp_path):
+        """다음 실행에서 파일 캐시 일괄 조회"""
+        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=False, register_global=False) as cache:
+            cache.set_many({f"key_{i}": float(i) for i in range(1200)})
+
+        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=True, register_global=False) as cache:
+            keys = [f"key_{i}" for i in range(1200)] + ["missing"]
+            result = cache.get_many(keys)
+
+            assert len(result) == 1200
+            assert result["key_1199"] == 1199.0
+            assert cache._file_hits == 1200
+            assert cache.stats.hits == 1200
+            assert cache.stats.misses == 1
+            # 두 번째 조회는 메모리 캐시에서 응답
+            cache.get_many(keys[:10])
+            assert cache._file_hits == 1200
+
+    def test_overwrite(self, tmp_path):
+        with FileBackedMetricCache(cache_dir=tmp_path, register_global=False) as cache:
+            cache.set("key", 1.0)
+            cache.set("key", 2.0)
+
+            assert cache.file_size() == 1
+            assert cache.get("key") == 2.0
+
+    def test_ttl_expiry_by_timestamp(self, tmp_path):
+        """저장 시각 인덱스 기준 만료"""
+        with FileBackedMetricCache(cache_dir=tmp_path, cleanup_on_exit=False, register_global=False) as cache:
+            with patch("core.shared.aws.metrics.session_cache.time.time", return_value=time.time() - 8 * 86400):
+                cache.set("old", 1.0)
+            cache.set("new", 2.0)
+
+        with FileBackedMetricCache(
+            cache_dir=tmp_path, ttl_days=7, cleanup_on_exit=True, register_global=False
+        ) as cache:
+            # 시작 시 만료 항목 정리
+            assert cache.file_size() == 1
+            assert cache.get("old") is None
+            assert cache.get("new") == 2.0
+
+    def test_concurrent_writes(self, tmp_path):
+        """멀티스레드 동시 저장"""
+        with FileBackedMetricCache(cache_dir=tmp_path, register_global=False) as cache:
+
+            def worker(n):
+                cache.set_many({f"t{n}_{i}": float(i) for i in range(100)})
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(worker, range(8)))
+
+            assert cache.file_size() == 800